@@ -0,0 +1,251 @@
+"""
+벤치마크 스위트
+==============
+분석 핫패스(RFM 스코어링, 첫 구매 카테고리 집계, 세션 집계, Figure 생성)와 페이지별 headless 렌더링
+시간을 합성 데이터(`thelook_analysis.synth`) 규모별로 측정하고 JSON 으로 저장합니다.
+저장된 결과끼리 비교해 배포 전에 성능 회귀를 잡는 용도입니다.
+
+asv 와 비슷하게 벤치마크 함수는 준비 작업(데이터 로드 등)을 하고 측정할 callable 을 반환하며,
+반환된 callable 만 반복 측정됩니다.
+
+사용 예:
+    python -m benchmarks --scales 10000 100000
+    python -m benchmarks --filter rfm --out before.json
+    python -m benchmarks --compare before.json after.json
+"""
+
+import datetime
+import functools
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+REPO_DIR = BENCHMARK_DIR.parent
+DATA_ROOT = BENCHMARK_DIR / ".data"
+RESULTS_DIR = BENCHMARK_DIR / "results"
+
+DEFAULT_SCALES = (10_000, 100_000)
+DEFAULT_REPEAT = 5
+
+# compare 에서 median 이 이 배수 이상 느려지면 회귀로 판단
+REGRESSION_THRESHOLD = 1.2
+
+BENCHMARKS = {}
+
+
+@dataclass
+class Benchmark:
+    name: str
+    group: str
+    setup: object
+    scaled: bool = True
+    repeat: int = None
+    measure: object = None
+
+    def run(self, ctx, repeat):
+        repeat = self.repeat or repeat
+        if self.measure is not None:
+            return self.measure(ctx, repeat)
+        return time_callable(self.setup(ctx), repeat)
+
+
+def benchmark(group, name=None, scaled=True, repeat=None):
+    """setup(ctx) → 측정할 callable 을 반환하는 함수를 등록"""
+    def register(setup):
+        key = f"{group}.{name or setup.__name__}"
+        BENCHMARKS[key] = Benchmark(key, group, setup, scaled=scaled, repeat=repeat)
+        return setup
+    return register
+
+
+def register_measure(group, name, measure, scaled=False):
+    """측정 방식을 직접 구현한 벤치마크 등록 (measure(ctx, repeat) → 결과 dict)"""
+    key = f"{group}.{name}"
+    BENCHMARKS[key] = Benchmark(key, group, None, scaled=scaled, measure=measure)
+
+
+def time_callable(fn, repeat, warmup=1):
+    """warmup 후 repeat 회 측정 (GC 는 측정 중에만 끔)"""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    gc_enabled = gc.isenabled()
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            fn()
+            samples.append((time.perf_counter() - started) * 1000)
+        finally:
+            if gc_enabled:
+                gc.enable()
+    return {
+        "min_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "stdev_ms": round(statistics.stdev(samples), 3) if len(samples) > 1 else 0.0,
+        "repeat": repeat,
+    }
+
+
+# ============================================
+# 데이터 컨텍스트
+# ============================================
+
+class Dataset:
+    """한 규모의 합성 데이터와 그 위에서 구체화한 dbt 모델 (준비 결과는 캐시)"""
+
+    def __init__(self, users, seed=42, root=DATA_ROOT):
+        self.users = users
+        self.seed = seed
+        self.data_dir = Path(root) / f"users-{users}-seed-{seed}"
+
+    def ensure(self):
+        """합성 데이터가 없으면 생성"""
+        from thelook_analysis.synth import SynthConfig, generate
+
+        if not (self.data_dir / "manifest.json").exists():
+            chunk_users = min(SynthConfig.chunk_users, max(1, self.users // 4))
+            generate(self.data_dir, SynthConfig(users=self.users, seed=self.seed, chunk_users=chunk_users))
+        return self
+
+    @functools.cached_property
+    def runner(self):
+        """모든 모델을 한 번 구체화해 둔 LocalRunner"""
+        from thelook_analysis.duckdb_backend import LocalRunner
+
+        runner = LocalRunner(self.ensure().data_dir)
+        runner.run()
+        return runner
+
+    @functools.cached_property
+    def order_rows(self):
+        """stg_orders JOIN stg_order_items 의 (user_id, order_id, order_date, sale_price) 배열"""
+        frame = self.runner.query("""
+            SELECT o.user_id, o.order_id, o.order_date, oi.sale_price
+            FROM stg_orders o
+            JOIN stg_order_items oi ON o.order_id = oi.order_id
+        """)
+        return (
+            frame["user_id"].to_numpy(),
+            frame["order_id"].to_numpy(),
+            frame["order_date"].to_numpy().astype("datetime64[D]"),
+            frame["sale_price"].to_numpy(),
+        )
+
+    def close(self):
+        if "runner" in self.__dict__:
+            self.runner.close()
+
+
+# ============================================
+# 실행 / 저장 / 비교
+# ============================================
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _environment():
+    from importlib import metadata
+
+    versions = {}
+    for package in ("numpy", "pandas", "duckdb", "pyarrow", "plotly", "streamlit"):
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "packages": versions,
+    }
+
+
+def selected(patterns=None):
+    """이름에 patterns 중 하나가 포함된 벤치마크"""
+    from benchmarks import suites  # noqa: F401  (등록)
+
+    return [
+        bench for name, bench in BENCHMARKS.items()
+        if not patterns or any(pattern in name for pattern in patterns)
+    ]
+
+
+def run(patterns=None, scales=DEFAULT_SCALES, repeat=DEFAULT_REPEAT, log=print):
+    """선택된 벤치마크를 실행하고 결과 문서(dict) 반환"""
+    benchmarks = selected(patterns)
+    results = []
+
+    for bench in (b for b in benchmarks if not b.scaled):
+        results.append({"name": bench.name, "group": bench.group, "scale": None, **bench.run(None, repeat)})
+        log(_format_row(results[-1]))
+
+    for users in scales if any(b.scaled for b in benchmarks) else ():
+        dataset = Dataset(users)
+        try:
+            for bench in (b for b in benchmarks if b.scaled):
+                results.append({"name": bench.name, "group": bench.group, "scale": users, **bench.run(dataset, repeat)})
+                log(_format_row(results[-1]))
+        finally:
+            dataset.close()
+
+    return {
+        "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "environment": _environment(),
+        "results": results,
+    }
+
+
+def save(document, path=None):
+    if path is None:
+        stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = RESULTS_DIR / f"{stamp}-{document['commit'] or 'nogit'}.json"
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def load(path):
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def compare(baseline, current, threshold=REGRESSION_THRESHOLD):
+    """(name, scale) 별 median 비율. ratio >= threshold 이면 regression=True"""
+    before = {(row["name"], row["scale"]): row for row in baseline["results"]}
+    rows = []
+    for row in current["results"]:
+        old = before.get((row["name"], row["scale"]))
+        if old is None or not old["median_ms"]:
+            continue
+        ratio = row["median_ms"] / old["median_ms"]
+        rows.append({
+            "name": row["name"],
+            "scale": row["scale"],
+            "before_ms": old["median_ms"],
+            "after_ms": row["median_ms"],
+            "ratio": round(ratio, 3),
+            "regression": ratio >= threshold,
+        })
+    return rows
+
+
+def _format_row(row):
+    scale = "-" if row["scale"] is None else f"{row['scale']:,}"
+    return f"{row['name']:<40}{scale:>12}{row['median_ms']:>12.2f}ms  (min {row['min_ms']:.2f}, n={row['repeat']})"
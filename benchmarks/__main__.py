@@ -0,0 +1,38 @@
+import argparse
+import sys
+
+from benchmarks import DEFAULT_REPEAT, DEFAULT_SCALES, REGRESSION_THRESHOLD, compare, load, run, save, selected
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="분석 핫패스 / 페이지 렌더링 벤치마크")
+    parser.add_argument("--filter", nargs="*", default=None, help="이름에 포함된 문자열로 벤치마크 선택")
+    parser.add_argument("--scales", nargs="*", type=int, default=list(DEFAULT_SCALES), help="합성 데이터 유저 수")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--out", default=None, help="결과 JSON 경로 (기본값: benchmarks/results/<시각>-<commit>.json)")
+    parser.add_argument("--list", action="store_true", help="벤치마크 목록만 출력")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"), help="두 결과 JSON 비교")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD, help="회귀로 판단할 median 비율")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for bench in selected(args.filter):
+            print(f"{bench.name:<40} {'scaled' if bench.scaled else ''}")
+        return 0
+
+    if args.compare:
+        rows = compare(load(args.compare[0]), load(args.compare[1]), threshold=args.threshold)
+        for row in rows:
+            scale = "-" if row["scale"] is None else f"{row['scale']:,}"
+            flag = "  REGRESSION" if row["regression"] else ""
+            print(f"{row['name']:<40}{scale:>12}{row['before_ms']:>12.2f}ms{row['after_ms']:>12.2f}ms"
+                  f"{row['ratio']:>8.2f}x{flag}")
+        return 1 if any(row["regression"] for row in rows) else 0
+
+    document = run(args.filter, scales=args.scales, repeat=args.repeat)
+    print(f"saved: {save(document, args.out)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
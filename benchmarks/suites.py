@@ -0,0 +1,351 @@
+"""
+벤치마크 정의
+============
+- analysis.*: 합성 데이터 규모(유저 수)별로 측정
+- roi.*: Action Plan ROI 몬테카를로 시뮬레이션 (캐시 미적중 / Phase 하나만 변경 / 적중)
+- figures.*: 대시보드 데이터셋 기준 Figure 생성 (캐시 미적중 / 적중)
+- pages.*: 페이지별 AppTest headless 렌더링 (규모별, 페이지마다 새 프로세스, `dashboard.timing` 사용).
+  합성 데이터를 THELOOK_DATA_DIR 로, 그 위에서 만든 RFM 저장소 / 스냅샷을 THELOOK_RFM_STORE / THELOOK_SNAPSHOTS 로
+  넘겨 하드코딩 값이 아니라 엔진 경로와 선택 구역까지 렌더링
+"""
+
+from benchmarks import benchmark, register_measure
+
+# promising_activity 와 같은 기준: 첫 구매일 다음 날부터의 세션 수 / 이벤트 수
+POST_PURCHASE_SESSIONS_SQL = """
+WITH first_purchase AS (
+    SELECT user_id, MIN(order_date) AS first_purchase_date
+    FROM stg_order_items
+    GROUP BY user_id
+),
+activity AS (
+    SELECT
+        r.user_id,
+        r.customer_segment,
+        r.monetary,
+        COUNT(DISTINCT e.session_id) AS sessions,
+        COUNT(e.event_id) AS events
+    FROM int_user_rfm r
+    JOIN first_purchase f ON r.user_id = f.user_id
+    LEFT JOIN stg_events e ON e.user_id = r.user_id AND e.event_date > f.first_purchase_date
+    WHERE r.customer_segment IN ('Promising High Value', 'Promising Low Value')
+    GROUP BY r.user_id, r.customer_segment, r.monetary
+)
+SELECT
+    customer_segment AS segment,
+    CASE
+        WHEN sessions = 0 THEN '0. 미활동'
+        WHEN sessions = 1 THEN '1. 1 Session'
+        WHEN sessions <= 3 THEN '2. 2-3 Sessions'
+        WHEN sessions <= 5 THEN '3. 4-5 Sessions'
+        ELSE '4. 6+ Sessions'
+    END AS activity_level,
+    COUNT(*) AS user_count,
+    AVG(events) AS avg_events,
+    AVG(monetary) AS avg_monetary
+FROM activity
+GROUP BY 1, 2
+ORDER BY 1, 2
+"""
+
+
+# ============================================
+# 분석 핫패스 (규모별)
+# ============================================
+
+@benchmark("analysis")
+def rfm_numpy(dataset):
+    from thelook_analysis.rfm import score_rfm
+
+    rows = dataset.order_rows
+    return lambda: score_rfm(*rows)
+
+
+@benchmark("analysis")
+def rfm_duckdb(dataset):
+    runner = dataset.runner
+    model = "int_user_rfm"
+
+    def run():
+        runner.full_refresh = True
+        try:
+            runner.run_model(model)
+        finally:
+            runner.full_refresh = False
+    return run
+
+
+@benchmark("analysis")
+def rfm_distribution_sketch(dataset):
+    from thelook_analysis.sketches import RFMDistribution
+
+    rows = dataset.order_rows
+    return lambda: RFMDistribution(seed=0).update_orders(*rows).to_dict()
+
+
+@benchmark("analysis")
+def resegment_histogram(dataset):
+    from thelook_analysis.histogram import RFMHistogram
+    from thelook_analysis.rfm import score_rfm
+
+    rfm = score_rfm(*dataset.order_rows)
+    histogram = RFMHistogram.from_arrays(rfm.recency_days, rfm.frequency, rfm.monetary)
+    return lambda: histogram.segment((60, 120, 300, 500), (3, 2), (250, 100, 50, 25))
+
+
+@benchmark("analysis")
+def cube_rollups(dataset):
+    from thelook_analysis import cube
+
+    rfm_cube = cube.RFMCube(dataset.runner.query("SELECT * FROM mart_rfm_cube"))
+    tables = (cube.segment_table, cube.channel_table, cube.category_table, cube.signup_table,
+              cube.channel_category_table)
+    return lambda: [table(rfm_cube) for table in tables]
+
+
+@benchmark("analysis")
+def first_purchase_category(dataset):
+    runner = dataset.runner
+    return lambda: runner.run_model("mart_first_purchase_category")
+
+
+@benchmark("analysis")
+def cohort_matrix(dataset):
+    from thelook_analysis.cohort import build_cohorts
+
+    data_dir = dataset.ensure().data_dir
+    return lambda: build_cohorts(data_dir)
+
+
+@benchmark("analysis")
+def repurchase_histogram(dataset):
+    from thelook_analysis.repurchase import build_repurchase_histogram
+
+    data_dir = dataset.ensure().data_dir
+    return lambda: build_repurchase_histogram(data_dir)
+
+
+@benchmark("analysis")
+def repurchase_rebucket(dataset):
+    from thelook_analysis.repurchase import build_repurchase_histogram
+
+    histogram = build_repurchase_histogram(dataset.ensure().data_dir, events=False)
+    # UI 에서 구간을 바꿀 때마다 다시 만드는 구간표 (칸 합만)
+    return lambda: histogram.table((3, 10, 20, 45, 100, 200))
+
+
+@benchmark("analysis")
+def post_purchase_sessions(dataset):
+    runner = dataset.runner
+    return lambda: runner.query(POST_PURCHASE_SESSIONS_SQL)
+
+
+@benchmark("analysis")
+def post_purchase_sessions_streaming(dataset):
+    from thelook_analysis.sessions import promising_activity
+
+    data_dir = dataset.ensure().data_dir
+    return lambda: promising_activity(data_dir)
+
+
+def _vip_page_queries(dataset):
+    from dashboard import data, warehouse
+
+    runner = dataset.runner
+    pool = warehouse.ConnectionPool(lambda: warehouse.DuckDBConnection(runner.con.cursor()))
+    queries = {"vip_repurchase_timing": data.VIP_REPURCHASE_TIMING_SQL,
+               "conversion_speed": data.CONVERSION_SPEED_SQL}
+    return warehouse.QueryExecutor(pool), queries
+
+
+@benchmark("analysis")
+def vip_page_queries_sequential(dataset):
+    executor, queries = _vip_page_queries(dataset)
+    return lambda: [executor.query(sql) for sql in queries.values()]
+
+
+@benchmark("analysis")
+def vip_page_queries_concurrent(dataset):
+    executor, queries = _vip_page_queries(dataset)
+    return lambda: executor.run(queries)
+
+
+# ============================================
+# 대용량 테이블 전송 (st.dataframe 이 보내는 Arrow 변환까지)
+# ============================================
+
+def _rfm_store(dataset):
+    from thelook_analysis.store import build_store, open_store
+
+    path = dataset.ensure().data_dir / "rfm.store"
+    if path.exists():
+        try:
+            return open_store(path)
+        except ValueError:
+            pass  # 이전 형식 버전
+    build_store(dataset.data_dir, path)
+    return open_store(path)
+
+
+@benchmark("analysis")
+def user_table_object(dataset):
+    import pyarrow as pa
+
+    store = _rfm_store(dataset)
+
+    def run():
+        frame = store.to_frame()
+        frame = frame.astype({name: object for name in ("segment", "traffic_source", "first_category")})
+        return pa.Table.from_pandas(frame, preserve_index=False)
+    return run
+
+
+@benchmark("analysis")
+def user_table_arrow(dataset):
+    store = _rfm_store(dataset)
+    return lambda: store.to_arrow()
+
+
+def _snapshots(dataset):
+    import shutil
+
+    from thelook_analysis.snapshots import SnapshotStore, backfill
+
+    root = dataset.ensure().data_dir / "snapshots"
+    store = SnapshotStore(root)
+    if not store.dates():
+        shutil.rmtree(root, ignore_errors=True)
+        backfill(root, dataset.data_dir, "2023-01-01", "2024-12-31", every=7)
+    return store
+
+
+@benchmark("analysis")
+def segment_transitions(dataset):
+    store = _snapshots(dataset)
+    dates = store.dates()
+    # 반년 전 스냅샷 → 마지막 스냅샷 (시작일 재구성 + 그 사이 변경분)
+    return lambda: store.transitions(dates[-27], dates[-1])
+
+
+@benchmark("analysis")
+def drilldown_page(dataset):
+    from thelook_analysis.drilldown import SegmentIndex
+
+    index = SegmentIndex(_rfm_store(dataset))
+    segment = index.counts()[0][0]
+    index.ordering("monetary", by_activity=False)
+    # 정렬 순열 생성 후 깊은 offset 의 한 페이지 조회
+    return lambda: index.page(segment, sort="monetary", offset=index.count(segment) // 2, limit=50)
+
+
+# ============================================
+# ROI 시뮬레이션 (Phase 당 100만 시나리오)
+# ============================================
+
+@benchmark("roi", scaled=False, repeat=3)
+def simulate_uncached(_):
+    from thelook_analysis import roi
+
+    def run():
+        roi._phase_scenarios.cache_clear()
+        roi._phase_summary.cache_clear()
+        roi.simulate.cache_clear()
+        return roi.simulate()
+    return run
+
+
+@benchmark("roi", scaled=False)
+def simulate_one_phase_changed(_):
+    import itertools
+
+    from thelook_analysis import roi
+
+    roi.simulate()
+    steps = itertools.count(1)
+
+    # 슬라이더 조작: 매번 새로운 재활성화율 (나머지 Phase 는 캐시 적중)
+    return lambda: roi.simulate(roi.with_means({"promising_high": {"reactivation": 0.25 + next(steps) * 1e-4}}))
+
+
+@benchmark("roi", scaled=False)
+def simulate_cached(_):
+    from thelook_analysis import roi
+
+    roi.simulate()
+    return lambda: roi.simulate()
+
+
+# ============================================
+# Figure 생성
+# ============================================
+
+def _segment_data():
+    import logging
+
+    import pandas as pd
+
+    # Streamlit 런타임 밖에서 st.cache_data 를 import 할 때 나오는 경고 억제
+    logging.getLogger("streamlit.runtime.caching.cache_data_api").setLevel(logging.ERROR)
+
+    from dashboard import data
+
+    return pd.DataFrame(data.load_segment_data.__wrapped__("benchmark"))
+
+
+@benchmark("figures", scaled=False)
+def build_uncached(_):
+    from dashboard import figures
+
+    frame = _segment_data()
+    return lambda: figures._express(
+        frame, "pie", values="user_count", names="segment",
+        traces=dict(textposition="inside", textinfo="percent+label"), layout=dict(height=450),
+    )
+
+
+@benchmark("figures", scaled=False)
+def build_cached(_):
+    from dashboard import figures
+
+    frame = _segment_data()
+    return lambda: figures.express(
+        "pie", frame, values="user_count", names="segment",
+        traces=dict(textposition="inside", textinfo="percent+label"), layout=dict(height=450),
+    )
+
+
+# ============================================
+# 페이지 렌더링
+# ============================================
+
+def _page_env(dataset):
+    return {
+        "THELOOK_DATA_DIR": str(dataset.ensure().data_dir),
+        "THELOOK_RFM_STORE": str(_rfm_store(dataset).path),
+        "THELOOK_SNAPSHOTS": str(_snapshots(dataset).root),
+    }
+
+
+def _page_measure(key):
+    def measure(dataset, repeat):
+        from dashboard.timing import measure_all
+
+        timing = measure_all(runs=repeat, pages=[key], env=_page_env(dataset))[0]
+        return {
+            "min_ms": timing["rerun_min_ms"],
+            "median_ms": timing["rerun_ms"],
+            "startup_ms": timing["startup_ms"],
+            "first_visit_ms": timing["first_visit_ms"],
+            "repeat": repeat,
+        }
+    return measure
+
+
+def _register_pages():
+    from dashboard.pages import PAGES
+
+    for key in PAGES.values():
+        register_measure("pages", key, _page_measure(key), scaled=True)
+
+
+_register_pages()
@@ -0,0 +1,3 @@
+"""
+TheLook RFM 대시보드 (Streamlit) 지원 모듈
+"""
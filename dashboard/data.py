@@ -0,0 +1,849 @@
+"""
+대시보드 데이터 접근 레이어
+==========================
+페이지 전환(rerun)마다 DataFrame 을 다시 만들지 않도록 데이터셋별 로더를
+`st.cache_data` 로 감쌉니다. 캐시 키는 데이터 버전이며 TTL 이 지나거나
+`invalidate()` 가 호출되면 다시 생성됩니다. 분석 기간은 staging 모델 필터(ANALYSIS_WINDOW)로 고정되어
+있으므로 캐시 키에 넣지 않습니다.
+
+아래 값들은 BigQuery 쿼리 결과(분석 기간 2023-01-01 ~ 2024-12-31)를 옮겨 온 것입니다.
+THELOOK_WAREHOUSE 가 설정되면 라이브 SQL 이 있는 데이터셋은 웨어하우스에서 직접 조회하며,
+한 페이지의 데이터셋은 `load_all` 로 동시에 로드합니다.
+"""
+
+import functools
+import os
+import threading
+
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+from dashboard import frames, instrumentation, warehouse
+
+# 기본 분석 기간 (stg_orders / stg_order_items 필터와 동일)
+ANALYSIS_WINDOW = ("2023-01-01", "2024-12-31")
+
+# 데이터 버전: 데이터가 갱신되면 값을 바꿔 캐시를 무효화
+DATA_VERSION_ENV = "THELOOK_DATA_VERSION"
+DEFAULT_DATA_VERSION = "bigquery-20250101"
+
+# 데이터 버전 파일 (thelook_analysis.scheduler 가 갱신 후 새 값을 씀). THELOOK_DATA_VERSION 이 없을 때 사용
+DATA_VERSION_FILE_ENV = "THELOOK_DATA_VERSION_FILE"
+
+# 로컬 원천 Parquet 디렉터리. 설정되면 엔진이 있는 데이터셋은 하드코딩 값 대신 직접 계산
+LOCAL_DATA_DIR_ENV = "THELOOK_DATA_DIR"
+
+# 유저별 RFM memory-mapped 저장소 (thelook_analysis.store). 설정되면 세그먼트 요약을 저장소에서 계산
+RFM_STORE_ENV = "THELOOK_RFM_STORE"
+
+# mart_rfm_cube 를 Parquet 로 내보낸 파일 (스케줄러 --export-dir). 없고 THELOOK_DATA_DIR 가 있으면 로컬에서 구체화
+RFM_CUBE_ENV = "THELOOK_RFM_CUBE"
+
+# 가입 코호트 행렬 파일 (thelook_analysis.cohort / 스케줄러 --export-dir). 없고 THELOOK_DATA_DIR 가 있으면 로컬에서 생성
+COHORTS_ENV = "THELOOK_COHORTS"
+
+# 재구매 간격 히스토그램 파일 (thelook_analysis.repurchase --out / 스케줄러 --export-dir).
+# 없고 THELOOK_DATA_DIR 가 있으면 로컬에서 생성
+REPURCHASE_ENV = "THELOOK_REPURCHASE"
+
+# 일별 세그먼트 변경분 스냅샷 디렉터리 (thelook_analysis.snapshots). 설정되면 세그먼트 이동 / 추이를 표시
+SNAPSHOTS_ENV = "THELOOK_SNAPSHOTS"
+
+# 캐시 유지 시간 (초)
+CACHE_TTL = 60 * 60
+
+# 웨어하우스 URL (dashboard.warehouse). 설정되면 라이브 SQL 이 있는 데이터셋은 웨어하우스에서 조회
+WAREHOUSE_ENV = warehouse.WAREHOUSE_ENV
+
+_CACHES = []
+_PAGE_TABLES = {}
+
+
+@functools.lru_cache(maxsize=8)
+def _read_version_file(path, mtime_ns):
+    with open(path, encoding="utf-8") as file:
+        return file.read().strip() or DEFAULT_DATA_VERSION
+
+
+def data_version():
+    """
+    현재 데이터 버전 (환경변수 THELOOK_DATA_VERSION > THELOOK_DATA_VERSION_FILE 내용 > 기본값).
+    버전 파일은 mtime 이 바뀔 때만 다시 읽으며, 값이 바뀌면 버전을 키로 쓰는 캐시가 모두 새로 만들어집니다.
+    """
+    version = os.environ.get(DATA_VERSION_ENV)
+    if version:
+        return version
+    path = os.environ.get(DATA_VERSION_FILE_ENV)
+    if path:
+        try:
+            return _read_version_file(path, os.stat(path).st_mtime_ns)
+        except FileNotFoundError:
+            pass
+    return DEFAULT_DATA_VERSION
+
+
+def local_data_dir():
+    """로컬 원천 Parquet 디렉터리 (환경변수 THELOOK_DATA_DIR, 없으면 None)"""
+    return os.environ.get(LOCAL_DATA_DIR_ENV)
+
+
+# 파일 / 데이터 버전을 키로 쓰는 리소스는 최신 것 하나만 유지 (파일이 다시 쓰이거나 버전이 바뀌면
+# 이전 큐브 / 행렬 / 저장소가 캐시에 남아 메모리가 계속 늘어나지 않도록)
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _open_rfm_store(path, mtime_ns):
+    from thelook_analysis.store import open_store
+
+    return open_store(path)
+
+
+def rfm_store():
+    """
+    THELOOK_RFM_STORE 저장소 (없으면 None). 프로세스당 한 번 mmap 으로 열고 세션 간에 공유하며,
+    같은 파일을 여는 다른 프로세스와는 OS 페이지 캐시를 공유합니다. 파일이 다시 만들어지면(mtime) 새로 엶.
+    """
+    path = os.environ.get(RFM_STORE_ENV)
+    return _open_rfm_store(path, os.stat(path).st_mtime_ns) if path else None
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _build_rfm_histogram(path, mtime_ns):
+    from thelook_analysis.histogram import RFMHistogram
+
+    return RFMHistogram.from_store(_open_rfm_store(path, mtime_ns))
+
+
+def rfm_histogram():
+    """기준값 시뮬레이션용 RFMHistogram (RFM 저장소가 없으면 None). 저장소 파일당 한 번 생성"""
+    path = os.environ.get(RFM_STORE_ENV)
+    if not path:
+        return None
+    with instrumentation.span("data", "rfm_histogram"):
+        return _build_rfm_histogram(path, os.stat(path).st_mtime_ns)
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _build_segment_index(path, mtime_ns):
+    from thelook_analysis.drilldown import SegmentIndex
+
+    return SegmentIndex(_open_rfm_store(path, mtime_ns))
+
+
+def segment_index():
+    """세그먼트 드릴다운용 SegmentIndex (RFM 저장소가 없으면 None). 정렬 순열은 프로세스 내 모든 세션이 공유"""
+    path = os.environ.get(RFM_STORE_ENV)
+    if not path:
+        return None
+    return _build_segment_index(path, os.stat(path).st_mtime_ns)
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _load_rfm_cube(kind, source, version):
+    from thelook_analysis import cube
+
+    if kind == "parquet":
+        return cube.RFMCube.from_parquet(source)
+    return cube.load_cube(source)
+
+
+def rfm_cube():
+    """
+    RFM OLAP 큐브 (없으면 None). segment / channel / category / signup / channel×category 데이터셋은
+    이 큐브의 roll-up 으로 만들어집니다. 파일은 다시 쓰이면(mtime, 스케줄러 내보내기) 새로 읽고,
+    로컬 원천에서 구체화한 큐브는 (원천, 데이터 버전) 당 한 번만 로드됩니다.
+    """
+    path = os.environ.get(RFM_CUBE_ENV)
+    if path:
+        return _load_rfm_cube("parquet", path, os.stat(path).st_mtime_ns)
+    if local_data_dir():
+        return _load_rfm_cube("local", local_data_dir(), data_version())
+    return None
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _load_cohorts(kind, source, version):
+    from thelook_analysis import cohort
+
+    if kind == "file":
+        return cohort.CohortMatrix.load(source)
+    return cohort.build_cohorts(source)
+
+
+def cohort_matrix():
+    """
+    가입 코호트 × 경과 개월 행렬 (없으면 None). 파일은 다시 쓰이면(mtime, `cohort update`) 새로 읽고,
+    로컬 원천에서 만든 행렬은 (원천, 데이터 버전) 당 한 번만 생성됩니다.
+    """
+    path = os.environ.get(COHORTS_ENV)
+    if path:
+        return _load_cohorts("file", path, os.stat(path).st_mtime_ns)
+    if local_data_dir():
+        with instrumentation.span("data", "cohort_matrix"):
+            return _load_cohorts("local", local_data_dir(), data_version())
+    return None
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _build_repurchase_histogram(kind, source, version):
+    from thelook_analysis import repurchase
+
+    if kind == "file":
+        return repurchase.RepurchaseHistogram.load(source)
+    return repurchase.build_repurchase_histogram(source)
+
+
+def repurchase_histogram():
+    """
+    세그먼트 × 첫→2차 구매 간격(일) 히스토그램 (없으면 None). 파일(THELOOK_REPURCHASE)은 다시 쓰이면 새로 읽고,
+    로컬 원천에서 만든 히스토그램은 (원천, 데이터 버전) 당 한 번 생성됩니다.
+    재구매 구간표는 모두 이 히스토그램의 칸 합으로 만들어집니다.
+    """
+    path = os.environ.get(REPURCHASE_ENV)
+    if path:
+        return _build_repurchase_histogram("file", path, os.stat(path).st_mtime_ns)
+    if not local_data_dir():
+        return None
+    with instrumentation.span("data", "repurchase_histogram"):
+        return _build_repurchase_histogram("local", local_data_dir(), data_version())
+
+
+def repurchase_table(edges, labels=None, segment="VIP"):
+    """재구매 간격 구간표 (간격 상한 edges, 포함). 히스토그램 칸 합이므로 구간을 바꿔도 주문을 다시 읽지 않음"""
+    with instrumentation.span("data", "repurchase_table"):
+        return repurchase_histogram().table(edges, segment, labels)
+
+
+def _snapshot_root():
+    path = os.environ.get(SNAPSHOTS_ENV)
+    # 새 스냅샷 파티션이 생기면 디렉터리 mtime 이 바뀌어 캐시 키가 달라짐
+    return (path, os.stat(path).st_mtime_ns) if path and os.path.isdir(path) else (None, None)
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _open_snapshots(path, mtime_ns):
+    from thelook_analysis.snapshots import SnapshotStore
+
+    return SnapshotStore(path)
+
+
+def snapshot_store():
+    """THELOOK_SNAPSHOTS 의 SnapshotStore (없거나 스냅샷이 없으면 None)"""
+    path, mtime_ns = _snapshot_root()
+    if path is None:
+        return None
+    store = _open_snapshots(path, mtime_ns)
+    return store if store.dates() else None
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _segment_transitions(path, mtime_ns, start, end):
+    return _open_snapshots(path, mtime_ns).transitions(start, end)
+
+
+def segment_transitions(start, end):
+    """start → end 세그먼트 이동 행렬 (행 = 시작 세그먼트, 열 = 종료 세그먼트, 유저 수)"""
+    with instrumentation.span("data", "segment_transitions"):
+        return _segment_transitions(*_snapshot_root(), str(start), str(end))
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _segment_history(path, mtime_ns):
+    return _open_snapshots(path, mtime_ns).history()
+
+
+_CACHES.extend((_segment_transitions, _segment_history))
+
+
+def segment_history():
+    """스냅샷 날짜 × 세그먼트 유저 수"""
+    with instrumentation.span("data", "segment_history"):
+        return _segment_history(*_snapshot_root())
+
+
+def _cube_table(name):
+    from thelook_analysis import cube
+
+    with instrumentation.span("data", f"cube.{name}"):
+        table = getattr(cube, name)(rfm_cube())
+    if "segment" in table:
+        table["segment"] = table["segment"].replace(SEGMENT_LABELS)
+    return table.round(2)
+
+
+@st.cache_resource(show_spinner=False)
+def _query_executor(url):
+    return warehouse.QueryExecutor(warehouse.open_pool(url))
+
+
+def query_executor():
+    """
+    THELOOK_WAREHOUSE 의 QueryExecutor (없으면 None). 연결 풀과 스레드 풀은 프로세스당 하나로
+    모든 세션이 공유합니다.
+    """
+    url = os.environ.get(WAREHOUSE_ENV)
+    return _query_executor(url) if url else None
+
+
+def _live_query(name, sql):
+    with instrumentation.span("query", name):
+        return query_executor().query(sql)
+
+
+def load_all(*loaders):
+    """
+    페이지의 데이터셋들을 한 번에 로드해 같은 순서의 튜플로 반환.
+    웨어하우스가 설정되어 있으면 로더를 동시에 실행하므로 페이지 지연이 쿼리 시간의 합이 아니라
+    가장 느린 쿼리에 가까워집니다 (캐시 적중분은 그대로 즉시 반환).
+    """
+    executor = query_executor()
+    if executor is None or len(loaders) < 2:
+        return tuple(loader() for loader in loaders)
+
+    # 작업 스레드에서도 st.cache_data 가 현재 세션으로 동작하도록 ScriptRunContext 를 넘겨 줌
+    ctx = get_script_run_ctx()
+
+    def call(loader):
+        if ctx is not None:
+            add_script_run_ctx(threading.current_thread(), ctx)
+        return loader()
+
+    results = executor.map({i: functools.partial(call, loader) for i, loader in enumerate(loaders)})
+    return tuple(results[i] for i in range(len(loaders)))
+
+
+def dataset(builder):
+    """
+    builder(version) 를 캐시하고, 현재 데이터 버전으로 호출하는 로더를 반환.
+    DataFrame 결과의 라벨 컬럼은 Categorical 로 바꿔 캐시합니다 (dashboard.frames.compact)
+    """
+    @functools.wraps(builder)
+    def build(version):
+        return frames.compact(builder(version))
+
+    cached = st.cache_data(ttl=CACHE_TTL, show_spinner=False)(build)
+    _CACHES.append(cached)
+
+    @functools.wraps(builder)
+    def load():
+        with instrumentation.span("data", builder.__name__):
+            return cached(data_version())
+
+    load.clear = cached.clear
+    return load
+
+
+def page_table(builder):
+    """페이지 내 정적 테이블 등록 (load_table(name) 으로 조회)"""
+    _PAGE_TABLES[builder.__name__] = builder
+    return builder
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _load_table(name, version):
+    return _PAGE_TABLES[name]()
+
+
+_CACHES.append(_load_table)
+
+
+def load_table(name):
+    """페이지 내 정적 테이블 (캐시됨)"""
+    if name not in _PAGE_TABLES:
+        raise KeyError(f"등록되지 않은 페이지 테이블: {name}")
+    with instrumentation.span("data", name):
+        return _load_table(name, data_version())
+
+
+def invalidate():
+    """모든 데이터셋/페이지 테이블 캐시 삭제"""
+    for cached in _CACHES:
+        cached.clear()
+
+
+# ============================================
+# 라이브 SQL (BigQuery 문법, {dataset} = dbt 모델 데이터셋)
+# ============================================
+
+# VIP 유저별 첫 번째 / 두 번째 주문 (주문 매출 포함)
+_VIP_FIRST_TWO_ORDERS = """
+WITH vip AS (
+    SELECT user_id, monetary, m_score
+    FROM {dataset}.int_user_rfm
+    WHERE customer_segment = 'VIP'
+),
+ranked_orders AS (
+    SELECT
+        o.user_id,
+        o.order_date,
+        SUM(oi.sale_price) AS revenue,
+        ROW_NUMBER() OVER (PARTITION BY o.user_id ORDER BY o.created_at, o.order_id) AS order_rank
+    FROM {dataset}.stg_orders o
+    JOIN {dataset}.stg_order_items oi ON o.order_id = oi.order_id
+    WHERE o.user_id IN (SELECT user_id FROM vip)
+    GROUP BY o.user_id, o.order_id, o.created_at, o.order_date
+),
+first_two AS (
+    SELECT
+        v.user_id,
+        v.monetary,
+        v.m_score,
+        MAX(CASE WHEN r.order_rank = 1 THEN r.order_date END) AS first_date,
+        MAX(CASE WHEN r.order_rank = 2 THEN r.order_date END) AS second_date,
+        MAX(CASE WHEN r.order_rank = 1 THEN r.revenue END) AS first_revenue,
+        MAX(CASE WHEN r.order_rank = 2 THEN r.revenue END) AS second_revenue
+    FROM vip v
+    JOIN ranked_orders r ON v.user_id = r.user_id
+    WHERE r.order_rank <= 2
+    GROUP BY v.user_id, v.monetary, v.m_score
+    HAVING MAX(CASE WHEN r.order_rank = 2 THEN r.order_date END) IS NOT NULL
+)"""
+
+VIP_REPURCHASE_TIMING_SQL = _VIP_FIRST_TWO_ORDERS + """
+SELECT
+    CASE
+        WHEN DATE_DIFF(second_date, first_date, DAY) <= 7 THEN '1. Within 1 Week'
+        WHEN DATE_DIFF(second_date, first_date, DAY) <= 14 THEN '2. Within 2 Weeks'
+        WHEN DATE_DIFF(second_date, first_date, DAY) <= 30 THEN '3. Within 1 Month'
+        WHEN DATE_DIFF(second_date, first_date, DAY) <= 60 THEN '4. Within 2 Months'
+        WHEN DATE_DIFF(second_date, first_date, DAY) <= 90 THEN '5. Within 3 Months'
+        ELSE '6. 3+ Months'
+    END AS bucket,
+    COUNT(*) AS count,
+    ROUND(COUNT(*) * 100.0 / SUM(COUNT(*)) OVER (), 2) AS pct,
+    ROUND(AVG(DATE_DIFF(second_date, first_date, DAY)), 1) AS avg_days,
+    ROUND(AVG(first_revenue), 2) AS avg_first_revenue,
+    ROUND(AVG(second_revenue), 2) AS avg_second_revenue,
+    ROUND(AVG(monetary), 2) AS avg_ltv
+FROM first_two
+GROUP BY 1
+ORDER BY 1
+"""
+
+# 첫 구매 다음 날부터 두 번째 구매 전날까지의 세션 / 상품 조회
+CONVERSION_SPEED_SQL = _VIP_FIRST_TWO_ORDERS + """,
+between_purchases AS (
+    SELECT
+        f.user_id,
+        f.monetary,
+        f.m_score,
+        DATE_DIFF(f.second_date, f.first_date, DAY) AS days_to_second,
+        COUNT(DISTINCT e.session_id) AS sessions,
+        COUNT(CASE WHEN e.event_type = 'product' THEN 1 END) AS product_views
+    FROM first_two f
+    LEFT JOIN {dataset}.stg_events e
+        ON e.user_id = f.user_id AND e.event_date > f.first_date AND e.event_date < f.second_date
+    GROUP BY f.user_id, f.monetary, f.m_score, f.first_date, f.second_date
+)
+SELECT
+    CASE
+        WHEN days_to_second <= 30 THEN '1. Quick (≤30 days)'
+        WHEN days_to_second <= 60 THEN '2. Medium (31-60 days)'
+        ELSE '3. Slow (61+ days)'
+    END AS speed,
+    COUNT(*) AS count,
+    ROUND(AVG(days_to_second), 1) AS avg_days,
+    ROUND(AVG(sessions), 1) AS avg_sessions,
+    ROUND(AVG(product_views), 1) AS avg_product_views,
+    ROUND(AVG(monetary), 2) AS avg_ltv,
+    ROUND(AVG(m_score), 2) AS avg_m_score
+FROM between_purchases
+GROUP BY 1
+ORDER BY 1
+"""
+
+
+# ============================================
+# 데이터셋 (Based on SQL Query Results)
+# ============================================
+
+@dataset
+def load_rfm_distribution(version):
+    # RFM 분포 데이터 (sale_price 기준)
+    return {
+        "recency": {"p10": 40, "p25": 111, "p50": 259, "p75": 455, "p90": 610, "p95": 668, "avg": 293.0, "std": 207.2},
+        "frequency": {"p10": 1, "p25": 1, "p50": 1, "p75": 1, "p90": 2, "p95": 2, "avg": 1.2, "std": 0.47},
+        "monetary": {"p10": 18.02, "p25": 34.0, "p50": 66.5, "p75": 134.72, "p90": 228.68, "p95": 301.98, "avg": 102.82, "std": 109.77}
+    }
+
+
+# thelook_analysis.rfm.SEGMENTS 이름 → 대시보드 표기
+SEGMENT_LABELS = {"VIP": "VIP Champions"}
+
+SEGMENT_COLUMNS = ["segment", "user_count", "pct", "avg_recency", "avg_frequency", "avg_monetary",
+                   "revenue_pct", "r_score", "f_score", "m_score", "total_revenue"]
+
+
+@dataset
+def load_segment_data(version):
+    # RFM 세그먼트 데이터
+    if rfm_cube() is not None:
+        return _cube_table("segment_table")
+    store = rfm_store()
+    if store is not None:
+        summary = store.segment_summary().replace({"segment": SEGMENT_LABELS})
+        return summary[SEGMENT_COLUMNS].round(2)
+    return pd.DataFrame([
+        {"segment": "VIP Champions", "user_count": 1531, "pct": 5.14, "avg_recency": 79.5,
+         "avg_frequency": 2.32, "avg_monetary": 275.88, "revenue_pct": 13.79,
+         "r_score": 4.59, "f_score": 4.28, "m_score": 4.30, "total_revenue": 422377.78},
+        {"segment": "Loyal High Value", "user_count": 2026, "pct": 6.80, "avg_recency": 185.3,
+         "avg_frequency": 2.15, "avg_monetary": 162.27, "revenue_pct": 10.73,
+         "r_score": 3.67, "f_score": 4.14, "m_score": 3.47, "total_revenue": 328759.12},
+        {"segment": "Loyal Low Value", "user_count": 587, "pct": 1.97, "avg_recency": 143.1,
+         "avg_frequency": 2.03, "avg_monetary": 48.40, "revenue_pct": 0.93,
+         "r_score": 4.05, "f_score": 4.03, "m_score": 1.84, "total_revenue": 28410.78},
+        {"segment": "Promising High Value", "user_count": 3555, "pct": 11.93, "avg_recency": 84.2,
+         "avg_frequency": 1.0, "avg_monetary": 155.86, "revenue_pct": 18.09,
+         "r_score": 4.55, "f_score": 3.0, "m_score": 3.51, "total_revenue": 554081.87},
+        {"segment": "Promising Low Value", "user_count": 4891, "pct": 16.42, "avg_recency": 85.3,
+         "avg_frequency": 1.0, "avg_monetary": 34.28, "revenue_pct": 5.47,
+         "r_score": 4.55, "f_score": 3.0, "m_score": 1.49, "total_revenue": 167640.62},
+        {"segment": "Need Attention", "user_count": 730, "pct": 2.45, "avg_recency": 476.2,
+         "avg_frequency": 2.08, "avg_monetary": 206.51, "revenue_pct": 4.92,
+         "r_score": 1.78, "f_score": 4.08, "m_score": 3.78, "total_revenue": 150755.89},
+        {"segment": "At Risk", "user_count": 6637, "pct": 22.28, "avg_recency": 270.2,
+         "avg_frequency": 1.0, "avg_monetary": 85.36, "revenue_pct": 18.49,
+         "r_score": 3.0, "f_score": 3.0, "m_score": 2.36, "total_revenue": 566558.73},
+        {"segment": "Hibernating", "user_count": 9707, "pct": 32.58, "avg_recency": 538.5,
+         "avg_frequency": 1.0, "avg_monetary": 86.38, "revenue_pct": 27.37,
+         "r_score": 1.53, "f_score": 3.0, "m_score": 2.35, "total_revenue": 838519.26},
+        {"segment": "Others", "user_count": 131, "pct": 0.44, "avg_recency": 490.2,
+         "avg_frequency": 2.02, "avg_monetary": 48.79, "revenue_pct": 0.21,
+         "r_score": 1.73, "f_score": 4.02, "m_score": 1.85, "total_revenue": 6391.18}
+    ])
+
+
+@dataset
+def load_channel_data(version):
+    # 컬럼명 변경: vip_conversion_rate -> vip_maturity_rate (VIP 성숙도/비중)
+    # 트래픽 소스별 VIP 비율
+    if rfm_cube() is not None:
+        return _cube_table("channel_table")
+    return pd.DataFrame([
+        {"channel": "Facebook", "vip_maturity_rate": 17.80, "promising_high": 35.28,
+         "promising_low": 46.93, "avg_monetary_vip": 268.85, "total_users": 618},
+        {"channel": "Search", "vip_maturity_rate": 15.37, "promising_high": 35.53,
+         "promising_low": 49.10, "avg_monetary_vip": 272.92, "total_users": 6927},
+        {"channel": "Organic", "vip_maturity_rate": 15.06, "promising_high": 36.87,
+         "promising_low": 48.07, "avg_monetary_vip": 295.01, "total_users": 1527},
+        {"channel": "Email", "vip_maturity_rate": 14.84, "promising_high": 31.71,
+         "promising_low": 53.46, "avg_monetary_vip": 262.42, "total_users": 492},
+        {"channel": "Display", "vip_maturity_rate": 12.83, "promising_high": 38.01,
+         "promising_low": 49.15, "avg_monetary_vip": 285.63, "total_users": 413}
+    ])
+
+
+@dataset
+def load_promising_activity(version):
+    # Promising 세그먼트 구매 후 활동 분석
+    if local_data_dir():
+        from thelook_analysis.sessions import promising_activity
+        return promising_activity(local_data_dir())
+    return pd.DataFrame([
+        {"segment": "Promising High Value", "activity_level": "0. 미활동", "user_count": 1643,
+         "pct": 46.22, "avg_events": 0.0, "avg_monetary": 131.06},
+        {"segment": "Promising High Value", "activity_level": "1. 1 Session", "user_count": 473,
+         "pct": 13.31, "avg_events": 1.2, "avg_monetary": 153.98},
+        {"segment": "Promising High Value", "activity_level": "2. 2-3 Sessions", "user_count": 1268,
+         "pct": 35.67, "avg_events": 2.4, "avg_monetary": 176.89},
+        {"segment": "Promising High Value", "activity_level": "3. 4-5 Sessions", "user_count": 170,
+         "pct": 4.78, "avg_events": 5.4, "avg_monetary": 244.25},
+        {"segment": "Promising Low Value", "activity_level": "0. 미활동", "user_count": 4275,
+         "pct": 87.41, "avg_events": 0.0, "avg_monetary": 32.59},
+        {"segment": "Promising Low Value", "activity_level": "1. 1 Session", "user_count": 227,
+         "pct": 4.64, "avg_events": 2.0, "avg_monetary": 44.13},
+        {"segment": "Promising Low Value", "activity_level": "2. 2-3 Sessions", "user_count": 384,
+         "pct": 7.85, "avg_events": 3.2, "avg_monetary": 47.18}
+    ])
+
+
+@dataset
+def load_vip_repurchase_timing(version):
+    # VIP 재구매 타이밍
+    if query_executor() is not None:
+        return _live_query("vip_repurchase_timing", VIP_REPURCHASE_TIMING_SQL)
+    if repurchase_histogram() is not None:
+        from thelook_analysis import repurchase
+
+        table = repurchase_table(repurchase.VIP_TIMING_EDGES, repurchase.VIP_TIMING_LABELS)
+        return table[["bucket", "count", "pct", "avg_days", "avg_first_revenue", "avg_second_revenue",
+                      "avg_ltv"]].round({"pct": 2, "avg_days": 1, "avg_first_revenue": 2,
+                                         "avg_second_revenue": 2, "avg_ltv": 2})
+    return pd.DataFrame([
+        {"bucket": "1. Within 1 Week", "count": 47, "pct": 3.07, "avg_days": 3.6,
+         "avg_first_revenue": 138.17, "avg_second_revenue": 120.71, "avg_ltv": 303.42},
+        {"bucket": "2. Within 2 Weeks", "count": 40, "pct": 2.61, "avg_days": 10.9,
+         "avg_first_revenue": 154.70, "avg_second_revenue": 92.02, "avg_ltv": 277.84},
+        {"bucket": "3. Within 1 Month", "count": 78, "pct": 5.09, "avg_days": 22.6,
+         "avg_first_revenue": 120.61, "avg_second_revenue": 118.48, "avg_ltv": 272.28},
+        {"bucket": "4. Within 2 Months", "count": 129, "pct": 8.43, "avg_days": 45.5,
+         "avg_first_revenue": 122.68, "avg_second_revenue": 117.58, "avg_ltv": 279.96},
+        {"bucket": "5. Within 3 Months", "count": 144, "pct": 9.41, "avg_days": 75.0,
+         "avg_first_revenue": 110.22, "avg_second_revenue": 115.43, "avg_ltv": 269.08},
+        {"bucket": "6. 3+ Months", "count": 1093, "pct": 71.39, "avg_days": 299.3,
+         "avg_first_revenue": 127.70, "avg_second_revenue": 120.24, "avg_ltv": 275.30}
+    ])
+
+
+@dataset
+def load_conversion_speed(version):
+    # VIP의 첫구매이후 두번째 구매 전환 속도 분석
+    if query_executor() is not None:
+        return _live_query("conversion_speed", CONVERSION_SPEED_SQL)
+    if repurchase_histogram() is not None:
+        from thelook_analysis import repurchase
+
+        table = repurchase_table(repurchase.CONVERSION_SPEED_EDGES, repurchase.CONVERSION_SPEED_LABELS)
+        table = table.rename(columns={"bucket": "speed"})
+        return table[["speed", "count", "avg_days", "avg_sessions", "avg_product_views", "avg_ltv",
+                      "avg_m_score"]].round({"avg_days": 1, "avg_sessions": 1, "avg_product_views": 1,
+                                             "avg_ltv": 2, "avg_m_score": 2})
+    return pd.DataFrame([
+        {"speed": "1. Quick (≤30 days)", "count": 165, "avg_days": 14.4, "avg_sessions": 0.9,
+         "avg_product_views": 0.2, "avg_ltv": 282.50, "avg_m_score": 4.35},
+        {"speed": "2. Medium (31-60 days)", "count": 129, "avg_days": 45.5, "avg_sessions": 1.1,
+         "avg_product_views": 0.3, "avg_ltv": 279.96, "avg_m_score": 4.31},
+        {"speed": "3. Slow (61+ days)", "count": 1237, "avg_days": 273.2, "avg_sessions": 1.1,
+         "avg_product_views": 0.5, "avg_ltv": 274.58, "avg_m_score": 4.30}
+    ])
+
+
+@dataset
+def load_signup_to_purchase(version):
+    # 가입~첫 구매 타이밍별 분석
+    if rfm_cube() is not None:
+        return _cube_table("signup_table")
+    return pd.DataFrame([
+        {"timing": "1. 1주일 이내", "user_count": 307, "repurchase_rate": 26.06, "avg_monetary": 112.28,
+         "vip_rate": 10.42, "promising_high_rate": 12.05, "promising_low_rate": 18.89},
+        {"timing": "2. 1개월 이내", "user_count": 901, "repurchase_rate": 25.08, "avg_monetary": 116.92,
+         "vip_rate": 9.32, "promising_high_rate": 13.10, "promising_low_rate": 16.98},
+        {"timing": "3. 2개월 이내", "user_count": 1161, "repurchase_rate": 24.63, "avg_monetary": 110.41,
+         "vip_rate": 9.47, "promising_high_rate": 12.14, "promising_low_rate": 19.47},
+        {"timing": "4. 3개월 이내", "user_count": 1058, "repurchase_rate": 23.63, "avg_monetary": 113.97,
+         "vip_rate": 7.75, "promising_high_rate": 12.00, "promising_low_rate": 18.34},
+        {"timing": "5. 3개월+", "user_count": 26368, "repurchase_rate": 15.79, "avg_monetary": 101.45,
+         "vip_rate": 4.64, "promising_high_rate": 11.88, "promising_low_rate": 16.16}
+    ])
+
+
+@dataset
+def load_first_session_behavior(version):
+    # 첫 세션 행동 분석 (세그먼트별)
+    return pd.DataFrame([
+        {"segment": "VIP Champions", "avg_events": 6.64, "cart_usage_rate": 100.0,
+         "purchase_rate": 100.0, "avg_monetary": 275.88},
+        {"segment": "Promising High Value", "avg_events": 7.05, "cart_usage_rate": 100.0,
+         "purchase_rate": 99.16, "avg_monetary": 155.86},
+        {"segment": "Promising Low Value", "avg_events": 5.29, "cart_usage_rate": 99.94,
+         "purchase_rate": 99.94, "avg_monetary": 34.28},
+        {"segment": "Loyal High Value", "avg_events": 5.89, "cart_usage_rate": 99.85,
+         "purchase_rate": 100.0, "avg_monetary": 162.27},
+        {"segment": "At Risk", "avg_events": 6.07, "cart_usage_rate": 99.95,
+         "purchase_rate": 100.0, "avg_monetary": 85.36},
+        {"segment": "Hibernating", "avg_events": 6.05, "cart_usage_rate": 99.96,
+         "purchase_rate": 100.0, "avg_monetary": 86.39}
+    ])
+
+
+@dataset
+def load_category_data(version):
+    # 첫 구매 카테고리별 VIP 평균 LTV TOP 10
+    if rfm_cube() is not None:
+        return _cube_table("category_table")
+    return pd.DataFrame([
+        {"category": "Outerwear & Coats", "vip_count": 119, "avg_ltv": 324.79},
+        {"category": "Pants & Capris",    "vip_count": 28,  "avg_ltv": 322.57},
+        {"category": "Suits & Sport Coats","vip_count": 65,  "avg_ltv": 315.22},
+        {"category": "Jeans",             "vip_count": 135, "avg_ltv": 299.16},
+        {"category": "Dresses",           "vip_count": 45,  "avg_ltv": 290.68},
+        {"category": "Active",            "vip_count": 74,  "avg_ltv": 279.64},
+        {"category": "Sweaters",          "vip_count": 108, "avg_ltv": 270.90},
+        {"category": "Tops & Tees",       "vip_count": 88,  "avg_ltv": 269.06},
+        {"category": "Accessories",       "vip_count": 76,  "avg_ltv": 262.09},
+        {"category": "Intimates",         "vip_count": 87,  "avg_ltv": 253.46}
+    ]).sort_values('avg_ltv', ascending=True)
+
+
+@dataset
+def load_channel_category_ltv(version):
+    # 채널 x 카테고리별 Champions LTV TOP 10
+    if rfm_cube() is not None:
+        return _cube_table("channel_category_table")
+    return pd.DataFrame([
+        {"channel": "Facebook", "category": "Outerwear & Coats", "champion_count": 8,
+         "avg_ltv": 386.28, "avg_first_price": 243.98, "m_score_5_count": 6},
+        {"channel": "Organic", "category": "Tops & Tees", "champion_count": 13,
+         "avg_ltv": 383.50, "avg_first_price": 64.69, "m_score_5_count": 7},
+        {"channel": "Email", "category": "Outerwear & Coats", "champion_count": 5,
+         "avg_ltv": 374.74, "avg_first_price": 247.99, "m_score_5_count": 2},
+        {"channel": "Organic", "category": "Suits & Sport Coats", "champion_count": 15,
+         "avg_ltv": 369.20, "avg_first_price": 150.70, "m_score_5_count": 8},
+        {"channel": "Search", "category": "Pants & Capris", "champion_count": 13,
+         "avg_ltv": 361.10, "avg_first_price": 81.58, "m_score_5_count": 7}
+    ])
+
+
+# ============================================
+# 페이지 내 정적 테이블
+# ============================================
+
+@page_table
+def users_df():
+    return pd.DataFrame({
+        "주요 컬럼": ["id", "first_name", "email", "age", "gender", "state", "country", "traffic_source", "created_at"],
+        "설명": ["고객 고유 ID (PK)", "이름", "이메일", "나이", "성별", "주/지역", "국가", "유입 채널", "가입일시"]
+    })
+
+
+@page_table
+def orders_df():
+    return pd.DataFrame({
+        "주요 컬럼": ["order_id", "user_id", "status", "created_at", "returned_at", "num_of_item"],
+        "설명": ["주문 ID (PK)", "고객 ID (FK)", "주문 상태", "주문일시", "반품일시", "상품 수량"]
+    })
+
+
+@page_table
+def order_items_df():
+    return pd.DataFrame({
+        "주요 컬럼": ["id", "order_id", "user_id", "product_id", "sale_price", "status", "created_at"],
+        "설명": ["주문상세 ID (PK)", "주문 ID (FK)", "고객 ID (FK)", "상품 ID (FK)", "판매가격", "상태", "생성일시"]
+    })
+
+
+@page_table
+def products_df():
+    return pd.DataFrame({
+        "주요 컬럼": ["id", "cost", "category", "name", "brand", "retail_price", "department"],
+        "설명": ["상품 ID (PK)", "원가", "카테고리", "상품명", "브랜드", "소매가격", "부서(남/여)"]
+    })
+
+
+@page_table
+def inventory_df():
+    return pd.DataFrame({
+        "주요 컬럼": ["id", "product_id", "created_at", "cost", "product_category"],
+        "설명": ["재고 ID (PK)", "상품 ID (FK)", "입고일시", "원가", "상품 카테고리"]
+    })
+
+
+@page_table
+def events_df():
+    return pd.DataFrame({
+        "주요 컬럼": ["id", "user_id", "session_id", "created_at", "event_type", "traffic_source", "uri"],
+        "설명": ["이벤트 ID (PK)", "고객 ID (FK)", "세션 ID", "이벤트 발생일시", "이벤트 유형", "트래픽 소스", "페이지 URI"]
+    })
+
+
+@page_table
+def dc_df():
+    return pd.DataFrame({
+        "주요 컬럼": ["id", "name", "latitude", "longitude"],
+        "설명": ["물류센터 ID (PK)", "물류센터명", "위도", "경도"]
+    })
+
+
+@page_table
+def recency_df():
+    return pd.DataFrame({
+        "분위수": ["P10", "P25", "P50 (중앙값)", "P75", "P90", "P95"],
+        "일수": [40, 111, 259, 455, 610, 668]
+    })
+
+
+@page_table
+def frequency_df():
+    return pd.DataFrame({
+        "분위수": ["P10", "P25", "P50 (중앙값)", "P75", "P90", "P95"],
+        "횟수": [1, 1, 1, 1, 2, 2]
+    })
+
+
+@page_table
+def monetary_df():
+    return pd.DataFrame({
+        "분위수": ["P10", "P25", "P50 (중앙값)", "P75", "P90", "P95"],
+        "금액": ["$18.02", "$34.00", "$66.50", "$134.72", "$228.68", "$301.98"]
+    })
+
+
+@page_table
+def segment_criteria():
+    return pd.DataFrame({
+        "세그먼트": ["VIP", "Loyal High Value", "Loyal Low Value", "Promising High Value",
+                   "Promising Low Value", "Need Attention", "At Risk", "Hibernating", "Others"],
+        "R 조건": ["≥4", "≥3", "≥3", "≥4", "≥4", "≤2", "=3", "≤2", "기타"],
+        "F 조건": ["≥4", "≥4", "≥4", "=3", "=3", "≥4", "=3", "≤3", "기타"],
+        "M 조건": ["≥4", "≥3", "≤2", "≥3", "≤2", "≥3", "any", "any", "기타"],
+        "정의": [
+            "최근 방문 + 자주 구매 + 고액 지출",
+            "자주 구매 + 중~고액 지출",
+            "자주 구매하지만 객단가 낮음",
+            "최근 첫 구매 + 중~고액 지출",
+            "최근 첫 구매 + 저액 지출",
+            "과거 충성 고객이나 오래 미방문",
+            "중간 Recency + 1회 구매 (이탈 위험)",
+            "장기 미방문 + 1회 구매",
+            "기타 예외 조합"
+        ],
+        "전략": [
+            "유지 & 업셀링",
+            "VIP 승급 유도",
+            "객단가 상승 유도",
+            "2차 구매 유도 → VIP 전환",
+            "2차 구매 유도 + 업셀링",
+            "윈백 캠페인 우선순위 1",
+            "긴급 리텐션 필요",
+            "윈백 또는 자연 이탈 허용",
+            "개별 분석 필요"
+        ]
+    })
+
+
+@page_table
+def promising_no_activity():
+    return pd.DataFrame([
+        {"segment": "Promising High", "status": "구매 후 미방문", "count": 1643},
+        {"segment": "Promising High", "status": "재방문/탐색 중", "count": 1912},
+        {"segment": "Promising Low", "status": "구매 후 미방문", "count": 4275},
+        {"segment": "Promising Low", "status": "재방문/탐색 중", "count": 616}
+    ])
+
+
+@page_table
+def risk_data():
+    return pd.DataFrame([
+        {"category": "성장 동력", "segments": "VIP + Loyal + Promising", "count": 12590, "pct": 42.26},
+        {"category": "이탈 위험", "segments": "At Risk + Hibernating + Others", "count": 17205, "pct": 57.74}
+    ])
+
+
+@page_table
+def kpi_data():
+    return pd.DataFrame({
+        "KPI": ["Promising High 세션 활동 전환", "Promising Low 세션 활동 전환",
+                "Promising High 재구매 전환", "Promising Low 재구매 전환",
+                "VIP 비율", "평균 LTV"],
+        "현재": ["53.8% (활동)", "12.6% (활동)", "0% (1회 구매)", "0% (1회 구매)", "5.14%", "$102.82"],
+        "목표 (3개월)": ["60%", "18%", "15%", "10%", "6%", "$108"],
+        "목표 (6개월)": ["65%", "25%", "25%", "15%", "7%", "$115"],
+        "목표 (1년)": ["70%", "35%", "35%", "20%", "10%", "$130"],
+        "측정 주기": ["주간", "주간", "월간", "월간", "월간", "월간"]
+    })
+
+
+# ============================================
+# ROI 시뮬레이션 (thelook_analysis.roi)
+# ============================================
+
+def roi_simulation(means=None, cost_ratio=None):
+    """
+    Action Plan ROI 몬테카를로 시뮬레이션. means = {Phase key: {가정 이름: 평균}}, cost_ratio = 비용 비율 평균.
+    결과는 가정 값 조합별로 프로세스 내 메모이즈되어 세션 간에 공유됩니다.
+    """
+    from thelook_analysis import roi
+
+    cost = roi.COST_RATIO if cost_ratio is None else roi.COST_RATIO.with_mean(cost_ratio)
+    with instrumentation.span("data", "roi_simulation"):
+        return roi.simulate(roi.with_means(means or {}), cost)
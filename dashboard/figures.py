@@ -0,0 +1,187 @@
+"""
+Plotly Figure 캐시
+==================
+입력 DataFrame 이 rerun 사이에 바뀌지 않으면 `px.*` / `go.Figure` 를 다시 만들 필요가 없습니다.
+(입력 프레임 해시, 빌더 이름, 차트 스펙) 으로 만든 content-addressed 키에 직렬화된 Figure JSON 을
+저장하고, 적중하면 빌더를 호출하지 않고 그대로 돌려줍니다.
+
+- 메모리: LRU (기본 256개). 역직렬화된 Figure 도 함께 보관해 적중 시 JSON 파싱 비용까지 생략
+- 디스크(선택): THELOOK_FIGURE_CACHE_DIR 가 설정되면 `<key>.json` 으로 저장해 프로세스 재시작 후에도 재사용
+
+키에 입력 데이터가 들어가므로 데이터 버전이 바뀌면 자연히 새 키가 되고, 별도 무효화가 필요 없습니다.
+반환된 Figure 는 세션 간에 공유되므로 호출 측에서 수정하지 말고 빌더 안에서 완성해야 합니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import pandas as pd
+import plotly.io as pio
+import pyarrow as pa
+
+from dashboard import instrumentation
+
+FIGURE_CACHE_DIR_ENV = "THELOOK_FIGURE_CACHE_DIR"
+DEFAULT_MAX_ENTRIES = 256
+
+
+def frame_digest(frame):
+    """DataFrame 내용(값, 인덱스, 컬럼, dtype) 또는 pyarrow.Table 내용(스키마 포함) 의 sha256"""
+    digest = hashlib.sha256()
+    if isinstance(frame, pa.Table):
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, frame.schema) as writer:
+            writer.write_table(frame)
+        digest.update(sink.getvalue())
+        return digest.hexdigest()
+    digest.update(pd.util.hash_pandas_object(frame, index=True).values.tobytes())
+    digest.update(repr(list(frame.columns)).encode())
+    digest.update(repr([str(dtype) for dtype in frame.dtypes]).encode())
+    return digest.hexdigest()
+
+
+def figure_key(builder_name, frame, spec):
+    """(builder, frame, spec) → 캐시 키. spec 은 JSON 직렬화 가능해야 함"""
+    payload = json.dumps(spec, sort_keys=True, ensure_ascii=False, default=str)
+    digest = hashlib.sha256()
+    for part in (builder_name, frame_digest(frame), payload):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class FigureCache:
+    """Figure JSON 을 저장하는 LRU 캐시 (메모리 + 선택적 디스크)"""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, disk_dir=None):
+        self.max_entries = max_entries
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+        self._entries = OrderedDict()   # key → (json, Figure)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        """캐시된 Figure (없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+        payload = self._read_disk(key)
+        if payload is None:
+            return None
+        figure = pio.from_json(payload)
+        with self._lock:
+            self.disk_hits += 1
+            self._store(key, payload, figure)
+        return figure
+
+    def put(self, key, figure):
+        payload = pio.to_json(figure, validate=False)
+        with self._lock:
+            self._store(key, payload, figure)
+        self._write_disk(key, payload)
+        return figure
+
+    def get_or_build(self, key, build):
+        figure = self.get(key)
+        if figure is not None:
+            return figure
+        with self._lock:
+            self.misses += 1
+        return self.put(key, build())
+
+    def clear(self, disk=False):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.disk_hits = self.misses = 0
+        if disk and self.disk_dir is not None:
+            for path in self.disk_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+        }
+
+    def _store(self, key, payload, figure):
+        self._entries[key] = (payload, figure)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _read_disk(self, key):
+        if self.disk_dir is None:
+            return None
+        try:
+            return (self.disk_dir / f"{key}.json").read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def _write_disk(self, key, payload):
+        if self.disk_dir is None:
+            return
+        # 임시 파일에 쓴 뒤 rename 해서 동시에 읽는 프로세스가 잘린 JSON 을 보지 않도록 함
+        path = self.disk_dir / f"{key}.json"
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(payload, encoding="utf-8")
+        tmp.replace(path)
+
+
+_CACHE = FigureCache(disk_dir=os.environ.get(FIGURE_CACHE_DIR_ENV))
+
+
+def cache():
+    """프로세스 공용 FigureCache"""
+    return _CACHE
+
+
+def cached(builder, frame, **spec):
+    """
+    builder(frame, **spec) 결과를 캐시합니다. builder 는 모듈 수준 함수여야 하며
+    (이름이 키에 들어감) spec 외의 상태에 의존하지 않아야 합니다.
+    """
+    name = f"{builder.__module__}.{builder.__qualname__}"
+    with instrumentation.span("figure", spec.get("title") or builder.__name__) as attrs:
+        key = figure_key(name, frame, spec)
+        attrs["cache_hit"] = key in _CACHE
+        return _CACHE.get_or_build(key, lambda: builder(frame, **spec))
+
+
+def _express(frame, kind, traces=None, layout=None, **kwargs):
+    import plotly.express as px
+
+    fig = getattr(px, kind)(frame, **kwargs)
+    if traces:
+        fig.update_traces(**traces)
+    if layout:
+        fig.update_layout(**layout)
+    return fig
+
+
+def express(kind, frame, traces=None, layout=None, **kwargs):
+    """
+    `px.<kind>(frame, **kwargs)` + update_traces(**traces) + update_layout(**layout) 를 캐시합니다.
+
+        fig = figures.express('bar', df, x='a', y='b', layout=dict(height=400))
+    """
+    return cached(_express, frame, kind=kind, traces=traces, layout=layout, **kwargs)
@@ -0,0 +1,69 @@
+"""
+Arrow 기반 결과 표현
+====================
+segment / channel / category / activity_level / bucket / timing 같은 라벨 컬럼은 값 종류가 몇 개뿐인데
+행마다 Python 문자열로 들고 있으면 메모리와 직렬화(st.dataframe 의 Arrow 변환, st.cache_data 의 pickle)
+비용이 행 수에 비례해 커집니다.
+
+- 웨어하우스 결과는 Arrow 테이블로 받아 문자열 컬럼을 사전(dictionary) 인코딩한 채로 유지하고,
+  DataFrame 이 필요할 때는 pandas Categorical (코드 + 카테고리) 로 변환합니다. 숫자 컬럼은 복사 없이 numpy 로
+- 하드코딩 / 큐브 / 엔진에서 만든 DataFrame 은 `compact` 로 라벨 컬럼만 Categorical 로 바꿉니다
+- st.dataframe 과 figures 빌더는 pyarrow.Table 도 그대로 받습니다 (Arrow → Python 객체 왕복 없음)
+
+Categorical 의 카테고리는 사전순이라 정렬 결과는 문자열일 때와 같고, 행 순서는 그대로 유지됩니다.
+"""
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# 대시보드 데이터셋의 라벨 컬럼 (Categorical 로 보관)
+CATEGORICAL_COLUMNS = frozenset({
+    "segment", "channel", "category", "activity_level", "bucket", "timing", "speed",
+    "traffic_source", "first_purchase_category", "first_category", "signup_to_purchase",
+})
+
+
+def _is_string(arrow_type):
+    return pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type)
+
+
+def encode_strings(table):
+    """Arrow 테이블의 문자열 컬럼을 사전 인코딩 (이미 사전 타입이면 그대로)"""
+    columns = [
+        pc.dictionary_encode(column) if _is_string(column.type) else column
+        for column in table.columns
+    ]
+    return pa.Table.from_arrays(columns, names=table.column_names)
+
+
+def from_arrow(table):
+    """
+    Arrow 테이블 → DataFrame. 사전 인코딩된 문자열은 Categorical (카테고리는 사전순), 숫자는 numpy 로 변환됩니다.
+    (사전 컬럼은 청크마다 사전이 다를 수 있으므로 하나로 합친 뒤 변환)
+    """
+    frame = encode_strings(table).unify_dictionaries().to_pandas()
+    for name in frame.columns:
+        if isinstance(frame[name].dtype, pd.CategoricalDtype):
+            frame[name] = frame[name].cat.reorder_categories(sorted(frame[name].cat.categories))
+    return frame
+
+
+def compact(frame):
+    """DataFrame 의 라벨 컬럼(CATEGORICAL_COLUMNS) 을 Categorical 로. DataFrame 이 아니면 그대로 반환"""
+    if not isinstance(frame, pd.DataFrame):
+        return frame
+    labels = [
+        name for name in frame.columns
+        if name in CATEGORICAL_COLUMNS and not isinstance(frame[name].dtype, pd.CategoricalDtype)
+    ]
+    if not labels:
+        return frame
+    return frame.astype({name: "category" for name in labels})
+
+
+def to_arrow(frame):
+    """DataFrame → Arrow 테이블 (Categorical 은 사전 타입으로, 라벨 문자열은 사전 인코딩). Table 이면 그대로"""
+    if isinstance(frame, pa.Table):
+        return frame
+    return encode_strings(pa.Table.from_pandas(compact(frame), preserve_index=False))
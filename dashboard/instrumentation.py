@@ -0,0 +1,334 @@
+"""
+렌더링 계측 (instrumentation)
+============================
+페이지가 느릴 때 데이터 준비 / Figure 생성 / `st.plotly_chart`·`st.dataframe` 직렬화 중 어디가 원인인지
+구분하기 위해 구간별 소요 시간과 payload 크기를 기록합니다.
+
+- span(kind, name): 임의 구간 (데이터 로드, Figure 생성 등)
+- page(key): 페이지 블록 전체. 그 안에서 기록된 span 은 해당 페이지 실행(PageRun)에 모임
+- plotly_chart / dataframe: st.plotly_chart / st.dataframe 대체. 전송 크기(JSON / Arrow 바이트)도 기록
+
+활성화: 환경변수 THELOOK_INSTRUMENTATION=1 (또는 enable()).
+비활성 상태에서는 플래그 검사 한 번 후 원래 함수를 그대로 호출하므로 비용이 거의 없습니다.
+
+내보내기:
+- THELOOK_METRICS_JSONL=<path>: 기록마다 JSON 한 줄 append (파일은 한 번 열어 두고 line buffering)
+- THELOOK_METRICS_PORT=<port>: `GET /metrics` 로 Prometheus text format 제공 (프로세스당 1회 기동).
+  기본은 127.0.0.1 에만 바인딩하며, 외부 수집기가 직접 긁어야 하면 THELOOK_METRICS_HOST=0.0.0.0 등으로 지정
+- 사이드바 진단 패널(sidebar_panel)의 다운로드 버튼
+"""
+
+import contextlib
+import contextvars
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import streamlit as st
+
+ENABLED_ENV = "THELOOK_INSTRUMENTATION"
+JSONL_ENV = "THELOOK_METRICS_JSONL"
+PORT_ENV = "THELOOK_METRICS_PORT"
+HOST_ENV = "THELOOK_METRICS_HOST"
+DEFAULT_HOST = "127.0.0.1"
+
+# 최근 기록 보관 개수 (분위수 계산용). 누적 합계는 별도로 무기한 유지
+MAX_RECORDS = 10_000
+
+_enabled = os.environ.get(ENABLED_ENV, "").lower() in ("1", "true", "yes", "on")
+_lock = threading.Lock()
+_records = deque(maxlen=MAX_RECORDS)
+_totals = {}   # (kind, page, name) → [count, seconds, bytes]
+_jsonl_path = os.environ.get(JSONL_ENV)
+_sink = None   # (경로, 열린 파일). 경로가 바뀌면 다시 엶
+_sink_lock = threading.Lock()
+_server = None
+_current_run = contextvars.ContextVar("thelook_page_run", default=None)
+
+
+@dataclass
+class Record:
+    kind: str
+    name: str
+    page: str
+    duration_ms: float
+    bytes: int = None
+    ts: float = 0.0
+    attrs: dict = field(default_factory=dict)
+
+
+@dataclass
+class PageRun:
+    """한 번의 페이지 렌더링에서 기록된 span 목록"""
+
+    page: str
+    records: list = field(default_factory=list)
+    duration_ms: float = 0.0
+
+
+def enabled():
+    return _enabled
+
+
+def enable(jsonl_path=None, port=None):
+    """계측 활성화 (선택적으로 JSONL 파일 / Prometheus 포트 지정)"""
+    global _enabled, _jsonl_path
+    _enabled = True
+    if jsonl_path:
+        _jsonl_path = jsonl_path
+    port = port or os.environ.get(PORT_ENV)
+    if port:
+        serve_prometheus(int(port))
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def _emit(record):
+    run = _current_run.get()
+    if run is not None:
+        run.records.append(record)
+    key = (record.kind, record.page, record.name)
+    with _lock:
+        _records.append(record)
+        totals = _totals.setdefault(key, [0, 0.0, 0])
+        totals[0] += 1
+        totals[1] += record.duration_ms / 1000
+        totals[2] += record.bytes or 0
+    if _jsonl_path:
+        _write_jsonl(json.dumps(asdict(record), ensure_ascii=False) + "\n")
+
+
+def _write_jsonl(line):
+    # 집계용 _lock 밖에서 기록. 줄이 섞이지 않도록 파일 쓰기만 별도 lock 으로 직렬화
+    global _sink
+    with _sink_lock:
+        if _sink is None or _sink[0] != _jsonl_path:
+            if _sink is not None:
+                _sink[1].close()
+            _sink = (_jsonl_path, open(_jsonl_path, "a", encoding="utf-8", buffering=1))
+        _sink[1].write(line)
+
+
+def _current_page():
+    run = _current_run.get()
+    return run.page if run is not None else ""
+
+
+@contextlib.contextmanager
+def _span(kind, name, attrs):
+    started = time.perf_counter()
+    try:
+        yield attrs
+    finally:
+        _emit(Record(
+            kind=kind, name=name, page=_current_page(),
+            duration_ms=(time.perf_counter() - started) * 1000, ts=time.time(), attrs=attrs,
+        ))
+
+
+def span(kind, name, **attrs):
+    """
+    구간 계측 context manager. with 블록 안에서 yield 된 dict 에 값을 넣으면 attrs 로 기록됩니다.
+    비활성 상태에서는 아무것도 하지 않는 공용 context manager 를 반환합니다.
+    """
+    if not _enabled:
+        return contextlib.nullcontext({})
+    return _span(kind, name, attrs)
+
+
+@contextlib.contextmanager
+def _page(key):
+    run = PageRun(page=key)
+    token = _current_run.set(run)
+    started = time.perf_counter()
+    try:
+        yield run
+    finally:
+        run.duration_ms = (time.perf_counter() - started) * 1000
+        _current_run.reset(token)
+        _emit(Record(kind="page", name=key, page=key, duration_ms=run.duration_ms, ts=time.time()))
+
+
+def page(key):
+    """페이지 블록 계측. 활성 상태면 PageRun, 아니면 None 을 yield"""
+    if not _enabled:
+        return contextlib.nullcontext(None)
+    return _page(key)
+
+
+def _caller(depth=2):
+    """계측 함수를 호출한 페이지 코드 위치 (module:line)"""
+    frame = sys._getframe(depth)
+    return f"{frame.f_globals.get('__name__', '?').rsplit('.', 1)[-1]}:{frame.f_lineno}"
+
+
+def _figure_name(figure):
+    try:
+        title = figure.layout.title.text
+    except AttributeError:
+        title = None
+    return title or _caller(3)
+
+
+def _emit_call(kind, name, call, payload_size, attrs=None):
+    started = time.perf_counter()
+    result = call()
+    duration_ms = (time.perf_counter() - started) * 1000
+    # 크기 계산은 측정 구간 밖에서
+    _emit(Record(
+        kind=kind, name=name, page=_current_page(), duration_ms=duration_ms,
+        bytes=payload_size(), ts=time.time(), attrs=attrs or {},
+    ))
+    return result
+
+
+def plotly_chart(figure, **kwargs):
+    """st.plotly_chart + 계측 (payload = Streamlit 이 보내는 것과 같은 Figure JSON 바이트 수)"""
+    if not _enabled:
+        return st.plotly_chart(figure, **kwargs)
+    import plotly.io as pio
+
+    return _emit_call(
+        "chart", _figure_name(figure), lambda: st.plotly_chart(figure, **kwargs),
+        lambda: len(pio.to_json(figure, validate=False).encode()),
+    )
+
+
+def dataframe(data, **kwargs):
+    """st.dataframe + 계측 (payload = Arrow 테이블 바이트 수). data 는 DataFrame 또는 pyarrow.Table"""
+    if not _enabled:
+        return st.dataframe(data, **kwargs)
+    import pyarrow as pa
+
+    def payload_size():
+        table = data if isinstance(data, pa.Table) else pa.Table.from_pandas(data, preserve_index=False)
+        return table.nbytes
+
+    return _emit_call(
+        "table", _caller(), lambda: st.dataframe(data, **kwargs), payload_size, {"rows": len(data)},
+    )
+
+
+# ============================================
+# 조회 / 내보내기
+# ============================================
+
+def records():
+    with _lock:
+        return list(_records)
+
+
+def reset():
+    with _lock:
+        _records.clear()
+        _totals.clear()
+
+
+def to_jsonl(items=None):
+    return "".join(json.dumps(asdict(r), ensure_ascii=False) + "\n" for r in (items or records()))
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text():
+    """누적 합계를 Prometheus text exposition format 으로"""
+    with _lock:
+        totals = sorted(_totals.items())
+    lines = [
+        "# HELP thelook_render_seconds Duration of instrumented dashboard blocks.",
+        "# TYPE thelook_render_seconds summary",
+    ]
+    for (kind, page_key, name), (count, seconds, _) in totals:
+        labels = f'kind="{_label(kind)}",page="{_label(page_key)}",name="{_label(name)}"'
+        lines.append(f"thelook_render_seconds_count{{{labels}}} {count}")
+        lines.append(f"thelook_render_seconds_sum{{{labels}}} {seconds:.6f}")
+    lines += [
+        "# HELP thelook_payload_bytes_total Bytes serialized for charts and tables.",
+        "# TYPE thelook_payload_bytes_total counter",
+    ]
+    for (kind, page_key, name), (_, _, size) in totals:
+        if kind in ("chart", "table"):
+            labels = f'kind="{_label(kind)}",page="{_label(page_key)}",name="{_label(name)}"'
+            lines.append(f"thelook_payload_bytes_total{{{labels}}} {size}")
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = prometheus_text().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve_prometheus(port, host=None):
+    """
+    `GET /metrics` 엔드포인트를 데몬 스레드로 기동 (이미 떠 있으면 그대로 반환).
+    host 기본값은 THELOOK_METRICS_HOST, 없으면 127.0.0.1
+    """
+    global _server
+    host = host or os.environ.get(HOST_ENV, DEFAULT_HOST)
+    with _lock:
+        if _server is None:
+            _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            threading.Thread(target=_server.serve_forever, name="thelook-metrics", daemon=True).start()
+    return _server
+
+
+if _enabled and os.environ.get(PORT_ENV):
+    serve_prometheus(int(os.environ[PORT_ENV]))
+
+
+# ============================================
+# 사이드바 진단 패널
+# ============================================
+
+def _summary(items):
+    import pandas as pd
+
+    frame = pd.DataFrame([asdict(r) for r in items])
+    if frame.empty:
+        return frame
+    grouped = frame.groupby(["kind", "page", "name"])["duration_ms"]
+    return pd.DataFrame({
+        "count": grouped.size(),
+        "p50_ms": grouped.median().round(1),
+        "p95_ms": grouped.quantile(0.95).round(1),
+    }).reset_index().sort_values("p95_ms", ascending=False)
+
+
+def sidebar_panel(run):
+    """현재 페이지 실행의 span 목록과 프로세스 누적 요약 (계측 비활성 시 아무것도 하지 않음)"""
+    if run is None:
+        return
+    import pandas as pd
+
+    with st.sidebar.expander(f"⏱️ Diagnostics · {run.duration_ms:.0f}ms", expanded=False):
+        current = pd.DataFrame([
+            {"kind": r.kind, "name": r.name, "ms": round(r.duration_ms, 1),
+             "KB": None if r.bytes is None else round(r.bytes / 1024, 1)}
+            for r in run.records
+        ])
+        st.dataframe(current, hide_index=True, use_container_width=True)
+        st.caption("최근 기록 기준 p50 / p95")
+        st.dataframe(_summary(records()), hide_index=True, use_container_width=True)
+        st.download_button("JSON lines", to_jsonl(), file_name="thelook_metrics.jsonl")
+        st.download_button("Prometheus", prometheus_text(), file_name="thelook_metrics.prom")
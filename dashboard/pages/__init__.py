@@ -0,0 +1,32 @@
+"""
+페이지 레지스트리
+================
+사이드바 라벨 → 페이지 모듈 이름. 각 모듈은 `render()` 함수를 제공하며,
+선택된 페이지의 모듈만 import 되므로 해당 페이지의 데이터/무거운 의존성(plotly 등)도
+그 페이지가 처음 선택될 때만 로드됩니다.
+"""
+
+import importlib
+
+PAGES = {
+    "📁 데이터셋 소개": "dataset_intro",
+    "📋 Executive Summary": "executive",
+    "🔬 RFM 등급 기준 & 근거": "rfm_criteria",
+    "👥 세그먼트 현황 분석": "segments",
+    "⚠️ 문제 정의 & 인사이트": "problems",
+    "🎯 Promising 분석": "promising",
+    "👑 VIP 분석": "vip",
+    "📢 채널 & 카테고리 분석": "channel",
+    "🚀 Action Plan & ROI": "action"
+}
+
+
+def load(key):
+    """페이지 모듈 import (최초 1회만 실제 로드)"""
+    if key not in PAGES.values():
+        raise KeyError(f"등록되지 않은 페이지: {key}")
+    return importlib.import_module(f"{__name__}.{key}")
+
+
+def render(key):
+    load(key).render()
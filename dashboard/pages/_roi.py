@@ -0,0 +1,104 @@
+"""
+ROI 시뮬레이션 결과 표시 (Action Plan / 문제 정의 / Promising 페이지 공용)
+======================================================================
+data.roi_simulation() 결과를 카드 본문 HTML 과 요약 표로 만듭니다. 페이지 모듈이 아니므로 레지스트리에 없음.
+"""
+
+import pandas as pd
+import streamlit as st
+
+
+def box(simulation, key, title="💰 ROI 산출 근거", line_height=1.8):
+    """Phase 하나의 산출 근거 roi-box"""
+    st.markdown(f"""
+    <div class="roi-box">
+        <div class="roi-title">{title}</div>
+        <div style="color: #4b5563; line-height: {line_height}; font-size: 0.9rem;">
+            {breakdown_html(simulation, key)}
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+def _money(value):
+    return f"${value:,.0f}"
+
+
+def _interval(values, fmt, unit=""):
+    """(P10, P50, P90) → "중앙값 (P10 ~ P90)" """
+    low, mid, high = values
+    return f"{fmt(mid)}{unit} ({fmt(low)} ~ {fmt(high)}{unit})"
+
+
+def _metric(row, metric):
+    return [row[f"{metric}_p{p}"] for p in (10, 50, 90)]
+
+
+def _rate(mean):
+    return f"{mean * 100:g}%"
+
+
+def phase_table(simulation, key):
+    """Phase 하나의 전환 인원 / 매출 / ROI (값 = 중앙값 (P10 ~ P90))"""
+    phase = next(item for item in simulation.phases if item.key == key)
+    row = simulation.summary.loc[key]
+    counts = simulation.counts[key]
+    rows = [("대상", phase.target)]
+    for step in phase.steps:
+        if step.rate:
+            label = f"{step.label} ({_rate(phase.assumption(step.rate).dist.mean)})"
+            rows.append((label, _interval(counts.loc[step.name], "{:,.0f}".format, "명")))
+    rows += [
+        ("예상 추가 매출", _interval(_metric(row, "revenue"), _money)),
+        ("캠페인 비용", _money(row["cost_p50"])),
+        ("예상 순이익", _interval(_metric(row, "profit"), _money)),
+        ("예상 ROI", _interval(_metric(row, "roi"), "{:,.0f}".format, "%")),
+    ]
+    return pd.DataFrame(rows, columns=["지표", "값"])
+
+
+def breakdown_html(simulation, key):
+    """
+    Phase 하나의 산출 근거 (roi-box 본문 HTML). 단계별 인원은 중앙값, 객단가는 가정 평균이며
+    합계 / 비용 / 순이익 / ROI 는 시뮬레이션 분위수 (중앙값, 괄호는 P10 ~ P90)
+    """
+    phase = next(item for item in simulation.phases if item.key == key)
+    row = simulation.summary.loc[key]
+    counts = simulation.counts[key]
+    lines = []
+    for step in phase.steps:
+        value = phase.assumption(step.value).dist.mean if step.value else 0.0
+        if not step.base:
+            lines.append(f"• {step.label}: <b>{_money(value)}</b>")
+            continue
+        count = counts.loc[step.name, "p50"]
+        label = f"{step.label} ({_rate(phase.assumption(step.rate).dist.mean)})" if step.rate else step.label
+        lines.append(f"• {label}: {count:,.0f}명 × {_money(value)} = <b>{_money(count * value)}</b>")
+    lines += [
+        "",
+        f"<b>총 추가 매출: {_interval(_metric(row, 'revenue'), _money)}</b>",
+        f"<b>비용: {_money(row['cost_p50'])}</b>",
+        f"<b>순이익: {_interval(_metric(row, 'profit'), _money)}</b>",
+        f"<b>ROI: {_interval(_metric(row, 'roi'), '{:,.0f}'.format, '%')}</b>",
+    ]
+    return "<br>".join(lines)
+
+
+def summary_table(simulation):
+    """Phase 별 / 전체 매출 · 비용 · 순이익 · ROI (중앙값, 범위 = P10 ~ P90)"""
+    from thelook_analysis import roi
+
+    rows = []
+    for phase in simulation.phases + (None,):
+        row = simulation.summary.loc[phase.key if phase else roi.TOTAL]
+        rows.append({
+            "Phase": phase.label if phase else "Total",
+            "대상": phase.target if phase else "-",
+            "핵심 가정": " · ".join(f"{a.label} {_rate(a.dist.mean)}" for a in phase.rates) if phase else "-",
+            "예상 추가 매출": _interval(_metric(row, "revenue"), _money),
+            "캠페인 비용": _money(row["cost_p50"]),
+            "순이익": _interval(_metric(row, "profit"), _money),
+            "ROI": _interval(_metric(row, "roi"), "{:,.0f}".format, "%"),
+            "우선순위": phase.priority if phase else "-",
+        })
+    return pd.DataFrame(rows)
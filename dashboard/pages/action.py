@@ -0,0 +1,499 @@
+"""
+페이지 8: Action Plan & ROI
+"""
+
+import tempfile
+
+import streamlit as st
+
+from dashboard import data, instrumentation
+from dashboard.pages import _roi
+
+# 브라우저 다운로드 최대 행 수. download_button 은 완성된 파일을 서버 메모리에 올려 두므로
+# 이보다 큰 대상은 CLI 로 추출
+DOWNLOAD_MAX_ROWS = 1_000_000
+
+# 추출 파일을 이 크기까지는 메모리에, 넘으면 임시 파일에 기록
+SPOOL_BYTES = 32 * 1024 * 1024
+
+# 분석 기간 총매출 (ROI 요약의 매출 대비 비율 기준)
+CURRENT_REVENUE = 3_060_000
+
+
+def render():
+    from thelook_analysis import roi
+
+    st.markdown("""
+    <div class="main-header">
+        <h1>🚀 Action Plan & ROI</h1>
+        <p>세그먼트별 구체적 액션플랜 및 예상 수익/ROI 산출 (Promising High/Low 분리)</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # ROI 정의 설명
+    st.markdown("""
+    <div class="insight-box navy">
+        <div class="insight-title">📌 ROI 산출 방법론</div>
+        <div class="insight-text">
+            • <b>ROI (Return on Investment)</b> = (순이익 / 캠페인 비용) × 100<br>
+            • <b>순이익</b> = 예상 추가 매출 - 캠페인 비용<br>
+            • <b>캠페인 비용</b>: 이메일 발송, 할인 쿠폰, 마케팅 인력, 시스템 비용 등 (예상 매출의 약 20% 가정)
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # 전체 수익 & ROI 요약
+    st.subheader("💰 전체 예상 수익 & ROI 요약")
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    # 가정 평균값 기준 시뮬레이션 중앙값 (아래 Phase별 산출 근거 / ROI 요약과 같은 결과)
+    simulation = data.roi_simulation()
+    total = simulation.summary.loc[roi.TOTAL]
+
+    with col1:
+        st.markdown(f"""
+        <div class="metric-card green">
+            <div class="metric-value">${total["revenue_p50"]:,.0f}</div>
+            <div class="metric-label">예상 총 추가 매출</div>
+            <div class="metric-delta delta-positive">현 매출 대비 +{total["revenue_p50"] / CURRENT_REVENUE:.1%}</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(f"""
+        <div class="metric-card orange">
+            <div class="metric-value">${total["cost_p50"]:,.0f}</div>
+            <div class="metric-label">예상 캠페인 비용</div>
+            <div class="metric-delta">계획 매출의 {roi.COST_RATIO.dist.mean:.0%}</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown(f"""
+        <div class="metric-card blue">
+            <div class="metric-value">${total["profit_p50"]:,.0f}</div>
+            <div class="metric-label">예상 순이익</div>
+            <div class="metric-delta">매출 - 비용</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col4:
+        st.markdown(f"""
+        <div class="metric-card purple">
+            <div class="metric-value">{total["roi_p50"]:,.0f}%</div>
+            <div class="metric-label">예상 ROI</div>
+            <div class="metric-delta">순이익/비용×100</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+
+    # 핵심 전략 강조
+    st.markdown("""
+    <div class="insight-box navy">
+        <div class="insight-title">⚠️ 핵심 발견: Promising 고객은 모두 구매 횟수 1회 + 세션 활동에 따라 LTV 차이</div>
+        <div class="insight-text">
+            • Promising High/Low 모두 <b>구매 횟수 = 1회</b> (아직 재구매 발생 X)<br>
+            • 구매 1회인데 <b>세션 활동이 많은 고객의 첫 구매 객단가가 더 높음</b><br>
+            • <b>→ 전략: 세션 활동 유도 → 더 많은 탐색 → 재구매 시 높은 객단가 → VIP 전환</b>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+# -------------------------------------------------------------------------
+# [수정됨] ROI 산출 근거 - ROAS와 ROI의 관계 명확화
+# -------------------------------------------------------------------------
+    with st.expander("📌 ROI 비용 설정(20%) 근거 및 업계 벤치마크 확인하기"):
+        st.markdown("""
+        <div style="background-color: #f8f9fa; padding: 15px; border-radius: 5px; font-size: 0.9rem; color: #333;">
+            <h4 style="margin-top: 0; font-size: 1rem; color: #333;">1. ROAS vs ROI 관점 적용</h4>
+            <ul style="margin-bottom: 15px;">
+                <li><b>일반적 ROAS (광고 효율):</b> 보통 패션 커머스의 목표 ROAS는 500% (광고비가 매출의 20%) 수준입니다.</li>
+                <li><b>본 리포트의 ROI 접근:</b> CRM 캠페인은 매체비는 적게 들지만 <b>'할인 쿠폰(판촉비)'</b> 비중이 큽니다.</li>
+                <li><b>결론:</b> 보수적인 수익성 검토를 위해, 일반적인 광고비 비중(20%)을 <b>'캠페인 총 비용(할인+발송비)' 한도(Budget Cap)</b>로 설정하여 계산했습니다.</li>
+            </ul>
+            <h4 style="margin-top: 0; font-size: 1rem; color: #333;">2. 비용 구조 상세 (Cost Breakdown)</h4>
+            <p style="margin-bottom: 10px;">
+                매출의 <b>20%</b>를 캠페인 예산으로 설정한 세부 내역입니다.
+            </p>
+            <ul>
+                <li><b>판촉비 (Incentive, ~15%):</b> 재구매 유도를 위한 할인 쿠폰 및 혜택 비용 (가장 큰 비중)</li>
+                <li><b>운영비 (Operation, ~5%):</b> 문자/알림톡 발송비 및 콘텐츠 제작 인건비</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    # Phase 1-A: Promising High Value
+    st.markdown("### 🔴 Phase 1-A: Promising High Value 리텐션 (구매 1회 → 세션 유도 → 재구매)")
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.markdown("""
+        <div class="action-box">
+            <div style="font-weight: 700; font-size: 1.1rem; margin-bottom: 1rem;">🟣 대상: Promising High 미활동 고객 1,643명 (구매 횟수 = 1회)</div>
+            <b>현황:</b><br>
+            • 총 Promising High: 3,555명 (<b>모두 구매 1회</b>)<br>
+            • 미활동률: 46.22% (1,643명 세션 활동 없음)<br>
+            • 미활동 LTV: $131.06 vs 활동(4-5 Sessions) LTV: $244.25 (<b>+86%</b>)<br><br>
+            <b>전략: 세션 활동 유도 → 재구매 시 높은 객단가</b><br>
+            • <b>D+1:</b> "구매하신 상품과 어울리는 아이템" 이메일 (사이트 방문 유도)<br>
+            • <b>D+3:</b> "나만의 스타일 큐레이션" 개인화 추천 (브라우징 유도)<br>
+            • <b>D+7:</b> 신상품 프리뷰 + VIP 전용 얼리 액세스 (세션 증가 유도)<br>
+            • <b>D+14:</b> "VIP까지 1회 남았습니다" + 고가 상품 20% 할인 (재구매 전환)<br>
+            • <b>D+30:</b> 최종 VIP 승급 기회 + 무료배송<br><br>
+            <b>목표:</b><br>
+            • 세션 활동 전환: 미활동 1,643명 중 30% → 493명 세션 활동<br>
+            • 재구매 전환: 세션 활동 493명 중 50% → 247명 재구매
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        _roi.box(simulation, "promising_high", "💰 수익 & ROI 산출")
+
+    # Phase 1-A 수치 근거
+    with st.expander("📌 Phase 1-A 수치 근거"):
+        st.markdown("""
+        <div class="insight-box navy" style="margin-top: 1rem;">
+            <div class="insight-title">📊 Phase 1-A 수치 근거 (데이터 출처)</div>
+            <div class="insight-text" style="font-size: 0.85rem;">
+                <b>🔢 전환율 가정:</b><br>
+                • <b>세션 활동 전환 30%:</b> 현재 Promising High 활동률 53.8% (1,912/3,555) 대비 보수적 가정. 이메일 오픈율 업계 평균 20-25%, 클릭율 2-5% 감안 시 5회 터치포인트로 30% 달성 가능<br>
+                • <b>재구매 전환 50%:</b> 현재 데이터에서 세션 활동 고객의 재구매 의향이 높음. Facebook 채널 VIP 비율 17.8% 대비 세션 활동+쿠폰 제공 시 50% 보수적 가정<br><br>
+                <b>💵 객단가 근거 (데이터 분석 결과):</b><br>
+                • <b>$176:</b> Promising High 2-3 Sessions 고객의 평균 LTV $176.89에서 도출<br>
+                • <b>$275 (VIP 객단가):</b> VIP 평균 LTV $277.56에서 도출<br>
+                • <b>$120 (3차 구매):</b> 평균 재구매 객단가 (VIP $275의 약 44%, 객단가 하락 반영)<br><br>
+                <b>📈 VIP 전환 목표 20% 근거:</b><br>
+                • Outerwear & Coats 카테고리 VIP 비율 22.5%, Suits 25.0% 데이터 기반<br>
+                • 고가 상품 구매 유도 시 20% 전환 현실적 목표
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # Phase 1-B: Promising Low Value
+    st.markdown("### 🔴 Phase 1-B: Promising Low Value 리텐션 (구매 1회 → 세션 유도 → 업셀링)")
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.markdown("""
+        <div class="action-box">
+            <div style="font-weight: 700; font-size: 1.1rem; margin-bottom: 1rem;">🟠 대상: Promising Low 미활동 고객 4,275명 (구매 횟수 = 1회)</div>
+            <b>현황:</b><br>
+            • 총 Promising Low: 4,891명 (<b>모두 구매 1회</b>)<br>
+            • 미활동률: <b>87.41%</b> (4,275명 세션 활동 없음) - 심각<br>
+            • 미활동 LTV: $32.59 vs 활동(2-3 Sessions) LTV: $47.18 (<b>+45%</b>)<br><br>
+            <b>전략: 세션 활동 유도 → 업셀링 → 재구매</b><br>
+            • <b>D+1:</b> "이 상품을 본 고객이 함께 구매한 아이템" (사이트 방문 유도)<br>
+            • <b>D+3:</b> 베스트셀러 큐레이션 + "무료배송까지 $XX" (브라우징 유도)<br>
+            • <b>D+7:</b> 번들/세트 상품 30% 할인 (업셀링 + 세션 유도)<br>
+            • <b>D+14:</b> 리뷰 하이라이트 + 한정 시간 15% 쿠폰 (재구매 전환)<br>
+            • <b>D+30:</b> 최종 25% 할인 + 제한 시간 오퍼<br><br>
+            <b>목표:</b><br>
+            • 세션 활동 전환: 미활동 4,275명 중 20% → 855명 세션 활동<br>
+            • 재구매 전환: 세션 활동 855명 중 35% → 299명 재구매
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        _roi.box(simulation, "promising_low", "💰 수익 & ROI 산출")
+
+    # Phase 1-B 수치 근거
+    with st.expander("📌 Phase 1-B 수치 근거"):
+        st.markdown("""
+        <div class="insight-box navy" style="margin-top: 1rem;">
+            <div class="insight-title">📊 Phase 1-B 수치 근거 (데이터 출처)</div>
+            <div class="insight-text" style="font-size: 0.85rem;">
+                <b>🔢 전환율 가정:</b><br>
+                • <b>세션 활동 전환 20%:</b> Promising Low 현재 활동률 12.6% (616/4,891)로 매우 낮음. High 대비 보수적으로 20% 설정 (현 활동률 대비 +7.4%p)<br>
+                • <b>재구매 전환 35%:</b> Low 세그먼트는 객단가가 낮아 재구매 허들도 낮음. 단, 업셀링 없이는 수익성 제한. High 50% 대비 보수적 설정<br><br>
+                <b>💵 객단가 근거 (데이터 분석 결과):</b><br>
+                • <b>$47:</b> Promising Low 2-3 Sessions 고객의 평균 LTV $47.18에서 도출<br>
+                • <b>$80 (업셀링):</b> Low→High 업셀링 시 예상 객단가. Promising High 미활동 LTV $131의 약 61%<br>
+                • <b>$180 (VIP 객단가):</b> VIP LTV $277 대비 Low 출신 VIP는 약 65% 수준으로 보수적 가정<br>
+                • <b>$50 (3차 구매):</b> Low 세그먼트 평균 객단가 수준 유지 가정<br><br>
+                <b>📈 업셀링/VIP 전환율 근거:</b><br>
+                • <b>업셀링 30%:</b> 번들/세트 할인 30% 제공 시 업셀링 성공률. 업계 평균 번들 구매율 25-35%<br>
+                • <b>VIP 전환 10%:</b> Low 세그먼트의 낮은 객단가 특성상 High 20% 대비 절반 수준으로 보수적 가정
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # Phase 2: VIP 유지
+    st.markdown("### 🟡 Phase 2: VIP 유지 & 강화")
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.markdown("""
+        <div class="action-box">
+            <div style="font-weight: 700; font-size: 1.1rem; margin-bottom: 1rem;">🎯 대상: VIP 1,531명</div>
+            <b>구체적 액션:</b><br>
+            • <b>VIP 전용 멤버십 프로그램:</b> 포인트 적립, 전용 할인, 얼리 액세스<br>
+            • <b>개인화 리마인더:</b> 구매 주기 기반 자동 알림 (보충형 상품)<br>
+            • <b>계절별 큐레이션:</b> 과거 구매 이력 기반 신상품 추천<br>
+            • <b>VIP 전용 이벤트:</b> 프리뷰 세일, 한정판 상품 우선 접근<br><br>
+            <b>재구매 주기 단축 전략:</b><br>
+            • 현재 71.4%가 3개월+ 후 재구매<br>
+            • 목표: 3개월 이내 재구매 비율 28.6% → 50%로 상향<br>
+            • 30일 내 재구매 시 추가 10% 할인 인센티브
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        _roi.box(simulation, "vip")
+
+    # Phase 2 수치 근거
+    with st.expander("📌 Phase 2 수치 근거"):
+        st.markdown("""
+        <div class="insight-box navy" style="margin-top: 1rem;">
+            <div class="insight-title">📊 Phase 2 수치 근거 (데이터 출처)</div>
+            <div class="insight-text" style="font-size: 0.85rem;">
+                <b>🔢 재구매 주기 데이터 (VIP 분석 결과):</b><br>
+                • <b>현재 3개월 이내 재구매: 28.6% (438명)</b> - VIP 재구매 타이밍 분석에서 도출<br>
+                • <b>목표 50% (765명):</b> 업계 우수 VIP 재구매율 45-55% 벤치마크. 추가 327명 = 현재 대비 +74.7%<br><br>
+                <b>💵 객단가 근거 (데이터 분석 결과):</b><br>
+                • <b>$28 LTV 증가분:</b> 1주일 내 재구매 VIP LTV $303.42 vs 3개월+ 재구매 VIP LTV $275.30. 차이 $28.12<br>
+                • <b>$140 재구매 객단가:</b> VIP 평균 LTV $277.56의 약 50% (재구매 시 객단가 하락 반영)<br>
+                • <b>$160 이탈 방지 효과:</b> VIP 이탈 시 손실 LTV. 평균 LTV $277의 약 58% (잔존 가치)<br><br>
+                <b>📈 이탈 방지율 10% 근거:</b><br>
+                • VIP 1,531명 중 At Risk 전환 위험군 추정 15% (약 230명)<br>
+                • 리텐션 캠페인으로 이 중 66% (153명) 이탈 방지 가정. 업계 VIP 이탈 방지 성공률 60-70%
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # Phase 3: Winback
+    st.markdown("### 🟠 Phase 3: Winback 캠페인")
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.markdown("""
+        <div class="action-box">
+            <div style="font-weight: 700; font-size: 1.1rem; margin-bottom: 1rem;">🎯 대상: At Risk + Hibernating 16,344명</div>
+            <b>세그먼트별 차별화 전략:</b><br><br>
+            <b>Need Attention (730명) - 긴급 윈백:</b><br>
+            • 과거 VIP/Loyal 고객 → 높은 복귀 가치<br>
+            • 20% 할인 + 무료배송 + "VIP 복귀 환영" 메시지<br><br>
+            <b>At Risk (6,637명) - 리마인더 캠페인:</b><br>
+            • "우리가 보고 싶어요" 감성 접근<br>
+            • 15% 할인 쿠폰 + 신상품 하이라이트<br><br>
+            <b>Hibernating (9,707명) - 최후 시도:</b><br>
+            • 파격 오퍼 (25% 할인) 1회 발송<br>
+            • 미반응 시 자연 이탈 허용
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        _roi.box(simulation, "winback")
+
+    # Phase 3 수치 근거
+    with st.expander("📌 Phase 3 수치 근거"):
+        st.markdown("""
+        <div class="insight-box navy" style="margin-top: 1rem;">
+            <div class="insight-title">📊 Phase 3 수치 근거 (데이터 출처)</div>
+            <div class="insight-text" style="font-size: 0.85rem;">
+                <b>🔢 복귀율 가정 (보수적 - 업계 벤치마크):</b><br>
+                • <b>Need Attention 10%:</b> 최근 이탈 고객으로 복귀 가능성 높음. 업계 윈백 캠페인 성공률 8-15%<br>
+                • <b>At Risk 5%:</b> 중기 이탈 고객. 업계 평균 3-7%. 할인 쿠폰+감성 접근으로 5% 가정<br>
+                • <b>Hibernating 2%:</b> 장기 이탈 고객으로 복귀 확률 매우 낮음. 업계 1-3%. 파격 할인으로 2%<br><br>
+                <b>💵 객단가 근거 (세그먼트별 LTV 분석):</b><br>
+                • <b>$180 (Need Attention):</b> 과거 VIP/Loyal 출신. 복귀 시 높은 객단가 유지. VIP LTV $277의 65%<br>
+                • <b>$85 (At Risk):</b> At Risk 평균 LTV $80.26에서 도출. 복귀 시 소폭 상승 가정<br>
+                • <b>$70 (Hibernating):</b> Hibernating 평균 LTV $73.11에서 도출<br>
+                • <b>$65 (2차 구매):</b> 복귀 고객의 2차 구매 시 객단가 하락 반영 (평균의 약 75%)<br><br>
+                <b>📈 세그먼트 인원 (데이터 분석 결과):</b><br>
+                • Need Attention: 730명 × 10% = 73명 / At Risk: 6,637명 × 5% = 332명 / Hibernating: 9,707명 × 2% = 194명
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # Phase 4: 채널 최적화
+    st.markdown("### 🟢 Phase 4: 채널 최적화")
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.markdown("""
+        <div class="action-box">
+            <div style="font-weight: 700; font-size: 1.1rem; margin-bottom: 1rem;">🎯 대상: 전 채널 마케팅 예산</div>
+            <b>채널 예산 재배분:</b><br>
+            • <b>Facebook:</b> 예산 20% 증액 (VIP 비율 17.8% 최고)<br>
+            • <b>Display:</b> 예산 15% 감축 (VIP 비율 12.8% 최저)<br>
+            • <b>Organic:</b> SEO/콘텐츠 투자 강화 (VIP LTV $295 최고)<br><br>
+            <b>카테고리 타겟팅 최적화:</b><br>
+            • 고가 카테고리 (Outerwear, Suits, Blazers) 광고 비중 확대<br>
+            • Promising High에게 고가 카테고리 추천<br>
+            • Promising Low에게 번들로 고가 카테고리 접근 유도
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        _roi.box(simulation, "channel")
+
+    # Phase 4 수치 근거
+    with st.expander("📌 Phase 4 수치 근거"):
+        st.markdown("""
+        <div class="insight-box navy" style="margin-top: 1rem;">
+            <div class="insight-title">📊 Phase 4 수치 근거 (데이터 출처)</div>
+            <div class="insight-text" style="font-size: 0.85rem;">
+                <b>🔢 채널 효율 데이터 (채널별 VIP 비율 분석):</b><br>
+                • <b>Facebook VIP 비율 17.8%:</b> 채널별 분석 결과 최고 효율. Display 12.8% 대비 +5%p<br>
+                • <b>Organic VIP LTV $295.01:</b> 채널별 VIP LTV 분석 결과 최고. Facebook VIP LTV $276 대비 +7%<br>
+                • <b>효율 10% 개선:</b> Facebook 예산 증액 + Display 감축으로 평균 VIP 비율 개선 보수적 가정<br><br>
+                <b>💵 추가 VIP 156명 산출 근거:</b><br>
+                • 월 예산 $50,000 × 12개월 = 연간 $600,000 마케팅 비용<br>
+                • 현재 VIP 비율 가중평균 약 14% → 15.4%로 +10% 개선 시<br>
+                • 현재 연간 VIP 획득 약 1,560명 → +10% = 추가 156명<br>
+                • <b>$275:</b> VIP 평균 LTV $277.56에서 도출<br><br>
+                <b>📈 CAC 절감 $15,000 근거:</b><br>
+                • Display 예산 15% 감축 = 연간 약 $9,000 절감<br>
+                • 저효율 채널 비용 절감 + Organic 강화로 추가 $6,000 절감 효과<br>
+                • 총 $15,000 = 순수 비용 절감 (추가 수익 아닌 비용 감소)
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+
+    _roi_simulator()
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+
+    # KPI 모니터링
+    st.subheader("📊 KPI 모니터링 대시보드 (세션 활동 + 재구매 전환)")
+
+    kpi_data = data.load_table("kpi_data")
+    instrumentation.dataframe(kpi_data, hide_index=True, use_container_width=True)
+
+    st.markdown("""
+    <div class="insight-box navy">
+        <div class="insight-title">📌 실행 로드맵 (세션 활동 유도 전략)</div>
+        <div class="insight-text">
+            <b>Month 1:</b> Phase 1 세션 활동 유도 캠페인 론칭, 이메일/푸시 A/B 테스트 시작<br>
+            <b>Month 2:</b> 세션 활동 전환율 분석, 재구매 전환 캠페인 강화<br>
+            <b>Month 3:</b> Phase 2 VIP 프로그램 론칭, Phase 3 Winback 준비<br>
+            <b>Month 4-6:</b> 전 Phase 병행 운영, 세션→재구매→VIP 퍼널 최적화<br>
+            <b>Month 6:</b> 전체 성과 리뷰, 세션 활동 기반 ROI 검증, 2차 전략 수립
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    _audience_export(data.rfm_store())
+
+
+def _percent_slider(assumption, key, high=95.0):
+    return st.slider(
+        assumption.label, 0.5, high, round(assumption.dist.mean * 100, 1), step=0.5, format="%.1f%%", key=key,
+    ) / 100
+
+
+@st.fragment
+def _roi_simulator():
+    # 가정 슬라이더 조작 시 이 블록만 rerun (가정 조합별 결과는 프로세스 내 메모이즈)
+    from thelook_analysis import roi
+
+    st.subheader("📈 Phase별 수익 & ROI 요약 (세션 활동 유도 전략)")
+    st.caption(
+        f"Phase마다 {roi.DEFAULT_SCENARIOS:,}개 시나리오 몬테카를로 시뮬레이션 · 전환율은 Beta, 객단가는 Gamma 분포 · "
+        "값 = 중앙값 (P10 ~ P90) · 예산 = 가정 평균 기준 계획 매출 × 비용 비율"
+    )
+
+    with st.expander("🎛️ 가정 조정"):
+        cost_ratio = _percent_slider(roi.COST_RATIO, "roi_cost_ratio", high=50.0)
+        means = {}
+        for tab, phase in zip(st.tabs([phase.label for phase in roi.PHASES]), roi.PHASES):
+            with tab:
+                means[phase.key] = {
+                    assumption.name: _percent_slider(assumption, f"roi_{phase.key}_{assumption.name}")
+                    for assumption in phase.rates
+                }
+
+    simulation = data.roi_simulation(means, cost_ratio)
+    instrumentation.dataframe(_roi.summary_table(simulation), hide_index=True, use_container_width=True)
+
+    total = simulation.summary.loc[roi.TOTAL]
+    st.markdown(f"""
+    <div class="insight-box success">
+        <div class="insight-title">💰 ROI 산출 요약</div>
+        <div class="insight-text">
+            <b>📊 전체 수익 요약 (중앙값, 괄호는 P10 ~ P90):</b><br>
+            • 예상 총 추가 매출: <b>${total["revenue_p50"]:,.0f}</b> (${total["revenue_p10"]:,.0f} ~ ${total["revenue_p90"]:,.0f}, 현 매출 $3.06M 대비 +{total["revenue_p50"] / CURRENT_REVENUE:.1%})<br>
+            • 예상 캠페인 비용: <b>${total["cost_p50"]:,.0f}</b> (계획 매출 ${total["planned_revenue"]:,.0f}의 {cost_ratio:.1%})<br>
+            • 예상 순이익: <b>${total["profit_p50"]:,.0f}</b> (${total["profit_p10"]:,.0f} ~ ${total["profit_p90"]:,.0f})<br>
+            • <b>ROI = {total["roi_p50"]:,.0f}%</b> ({total["roi_p10"]:,.0f}% ~ {total["roi_p90"]:,.0f}%) · 손실 확률 {total["loss_probability"]:.1%}<br><br>
+            <b>🔑 핵심 발견 기반 전략:</b><br>
+            • Promising 고객은 모두 <b>구매 횟수 1회</b>인데, 세션 활동에 따라 LTV가 다름<br>
+            • <b>세션 활동 유도 → 더 많은 탐색 → 재구매 시 높은 객단가 → VIP 전환</b>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+def _export_file(store, audience, fmt, data_dir):
+    """download_button 콜백: 클릭 시 별도 스레드에서 배치 단위로 기록한 파일 객체를 반환"""
+    from thelook_analysis import export
+
+    def build():
+        with instrumentation.span("data", f"export.{audience}", format=fmt):
+            sink = tempfile.SpooledTemporaryFile(max_size=SPOOL_BYTES)
+            export.write(export.iter_audience(store, audience, data_dir), sink, fmt)
+            sink.seek(0)
+            return sink
+    return build
+
+
+@st.fragment
+def _audience_export(store):
+    if store is None:
+        return
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    st.subheader("📤 캠페인 대상 추출")
+
+    from thelook_analysis import export
+
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        audience = st.selectbox(
+            "대상 고객군", list(export.AUDIENCES), format_func=lambda name: export.AUDIENCES[name]["label"],
+            key="export_audience",
+        )
+    with col2:
+        fmt = st.selectbox("형식", export.FORMATS, key="export_format")
+
+    rows = export.count(store, audience)
+    data_dir = data.local_data_dir()
+    st.caption(
+        f"{rows:,}명 · user_id, email, segment, R/F/M 점수, 마지막 주문일, 구매 후 세션 수"
+        + ("" if data_dir else " (THELOOK_DATA_DIR 가 없어 email 은 비어 있음)")
+    )
+
+    if rows > DOWNLOAD_MAX_ROWS:
+        st.warning(f"{DOWNLOAD_MAX_ROWS:,}명을 넘는 대상은 서버 메모리 보호를 위해 CLI 로 추출하세요.")
+        st.code(
+            f"python -m thelook_analysis.export --store {store.path} --audience {audience} "
+            + (f"--data-dir {data_dir} " if data_dir else "")
+            + f"--out {audience}.{fmt}",
+            language="bash",
+        )
+        return
+
+    st.download_button(
+        "⬇️ 다운로드",
+        data=_export_file(store, audience, fmt, data_dir),
+        file_name=f"{audience}.{fmt}",
+        mime="text/csv" if fmt == "csv" else "application/octet-stream",
+        disabled=rows == 0,
+        key="export_download",
+    )
@@ -0,0 +1,201 @@
+"""
+페이지 7: 채널 & 카테고리 분석
+"""
+
+import streamlit as st
+
+from dashboard import data, figures, instrumentation
+
+# 히트맵 지표: (라벨, 색상 축 라벨, 셀 표시 형식)
+COHORT_METRICS = {
+    "retention_pct": ("리텐션 (%)", "활성 유저 비율 (%)", ".1f"),
+    "revenue_per_user": ("코호트 유저당 매출 ($)", "유저당 매출 ($)", ".2f"),
+    "active_users": ("활성 유저 수", "활성 유저 (명)", ",.0f"),
+}
+
+ALL_CHANNELS = "전체"
+
+
+def render():
+    channel_data, category_data = data.load_all(data.load_channel_data, data.load_category_data)
+
+    st.markdown("""
+    <div class="main-header">
+        <h1>📢 채널 & 카테고리 분석</h1>
+        <p>활성 고객(Recency 180일 이내)의 가입시 유입 채널별 품질 및 첫구매 카테고리 분석</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # -------------------------------------------------------------------------
+    # 1. 채널 분석 데이터
+    # -------------------------------------------------------------------------
+
+
+    # -------------------------------------------------------------------------
+    # 1-1. 채널별 VIP 비중 시각화
+    # -------------------------------------------------------------------------
+    st.subheader("📊 가입시 유입 채널별 활성 고객 내 VIP 비중")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # VIP 비중 차트
+        fig = figures.express(
+            'bar',
+            channel_data,
+            x='vip_maturity_rate',
+            y='channel',
+            orientation='h',
+            color='vip_maturity_rate',
+            color_continuous_scale='Greens',
+            title='활성 고객 중 VIP가 된 비율 (%)',
+            labels={'vip_maturity_rate': 'VIP 비중 (%)', 'channel': '유입 채널'},
+            text_auto='.1f',
+            layout=dict(height=400),
+        )
+        instrumentation.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        # Promising 구성비
+        fig = figures.express(
+            'bar',
+            channel_data,
+            x='channel',
+            y=['promising_high', 'promising_low'],
+            barmode='stack',
+            title='채널별 잠재 고객(Promising) 구성비',
+            labels={'value': '비중 (%)', 'channel': '채널', 'variable': '세그먼트'},
+            color_discrete_map={'promising_high': '#8b5cf6', 'promising_low': '#f97316'},
+            layout=dict(height=400, legend_title_text='세그먼트'),
+        )
+        instrumentation.plotly_chart(fig, use_container_width=True)
+
+    # 채널 인사이트 (수정됨)
+    st.markdown("""
+    <div class="insight-box success">
+        <div class="insight-title">✅ Facebook: "고객 성숙도"가 가장 높은 채널</div>
+        <div class="insight-text">
+            • <b>VIP 비중 1위 (17.8%):</b> 최근 구매한 활성 고객 중 VIP로 안착한 비율이 가장 높음.<br>
+            • <b>의미:</b> Facebook을 통해 유입된 고객은 1회성 구매(Promising)에 그치지 않고 <b>VIP로 성장하는 '유지력(Retention)'이 강함.</b><br>
+            • <b>Organic:</b> VIP 평균 LTV는 $295로 가장 높으나, VIP 비중(15%)은 평균 수준임.<br>
+            • <b>Action:</b> Facebook은 <b>'충성 고객 확보'</b> 용도로, Search는 <b>'신규 모수 확보'</b> 용도로 믹스 전략 필요.
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # -------------------------------------------------------------------------
+    # 1-2. 가입 코호트 리텐션 히트맵
+    # -------------------------------------------------------------------------
+    _cohort_heatmap(data.cohort_matrix())
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+
+    # -------------------------------------------------------------------------
+    # 2. 카테고리 분석 데이터 (기존 로직 유지)
+    # -------------------------------------------------------------------------
+
+
+    # 2-1. 카테고리별 VIP 분석 시각화
+    st.subheader("🏷️ VIP 입문(Gateway) 카테고리 분석")
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        fig = figures.express(
+            'bar',
+            category_data,
+            x='avg_ltv',
+            y='category',
+            orientation='h',
+            color='vip_count',
+            color_continuous_scale='Blues',
+            title='첫 구매 카테고리별 VIP 평균 LTV TOP 10',
+            labels={'avg_ltv': '평균 LTV ($)', 'category': '카테고리', 'vip_count': 'VIP 배출 수'},
+            layout=dict(height=500),
+        )
+        instrumentation.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        st.markdown("""
+        <div class="insight-box success">
+            <div class="insight-title">🏆 Gateway Product: 아우터 & 수트</div>
+            <div class="insight-text">
+                • <b>Outerwear & Coats:</b><br>
+                LTV <b>$324.79</b> (1위) / VIP 수 119명 (2위)<br>
+                → <i>객단가와 VIP 배출력을 모두 갖춘 핵심 입문 상품</i><br><br>
+                • <b>Suits & Sport Coats:</b><br>
+                LTV <b>$315.22</b> (3위) / VIP 수 65명<br>
+                → <i>확실한 고가치 고객 유입 통로</i><br><br>
+                • <b>Jeans:</b><br>
+                VIP 수 <b>135명</b> (최다) / LTV $299.16<br>
+                → <i>VIP로 가는 가장 넓은 문(Volume) 역할</i>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+# -------------------------------------------------------------------------
+# 3. 분석 방법론 (Methodology) - 정의 구체화
+# -------------------------------------------------------------------------
+    with st.expander("📊 데이터 산출 로직 및 정의 (Methodology)"):
+        st.markdown("""
+        <div style="background-color: #f8f9fa; padding: 15px; border-radius: 10px; font-size: 0.9rem;">
+            <h4 style="margin-top:0;">1. 채널 분석 (Initial Acquisition Source)</h4>
+            <ul>
+                <li><b>분석 기준:</b>users 테이블의 traffic_source 컬럼</li>
+                <li><b>의미:</b> 해당 고객이 <b>최초로 회원가입했을 당시</b>의 유입 경로 (최초 획득 채널)</li>
+                <li><b>해석 목적:</b> "현재의 VIP들을 <b>맨 처음에 어디서 데려왔는지</b>"를 파악하여, 고가치 유저 획득 예산을 최적화하기 위함입니다. (재구매 시점의 클릭 배너 아님)</li>
+            </ul>
+            <h4 style="margin-top:15px;">2. 카테고리 분석 (Gateway Product)</h4>
+            <ul>
+                <li><b>분석 대상:</b> 현재 VIP 등급인 유저들의 <b>가입 후 첫 번째 구매 상품</b></li>
+                <li><b>지표:</b> avg_ltv (해당 카테고리로 입문한 유저들의 누적 구매액 평균)</li>
+                <li><b>해석 목적:</b> VIP를 유치하기 위해 첫 구매 유도 시 어떤 상품을 미끼(Hook)로 쓸지 결정</li>
+            </ul>
+            <h4 style="margin-top:15px;">3. 지표 정의 (Metric)</h4>
+            <ul>
+                 <li><b>VIP 비중 (Maturity Rate):</b>VIP 수 / (VIP + Promising High + Promising Low)</li>
+                 <li>최근 활동 유저 중 <b>VIP 단계까지 성숙한 비율</b>을 의미합니다.</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+
+@st.fragment
+def _cohort_heatmap(matrix):
+    # 채널 / 지표 선택 시 이 블록만 rerun (행렬은 프로세스당 한 번 생성, 선택은 코호트 × 개월 슬라이스)
+    if matrix is None:
+        return
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    st.subheader("🗓️ 가입 코호트 리텐션 (가입월 × 가입 후 경과 개월)")
+
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        channels = (ALL_CHANNELS,) + (matrix.groups if len(matrix.groups) > 1 else ())
+        channel = st.selectbox("유입 채널", channels, key="cohort_channel")
+    with col2:
+        metric = st.radio(
+            "지표", tuple(COHORT_METRICS), format_func=lambda name: COHORT_METRICS[name][0],
+            horizontal=True, key="cohort_metric",
+        )
+
+    label, color_label, fmt = COHORT_METRICS[metric]
+    group = None if channel == ALL_CHANNELS else channel
+    with instrumentation.span("data", "cohort_pivot"):
+        pivot = matrix.pivot(metric, group, since=data.ANALYSIS_WINDOW[0][:7])
+
+    fig = figures.express(
+        'imshow',
+        pivot,
+        labels=dict(x='가입 후 경과 개월', y='가입월 코호트', color=color_label),
+        color_continuous_scale='Greens',
+        aspect='auto',
+        text_auto=fmt,
+        title=f'{channel} 가입 코호트 {label}',
+        layout=dict(height=650),
+    )
+    instrumentation.plotly_chart(fig, use_container_width=True)
+    st.caption(
+        "코호트 = 가입월, 0개월 = 가입한 달. 활성 유저 = 그 달에 주문 상품이 있는 코호트 유저 "
+        "(리텐션 % 는 코호트 가입자 대비). 빈 칸은 아직 관측되지 않은 기간입니다."
+    )
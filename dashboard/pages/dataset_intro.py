@@ -0,0 +1,259 @@
+"""
+페이지 0: 데이터셋 소개
+"""
+
+import streamlit as st
+
+from dashboard import data, instrumentation
+
+
+def render():
+    st.markdown("""
+    <div class="main-header">
+        <h1>📁 TheLook E-commerce 데이터셋 소개</h1>
+        <p>Google BigQuery Public Dataset | 패션 의류 쇼핑몰 분석</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # 데이터셋 개요
+    st.subheader("🏪 TheLook E-commerce란?")
+
+    st.markdown("""
+    <div class="insight-box">
+        <div class="insight-title">📌 데이터셋 개요</div>
+        <div class="insight-text">
+            <b>TheLook</b>은 Google BigQuery에서 제공하는 <b>가상의 패션 의류 쇼핑몰</b> 데이터셋입니다.<br><br>
+            실제 이커머스 환경을 모방하여 생성된 <b>합성 데이터(Synthetic Data)</b>로,
+            고객 행동, 주문, 상품, 재고, 마케팅 채널 등 온라인 쇼핑몰 운영에 필요한 모든 요소를 포함합니다.<br><br>
+            <b>📦 BigQuery 경로:</b> <code>bigquery-public-data.thelook_ecommerce</code>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+
+    # 분석 기간 및 기준
+    st.subheader("📅 분석 기간 & 기준")
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown("""
+        <div class="metric-card blue">
+            <div class="metric-value">2023.01 - 2024.12</div>
+            <div class="metric-label">분석 기간 (2년)</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div class="metric-card purple">
+            <div class="metric-value">2025-01-01</div>
+            <div class="metric-label">Recency 기준일</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown("""
+        <div class="metric-card green">
+            <div class="metric-value">29,795명</div>
+            <div class="metric-label">분석 대상 고객</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="insight-box navy">
+        <div class="insight-title">⏰ Recency 계산 기준</div>
+        <div class="insight-text">
+            고객의 <b>마지막 구매일로부터 2025-01-01까지의 일수</b>를 Recency로 계산합니다.<br>
+            예: 마지막 구매일이 2024-12-01인 고객의 Recency = 31일
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+
+    # ERD 다이어그램
+    st.subheader("🗂️ ERD (Entity Relationship Diagram)")
+
+    st.markdown("""
+    <div class="insight-box">
+        <div class="insight-title">📊 데이터베이스 구조</div>
+        <div class="insight-text">
+            TheLook E-commerce는 <b>7개의 핵심 테이블</b>로 구성되어 있으며,
+            고객 → 주문 → 상품 → 재고 → 물류센터까지 이커머스 전 과정을 커버합니다.
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # ERD를 시각적으로 표현
+    col1, col2 = st.columns([3, 2])
+
+    with col1:
+        st.markdown("#### 📋 테이블 관계도")
+        st.markdown("""
+        ```
+        ┌─────────────────┐
+        │     USERS       │──────────────────────────────────┐
+        │─────────────────│                                  │
+        │ id (PK)         │                                  │
+        │ first_name      │                                  │
+        │ email           │     ┌─────────────────┐          │
+        │ age             │     │    ORDERS       │          │
+        │ gender          │─────│─────────────────│          │
+        │ state           │     │ order_id (PK)   │          │
+        │ country         │     │ user_id (FK)    │──────────┤
+        │ traffic_source  │     │ status          │          │
+        │ created_at      │     │ created_at      │          │
+        └─────────────────┘     │ num_of_item     │          │
+                                └────────┬────────┘          │
+        ┌─────────────────┐              │                   │
+        │    EVENTS       │              │                   │
+        │─────────────────│              │                   │
+        │ id (PK)         │              │                   │
+        │ user_id (FK)    │──────────────┤                   │
+        │ session_id      │              │                   │
+        │ event_type      │     ┌────────┴────────┐          │
+        │ traffic_source  │     │  ORDER_ITEMS    │          │
+        │ uri             │     │─────────────────│          │
+        └─────────────────┘     │ id (PK)         │          │
+                                │ order_id (FK)   │──────────┤
+        ┌─────────────────┐     │ user_id (FK)    │──────────┘
+        │   PRODUCTS      │     │ product_id (FK) │
+        │─────────────────│─────│ sale_price      │
+        │ id (PK)         │     │ status          │
+        │ cost            │     └─────────────────┘
+        │ category        │
+        │ name            │     ┌─────────────────┐
+        │ brand           │     │ INVENTORY_ITEMS │
+        │ retail_price    │─────│─────────────────│
+        │ department      │     │ id (PK)         │
+        └─────────────────┘     │ product_id (FK) │
+                                │ cost            │
+        ┌─────────────────┐     │ product_category│
+        │DISTRIBUTION_    │     └────────┬────────┘
+        │   CENTERS       │              │
+        │─────────────────│──────────────┘
+        │ id (PK)         │
+        │ name            │
+        │ latitude        │
+        │ longitude       │
+        └─────────────────┘
+        ```
+        """)
+
+    with col2:
+        st.markdown("#### 🔗 테이블 관계")
+        st.markdown("""
+        <div style="background: white; padding: 1rem; border-radius: 12px; box-shadow: 0 2px 10px rgba(0,0,0,0.06);">
+            <p><b>USERS</b> → <b>ORDERS</b><br>
+            <span style="color: #6b7280;">1명의 고객이 여러 주문 가능</span></p>
+            <hr style="margin: 0.75rem 0;">
+            <p><b>USERS</b> → <b>EVENTS</b><br>
+            <span style="color: #6b7280;">1명의 고객이 여러 이벤트 생성</span></p>
+            <hr style="margin: 0.75rem 0;">
+            <p><b>ORDERS</b> → <b>ORDER_ITEMS</b><br>
+            <span style="color: #6b7280;">1개 주문에 여러 상품 포함</span></p>
+            <hr style="margin: 0.75rem 0;">
+            <p><b>PRODUCTS</b> → <b>ORDER_ITEMS</b><br>
+            <span style="color: #6b7280;">1개 상품이 여러 주문에 포함</span></p>
+            <hr style="margin: 0.75rem 0;">
+            <p><b>PRODUCTS</b> → <b>INVENTORY_ITEMS</b><br>
+            <span style="color: #6b7280;">1개 상품이 여러 재고로 관리</span></p>
+            <hr style="margin: 0.75rem 0;">
+            <p><b>DISTRIBUTION_CENTERS</b> → <b>INVENTORY</b><br>
+            <span style="color: #6b7280;">1개 물류센터가 여러 재고 보유</span></p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+
+# 테이블 상세 설명
+    st.subheader("📑 테이블 상세 설명")
+
+    tab1, tab2, tab3, tab4 = st.tabs(["👥 고객/주문", "📦 상품/재고", "📊 이벤트", "🏭 물류센터"])
+
+    with tab1:
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("##### USERS (고객)")
+            users_df = data.load_table("users_df")
+            instrumentation.dataframe(users_df, hide_index=True, use_container_width=True)
+
+        with col2:
+            st.markdown("##### ORDERS (주문)")
+            orders_df = data.load_table("orders_df")
+            instrumentation.dataframe(orders_df, hide_index=True, use_container_width=True)
+
+        st.markdown("##### ORDER_ITEMS (주문 상세)")
+        order_items_df = data.load_table("order_items_df")
+        instrumentation.dataframe(order_items_df, hide_index=True, use_container_width=True)
+
+    with tab2:
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("##### PRODUCTS (상품)")
+            products_df = data.load_table("products_df")
+            instrumentation.dataframe(products_df, hide_index=True, use_container_width=True)
+
+        with col2:
+            st.markdown("##### INVENTORY_ITEMS (재고)")
+            inventory_df = data.load_table("inventory_df")
+            instrumentation.dataframe(inventory_df, hide_index=True, use_container_width=True)
+
+    with tab3:
+        st.markdown("##### EVENTS (이벤트/행동 로그)")
+        events_df = data.load_table("events_df")
+        instrumentation.dataframe(events_df, hide_index=True, use_container_width=True)
+
+        st.markdown("""
+        <div class="insight-box warning">
+            <div class="insight-title">📌 주요 Event Types</div>
+            <div class="insight-text">
+                <code>home</code> · <code>department</code> · <code>product</code> · <code>cart</code> · <code>purchase</code> · <code>cancel</code>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with tab4:
+        st.markdown("##### DISTRIBUTION_CENTERS (물류센터)")
+        dc_df = data.load_table("dc_df")
+        instrumentation.dataframe(dc_df, hide_index=True, use_container_width=True)
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+
+    # 분석에 사용한 테이블
+    st.subheader("🔬 본 분석에 사용한 핵심 테이블")
+
+    st.markdown("""
+    <div class="insight-box success">
+        <div class="insight-title">✅ RFM 분석 핵심 테이블</div>
+        <div class="insight-text">
+            <b>1. USERS</b> - 고객 기본 정보 (유입 채널, 가입일 등)<br>
+            <b>2. ORDER_ITEMS</b> - 구매 금액 (sale_price), 주문일시, 상품 정보<br>
+            <b>3. EVENTS</b> - 구매 후 세션 활동 분석 (Promising 고객 분석)<br>
+            <b>4. PRODUCTS</b> - 카테고리별 VIP 비율 분석<br>
+            <b>5. ORDERS</b> - 주문이 Cancelled, Complete, Returned 인지 구분
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # SQL 예시
+    with st.expander("📝 RFM 분석 기본 SQL 쿼리 예시"):
+        st.code("""
+-- RFM 기본 지표 추출 쿼리
+SELECT
+    u.id AS user_id,
+    DATE_DIFF('2025-01-01', MAX(DATE(oi.created_at)), DAY) AS recency,
+    COUNT(DISTINCT oi.order_id) AS frequency,
+    SUM(oi.sale_price) AS monetary,
+    u.traffic_source
+FROM `bigquery-public-data.thelook_ecommerce.users` u
+JOIN `bigquery-public-data.thelook_ecommerce.order_items` oi
+    ON u.id = oi.user_id
+WHERE oi.status NOT IN ('Cancelled', 'Returned')
+    AND DATE(oi.created_at) BETWEEN '2023-01-01' AND '2024-12-31'
+GROUP BY u.id, u.traffic_source
+        """, language="sql")
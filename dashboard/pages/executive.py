@@ -0,0 +1,172 @@
+"""
+페이지 1: Executive Summary
+"""
+
+import streamlit as st
+
+from dashboard import data, figures, instrumentation
+
+
+def render():
+    segment_data = data.load_segment_data()
+
+    st.markdown("""
+    <div class="exec-header">
+        <h1>📋 Executive Summary</h1>
+        <p>TheLook E-commerce RFM 분석 핵심 요약 | 2023.01 - 2024.12</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # 핵심 지표 요약
+    st.subheader("🎯 핵심 비즈니스 지표")
+
+    col1, col2, col3, col4, col5 = st.columns(5)
+
+    with col1:
+        st.markdown("""
+        <div class="exec-metric">
+            <div class="exec-metric-value">29,795</div>
+            <div class="exec-metric-label">분석 고객 수</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div class="exec-metric">
+            <div class="exec-metric-value">$3.06M</div>
+            <div class="exec-metric-label">총 매출</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown("""
+        <div class="exec-metric">
+            <div class="exec-metric-value">5.14%</div>
+            <div class="exec-metric-label">VIP 비율</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col4:
+        st.markdown("""
+        <div class="exec-metric">
+            <div class="exec-metric-value">$102.82</div>
+            <div class="exec-metric-label">평균 LTV</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col5:
+        st.markdown("""
+        <div class="exec-metric">
+            <div class="exec-metric-value">54.86%</div>
+            <div class="exec-metric-label">이탈 위험 고객</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+
+    # 핵심 발견사항
+    st.subheader("🔍 핵심 발견사항 (Key Findings)")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        <div class="key-finding critical">
+            <div style="font-weight: 700; color: #dc2626; margin-bottom: 0.5rem;">🚨 Critical Issue #1</div>
+            <div style="font-size: 1.5rem; font-weight: 700; margin-bottom: 0.5rem;">Promising 고객 70.1% 미활동 (구매 1회)</div>
+            <div style="color: #4b5563; line-height: 1.6;">
+                • Promising High: 46.2% 미활동 (1,643명)<br>
+                • Promising Low: <b>87.4%</b> 미활동 (4,275명)<br>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown("""
+        <div class="key-finding critical">
+            <div style="font-weight: 700; color: #dc2626; margin-bottom: 0.5rem;">🚨 Critical Issue #2</div>
+            <div style="font-size: 1.5rem; font-weight: 700; margin-bottom: 0.5rem;">VIP의 71.4% 3개월+ 후 재구매</div>
+            <div style="color: #4b5563; line-height: 1.6;">
+                • 3개월 이내 재구매: 28.6% (438명)<br>
+                • 1주일 내 재구매 시 LTV: <b>$303.42</b><br>
+                • 3개월+ 재구매 시 LTV: $275.30 (10% 손실)
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        # Opportunity #1
+        st.markdown("""
+        <div class="key-finding opportunity">
+            <div style="font-weight: 700; color: #059669; margin-bottom: 0.5rem;">✅ Opportunity #1</div>
+            <div style="font-size: 1.5rem; font-weight: 700; margin-bottom: 0.5rem;">가입시 유입채널이 Facebook인 VIP비율 17.8%</div>
+            <div style="color: #4b5563; line-height: 1.6; margin-bottom: 12px;">
+                • 전 채널 최고 효율 (Display 12.8% 대비 +5%p)<br>
+                • Organic 채널 VIP LTV 최고: <b>$295.01</b><br>
+                • 광고 예산 재배분으로 ROI 극대화 가능
+            </div>
+            <div style="background-color: #ecfdf5; padding: 10px; border-radius: 6px; border-top: 1px dashed #6ee7b7; font-size: 0.85rem; color: #047857;">
+                ℹ️ <b>Why Active Segments?</b><br>
+                <b>최근 180일 내 구매 이력(Recency)</b>이 있는
+                <b>Active 세그먼트</b>(VIP, Promising)만을 모수로 하여 실질적인 성과를 측정했습니다.
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Opportunity #2
+        st.markdown("""
+        <div class="key-finding opportunity">
+            <div style="font-weight: 700; color: #059669; margin-bottom: 0.5rem;">✅ Opportunity #2</div>
+            <div style="font-size: 1.5rem; font-weight: 700; margin-bottom: 0.5rem;">첫구매가 고가 카테고리 = 높은 VIP 비율</div>
+            <div style="color: #4b5563; line-height: 1.6; margin-bottom: 12px;">
+                • Outerwear & Coats: VIP 비율 22.5%, LTV <b>$345</b><br>
+                • Suits: VIP 비율 25.0%, LTV $249<br>
+                • 첫 구매 카테고리 유도로 VIP 확보 가속화
+            </div>
+            <div style="background-color: #ecfdf5; padding: 10px; border-radius: 6px; border-top: 1px dashed #6ee7b7; font-size: 0.85rem; color: #047857;">
+                ℹ️ <b>Why Active Segments?</b><br>
+                <b>최근 180일 내 구매 이력(Recency)</b>이 있는
+                <b>Active 세그먼트</b>(VIP, Promising)만을 모수로 하여 실질적인 성과를 측정했습니다.
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+
+    # 세그먼트 분포 요약
+    st.subheader("📊 세그먼트 분포 요약")
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        # 트리맵
+        fig = figures.express(
+            'treemap',
+            segment_data,
+            path=['segment'],
+            values='user_count',
+            color='avg_monetary',
+            color_continuous_scale='RdYlGn',
+            title='RFM 세그먼트 분포 (크기: 고객 수, 색상: 평균 LTV)',
+            layout=dict(height=400),
+        )
+        instrumentation.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        st.markdown("""
+        <div class="insight-box navy">
+            <div class="insight-title">💡 세그먼트 핵심 요약</div>
+            <div class="insight-text">
+                <b>성장 동력 (28.4%)</b><br>
+                • VIP: 5.14%<br>
+                • Promising: 28.35%<br><br>
+                <b>위험 고객 (54.9%)</b><br>
+                • At Risk: 22.28%<br>
+                • Hibernating: 32.58%<br><br>
+                <b>매출 기여</b><br>
+                • VIP 5.14% → 매출 13.79%<br>
+                • 이탈위험 55% → 매출 46%
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
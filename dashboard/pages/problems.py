@@ -0,0 +1,273 @@
+"""
+페이지 4: 문제 정의 & 인사이트
+"""
+
+import plotly.express as px
+import streamlit as st
+
+from dashboard import data, figures, instrumentation
+from dashboard.pages import _roi
+
+
+def render():
+    vip_repurchase_timing = data.load_vip_repurchase_timing()
+
+    st.markdown("""
+    <div class="main-header">
+        <h1>⚠️ 문제 정의 & 인사이트</h1>
+        <p>데이터 기반 핵심 문제점 도출 및 비즈니스 인사이트</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # -------------------------------------------------------------------------
+    # 문제 1: Promising 미활동 (High/Low 분리)
+    # -------------------------------------------------------------------------
+    st.subheader("🚨 문제 #1: Promising 고객 대다수 미활동 (구매 횟수 = 모두 1회)")
+
+    # 1. 핵심 특성 강조 (Recency + 구매 후 활동의 의미)
+    st.markdown("""
+    <div class="insight-box navy">
+        <div class="insight-title">⚠️ 핵심 특성: VIP와 유사한 '최신성'을 가졌으나 '재구매'가 지연됨</div>
+        <div class="insight-text">
+            • <b>Why Promising?</b> 최근 구매일(Recency)이 <b>180일 이내</b>로 우리 브랜드를 기억하고 있는 상태<br>
+            • <b>Behavior Pattern:</b> 모든 고객이 <b>구매 1회</b>로 동일하지만, <b>'구매 후 사이트 활동(Session)'</b>에서 극명한 차이<br>
+            • <b>Key Insight:</b> <u>"구매 후 다시 찾아와 둘러보았으나(Session ↑), 아직 결제하지 않음"</u> → <b>가장 확실한 잠재 수요</b>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # 2. 현황 데이터 & 차트 (위치 이동: 상단 배치)
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        st.markdown("""
+        <div class="problem-box">
+            <div class="problem-title">📊 현황 데이터: 첫 구매 후 추가 탐색 활동 여부</div>
+            <div style="color: #4b5563; line-height: 1.8;">
+                <b>🟣 Promising High Value (3,555명)</b><br>
+                • <b>구매 후 미방문(0 Session): 46.22%</b> (1,643명) → <span style="color:#ef4444">위험</span><br>
+                • 재방문/탐색(1 Session): 13.31%<br>
+                • <b>적극적 탐색(2+ Sessions): 40.47%</b> (고관여 그룹)<br>
+                → <i>구매 후 다시 방문한 그룹의 LTV가 월등히 높음</i><br><br>
+                <b>🟠 Promising Low Value (4,891명)</b><br>
+                • <b>구매 후 미방문(0 Session): 87.41%</b> (4,275명) → <span style="color:#ef4444">심각</span><br>
+                • 재방문/탐색(1+ Session): 12.59%<br>
+                → <i>대다수가 구매 후 사이트를 잊고 있음 (이탈 전조)</i>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        promising_no_activity = data.load_table("promising_no_activity")
+
+        fig = figures.express(
+            'bar',
+            promising_no_activity,
+            x='segment',
+            y='count',
+            color='status',
+            barmode='stack',
+            title='첫 구매 이후 사이트 재방문 현황',
+            color_discrete_map={'구매 후 미방문': '#ef4444', '재방문/탐색 중': '#10b981'},
+            layout=dict(height=350),
+        )
+        instrumentation.plotly_chart(fig, use_container_width=True)
+
+    # High Value / Low Value 기대 효과는 Action Plan 과 같은 ROI 시뮬레이션 결과
+    simulation = data.roi_simulation()
+
+    # High Value 상세 분석 섹션
+    st.markdown("#### 🟣 Promising High Value 분석 (고관여 잠재 고객)")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        <div class="insight-box purple">
+            <div class="insight-title">💡 인사이트: "탐색하는 고객이 비싸게 산다"</div>
+            <div class="insight-text">
+                <b>🔍 행동 데이터 연결:</b><br>
+                모두 구매 횟수는 1회지만, <b>구매 전후로 세션 활동(4-5회)이 많았던 고객</b>은<br>
+                그렇지 않은 고객보다 <b>LTV가 86%나 더 높음 ($131 vs $244).</b><br><br>
+                <b>📝 해석:</b><br>
+                1. <b>신중한 탐색:</b> 여러 번 방문하며 상품을 꼼꼼히 본 고객이 고가 제품을 구매함.<br>
+                2. <b>재구매 시그널:</b> 구매 후에도 사이트에 접속했다는 것은 <b>추가 구매 아이템을 찾고 있다</b>는 강력한 신호.<br>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(f"""
+        <div class="roi-box">
+            <div class="roi-title">💰 전략 및 ROI: 큐레이션으로 '확신' 심어주기</div>
+            <div style="color: #4b5563; line-height: 1.8; font-size: 0.9rem;">
+                <b>전략: Active Browsing 유도 (단순 클릭 X, 상품 탐색 O)</b><br><br>
+                <b>기대 효과:</b><br>
+                {_expected_effect(simulation, "promising_high")}
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        with st.expander("🟣 ROI & 매출 상세 계산식"):
+            st.markdown(f"""
+            <div style="font-size: 0.85rem; color: #555;">
+                {_roi.breakdown_html(simulation, "promising_high")}
+            </div>
+            """, unsafe_allow_html=True)
+
+    # Low Value 상세 분석 섹션
+    st.markdown("#### 🟠 Promising Low Value 분석 (이탈 위험 잠재 고객)")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        <div class="insight-box warning">
+            <div class="insight-title">💡 인사이트: "잊혀지기 전에 다시 부르는 것이 급선무"</div>
+            <div class="insight-text">
+                <b>🔍 행동 데이터 연결:</b><br>
+                이 그룹의 <b>87%는 첫 구매 후 사이트에 단 한 번도 오지 않음.</b><br>
+                하지만, 2-3회라도 다시 방문한 소수 고객은 <b>LTV가 45% 상승 ($32 vs $47).</b><br><br>
+                <b>📝 해석:</b><br>
+                1. <b>단순 이탈 위험:</b> 구매 후 만족도 문제보다는, 단순히 <b>브랜드를 잊어버렸을 확률</b>이 높음.<br>
+                2. <b>가벼운 관심:</b> 깊은 탐색보다는 가벼운 아이쇼핑(Window Shopping) 유도가 필요.<br>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(f"""
+        <div class="roi-box">
+            <div class="roi-title">💰 전략 및 ROI: 가벼운 방문 유도 (Click-bait)</div>
+            <div style="color: #4b5563; line-height: 1.8; font-size: 0.9rem;">
+                <b>전략: Re-Visit 유도 (일단 사이트에 오게 만들기)</b><br><br>
+                <b>기대 효과:</b><br>
+                {_expected_effect(simulation, "promising_low")}
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        with st.expander("🟠 ROI & 매출 상세 계산식"):
+            st.markdown(f"""
+            <div style="font-size: 0.85rem; color: #555;">
+                {_roi.breakdown_html(simulation, "promising_low")}
+            </div>
+            """, unsafe_allow_html=True)
+
+    # 해결방안 (High/Low 차별화)
+    st.markdown("""
+    <div class="solution-box">
+        <div class="solution-title">✅ 통합 해결 솔루션: Post-Purchase Engagement (구매 후 관계 형성)</div>
+        <div style="color: #4b5563; line-height: 1.8;">
+            <b>🎯 핵심 목표: "첫 구매는 끝이 아니라 시작" → 구매 후 30일 내 재방문 유도</b><br><br>
+            <b>🟣 High Value (Relationship): "더 깊은 관계 맺기"</b><br>
+            • <b>Action:</b> 구매 상품 관리 팁, 스타일링 가이드 발송 (정보성 콘텐츠)<br>
+            • <b>Logic:</b> 단순 판매 촉진이 아닌, '브랜드 경험'을 확장하여 자연스러운 재방문 유도<br><br>
+            <b>🟠 Low Value (Remind): "존재감 상기 시키기"</b><br>
+            • <b>Action:</b> 타임세일, 무료배송 쿠폰, 신규 가입 혜택 리마인드<br>
+            • <b>Logic:</b> 잊혀진 브랜드 인지도를 다시 깨우는 강력한 '혜택' 위주의 넛지(Nudge)
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+
+    # 문제 2: VIP 재구매 지연
+    st.subheader("🚨 문제 #2: VIP 재구매 주기 과다 지연")
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        fig = figures.express(
+            'pie',
+            vip_repurchase_timing,
+            values='count',
+            names='bucket',
+            title='VIP 재구매 타이밍 분포',
+            color_discrete_sequence=px.colors.sequential.Reds_r,
+            traces=dict(textposition='inside', textinfo='percent+label'),
+            layout=dict(height=350),
+        )
+        instrumentation.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        st.markdown("""
+        <div class="problem-box">
+            <div class="problem-title">📊 현황 데이터</div>
+            <div style="color: #4b5563; line-height: 1.8;">
+                <b>VIP 재구매 타이밍:</b><br>
+                • 1주일 이내: 3.07% (47명)<br>
+                • 2주 이내: 2.61% (40명)<br>
+                • 1개월 이내: 5.09% (78명)<br>
+                • 2개월 이내: 8.43% (129명)<br>
+                • 3개월 이내: 9.41% (144명)<br>
+                • <b>3개월+: 71.39% (1,093명)</b><br><br>
+                <b>문제:</b> VIP의 71%가 3개월 후에야 재구매
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="insight-box warning">
+        <div class="insight-title">💡 인사이트</div>
+        <div class="insight-text">
+            • 1주일 내 재구매 VIP의 평균 LTV: <b>$303.42</b><br>
+            • 3개월+ 재구매 VIP의 평균 LTV: <b>$275.30</b><br>
+            • LTV 차이: <b>$28.12 (10.2% 손실)</b><br>
+            • 빠른 재구매 유도 시 VIP 1,093명 × $28 = <b>$30,604 추가 매출 가능</b>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+
+    # 문제 3: 이탈 고객 비중
+    st.subheader("🚨 문제 #3: 전체 고객의 55%가 이탈 위험/휴면")
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        risk_data = data.load_table("risk_data")
+
+        fig = figures.express(
+            'pie',
+            risk_data,
+            values='count',
+            names='category',
+            title='성장 vs 이탈 위험 고객 비율',
+            color_discrete_map={'성장 동력': '#10b981', '이탈 위험': '#ef4444'},
+            traces=dict(textposition='inside', textinfo='percent+label'),
+            layout=dict(height=350),
+        )
+        instrumentation.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        st.markdown("""
+        <div class="problem-box">
+            <div class="problem-title">📊 현황 데이터</div>
+            <div style="color: #4b5563; line-height: 1.8;">
+                <b>이탈 위험 세그먼트:</b><br>
+                • At Risk: 6,637명 (22.28%)<br>
+                • Hibernating: 9,707명 (32.58%)<br>
+                • Others: 131명 (0.44%)<br>
+                • <b>합계: 16,475명 (55.30%)</b><br><br>
+                <b>매출 영향:</b><br>
+                • 이탈 위험 고객 매출: $1.4M (45.9%)<br>
+                • 완전 이탈 시 <b>총 매출의 46% 타격</b>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+
+def _expected_effect(simulation, key):
+    """ROI 시뮬레이션(가정 평균 기준) 중앙값으로 만든 기대 효과 요약"""
+    phase = next(item for item in simulation.phases if item.key == key)
+    counts = simulation.counts[key]["p50"]
+    row = simulation.summary.loc[key]
+    reactivation = phase.assumption("reactivation").dist.mean
+    second = phase.assumption("second_purchase").dist.mean
+    return (
+        f"• 미활동 고객의 {reactivation:.0%} 재활성화 ({counts['reactivated']:,.0f}명)<br>"
+        f"• 재활성화 고객의 {second:.0%}가 2차 구매 ({counts['second']:,.0f}명)<br>"
+        f"• <b>예상 매출: ${row['revenue_p50']:,.0f} (ROI {row['roi_p50']:,.0f}%)</b>"
+    )
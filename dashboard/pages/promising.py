@@ -0,0 +1,140 @@
+"""
+페이지 5: Promising 분석
+"""
+
+import streamlit as st
+
+from dashboard import data, figures, instrumentation
+from dashboard.pages import _roi
+
+
+def render():
+    promising_activity = data.load_promising_activity()
+
+    st.markdown("""
+    <div class="main-header">
+        <h1>🎯 Promising 분석</h1>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # 주요 지표 (High/Low 분리)
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.markdown("""
+        <div class="metric-card purple">
+            <div class="metric-value">3,555</div>
+            <div class="metric-label">Promising High</div>
+            <div class="metric-delta">미활동률 46.2%</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div class="metric-card orange">
+            <div class="metric-value">4,891</div>
+            <div class="metric-label">Promising Low</div>
+            <div class="metric-delta delta-negative">미활동률 87.4%</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown("""
+        <div class="metric-card green">
+            <div class="metric-value">$155.86</div>
+            <div class="metric-label">High 평균 LTV</div>
+            <div class="metric-delta">Low 대비 4.5배</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col4:
+        st.markdown("""
+        <div class="metric-card blue">
+            <div class="metric-value">$721K</div>
+            <div class="metric-label">Promising 총 매출</div>
+            <div class="metric-delta">전체의 23.6%</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+
+    # 활동 레벨별 분석 (High/Low 분리)
+    st.subheader("📊 구매 후 활동 레벨별 분석 (High/Low 비교)")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        promising_high = promising_activity[promising_activity['segment'] == 'Promising High Value']
+        fig = figures.express(
+            'bar',
+            promising_high,
+            x='activity_level',
+            y='user_count',
+            color='avg_monetary',
+            color_continuous_scale='Purples',
+            title='🟣 Promising High Value: 활동 레벨별 분포',
+            labels={'user_count': '고객 수', 'activity_level': '활동 레벨'},
+            layout=dict(height=350),
+        )
+        instrumentation.plotly_chart(fig, use_container_width=True)
+
+        st.markdown("""
+        <div class="insight-box purple">
+            <div class="insight-title">Promising High 특성</div>
+            <div class="insight-text">
+                • 미활동 → 4-5 Sessions: LTV <b>+86%</b> 상승<br>
+                • 세션 증가 = LTV 증가 <b>강한 상관관계</b><br>
+                • 활동 고객의 53.8%가 재활성화 성공
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        promising_low = promising_activity[promising_activity['segment'] == 'Promising Low Value']
+        fig = figures.express(
+            'bar',
+            promising_low,
+            x='activity_level',
+            y='user_count',
+            color='avg_monetary',
+            color_continuous_scale='Oranges',
+            title='🟠 Promising Low Value: 활동 레벨별 분포',
+            labels={'user_count': '고객 수', 'activity_level': '활동 레벨'},
+            layout=dict(height=350),
+        )
+        instrumentation.plotly_chart(fig, use_container_width=True)
+
+        st.markdown("""
+        <div class="insight-box warning">
+            <div class="insight-title">Promising Low 특성</div>
+            <div class="insight-text">
+                • 미활동 → 2-3 Sessions: LTV <b>+45%</b> 상승<br>
+                • 87.4% 미활동 → <b>첫 경험 개선 필수</b><br>
+                • 활동 유도 시 업셀링 가능성 높음
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+
+    # 미활동 개선 목표 & ROI (High/Low 분리)
+    st.subheader("🎯 미활동 개선 목표 & 예상 ROI")
+
+    simulation = data.roi_simulation()
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("#### 🟣 Promising High Value")
+        instrumentation.dataframe(_roi.phase_table(simulation, "promising_high"), hide_index=True,
+                                  use_container_width=True)
+
+        _roi.box(simulation, "promising_high", "💰 상세 ROI 산출", line_height=1.6)
+
+    with col2:
+        st.markdown("#### 🟠 Promising Low Value")
+        instrumentation.dataframe(_roi.phase_table(simulation, "promising_low"), hide_index=True,
+                                  use_container_width=True)
+
+        _roi.box(simulation, "promising_low", "💰 상세 ROI 산출", line_height=1.6)
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
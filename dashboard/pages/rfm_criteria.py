@@ -0,0 +1,277 @@
+"""
+페이지 2: RFM 등급 기준 & 근거
+"""
+
+import pandas as pd
+import streamlit as st
+
+from dashboard import data, figures, instrumentation
+from thelook_analysis.rfm import F_THRESHOLDS, M_THRESHOLDS, R_THRESHOLDS
+
+
+def render():
+    rfm_distribution, segment_data = data.load_all(data.load_rfm_distribution, data.load_segment_data)
+
+    st.markdown("""
+    <div class="main-header">
+        <h1>🔬 RFM 등급 기준 & 근거</h1>
+        <p>데이터 분포 분석을 통한 등급 산정 로직 및 세그먼트 정의</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # RFM 분포 분석 결과
+    st.subheader("📊 RFM 분포 분석 결과 (sale_price 기반)")
+
+    st.markdown("""
+    <div class="insight-box navy">
+        <div class="insight-title">📌 분석 기반 데이터</div>
+        <div class="insight-text">
+            • <b>분석 기간:</b> 2023-01-01 ~ 2024-12-31 (2년)<br>
+            • <b>총 고객 수:</b> 29,795명 (Cancelled/Returned 주문 제외)<br>
+            • <b>매출 기준:</b> sale_price (실제 판매가) 기반 집계<br>
+            • <b>분석 기준일:</b> 2024-12-31
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown("#### Recency (최근성)")
+        recency_df = data.load_table("recency_df")
+        instrumentation.dataframe(recency_df, hide_index=True, use_container_width=True)
+        st.markdown(f"**평균:** {rfm_distribution['recency']['avg']}일 | **표준편차:** {rfm_distribution['recency']['std']}일")
+
+    with col2:
+        st.markdown("#### Frequency (빈도)")
+        frequency_df = data.load_table("frequency_df")
+        instrumentation.dataframe(frequency_df, hide_index=True, use_container_width=True)
+        st.markdown(f"**평균:** {rfm_distribution['frequency']['avg']}회 | **표준편차:** {rfm_distribution['frequency']['std']}회")
+
+    with col3:
+        st.markdown("#### Monetary (금액)")
+        monetary_df = data.load_table("monetary_df")
+        instrumentation.dataframe(monetary_df, hide_index=True, use_container_width=True)
+        st.markdown(f"평균: ${rfm_distribution['monetary']['avg']} | 표준편차: ${rfm_distribution['monetary']['std']}")
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+
+    # RFM 스코어링 기준
+    st.subheader("📐 RFM 스코어링 기준 (1-5점)")
+
+    st.markdown("""
+    <div class="insight-box">
+        <div class="insight-title">🎯 스코어링 설계 원칙</div>
+        <div class="insight-text">
+            각 RFM 요소를 <b>1~5점</b>으로 스코어링하여 세그먼트 분류에 활용합니다.
+            스코어링 기준은 <b>실제 데이터 분포(Percentile)</b>와 <b>비즈니스 로직</b>을 함께 고려하여 설정했습니다.
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown("#### Recency Score (R)")
+        st.markdown("""
+        | 점수 | 기준 | 근거 |
+        |------|------|------|
+        | **5** | ≤90일 | 3개월 이내 활성 고객 |
+        | **4** | 91-180일 | 6개월 이내 준활성 |
+        | **3** | 181-365일 | 1년 이내 비활성화 진행 |
+        | **2** | 366-545일 | 1.5년 이내 이탈 위험 |
+        | **1** | >545일 | 장기 휴면 고객 |
+        """)
+        st.markdown("""
+        <div class="insight-box success" style="margin-top: 1rem;">
+            <div class="insight-title">💡 설정 근거</div>
+            <div class="insight-text">
+                • P50(중앙값) = 259일 → 3등급 기준<br>
+                • 일반적 리텐션 주기 고려 (90일 단위)<br>
+                • P75(455일) ≈ 1.5년 → 휴면 기준
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("#### Frequency Score (F)")
+        st.markdown("""
+        | 점수 | 기준 | 근거 |
+        |------|------|------|
+        | **5** | ≥3회 | 상위 5%+ 충성 고객 |
+        | **4** | 2회 | P90 수준 재구매 고객 |
+        | **3** | 1회 | 대다수(75%) 1회 구매 |
+        | **1** | 0회 | (해당 없음) |
+        """)
+        st.markdown("""
+        <div class="insight-box success" style="margin-top: 1rem;">
+            <div class="insight-title">💡 설정 근거</div>
+            <div class="insight-text">
+                • P90 = 2회 → 재구매 자체가 상위 10%<br>
+                • 대부분(75%) 1회 구매 → F스코어 3점<br>
+                • <b>2회 이상 = 충성 고객</b>으로 분류<br>
+                • 최대 빈도 4회 (P95 = 2회)
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown("#### Monetary Score (M)")
+        st.markdown("""
+        | 점수 | 기준 | 근거 |
+        |------|------|------|
+        | **5** | ≥$300 | P95+ 고객 (상위 5%) |
+        | **4** | $135-299 | P75+ (상위 25%) |
+        | **3** | $67-134 | P50+ (중앙값 이상) |
+        | **2** | $34-66 | P25+ (하위 50%) |
+        | **1** | <$34 | P25 미만 (하위 25%) |
+        """)
+        st.markdown("""
+        <div class="insight-box success" style="margin-top: 1rem;">
+            <div class="insight-title">💡 설정 근거</div>
+            <div class="insight-text">
+                • P50 = $66.50 → 3점 하한선<br>
+                • P75 = $134.72 → 4점 하한선<br>
+                • P95 = $301.98 → 5점 하한선<br>
+                • <b>분포 기반 자연스러운 구간 설정</b>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+
+    # 세그먼트 정의
+    st.subheader("🏷️ RFM 세그먼트 정의 (9개)")
+
+    st.markdown("""
+    <div class="insight-box navy">
+        <div class="insight-title">📌 세그먼트 분류 기준</div>
+        <div class="insight-text">
+            R, F, M 스코어 조합을 통해 <b>9개 고객 세그먼트</b>를 정의합니다.
+            각 세그먼트는 고객의 <b>현재 가치</b>와 <b>행동 패턴</b>을 반영합니다.
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    segment_criteria = data.load_table("segment_criteria")
+
+    instrumentation.dataframe(segment_criteria, hide_index=True, use_container_width=True, height=380)
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+
+    # 세그먼트별 실제 분포
+    st.subheader("📈 세그먼트별 실제 분포 검증")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        fig = figures.express(
+            'bar',
+            segment_data.sort_values('pct', ascending=True),
+            x='pct',
+            y='segment',
+            orientation='h',
+            color='avg_monetary',
+            color_continuous_scale='RdYlGn',
+            title='세그먼트별 고객 비율 (%, 색상: 평균 LTV)',
+            labels={'pct': '고객 비율 (%)', 'segment': '세그먼트'},
+            layout=dict(height=400),
+        )
+        instrumentation.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        fig = figures.express(
+            'bar',
+            segment_data.sort_values('revenue_pct', ascending=True),
+            x='revenue_pct',
+            y='segment',
+            orientation='h',
+            color='avg_monetary',
+            color_continuous_scale='RdYlGn',
+            title='세그먼트별 매출 기여도 (%, 색상: 평균 LTV)',
+            labels={'revenue_pct': '매출 기여 (%)', 'segment': '세그먼트'},
+            layout=dict(height=400),
+        )
+        instrumentation.plotly_chart(fig, use_container_width=True)
+
+    st.markdown("""
+    <div class="insight-box success">
+        <div class="insight-title">✅ 세그먼트 분류 검증 결과</div>
+        <div class="insight-text">
+            • <b>VIP (5.14%)</b>: 평균 LTV $275.88로 전체 평균의 <b>2.7배</b> → 프리미엄 고객 정확 식별<br>
+            • <b>Promising (28.35%)</b>: 최근성 높고 1회 구매 → 전환 잠재력 높은 그룹 정확 분리<br>
+            • <b>At Risk + Hibernating (54.86%)</b>: 과반수가 이탈 위험 → <b>리텐션 전략 시급</b>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    _threshold_simulator(data.rfm_histogram())
+
+
+def _sliders(labels, defaults, low, high, key, step=1):
+    return tuple(
+        st.slider(label, low, high, value, step=step, key=f"{key}_{i}")
+        for i, (label, value) in enumerate(zip(labels, defaults))
+    )
+
+
+@st.fragment
+def _threshold_simulator(histogram):
+    # 슬라이더 조작 시 이 블록만 rerun (재분류는 히스토그램 누적합 조회라 유저 수와 무관)
+    if histogram is None:
+        return
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    st.subheader("🎛️ 기준값 시뮬레이션")
+
+    st.caption(f"{histogram.users:,}명 기준 · 기준값을 옮기면 세그먼트 규모와 매출 비중을 즉시 다시 계산합니다")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        r = _sliders([f"R {5 - i}점: ≤ N일" for i in range(4)], R_THRESHOLDS, 1, histogram.recency_max - 1, "rfm_r")
+    with col2:
+        f = _sliders(["F 5점: ≥ N회", "F 4점: ≥ N회"], F_THRESHOLDS, 1, histogram.frequency_max, "rfm_f")
+    with col3:
+        m = _sliders([f"M {5 - i}점: ≥ $N" for i in range(4)], M_THRESHOLDS, histogram.monetary_step,
+                     histogram.monetary_max, "rfm_m", step=histogram.monetary_step)
+
+    if list(r) != sorted(r) or list(f) != sorted(f, reverse=True) or list(m) != sorted(m, reverse=True):
+        st.warning("기준값 순서가 점수 순서와 맞지 않습니다. 구간은 정렬된 값으로 계산됩니다.")
+
+    with instrumentation.span("data", "resegment"):
+        baseline = histogram.segment()
+        adjusted = histogram.segment(r, f, m)
+
+    comparison = pd.DataFrame({
+        "segment": baseline["segment"].replace(data.SEGMENT_LABELS),
+        "현재 고객 수": baseline["user_count"],
+        "조정 고객 수": adjusted["user_count"],
+        "변화": adjusted["user_count"] - baseline["user_count"],
+        "현재 비율 (%)": baseline["pct"].round(2),
+        "조정 비율 (%)": adjusted["pct"].round(2),
+        "현재 매출 비중 (%)": baseline["revenue_pct"].round(2),
+        "조정 매출 비중 (%)": adjusted["revenue_pct"].round(2),
+    })
+
+    col1, col2 = st.columns(2)
+    for column, metric, title in ((col1, "비율 (%)", "세그먼트별 고객 비율 (%)"),
+                                  (col2, "매출 비중 (%)", "세그먼트별 매출 비중 (%)")):
+        long = comparison.melt(
+            id_vars="segment", value_vars=[f"현재 {metric}", f"조정 {metric}"], var_name="기준", value_name=metric,
+        )
+        with column:
+            fig = figures.express(
+                'bar',
+                long,
+                x=metric,
+                y='segment',
+                color='기준',
+                orientation='h',
+                barmode='group',
+                title=title,
+                color_discrete_sequence=['#9CA3AF', '#2563EB'],
+                layout=dict(height=450, legend_title_text=''),
+            )
+            instrumentation.plotly_chart(fig, use_container_width=True)
+
+    instrumentation.dataframe(comparison, hide_index=True, use_container_width=True)
@@ -0,0 +1,269 @@
+"""
+페이지 3: 세그먼트 현황 분석
+"""
+
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from dashboard import data, figures, instrumentation
+
+
+def _rfm_radar(segment_data):
+    fig = go.Figure()
+
+    for _, row in segment_data.iterrows():
+        fig.add_trace(go.Scatterpolar(
+            r=[row['r_score'], row['f_score'], row['m_score']],
+            theta=['Recency', 'Frequency', 'Monetary'],
+            fill='toself',
+            name=row['segment']
+        ))
+
+    fig.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[0, 5])),
+        title='세그먼트별 RFM 스코어 레이더 차트',
+        height=500
+    )
+    return fig
+
+
+def render():
+    segment_data = data.load_segment_data()
+
+    st.markdown("""
+    <div class="main-header">
+        <h1>👥 세그먼트 현황 분석</h1>
+        <p>9개 RFM 세그먼트별 상세 현황 및 특성 분석</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # 주요 지표 요약
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.markdown("""
+        <div class="metric-card green">
+            <div class="metric-value">29,795</div>
+            <div class="metric-label">총 분석 고객</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div class="metric-card blue">
+            <div class="metric-value">$3.06M</div>
+            <div class="metric-label">총 매출</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown("""
+        <div class="metric-card purple">
+            <div class="metric-value">$102.82</div>
+            <div class="metric-label">평균 LTV</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col4:
+        st.markdown("""
+        <div class="metric-card orange">
+            <div class="metric-value">1.2회</div>
+            <div class="metric-label">평균 구매 빈도</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+
+    # 세그먼트 분포 시각화
+    st.subheader("📊 세그먼트 분포")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        fig = figures.express(
+            'pie',
+            segment_data,
+            values='user_count',
+            names='segment',
+            title='세그먼트별 고객 수 분포',
+            color_discrete_sequence=px.colors.qualitative.Set2,
+            traces=dict(textposition='inside', textinfo='percent+label'),
+            layout=dict(height=450),
+        )
+        instrumentation.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        fig = figures.express(
+            'pie',
+            segment_data,
+            values='total_revenue',
+            names='segment',
+            title='세그먼트별 매출 기여도',
+            color_discrete_sequence=px.colors.qualitative.Set2,
+            traces=dict(textposition='inside', textinfo='percent+label'),
+            layout=dict(height=450),
+        )
+        instrumentation.plotly_chart(fig, use_container_width=True)
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+
+    # 세그먼트별 상세 테이블
+    st.subheader("📋 세그먼트별 상세 지표")
+
+    display_df = segment_data[['segment', 'user_count', 'pct', 'avg_recency', 'avg_frequency',
+                               'avg_monetary', 'revenue_pct', 'r_score', 'f_score', 'm_score']].copy()
+    display_df.columns = ['세그먼트', '고객 수', '비율(%)', '평균 Recency', '평균 Frequency',
+                          '평균 LTV($)', '매출 기여(%)', 'R Score', 'F Score', 'M Score']
+
+    instrumentation.dataframe(display_df, hide_index=True, use_container_width=True)
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+
+    # RFM 스코어 비교
+    st.subheader("📈 세그먼트별 RFM 스코어 비교")
+
+    fig = figures.cached(_rfm_radar, segment_data)
+    instrumentation.plotly_chart(fig, use_container_width=True)
+
+    st.markdown("""
+    <div class="insight-box">
+        <div class="insight-title">💡 세그먼트 특성 요약</div>
+        <div class="insight-text">
+            • <b>VIP</b>: 모든 RFM 지표 최상위 (R:4.59, F:4.28, M:4.30)<br>
+            • <b>Promising</b>: 높은 Recency(4.55)와 중간 Monetary, 낮은 Frequency(3.0) → 재구매 유도 핵심 타겟<br>
+            • <b>Hibernating</b>: 모든 지표 최하위 (R:1.53, F:3.0, M:2.35) → 윈백 또는 자연 이탈 허용
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    _drilldown(data.segment_index())
+    _segment_transitions(data.snapshot_store())
+
+
+# 드릴다운 컬럼 → 표시 이름
+DRILLDOWN_COLUMNS = {
+    "user_id": "User ID",
+    "recency_days": "Recency(일)",
+    "frequency": "구매 횟수",
+    "monetary": "LTV($)",
+    "r_score": "R",
+    "f_score": "F",
+    "m_score": "M",
+    "traffic_source": "유입 채널",
+    "first_category": "첫 구매 카테고리",
+    "post_purchase_sessions": "구매 후 세션",
+}
+
+DRILLDOWN_SORTS = ("monetary", "recency_days", "frequency", "post_purchase_sessions", "user_id")
+
+ALL_ACTIVITY = "전체"
+
+
+@st.fragment
+def _drilldown(index):
+    # 필터 / 페이지 조작 시 이 블록만 rerun. 세션 상태에는 위젯 값만 남고 멤버 목록은 현재 페이지만 조회
+    if index is None:
+        return
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    st.subheader("🔎 세그먼트 드릴다운")
+
+    col1, col2, col3, col4, col5 = st.columns([3, 2, 2, 1, 1])
+    with col1:
+        segment = st.selectbox(
+            "세그먼트", index.segments, format_func=lambda name: data.SEGMENT_LABELS.get(name, name),
+            key="drill_segment",
+        )
+    with col2:
+        activity = st.selectbox("구매 후 활동 레벨", (ALL_ACTIVITY,) + index.activity_levels, key="drill_activity")
+    with col3:
+        sort = st.selectbox("정렬", DRILLDOWN_SORTS, format_func=DRILLDOWN_COLUMNS.get, key="drill_sort")
+    with col4:
+        descending = st.toggle("내림차순", value=True, key="drill_desc")
+    with col5:
+        limit = st.selectbox("행 수", (25, 50, 100), index=1, key="drill_limit")
+
+    activity = None if activity == ALL_ACTIVITY else activity
+    total = index.count(segment, activity)
+    pages = max(-(-total // limit), 1)
+    # 필터가 바뀌어 페이지 수가 줄면 첫 페이지로
+    if st.session_state.get("drill_page", 1) > pages:
+        st.session_state["drill_page"] = 1
+    page = st.number_input(f"페이지 (총 {pages:,})", min_value=1, max_value=pages, step=1, key="drill_page")
+
+    offset = (page - 1) * limit
+    with instrumentation.span("data", "drilldown_page"):
+        table = index.page(segment, activity, sort, descending, offset, limit)
+    table = table.rename_columns([DRILLDOWN_COLUMNS[name] for name in table.column_names])
+
+    if total:
+        st.caption(f"{total:,}명 중 {offset + 1:,}–{offset + table.num_rows:,}번째")
+    else:
+        st.caption("해당 조건의 고객이 없습니다")
+    instrumentation.dataframe(
+        table, hide_index=True, use_container_width=True,
+        column_config={DRILLDOWN_COLUMNS["monetary"]: st.column_config.NumberColumn(format="%.2f")},
+    )
+
+
+@st.fragment
+def _segment_transitions(snapshots):
+    # 기간 조작 시 이 블록만 rerun. 이동 행렬은 시작일 상태 + 그 사이 변경분만 읽어 계산
+    if snapshots is None:
+        return
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+    st.subheader("🔀 세그먼트 이동 (스냅샷 비교)")
+
+    dates = [str(date) for date in snapshots.dates()]
+    if len(dates) < 2:
+        st.caption(f"스냅샷이 하나뿐입니다 ({dates[0]}). 비교하려면 두 시점 이상이 필요합니다.")
+        return
+    start, end = st.select_slider(
+        "비교 기간 (시작 스냅샷 → 종료 스냅샷)", options=dates,
+        value=(dates[max(len(dates) - 1 - 90, 0)], dates[-1]), key="transition_range",
+    )
+    share = st.toggle("시작 세그먼트 대비 비율(%)로 보기", value=False, key="transition_share")
+
+    matrix = data.segment_transitions(start, end)
+    moved = int(matrix.to_numpy().sum() - np.trace(matrix.to_numpy()))
+    # 비어 있는 행 / 열(예: 신규 유입이 없는 기간의 '(없음)')은 숨김
+    matrix = matrix.loc[matrix.sum(axis=1) > 0, matrix.sum(axis=0) > 0]
+    labels = {name: data.SEGMENT_LABELS.get(name, name) for name in matrix.index.union(matrix.columns)}
+    matrix = matrix.rename(index=labels, columns=labels)
+    if share:
+        matrix = (matrix.div(matrix.sum(axis=1), axis=0) * 100).round(1)
+
+    col1, col2 = st.columns([3, 2])
+    with col1:
+        fig = figures.express(
+            'imshow',
+            matrix,
+            labels=dict(x=f'{end} 세그먼트', y=f'{start} 세그먼트', color='비율 (%)' if share else '유저 수'),
+            color_continuous_scale='Purples',
+            aspect='auto',
+            text_auto='.1f' if share else ',d',
+            title=f'세그먼트 이동 행렬 ({start} → {end})',
+            layout=dict(height=550),
+        )
+        instrumentation.plotly_chart(fig, use_container_width=True)
+    with col2:
+        history = data.segment_history().rename(columns=labels)
+        frame = history.reset_index().melt(id_vars="snapshot_date", var_name="segment", value_name="user_count")
+        fig = figures.express(
+            'line',
+            frame,
+            x='snapshot_date',
+            y='user_count',
+            color='segment',
+            title='세그먼트 규모 추이',
+            labels={'snapshot_date': '스냅샷 날짜', 'user_count': '유저 수', 'segment': '세그먼트'},
+            color_discrete_sequence=px.colors.qualitative.Set2,
+            layout=dict(height=550),
+        )
+        instrumentation.plotly_chart(fig, use_container_width=True)
+
+    st.caption(f"{start} → {end}: 세그먼트가 바뀐 유저 {moved:,}명 (신규 유입 / 이탈 포함). "
+               "행 = 시작 세그먼트, 열 = 종료 세그먼트")
@@ -0,0 +1,260 @@
+"""
+페이지 6: VIP 심층분석
+"""
+
+import plotly.express as px
+import streamlit as st
+
+from dashboard import data, figures, instrumentation
+
+# 재구매 간격 구간 프리셋 (간격 상한 일수, 포함). None = 직접 입력
+BUCKET_PRESETS = {
+    "재구매 타이밍 (1주 ~ 3개월+)": (7, 14, 30, 60, 90),
+    "전환 속도 (30 / 60일)": (30, 60),
+    "주 단위 (~8주)": (7, 14, 21, 28, 35, 42, 49, 56),
+    "월 단위 (~6개월)": (30, 60, 90, 120, 150, 180),
+    "직접 입력": None,
+}
+
+
+def render():
+    vip_repurchase_timing, conversion_speed = data.load_all(
+        data.load_vip_repurchase_timing, data.load_conversion_speed,
+    )
+
+    st.markdown("""
+    <div class="main-header">
+        <h1>👑 VIP 심층분석</h1>
+        <p>최고 가치 고객군의 행동 패턴 및 성공 요인 분석</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # VIP 주요 지표
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.markdown("""
+        <div class="metric-card green">
+            <div class="metric-value">1,531</div>
+            <div class="metric-label">VIP</div>
+            <div class="metric-delta">전체의 5.14%</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div class="metric-card blue">
+            <div class="metric-value">$275.88</div>
+            <div class="metric-label">평균 LTV</div>
+            <div class="metric-delta">전체 평균의 2.7배</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown("""
+        <div class="metric-card purple">
+            <div class="metric-value">2.32회</div>
+            <div class="metric-label">평균 구매 빈도</div>
+            <div class="metric-delta">전체 평균의 1.9배</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col4:
+        st.markdown("""
+        <div class="metric-card orange">
+            <div class="metric-value">79.5일</div>
+            <div class="metric-label">평균 Recency</div>
+            <div class="metric-delta">최근 활동 고객</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+
+    # 재구매 타이밍 분석
+    st.subheader("⏰ VIP 재구매 타이밍 분석")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        fig = figures.express(
+            'pie',
+            vip_repurchase_timing,
+            values='count',
+            names='bucket',
+            title='첫→2차 구매까지 소요 기간 분포',
+            color_discrete_sequence=px.colors.sequential.Greens_r,
+            traces=dict(textposition='inside', textinfo='percent+label'),
+            layout=dict(height=400),
+        )
+        instrumentation.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        fig = figures.express(
+            'bar',
+            vip_repurchase_timing,
+            x='bucket',
+            y='avg_ltv',
+            color='avg_ltv',
+            color_continuous_scale='Greens',
+            title='재구매 타이밍별 평균 LTV',
+            labels={'avg_ltv': '평균 LTV ($)', 'bucket': '재구매 타이밍'},
+            layout=dict(height=400, xaxis_tickangle=-45),
+        )
+        instrumentation.plotly_chart(fig, use_container_width=True)
+
+    st.markdown("""
+    <div class="insight-box warning">
+        <div class="insight-title">⚠️ 문제: VIP의 71.4%가 3개월+ 후 재구매</div>
+        <div class="insight-text">
+            • 3개월 이내 재구매: <b>28.6%</b> (438명)<br>
+            • 3개월+ 재구매: <b>71.4%</b> (1,093명)<br>
+            • 빠른 재구매(1주 내) 시 LTV <b>$303.42</b> vs 3개월+ <b>$275.30</b> (+10.2%)
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("<div class='section-divider'></div>", unsafe_allow_html=True)
+
+# -------------------------------------------------------------------------
+    # 전환 속도 분석 (SQL 로직: 첫 구매 ~ 두 번째 구매 간격)
+    # -------------------------------------------------------------------------
+    st.subheader("🚀 VIP 초기 안착 속도 분석 (첫 구매 시점 → 두 번째 구매까지 소요 기간)")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        fig = figures.express(
+            'bar',
+            conversion_speed,
+            x='speed',
+            y='count',
+            color='avg_ltv',
+            color_continuous_scale='Greens',
+            title='첫 재구매 소요 기간별 VIP 분포',
+            labels={'count': 'VIP 수', 'speed': '재구매 소요 기간 (Speed Bucket)'},
+            layout=dict(height=350),
+        )
+        instrumentation.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        fig = figures.express(
+            'bar',
+            conversion_speed,
+            x='speed',
+            y='avg_sessions',
+            color='avg_sessions',
+            color_continuous_scale='Blues',
+            title='구간별 구매 사이 평균 세션 활동 수',
+            labels={'avg_sessions': '평균 세션 수', 'speed': '재구매 소요 기간 (Speed Bucket)'},
+            layout=dict(height=350),
+        )
+        instrumentation.plotly_chart(fig, use_container_width=True)
+
+    _custom_buckets(data.repurchase_histogram())
+
+    # [수정] 분석 모수 및 산출 근거 (Expander) - SQL 로직 반영
+    with st.expander("📊 분석 방법론 및 지표 정의 (Methodology)"):
+        st.markdown("""
+        <div style="background-color: #f8f9fa; padding: 15px; border-radius: 10px; font-size: 0.9rem;">
+            <h4 style="margin-top:0;">1. 분석 대상 (Population)</h4>
+            <ul>
+                <li><b>분석 데이터:</b> 현재 <b>VIP</b> 등급 유저들의 과거 구매 이력</li>
+                <li><b>타겟 적용 대상:</b> 재구매 유도가 필요한 <b>Promising(1회 구매)</b> 세그먼트</li>
+                <li><b>공통 기준:</b> <code>Recency ≤ 180일</code> (최근 트렌드를 반영하기 위해 활성 유저 한정)</li>
+            </ul>
+            <h4 style="margin-top:15px;">2. 선정 근거 (Rationale)</h4>
+            <ul>
+                <li><b>롤모델 분석:</b> 현재 VIP인 고객들이 <b>"과거에 얼마나 빨리 첫 재구매를 했는지"</b> 분석하여, 현재 Promising 고객의 골든타임을 도출함.</li>
+                <li><b>타겟팅 전략:</b> VIP가 되는 길(Track)이 '빠른 재구매' 하나뿐인지, '느린 재구매'도 유효한지 파악하여 캠페인 기간을 설정하기 위함.</li>
+            </ul>
+            <h4 style="margin-top:15px;">3. 지표 정의 (Definition)</h4>
+            <ul>
+                <li><b>전환 속도 (Conversion Speed):</b> <code>2번째 구매일 - 1번째 구매일</code> (Time to First Repeat Purchase)</li>
+                <li><b>Quick:</b> 30일 이내 재구매 / <b>Slow:</b> 61일 이후 재구매</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # [수정] 인사이트 박스 - 데이터 해석 논리 수정
+    st.markdown("""
+    <div class="insight-box">
+        <div class="insight-title">💡 Insight: VIP가 되는 두 가지 길 (Quick vs Slow)</div>
+        <div class="insight-text">
+            • <b>Quick (≤30일):</b> 165명, 평균 14.4일 만에 재구매, LTV $282.50<br>
+            • <b>Slow (61+일):</b> 1,237명, 평균 273.2일 후 재구매, LTV $274.58<br><br>
+            <b>🔍 핵심 발견:</b><br>
+            1. <b>대다수는 Slow Starter:</b> VIP의 <b>88%</b>는 첫 재구매까지 2달 이상 걸린 <b>Slow Track</b> 출신입니다.<br>
+            2. <b>LTV 차이는 미미함:</b> 빨리 재구매한 고객의 LTV가 $8 더 높지만, 늦게 재구매한 고객도 충분히 높은 가치를 유지합니다.<br><br>
+            <b>🚀 Action Item:</b><br>
+            • <b>단기 전략:</b> 구매 후 30일 내(Quick) 재구매 유도 캠페인으로 'Early VIP' 확보<br>
+            • <b>장기 전략:</b> <u>"한 달 안에 안 샀다고 포기하지 말 것."</u> Promising 고객에게는 <b>최대 6개월까지</b> 꾸준한 관리(Nurturing)가 들어가야 VIP로 전환됨.
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+def _parse_edges(text):
+    edges = sorted({int(part) for part in text.replace(" ", "").split(",") if part})
+    if not edges or edges[0] < 0:
+        raise ValueError
+    return tuple(edges)
+
+
+@st.fragment
+def _custom_buckets(histogram):
+    # 구간 조작 시 이 블록만 rerun. 구간표는 1일 단위 히스토그램의 칸 합이라 주문 수와 무관
+    if histogram is None:
+        return
+
+    st.subheader("🧮 재구매 간격 구간 직접 설정")
+
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        preset = st.selectbox("구간 체계", tuple(BUCKET_PRESETS), key="repurchase_preset")
+    edges = BUCKET_PRESETS[preset]
+    if edges is None:
+        with col2:
+            text = st.text_input("구간 상한 (일, 쉼표 구분)", value="7, 14, 30, 60, 90", key="repurchase_edges")
+        try:
+            edges = _parse_edges(text)
+        except ValueError:
+            st.error("구간 상한은 0 이상의 정수를 쉼표로 구분해 입력하세요 (예: 7, 30, 90)")
+            return
+
+    table = data.repurchase_table(edges)
+    col1, col2 = st.columns(2)
+    with col1:
+        fig = figures.express(
+            'bar',
+            table,
+            x='bucket',
+            y='count',
+            color='avg_ltv',
+            color_continuous_scale='Greens',
+            title='구간별 VIP 수',
+            labels={'count': 'VIP 수', 'bucket': '첫→2차 구매 간격', 'avg_ltv': '평균 LTV ($)'},
+            layout=dict(height=350),
+        )
+        instrumentation.plotly_chart(fig, use_container_width=True)
+    with col2:
+        fig = figures.express(
+            'bar',
+            table,
+            x='bucket',
+            y='avg_sessions',
+            color='avg_sessions',
+            color_continuous_scale='Blues',
+            title='구간별 구매 사이 평균 세션 수',
+            labels={'avg_sessions': '평균 세션 수', 'bucket': '첫→2차 구매 간격'},
+            layout=dict(height=350),
+        )
+        instrumentation.plotly_chart(fig, use_container_width=True)
+
+    instrumentation.dataframe(
+        table.rename(columns={
+            "bucket": "구간", "count": "VIP 수", "pct": "비중 (%)", "avg_days": "평균 간격 (일)",
+            "avg_first_revenue": "첫 주문 매출", "avg_second_revenue": "2차 주문 매출", "avg_ltv": "평균 LTV",
+            "avg_m_score": "평균 M", "avg_sessions": "평균 세션", "avg_product_views": "평균 상품 조회",
+        }).round(2),
+        hide_index=True, use_container_width=True,
+    )
@@ -0,0 +1,264 @@
+"""
+대시보드 공통 스타일 (커스텀 CSS)
+모듈 import 시 한 번만 평가되며, rerun 마다 inject() 로 주입합니다.
+"""
+
+import streamlit as st
+
+CSS = """
+<style>
+    /* 메인 헤더 */
+    .main-header {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        padding: 2rem 2.5rem;
+        border-radius: 16px;
+        margin-bottom: 2rem;
+        color: white;
+        box-shadow: 0 10px 40px rgba(102, 126, 234, 0.3);
+    }
+    .main-header h1 {
+        font-size: 2.2rem;
+        font-weight: 700;
+        margin-bottom: 0.5rem;
+    }
+    .main-header p {
+        opacity: 0.9;
+        font-size: 1.1rem;
+    }
+    
+    /* Executive Summary 헤더 */
+    .exec-header {
+        background: linear-gradient(135deg, #1e3a5f 0%, #2d5a87 100%);
+        padding: 2.5rem 3rem;
+        border-radius: 16px;
+        margin-bottom: 2rem;
+        color: white;
+        box-shadow: 0 10px 40px rgba(30, 58, 95, 0.4);
+    }
+    .exec-header h1 {
+        font-size: 2.4rem;
+        font-weight: 700;
+        margin-bottom: 0.5rem;
+    }
+    
+    /* 메트릭 카드 */
+    .metric-card {
+        background: white;
+        padding: 1.5rem;
+        border-radius: 12px;
+        box-shadow: 0 4px 20px rgba(0,0,0,0.08);
+        border-left: 4px solid;
+        transition: transform 0.2s ease;
+        margin-bottom: 1rem;
+    }
+    .metric-card:hover {
+        transform: translateY(-2px);
+    }
+    .metric-card.blue { border-color: #667eea; }
+    .metric-card.green { border-color: #10b981; }
+    .metric-card.orange { border-color: #f59e0b; }
+    .metric-card.red { border-color: #ef4444; }
+    .metric-card.purple { border-color: #8b5cf6; }
+    .metric-card.navy { border-color: #1e3a5f; }
+    
+    .metric-value {
+        font-size: 2rem;
+        font-weight: 700;
+        color: #1f2937;
+    }
+    .metric-label {
+        font-size: 0.9rem;
+        color: #6b7280;
+        margin-top: 0.25rem;
+    }
+    .metric-delta {
+        font-size: 0.85rem;
+        margin-top: 0.5rem;
+    }
+    .delta-positive { color: #10b981; }
+    .delta-negative { color: #ef4444; }
+    
+    /* 인사이트 박스 */
+    .insight-box {
+        background: linear-gradient(135deg, #f0f9ff 0%, #e0f2fe 100%);
+        border-left: 4px solid #0ea5e9;
+        padding: 1.25rem 1.5rem;
+        border-radius: 0 12px 12px 0;
+        margin: 1rem 0;
+    }
+    .insight-box.warning {
+        background: linear-gradient(135deg, #fffbeb 0%, #fef3c7 100%);
+        border-color: #f59e0b;
+    }
+    .insight-box.success {
+        background: linear-gradient(135deg, #ecfdf5 0%, #d1fae5 100%);
+        border-color: #10b981;
+    }
+    .insight-box.danger {
+        background: linear-gradient(135deg, #fef2f2 0%, #fee2e2 100%);
+        border-color: #ef4444;
+    }
+    .insight-box.navy {
+        background: linear-gradient(135deg, #e8f4fd 0%, #d1e9fc 100%);
+        border-color: #1e3a5f;
+    }
+    .insight-box.purple {
+        background: linear-gradient(135deg, #f5f3ff 0%, #ede9fe 100%);
+        border-color: #8b5cf6;
+    }
+    .insight-title {
+        font-weight: 600;
+        font-size: 1rem;
+        color: #1f2937;
+        margin-bottom: 0.5rem;
+    }
+    .insight-text {
+        color: #4b5563;
+        font-size: 0.95rem;
+        line-height: 1.6;
+    }
+    
+    /* 문제정의 박스 */
+    .problem-box {
+        background: linear-gradient(135deg, #fef2f2 0%, #fee2e2 100%);
+        border: 2px solid #ef4444;
+        border-radius: 12px;
+        padding: 1.5rem;
+        margin: 1rem 0;
+    }
+    .problem-title {
+        font-weight: 700;
+        font-size: 1.1rem;
+        color: #dc2626;
+        margin-bottom: 0.75rem;
+    }
+    
+    /* 해결방안 박스 */
+    .solution-box {
+        background: linear-gradient(135deg, #ecfdf5 0%, #d1fae5 100%);
+        border: 2px solid #10b981;
+        border-radius: 12px;
+        padding: 1.5rem;
+        margin: 1rem 0;
+    }
+    .solution-title {
+        font-weight: 700;
+        font-size: 1.1rem;
+        color: #059669;
+        margin-bottom: 0.75rem;
+    }
+    
+    /* ROI 박스 */
+    .roi-box {
+        background: linear-gradient(135deg, #fefce8 0%, #fef9c3 100%);
+        border: 2px solid #eab308;
+        border-radius: 12px;
+        padding: 1.5rem;
+        margin: 1rem 0;
+    }
+    .roi-title {
+        font-weight: 700;
+        font-size: 1.1rem;
+        color: #ca8a04;
+        margin-bottom: 0.75rem;
+    }
+    
+    /* 액션 플랜 박스 */
+    .action-box {
+        background: white;
+        border: 2px solid #e5e7eb;
+        border-radius: 12px;
+        padding: 1.5rem;
+        margin: 1rem 0;
+        transition: all 0.2s ease;
+    }
+    .action-box:hover {
+        border-color: #667eea;
+        box-shadow: 0 4px 20px rgba(102, 126, 234, 0.15);
+    }
+    .action-header {
+        display: flex;
+        align-items: center;
+        gap: 0.75rem;
+        margin-bottom: 1rem;
+    }
+    .action-icon {
+        width: 40px;
+        height: 40px;
+        border-radius: 10px;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        font-size: 1.25rem;
+    }
+    .action-title {
+        font-weight: 600;
+        font-size: 1.1rem;
+        color: #1f2937;
+    }
+    .action-content {
+        color: #4b5563;
+        font-size: 0.95rem;
+        line-height: 1.7;
+    }
+    
+    /* 섹션 디바이더 */
+    .section-divider {
+        height: 2px;
+        background: linear-gradient(90deg, #667eea, #764ba2, #667eea);
+        margin: 2rem 0;
+        border-radius: 1px;
+    }
+    
+    /* RFM 기준 테이블 */
+    .rfm-criteria-table {
+        background: white;
+        border-radius: 12px;
+        padding: 1.5rem;
+        box-shadow: 0 4px 20px rgba(0,0,0,0.08);
+    }
+    
+    /* Executive Summary 핵심 지표 */
+    .exec-metric {
+        background: white;
+        padding: 1.75rem;
+        border-radius: 16px;
+        box-shadow: 0 8px 30px rgba(0,0,0,0.12);
+        text-align: center;
+        transition: transform 0.3s ease;
+    }
+    .exec-metric:hover {
+        transform: translateY(-4px);
+    }
+    .exec-metric-value {
+        font-size: 2.5rem;
+        font-weight: 800;
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+    }
+    .exec-metric-label {
+        font-size: 1rem;
+        color: #6b7280;
+        margin-top: 0.5rem;
+        font-weight: 500;
+    }
+    
+    /* Key Finding 카드 */
+    .key-finding {
+        background: white;
+        border-radius: 12px;
+        padding: 1.5rem;
+        margin: 0.5rem 0;
+        box-shadow: 0 2px 10px rgba(0,0,0,0.06);
+        border-left: 4px solid;
+    }
+    .key-finding.critical { border-color: #ef4444; }
+    .key-finding.opportunity { border-color: #10b981; }
+    .key-finding.insight { border-color: #3b82f6; }
+</style>
+"""
+
+
+def inject():
+    st.markdown(CSS, unsafe_allow_html=True)
@@ -0,0 +1,102 @@
+"""
+페이지별 렌더링 시간 측정 하네스
+==============================
+Streamlit AppTest 로 대시보드를 headless 실행하여 페이지마다
+- first_visit_ms: 프로세스에서 해당 페이지를 처음 열 때 (모듈/plotly import 포함)
+- rerun_ms: 같은 페이지에서 다시 rerun 할 때 (중앙값)
+를 측정합니다. 페이지 간 import 비용이 섞이지 않도록 각 페이지는 별도 프로세스에서 측정합니다.
+--data-dir 를 주면 THELOOK_DATA_DIR 로 넘겨 하드코딩 값 대신 로컬 원천에서 계산하는 경로를 측정합니다.
+
+사용 예:
+    python -m dashboard.timing --runs 5
+    python -m dashboard.timing --json timings.json
+    python -m dashboard.timing --data-dir data/thelook
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from dashboard.pages import PAGES
+
+MAIN_SCRIPT = Path(__file__).resolve().parent.parent / "streamlit_analysis.py"
+
+
+def measure_page(key, runs=5, script=MAIN_SCRIPT, timeout=60):
+    """현재 프로세스에서 한 페이지의 startup / first visit / rerun 시간 측정 (ms)"""
+    from streamlit.testing.v1 import AppTest
+
+    label = next(label for label, page_key in PAGES.items() if page_key == key)
+    at = AppTest.from_file(str(script), default_timeout=timeout)
+
+    started = time.perf_counter()
+    at.run()
+    startup_ms = (time.perf_counter() - started) * 1000
+    if at.exception:
+        raise RuntimeError(f"앱 실행 실패: {at.exception}")
+
+    first_visit_ms = startup_ms
+    if at.sidebar.radio[0].value != label:
+        started = time.perf_counter()
+        at.sidebar.radio[0].set_value(label).run()
+        first_visit_ms = (time.perf_counter() - started) * 1000
+
+    reruns = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        at.run()
+        reruns.append((time.perf_counter() - started) * 1000)
+    if at.exception:
+        raise RuntimeError(f"{key} 렌더링 실패: {at.exception}")
+
+    return {
+        "page": key,
+        "startup_ms": round(startup_ms, 2),
+        "first_visit_ms": round(first_visit_ms, 2),
+        "rerun_ms": round(statistics.median(reruns), 2),
+        "rerun_min_ms": round(min(reruns), 2),
+        "runs": runs,
+    }
+
+
+def measure_all(runs=5, pages=None, env=None):
+    """페이지마다 새 프로세스에서 measure_page 실행 (env = 측정 프로세스에 추가할 환경변수)"""
+    results = []
+    for key in pages or PAGES.values():
+        output = subprocess.run(
+            [sys.executable, "-m", "dashboard.timing", "--page", key, "--runs", str(runs)],
+            check=True, capture_output=True, text=True,
+            cwd=MAIN_SCRIPT.parent, env={**os.environ, **(env or {})},
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="대시보드 페이지별 렌더링 시간 측정")
+    parser.add_argument("--runs", type=int, default=5, help="페이지별 rerun 측정 횟수")
+    parser.add_argument("--page", default=None, help="(내부용) 현재 프로세스에서 한 페이지만 측정")
+    parser.add_argument("--json", default=None, help="결과를 저장할 JSON 경로")
+    parser.add_argument("--data-dir", default=None, help="로컬 원천 Parquet 디렉터리 (THELOOK_DATA_DIR)")
+    args = parser.parse_args(argv)
+
+    if args.page:
+        print(json.dumps(measure_page(args.page, runs=args.runs)))
+        return
+
+    env = {"THELOOK_DATA_DIR": str(Path(args.data_dir).resolve())} if args.data_dir else None
+    results = measure_all(runs=args.runs, env=env)
+    print(f"{'page':<16}{'startup':>12}{'first visit':>14}{'rerun':>12}")
+    for row in results:
+        print(f"{row['page']:<16}{row['startup_ms']:>10.1f}ms{row['first_visit_ms']:>12.1f}ms{row['rerun_ms']:>10.1f}ms")
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+웨어하우스 연결 풀 / 동시 쿼리 실행기
+====================================
+페이지 하나가 서로 독립적인 결과 집합을 여러 개 필요로 할 때, 순서대로 실행하면 지연 시간이 합산됩니다.
+QueryExecutor 는 제한된 크기의 스레드 풀로 쿼리를 동시에 제출하고, 각 스레드는 ConnectionPool 에서
+연결을 빌려 씁니다. 페이지 지연은 합이 아니라 가장 느린 쿼리에 가까워집니다.
+
+연결 대상 (환경변수 THELOOK_WAREHOUSE):
+- duckdb:///<path>.duckdb : `python -m thelook_analysis.duckdb_backend --database <path>` (또는 스케줄러) 로 만든 로컬 DB.
+  쿼리마다 읽기 전용 연결을 열고 끝나면 닫으므로 쿼리 사이에는 파일 잠금을 잡고 있지 않아 스케줄러가 같은 파일을
+  읽기-쓰기로 열 수 있음. 스케줄러가 갱신 중이면 잠금이 풀릴 때까지 재시도 (THELOOK_WAREHOUSE_LOCK_TIMEOUT 초).
+  쿼리는 BigQuery 문법으로 작성하고 실행 직전에 번역
+- bigquery://<project> : google-cloud-bigquery 가 설치되어 있어야 함 (Client 는 스레드 안전하므로 공유)
+
+쿼리는 모두 BigQuery 문법이며 `{dataset}` 자리에 모델이 있는 데이터셋 이름이 들어갑니다.
+결과는 Arrow 테이블로 받아 문자열을 사전 인코딩한 채로 다룹니다 (dashboard.frames).
+"""
+
+import contextlib
+import contextvars
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from dashboard import frames
+
+WAREHOUSE_ENV = "THELOOK_WAREHOUSE"
+POOL_SIZE_ENV = "THELOOK_WAREHOUSE_POOL_SIZE"
+DEFAULT_POOL_SIZE = 4
+LOCK_TIMEOUT_ENV = "THELOOK_WAREHOUSE_LOCK_TIMEOUT"
+DEFAULT_LOCK_TIMEOUT = 60.0
+
+
+class ConnectionPool:
+    """
+    factory() 로 만든 연결을 최대 size 개까지 재사용하는 풀. 모두 사용 중이면 반납될 때까지 대기.
+    reuse=False 면 동시 연결 수만 제한하고 연결은 쓸 때마다 새로 만들어 반납 시 닫음
+    """
+
+    def __init__(self, factory, size=DEFAULT_POOL_SIZE, reuse=True):
+        self.factory = factory
+        self.size = size
+        self.reuse = reuse
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+
+    @contextlib.contextmanager
+    def connection(self):
+        self._slots.acquire()
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    self._created += 1
+                conn = self.factory()
+            try:
+                yield conn
+            finally:
+                if self.reuse:
+                    self._idle.put(conn)
+                else:
+                    conn.close()
+        finally:
+            self._slots.release()
+
+    def close(self):
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            close = getattr(conn, "close", None)
+            if close is not None:
+                close()
+
+
+class DuckDBConnection:
+    """로컬 DuckDB 연결 (BigQuery 문법 쿼리를 번역해 실행)"""
+
+    dataset = "main"
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+
+    @classmethod
+    def open(cls, database, lock_timeout=DEFAULT_LOCK_TIMEOUT):
+        """읽기 전용으로 연결. 다른 프로세스(스케줄러)가 쓰기 잠금을 잡고 있으면 lock_timeout 초까지 재시도"""
+        import duckdb
+
+        deadline = time.monotonic() + lock_timeout
+        delay = 0.05
+        while True:
+            try:
+                return cls(duckdb.connect(str(database), read_only=True))
+            except duckdb.IOException as exc:
+                if "lock" not in str(exc).lower() or time.monotonic() + delay > deadline:
+                    raise
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
+
+    def query_arrow(self, sql):
+        from thelook_analysis.duckdb_backend import translate_sql
+
+        result = self.cursor.execute(translate_sql(sql))
+        # duckdb 1.4+ 는 to_arrow_table, 이전 버전은 fetch_arrow_table
+        fetch = getattr(result, "to_arrow_table", None) or result.fetch_arrow_table
+        return fetch()
+
+    def close(self):
+        self.cursor.close()
+
+
+class BigQueryConnection:
+    def __init__(self, client, dataset):
+        self.client = client
+        self.dataset = dataset
+
+    def query_arrow(self, sql):
+        return self.client.query(sql).to_arrow()
+
+    def close(self):
+        pass
+
+
+def duckdb_pool(database, size=DEFAULT_POOL_SIZE, lock_timeout=None):
+    """
+    DuckDB 파일에 쿼리마다 읽기 전용 연결을 여는 풀 (동시 연결 size 개).
+    연결을 유지하면 파일 잠금이 남아 스케줄러의 읽기-쓰기 연결이 실패하므로 재사용하지 않음
+    """
+    if not os.path.exists(database):
+        raise FileNotFoundError(f"DuckDB 파일이 없습니다: {database}")
+    if lock_timeout is None:
+        lock_timeout = float(os.environ.get(LOCK_TIMEOUT_ENV, DEFAULT_LOCK_TIMEOUT))
+    return ConnectionPool(lambda: DuckDBConnection.open(database, lock_timeout), size, reuse=False)
+
+
+def bigquery_pool(project, dataset, size=DEFAULT_POOL_SIZE):
+    try:
+        from google.cloud import bigquery
+    except ImportError as exc:
+        raise ImportError("bigquery:// 웨어하우스에는 google-cloud-bigquery 가 필요합니다") from exc
+
+    client = bigquery.Client(project=project)
+    return ConnectionPool(lambda: BigQueryConnection(client, dataset), size)
+
+
+def open_pool(url, size=None):
+    """
+    duckdb:///path/thelook.duckdb 또는 bigquery://<project>/<dataset> → ConnectionPool
+    """
+    size = size or int(os.environ.get(POOL_SIZE_ENV, DEFAULT_POOL_SIZE))
+    parsed = urlparse(url)
+    if parsed.scheme == "duckdb":
+        return duckdb_pool(parsed.path, size)
+    if parsed.scheme == "bigquery":
+        return bigquery_pool(parsed.netloc, parsed.path.strip("/") or "thelook_dbt", size)
+    raise ValueError(f"지원하지 않는 웨어하우스 URL: {url}")
+
+
+class QueryExecutor:
+    """
+    ConnectionPool 위의 동시 쿼리 실행기.
+
+        executor.run({"timing": TIMING_SQL, "speed": SPEED_SQL})  # → {"timing": df, "speed": df}
+
+    제출한 스레드의 contextvars (페이지 계측 등) 를 작업 스레드로 복사합니다.
+    """
+
+    def __init__(self, pool, max_workers=None):
+        self.pool = pool
+        self._threads = ThreadPoolExecutor(max_workers=max_workers or pool.size,
+                                           thread_name_prefix="thelook-query")
+
+    def query_arrow(self, sql):
+        """연결을 하나 빌려 동기 실행 → 문자열이 사전 인코딩된 Arrow 테이블"""
+        with self.pool.connection() as conn:
+            return frames.encode_strings(conn.query_arrow(sql.format(dataset=conn.dataset)))
+
+    def query(self, sql):
+        """query_arrow 결과를 DataFrame 으로 (문자열 컬럼은 Categorical)"""
+        return frames.from_arrow(self.query_arrow(sql))
+
+    def submit(self, fn, *args):
+        context = contextvars.copy_context()
+        return self._threads.submit(context.run, fn, *args)
+
+    def map(self, calls):
+        """{이름: 인자 없는 함수} 를 동시에 실행해 {이름: 결과}. 하나라도 실패하면 그 예외를 그대로 전달"""
+        futures = {name: self.submit(fn) for name, fn in calls.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+    def run(self, queries, arrow=False):
+        """{이름: SQL} 를 동시에 실행해 {이름: DataFrame} (arrow=True 면 {이름: pyarrow.Table})"""
+        query = self.query_arrow if arrow else self.query
+        return self.map({name: (lambda sql=sql: query(sql)) for name, sql in queries.items()})
+
+    def close(self):
+        self._threads.shutdown(wait=False, cancel_futures=True)
+        self.pool.close()
@@ -0,0 +1,140 @@
+"""
+공용 fixture: 작은 합성 데이터셋(thelook_analysis.synth) 과 그 위의 DuckDB 로컬 러너.
+엔진 결과는 같은 데이터에서 dbt 모델(SQL) 로 계산한 값과 비교합니다.
+
+    python -m pytest -q tests
+"""
+
+import shutil
+
+import duckdb
+import pytest
+
+from thelook_analysis.rfm import score_rfm
+
+ORDER_ROWS_SQL = """
+    SELECT o.user_id, o.order_id, o.order_date, oi.sale_price, oi.created_at
+    FROM stg_orders o
+    JOIN stg_order_items oi ON o.order_id = oi.order_id
+"""
+
+
+@pytest.fixture(scope="session")
+def synth_config():
+    from thelook_analysis.synth import SynthConfig
+
+    return SynthConfig(users=20_000, chunk_users=5_000, products=500)
+
+
+@pytest.fixture(scope="session")
+def data_dir(tmp_path_factory, synth_config):
+    from thelook_analysis.synth import generate
+
+    out_dir = tmp_path_factory.mktemp("thelook")
+    generate(out_dir, synth_config, workers=1)
+    return out_dir
+
+
+@pytest.fixture(scope="session")
+def runner(data_dir):
+    from thelook_analysis.duckdb_backend import LocalRunner
+
+    runner = LocalRunner(data_dir)
+    runner.run(["stg_orders", "stg_order_items", "stg_users", "stg_events", "int_user_rfm", "mart_rfm_cube"])
+    yield runner
+    runner.close()
+
+
+@pytest.fixture(scope="session")
+def order_rows(runner):
+    rows = runner.query(ORDER_ROWS_SQL)
+    return tuple(rows[name].to_numpy() for name in ("user_id", "order_id", "order_date", "sale_price"))
+
+
+@pytest.fixture(scope="session")
+def rfm(order_rows):
+    return score_rfm(*order_rows)
+
+
+@pytest.fixture(scope="session")
+def store_path(data_dir, tmp_path_factory):
+    from thelook_analysis.store import build_store
+
+    return build_store(data_dir, tmp_path_factory.mktemp("store") / "rfm.store")
+
+
+@pytest.fixture(scope="session")
+def store(store_path):
+    from thelook_analysis.store import open_store
+
+    with open_store(store_path) as store:
+        yield store
+
+
+# ============================================
+# 원천 변경 (incremental 검사용)
+# ============================================
+
+def _rewrite(data_dir, table, sql):
+    """<data_dir>/<table>/ 의 Parquet 를 sql (src = 기존 행) 결과 한 파일로 교체"""
+    directory = data_dir / table
+    con = duckdb.connect()
+    con.execute(f"CREATE TABLE src AS SELECT * FROM read_parquet('{directory.as_posix()}/*.parquet')")
+    shutil.rmtree(directory)
+    directory.mkdir()
+    con.execute(f"COPY ({sql}) TO '{(directory / 'part-00000.parquet').as_posix()}' (FORMAT PARQUET)")
+    con.close()
+
+
+@pytest.fixture
+def source_copy(data_dir, tmp_path):
+    """변경해도 되는 원천 복사본"""
+    copy = tmp_path / "source"
+    shutil.copytree(data_dir, copy)
+    return copy
+
+
+@pytest.fixture
+def return_month(source_copy):
+    """month (YYYY-MM-01) 에 생성된 주문 / 주문 상품을 모두 반품 처리 (반품 시각은 기존 워터마크 이후)"""
+
+    def apply(month):
+        for table in ("orders", "order_items"):
+            _rewrite(source_copy, table, f"""
+                SELECT * REPLACE (
+                    CASE WHEN date_trunc('month', created_at) = DATE '{month}' THEN 'Returned' ELSE status END
+                        AS status,
+                    CASE WHEN date_trunc('month', created_at) = DATE '{month}'
+                         THEN (SELECT max(greatest(created_at, coalesce(returned_at, created_at))) FROM src)
+                              + INTERVAL 1 DAY
+                         ELSE returned_at END AS returned_at
+                )
+                FROM src
+            """)
+
+    return apply
+
+
+@pytest.fixture
+def rewind_source(data_dir, source_copy):
+    """cutoff 시점의 원천으로 되돌림 (이후 생성된 주문은 제외, 이후 반품은 아직 반품 전). 반환값을 호출하면 원래대로 복원"""
+
+    def apply(cutoff):
+        for table in ("orders", "order_items"):
+            _rewrite(source_copy, table, f"""
+                SELECT * REPLACE (
+                    CASE WHEN returned_at >= TIMESTAMP '{cutoff}' THEN 'Complete' ELSE status END AS status,
+                    CASE WHEN returned_at >= TIMESTAMP '{cutoff}' THEN NULL ELSE returned_at END AS returned_at
+                )
+                FROM src
+                WHERE created_at < TIMESTAMP '{cutoff}'
+            """)
+
+        def restore():
+            for table in ("orders", "order_items"):
+                shutil.rmtree(source_copy / table)
+                shutil.copytree(data_dir / table, source_copy / table)
+
+        return restore
+
+    return apply
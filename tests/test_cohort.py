@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from thelook_analysis.cohort import CohortMatrix, build_cohorts, update_cohorts
+
+
+@pytest.fixture(scope="module")
+def cohorts(data_dir):
+    return build_cohorts(data_dir, batch_size=5_000)
+
+
+def test_table_matches_sql(runner, cohorts):
+    expected = runner.query("""
+        SELECT
+            strftime(u.signup_date, '%Y-%m') AS cohort,
+            date_diff('month', date_trunc('month', u.signup_date), date_trunc('month', oi.order_date))
+                AS months_since_signup,
+            COUNT(DISTINCT oi.user_id) AS active_users,
+            SUM(oi.sale_price) AS revenue,
+            COUNT(*) AS items
+        FROM stg_order_items oi
+        JOIN stg_users u USING (user_id)
+        GROUP BY 1, 2
+        ORDER BY 1, 2
+    """)
+    actual = cohorts.table()
+    actual = actual[actual["items"] > 0].sort_values(["cohort", "months_since_signup"]).reset_index(drop=True)
+    assert len(expected) > 0
+    np.testing.assert_array_equal(actual["cohort"], expected["cohort"])
+    np.testing.assert_array_equal(actual["months_since_signup"], expected["months_since_signup"])
+    np.testing.assert_array_equal(actual["active_users"], expected["active_users"])
+    np.testing.assert_array_equal(actual["items"], expected["items"])
+    np.testing.assert_allclose(actual["revenue"], expected["revenue"], rtol=1e-9)
+
+
+def test_channel_groups_sum_to_total(cohorts):
+    total = cohorts.pivot("active_users")
+    by_group = sum(cohorts.pivot("active_users", group=group).fillna(0) for group in cohorts.groups)
+    pd.testing.assert_frame_equal(by_group, total.fillna(0))
+    with pytest.raises(KeyError):
+        cohorts.pivot(group="Nope")
+
+
+def test_update_matches_full_build(data_dir, cohorts, tmp_path):
+    # 저장본을 다시 읽어 마지막 월을 비우고 재반영해도 같은 결과 (여러 번 갱신해도 같음)
+    updated = update_cohorts(CohortMatrix.load(cohorts.save(tmp_path / "cohorts.npz")), data_dir)
+    updated = update_cohorts(updated, data_dir)
+    for group in (None, *cohorts.groups):
+        pd.testing.assert_frame_equal(updated.table(group), cohorts.table(group))
+
+
+def test_update_after_new_orders_matches_full_build(source_copy, rewind_source, tmp_path):
+    restore = rewind_source("2024-07-01")
+    saved = build_cohorts(source_copy).save(tmp_path / "cohorts.npz")
+    restore()
+
+    full = build_cohorts(source_copy)
+    updated = update_cohorts(CohortMatrix.load(saved), source_copy)
+    updated = update_cohorts(updated, source_copy)
+    for group in (None, *full.groups):
+        pd.testing.assert_frame_equal(updated.table(group), full.table(group))
+
+
+def test_since_drops_earlier_cohorts(cohorts):
+    table = cohorts.table(since="2024-01")
+    assert table["cohort"].min() == "2024-01"
+    assert table["months_since_signup"].max() <= 11
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from thelook_analysis import cube
+
+
+@pytest.fixture(scope="module")
+def rfm_cube(runner):
+    return cube.RFMCube(runner.query("SELECT * FROM mart_rfm_cube"))
+
+
+@pytest.fixture(scope="module")
+def users(runner):
+    # 큐브와 같은 기준의 유저 단위 행 (유입 채널 포함)
+    return runner.query("""
+        SELECT r.user_id, r.customer_segment AS segment, r.monetary, r.frequency,
+               COALESCE(u.traffic_source, 'Unknown') AS traffic_source
+        FROM int_user_rfm r
+        LEFT JOIN stg_users u USING (user_id)
+    """)
+
+
+def test_cube_matches_store(rfm_cube, store):
+    expected = store.segment_summary().set_index("segment")
+    actual = cube.segment_table(rfm_cube).set_index("segment").loc[expected.index]
+    np.testing.assert_array_equal(actual["user_count"], expected["user_count"])
+    for name in ("avg_recency", "avg_frequency", "avg_monetary", "r_score", "f_score", "m_score", "total_revenue",
+                 "pct", "revenue_pct"):
+        # 저장소의 monetary 는 float32
+        np.testing.assert_allclose(actual[name], expected[name], rtol=1e-6, err_msg=name)
+
+
+def test_rollup_totals_and_filters(rfm_cube, users):
+    total = rfm_cube.rollup()
+    assert total["users"][0] == len(users)
+    assert total["revenue"][0] == pytest.approx(users["monetary"].sum())
+    assert total["repeat_users"][0] == (users["frequency"] >= 2).sum()
+
+    vip = rfm_cube.rollup("traffic_source", where={"segment": cube.VIP}).set_index("traffic_source")
+    expected = users[users["segment"] == cube.VIP].groupby("traffic_source").agg(
+        users=("user_id", "size"), revenue=("monetary", "sum"),
+    )
+    np.testing.assert_array_equal(vip["users"].loc[expected.index], expected["users"])
+    np.testing.assert_allclose(vip["revenue"].loc[expected.index], expected["revenue"])
+
+
+def test_channel_table_matches_user_rows(rfm_cube, users):
+    table = cube.channel_table(rfm_cube).set_index("channel")
+    focus = users[users["segment"].isin([cube.VIP, cube.PROMISING_HIGH, cube.PROMISING_LOW])]
+    counts = pd.crosstab(focus["traffic_source"], focus["segment"])
+    np.testing.assert_array_equal(table["total_users"], counts.sum(axis=1).loc[table.index])
+    np.testing.assert_allclose(table["vip_maturity_rate"],
+                               (counts[cube.VIP] / counts.sum(axis=1) * 100).loc[table.index])
+    assert table["vip_maturity_rate"].is_monotonic_decreasing
+
+
+def test_missing_columns_rejected(runner):
+    with pytest.raises(ValueError, match="revenue"):
+        cube.RFMCube(runner.query("SELECT * EXCLUDE (revenue) FROM mart_rfm_cube"))
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from thelook_analysis.drilldown import SegmentIndex
+from thelook_analysis.sessions import DEFAULT_EDGES
+
+SEGMENT = "Promising High Value"
+
+
+@pytest.fixture(scope="module")
+def index(store):
+    return SegmentIndex(store)
+
+
+@pytest.fixture(scope="module")
+def members(store, index):
+    frame = store.to_frame(columns=["user_id", "segment", "monetary", "recency_days", "post_purchase_sessions"])
+    level = np.searchsorted(DEFAULT_EDGES, frame["post_purchase_sessions"], side="right") - 1
+    frame["activity"] = np.asarray(index.activity_levels)[level]
+    return frame[frame["segment"] == SEGMENT]
+
+
+def _pages(index, limit, **kwargs):
+    ids, offset = [], 0
+    while True:
+        page = index.page(SEGMENT, offset=offset, limit=limit, columns=["user_id"], **kwargs)
+        if page.num_rows == 0:
+            return ids
+        assert page.num_rows <= limit
+        ids.extend(page.column("user_id").to_pylist())
+        offset += limit
+
+
+@pytest.mark.parametrize("sort,descending", [("monetary", True), ("recency_days", False), ("user_id", True)])
+def test_pages_cover_group_in_sort_order(index, members, sort, descending):
+    expected = members.sort_values([sort, "user_id"], kind="stable")["user_id"].tolist()
+    if descending:
+        expected = expected[::-1]
+    assert _pages(index, 37, sort=sort, descending=descending) == expected
+
+
+def test_activity_groups(index, members):
+    counts = members["activity"].value_counts()
+    for activity, users in counts.items():
+        assert index.count(SEGMENT, activity) == users
+        rows = index.rows(SEGMENT, activity, sort="monetary", limit=len(members))
+        assert set(index.store.user_id[rows]) == set(members.loc[members["activity"] == activity, "user_id"])
+    assert index.count(SEGMENT) == len(members)
+    listed = {(segment, activity): users for segment, activity, users in index.counts()}
+    assert sum(listed.values()) == len(index.store)
+    assert all(listed[(SEGMENT, activity)] == users for activity, users in counts.items())
+
+
+def test_offset_past_end_and_bad_keys(index, members):
+    assert len(index.rows(SEGMENT, offset=len(members) + 10)) == 0
+    assert len(index.rows(SEGMENT, descending=False, offset=len(members) + 10)) == 0
+    with pytest.raises(KeyError):
+        index.count("Nope")
+    with pytest.raises(KeyError):
+        index.count(SEGMENT, "Nope")
+    with pytest.raises(ValueError):
+        index.rows(SEGMENT, sort="segment")
+    with pytest.raises(ValueError):
+        SegmentIndex(index.store, edges=(1, 2))
@@ -0,0 +1,53 @@
+import duckdb
+import pandas as pd
+
+from thelook_analysis.duckdb_backend import LocalRunner, translate_sql
+
+
+def test_translate_sql():
+    sql = translate_sql(
+        "SELECT DATE_DIFF(DATE(o.created_at), DATE_TRUNC(u.created_at, MONTH), DAY) AS days, STDDEV(x) "
+        "FROM `proj.look.orders` o"
+    )
+    assert sql == (
+        "SELECT date_diff('day', CAST(date_trunc('month', u.created_at) AS DATE), CAST(o.created_at AS DATE)) "
+        'AS days, STDDEV_SAMP(x) FROM "proj"."look"."orders" o'
+    )
+    assert translate_sql("SELECT t.stddev(x)") == "SELECT t.stddev(x)"
+
+
+def test_translate_sql_nested_calls_are_translated_once():
+    assert translate_sql("DATE_DIFF(a, DATE_TRUNC(b, MONTH), DAY)") == (
+        "date_diff('day', CAST(date_trunc('month', b) AS DATE), a)"
+    )
+    assert translate_sql("DATE_DIFF(DATE_DIFF(a, b, DAY), b, day)") == (
+        "date_diff('day', b, date_diff('day', b, a))"
+    )
+
+
+def test_translated_functions_match_bigquery_semantics():
+    row = duckdb.sql(translate_sql("""
+        SELECT
+            DATE_DIFF(DATE '2024-03-01', DATE '2024-02-01', DAY) AS days,
+            DATE_TRUNC(DATE '2024-03-17', MONTH) AS month,
+            STDDEV(v) AS std
+        FROM (VALUES (1.0), (3.0)) t(v)
+    """)).fetchone()
+    assert row[0] == 29
+    assert str(row[1]) == "2024-03-01"
+    assert row[2] == 2 ** 0.5
+
+
+def test_stored_mode_matches_in_memory(data_dir, runner, tmp_path):
+    models = ["stg_orders", "stg_order_items", "int_user_rfm"]
+    stored = LocalRunner(data_dir, storage_dir=tmp_path / "warehouse")
+    try:
+        stored.run(models)
+        for name in models:
+            # 저장 모드는 hive 파티션 컬럼이 마지막에 오므로 컬럼 순서는 비교하지 않음
+            columns = sorted(runner.query(f'SELECT * FROM "{name}" LIMIT 0').columns)
+            sql = f'SELECT {", ".join(columns)} FROM "{name}" ORDER BY ALL'
+            pd.testing.assert_frame_equal(stored.query(sql), runner.query(sql), check_dtype=False)
+        assert list((tmp_path / "warehouse" / "stg_orders").glob("order_month=*"))
+    finally:
+        stored.close()
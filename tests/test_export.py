@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+import pyarrow.csv as pcsv
+import pyarrow.parquet as pq
+import pytest
+
+from thelook_analysis import export
+
+
+def test_export_matches_models(runner, store_path, data_dir, tmp_path):
+    out = tmp_path / "winback.parquet"
+    rows = export.export(store_path, "winback", out, data_dir=data_dir, batch_size=1_000)
+    actual = pq.read_table(out).to_pandas().sort_values("user_id").reset_index(drop=True)
+    expected = runner.query("""
+        SELECT r.user_id, u.email, r.last_order_date, r.monetary
+        FROM int_user_rfm r
+        JOIN stg_users u USING (user_id)
+        WHERE r.customer_segment IN ('Need Attention', 'At Risk', 'Hibernating')
+        ORDER BY r.user_id
+    """)
+    assert rows == len(actual) == len(expected) > 0
+    np.testing.assert_array_equal(actual["user_id"], expected["user_id"])
+    np.testing.assert_array_equal(actual["email"], expected["email"])
+    np.testing.assert_array_equal(pd.to_datetime(actual["last_order_date"]), pd.to_datetime(expected["last_order_date"]))
+    np.testing.assert_allclose(actual["monetary"], expected["monetary"], atol=0.005)
+    assert pq.ParquetFile(out).schema_arrow == export.EXPORT_SCHEMA
+
+
+def test_batches_stay_bounded(store, data_dir):
+    for source in (data_dir, None):
+        batches = list(export.iter_audience(store, "promising_high_inactive", source, batch_size=500))
+        assert all(0 < batch.num_rows <= 500 for batch in batches)
+        sessions = np.concatenate([batch.column("post_purchase_sessions").to_numpy() for batch in batches])
+        assert len(sessions) == export.count(store, "promising_high_inactive", batch_size=500)
+        assert not sessions.any()
+        segments = {s for batch in batches for s in batch.column("segment").to_pylist()}
+        assert segments == {"Promising High Value"}
+
+
+def test_csv_without_users_source(store_path, store, tmp_path):
+    out = tmp_path / "vip.csv"
+    rows = export.export(store_path, "vip", out)
+    table = pcsv.read_csv(out)
+    assert rows == table.num_rows == export.count(store, "vip")
+    assert table.column("email").null_count == rows
+
+
+def test_rejects_unknown_audience_and_format(store, tmp_path):
+    with pytest.raises(KeyError):
+        export.count(store, "everyone")
+    with pytest.raises(ValueError):
+        export.write(iter(()), str(tmp_path / "out.json"), "json")
@@ -0,0 +1,70 @@
+import pandas as pd
+import plotly.graph_objects as go
+import pyarrow as pa
+
+from dashboard import figures
+from dashboard.figures import FigureCache, figure_key, frame_digest
+
+FRAME = pd.DataFrame({"segment": ["VIP", "Promising"], "users": [10, 20]})
+
+
+def _bar(frame, title=None):
+    return go.Figure(go.Bar(x=frame["segment"], y=frame["users"]), layout=dict(title=title))
+
+
+def test_frame_digest_tracks_content():
+    assert frame_digest(FRAME) == frame_digest(FRAME.copy())
+    assert frame_digest(FRAME) != frame_digest(FRAME.assign(users=[10, 21]))
+    assert frame_digest(FRAME) != frame_digest(FRAME.astype({"users": "float64"}))
+    assert frame_digest(FRAME) != frame_digest(FRAME.rename(columns={"users": "count"}))
+    table = pa.Table.from_pandas(FRAME)
+    assert frame_digest(table) == frame_digest(pa.Table.from_pandas(FRAME.copy()))
+
+
+def test_figure_key_includes_builder_and_spec():
+    key = figure_key("a", FRAME, {"title": "x"})
+    assert key == figure_key("a", FRAME.copy(), {"title": "x"})
+    assert key != figure_key("b", FRAME, {"title": "x"})
+    assert key != figure_key("a", FRAME, {"title": "y"})
+
+
+def test_get_or_build_builds_once_and_evicts_lru():
+    cache = FigureCache(max_entries=2)
+    calls = []
+
+    def build(title):
+        calls.append(title)
+        return _bar(FRAME, title)
+
+    first = cache.get_or_build("a", lambda: build("a"))
+    assert cache.get_or_build("a", lambda: build("a")) is first
+    cache.get_or_build("b", lambda: build("b"))
+    cache.get("a")
+    cache.get_or_build("c", lambda: build("c"))
+
+    assert calls == ["a", "b", "c"]
+    assert "a" in cache and "b" not in cache and len(cache) == 2
+    assert cache.stats() == {"entries": 2, "hits": 2, "disk_hits": 0, "misses": 3}
+
+
+def test_disk_cache_survives_restart(tmp_path):
+    FigureCache(disk_dir=tmp_path).put("k", _bar(FRAME, "disk"))
+    restarted = FigureCache(disk_dir=tmp_path)
+    figure = restarted.get("k")
+    assert figure.layout.title.text == "disk"
+    assert restarted.stats()["disk_hits"] == 1
+    assert not list(tmp_path.glob("*.tmp"))
+
+    restarted.clear(disk=True)
+    assert restarted.get("k") is None
+
+
+def test_express_reuses_figure_until_data_changes():
+    cache = figures.cache()
+    cache.clear()
+    first = figures.express("bar", FRAME, x="segment", y="users", layout=dict(height=300))
+    assert figures.express("bar", FRAME.copy(), x="segment", y="users", layout=dict(height=300)) is first
+    changed = figures.express("bar", FRAME.assign(users=[1, 2]), x="segment", y="users", layout=dict(height=300))
+    assert changed is not first
+    assert changed.layout.height == 300
+    assert cache.stats()["misses"] == 2
@@ -0,0 +1,47 @@
+import pandas as pd
+
+from thelook_analysis.duckdb_backend import LocalRunner
+
+MODELS = [
+    "stg_orders", "stg_order_items", "stg_users", "stg_products",
+    "int_user_rfm", "int_user_first_purchase", "mart_first_purchase_category",
+]
+MONTH = "2024-03-01"
+
+
+def _first_purchases(runner):
+    # 같은 created_at 의 상품은 어느 쪽이 골라져도 되므로 시각 / 날짜만 비교
+    return runner.query(
+        "SELECT user_id, first_purchase_at, first_order_date FROM int_user_first_purchase ORDER BY user_id"
+    )
+
+
+def test_first_item_is_earliest_order_item(runner):
+    runner.run(["stg_products", "int_user_first_purchase"])
+    expected = runner.query("""
+        SELECT user_id, MIN(created_at) AS first_purchase_at
+        FROM stg_order_items
+        GROUP BY user_id
+        ORDER BY user_id
+    """)
+    actual = _first_purchases(runner)[["user_id", "first_purchase_at"]]
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+
+def test_incremental_matches_full_refresh_after_returns(source_copy, return_month, tmp_path):
+    runner = LocalRunner(source_copy, database=str(tmp_path / "incremental.duckdb"))
+    runner.run(MODELS)
+
+    return_month(MONTH)
+    runner.run(MODELS)
+    full = LocalRunner(source_copy, full_refresh=True)
+    full.run(MODELS)
+    try:
+        pd.testing.assert_frame_equal(_first_purchases(runner), _first_purchases(full), check_dtype=False)
+        assert runner.query("SELECT count(DISTINCT source_watermark) AS n FROM int_user_first_purchase")["n"][0] == 1
+
+        mart = "SELECT customer_segment, SUM(users) AS users FROM mart_first_purchase_category GROUP BY 1 ORDER BY 1"
+        pd.testing.assert_frame_equal(runner.query(mart), full.query(mart), check_dtype=False)
+    finally:
+        runner.close()
+        full.close()
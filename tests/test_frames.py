@@ -0,0 +1,34 @@
+import pandas as pd
+import pyarrow as pa
+
+from dashboard import frames
+
+
+def test_from_arrow_unifies_chunk_dictionaries():
+    table = pa.Table.from_batches([
+        pa.record_batch({"segment": ["VIP", "Others"], "users": [3, 1]}),
+        pa.record_batch({"segment": ["At Risk", "VIP"], "users": [2, 5]}),
+    ])
+    frame = frames.from_arrow(table)
+    assert isinstance(frame["segment"].dtype, pd.CategoricalDtype)
+    assert list(frame["segment"].cat.categories) == ["At Risk", "Others", "VIP"]
+    assert frame["segment"].astype(str).tolist() == ["VIP", "Others", "At Risk", "VIP"]
+    assert frame["users"].tolist() == [3, 1, 2, 5]
+
+
+def test_compact_only_touches_label_columns():
+    frame = pd.DataFrame({"segment": ["VIP", "VIP"], "note": ["a", "b"], "users": [1, 2]})
+    compacted = frames.compact(frame)
+    assert isinstance(compacted["segment"].dtype, pd.CategoricalDtype)
+    assert compacted["note"].dtype == frame["note"].dtype
+    assert frames.compact(compacted) is compacted
+    assert frames.compact("not a frame") == "not a frame"
+
+
+def test_to_arrow_round_trip():
+    frame = pd.DataFrame({"channel": ["Search", "Email", "Search"], "rate": [1.5, 2.0, 3.5]})
+    table = frames.to_arrow(frame)
+    assert pa.types.is_dictionary(table.schema.field("channel").type)
+    assert frames.to_arrow(table) is table
+    back = frames.from_arrow(table)
+    pd.testing.assert_frame_equal(back.astype({"channel": str}), frame)
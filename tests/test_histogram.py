@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from thelook_analysis.histogram import RFMHistogram
+from thelook_analysis.rfm import SEGMENTS, assign_segments, score_frequency, score_monetary, score_recency
+
+THRESHOLDS = ((60, 120, 300, 500), (3, 2), (250, 100, 50, 25))
+
+
+@pytest.fixture(scope="module")
+def histogram(rfm):
+    return RFMHistogram.from_arrays(rfm.recency_days, rfm.frequency, rfm.monetary)
+
+
+def _direct(rfm, r_thresholds, f_thresholds, m_thresholds):
+    codes = assign_segments(score_recency(rfm.recency_days, r_thresholds),
+                            score_frequency(rfm.frequency, f_thresholds),
+                            score_monetary(rfm.monetary, m_thresholds))
+    return (np.bincount(codes, minlength=len(SEGMENTS)),
+            np.bincount(codes, weights=rfm.monetary, minlength=len(SEGMENTS)))
+
+
+def test_default_thresholds_match_scored_segments(histogram, rfm):
+    actual = histogram.segment()
+    np.testing.assert_array_equal(actual["user_count"], np.bincount(rfm.segment, minlength=len(SEGMENTS)))
+
+
+def test_segment_matches_direct_scoring(histogram, rfm):
+    actual = histogram.segment(*THRESHOLDS)
+    counts, revenue = _direct(rfm, *THRESHOLDS)
+    np.testing.assert_array_equal(actual["user_count"], counts)
+    np.testing.assert_allclose(actual["revenue"], revenue)
+
+
+def test_threshold_order_does_not_matter(histogram):
+    # 슬라이더 순서가 뒤바뀌어도 정렬된 기준값과 같은 구간 (R/F/M 모두)
+    r, f, m = THRESHOLDS
+    swapped = histogram.segment(r[::-1], f[::-1], m[::-1])
+    np.testing.assert_array_equal(swapped["user_count"], histogram.segment(*THRESHOLDS)["user_count"])
+    np.testing.assert_array_equal(score_frequency(np.arange(5), (2, 3)), score_frequency(np.arange(5), (3, 2)))
+
+
+def test_rejects_thresholds_outside_grid(histogram):
+    with pytest.raises(ValueError):
+        histogram.segment(m_thresholds=(histogram.monetary_max + 1, 135, 67, 34))
+    with pytest.raises(ValueError):
+        histogram.segment(r_thresholds=(90, 180, 365, histogram.recency_max))
+
+
+def test_from_store_matches_from_arrays(histogram, store):
+    from_store = RFMHistogram.from_store(store)
+    np.testing.assert_array_equal(from_store.segment()["user_count"], histogram.segment()["user_count"])
@@ -0,0 +1,51 @@
+import pandas as pd
+import pytest
+
+from thelook_analysis.duckdb_backend import LocalRunner
+
+MODELS = ["stg_orders", "stg_order_items", "int_user_rfm"]
+
+
+def _rfm(runner):
+    return runner.query("SELECT * EXCLUDE (source_watermark) FROM int_user_rfm ORDER BY user_id")
+
+
+def _compare(runner, source):
+    full = LocalRunner(source, full_refresh=True)
+    full.run(MODELS)
+    try:
+        pd.testing.assert_frame_equal(_rfm(runner), _rfm(full), check_dtype=False)
+        assert runner.query("SELECT count(DISTINCT source_watermark) AS n FROM int_user_rfm")["n"][0] == 1
+    finally:
+        full.close()
+
+
+@pytest.mark.parametrize("stored", [False, True])
+def test_incremental_matches_full_refresh_after_new_orders(source_copy, rewind_source, tmp_path, stored):
+    storage = tmp_path / "warehouse" if stored else None
+    runner = LocalRunner(source_copy, database=str(tmp_path / "incremental.duckdb"), storage_dir=storage)
+    restore = rewind_source("2024-07-01")
+    runner.run(MODELS)
+    before = len(_rfm(runner))
+
+    restore()
+    runner.run(MODELS)
+    try:
+        assert len(_rfm(runner)) > before
+        _compare(runner, source_copy)
+    finally:
+        runner.close()
+
+
+def test_incremental_drops_users_whose_orders_were_all_returned(source_copy, return_month, tmp_path):
+    runner = LocalRunner(source_copy, database=str(tmp_path / "incremental.duckdb"))
+    runner.run(MODELS)
+    users = set(_rfm(runner)["user_id"])
+
+    return_month("2024-03-01")
+    runner.run(MODELS)
+    try:
+        assert set(_rfm(runner)["user_id"]) < users
+        _compare(runner, source_copy)
+    finally:
+        runner.close()
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from thelook_analysis import repurchase
+from thelook_analysis.duckdb_backend import translate_sql
+from thelook_analysis.repurchase import RepurchaseHistogram, build_repurchase_histogram
+
+
+@pytest.fixture(scope="module")
+def histogram(data_dir):
+    return build_repurchase_histogram(data_dir)
+
+
+def _sql(runner, sql):
+    return runner.query(translate_sql(sql.format(dataset="main")))
+
+
+def test_vip_timing_matches_sql(runner, histogram):
+    from dashboard.data import VIP_REPURCHASE_TIMING_SQL
+
+    expected = _sql(runner, VIP_REPURCHASE_TIMING_SQL)
+    actual = histogram.table(repurchase.VIP_TIMING_EDGES, labels=repurchase.VIP_TIMING_LABELS)
+    assert len(expected) > 0
+    np.testing.assert_array_equal(actual["bucket"], expected["bucket"])
+    np.testing.assert_array_equal(actual["count"], expected["count"])
+    for name in ("avg_days", "avg_first_revenue", "avg_second_revenue", "avg_ltv"):
+        np.testing.assert_allclose(actual[name], expected[name], atol=0.051, err_msg=name)
+
+
+def test_conversion_speed_matches_sql(runner, histogram):
+    from dashboard.data import CONVERSION_SPEED_SQL
+
+    expected = _sql(runner, CONVERSION_SPEED_SQL)
+    actual = histogram.table(repurchase.CONVERSION_SPEED_EDGES, labels=repurchase.CONVERSION_SPEED_LABELS)
+    np.testing.assert_array_equal(actual["bucket"], expected["speed"])
+    np.testing.assert_array_equal(actual["count"], expected["count"])
+    for name in ("avg_days", "avg_sessions", "avg_product_views", "avg_ltv", "avg_m_score"):
+        np.testing.assert_allclose(actual[name], expected[name], atol=0.051, err_msg=name)
+
+
+def test_rebucketing_preserves_totals(histogram):
+    coarse = histogram.table((30, 60), group=None)
+    fine = histogram.table((3, 10, 20, 30, 45, 60, 100, 200), group=None)
+    assert coarse["count"].sum() == fine["count"].sum()
+    np.testing.assert_allclose((coarse["avg_days"] * coarse["count"]).sum(), (fine["avg_days"] * fine["count"]).sum())
+
+
+def test_round_trip(histogram, tmp_path):
+    loaded = RepurchaseHistogram.load(histogram.save(tmp_path / "repurchase.npz"))
+    edges = (3, 10, 20, 45, 100, 200)
+    for group in ("VIP", None):
+        pd.testing.assert_frame_equal(loaded.table(edges, group=group), histogram.table(edges, group=group))
@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+
+from thelook_analysis.rfm import SEGMENTS, score_frequency, score_monetary, score_recency, score_rfm
+
+
+def test_score_rfm_matches_int_user_rfm(runner, rfm):
+    expected = runner.query("SELECT * FROM int_user_rfm ORDER BY user_id")
+    actual = rfm.to_frame()
+    assert len(actual) == len(expected)
+    for name in ("user_id", "recency_days", "frequency", "r_score", "f_score", "m_score"):
+        np.testing.assert_array_equal(actual[name].to_numpy(np.int64), expected[name].to_numpy(np.int64), err_msg=name)
+    np.testing.assert_allclose(actual["monetary"], expected["monetary"].astype(np.float64), atol=1e-9)
+    np.testing.assert_array_equal(actual["customer_segment"].astype(str), expected["customer_segment"].astype(str))
+    np.testing.assert_array_equal(pd.to_datetime(actual["last_order_date"]),
+                                  pd.to_datetime(expected["last_order_date"]))
+
+
+def test_score_rfm_is_order_independent(order_rows, rfm):
+    shuffled = np.random.default_rng(0).permutation(len(order_rows[0]))
+    again = score_rfm(*(column[shuffled] for column in order_rows))
+    for name in ("user_id", "recency_days", "frequency", "monetary", "segment"):
+        np.testing.assert_array_equal(getattr(again, name), getattr(rfm, name), err_msg=name)
+
+
+def test_score_boundaries():
+    np.testing.assert_array_equal(score_recency(np.array([0, 90, 91, 180, 365, 545, 546])), [5, 5, 4, 4, 3, 2, 1])
+    np.testing.assert_array_equal(score_frequency(np.array([1, 2, 3, 10])), [1, 4, 5, 5])
+    np.testing.assert_array_equal(score_monetary(np.array([0.0, 33.99, 34, 67, 135, 300])), [1, 1, 2, 3, 4, 5])
+    assert len(SEGMENTS) == 9
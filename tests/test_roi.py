@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from thelook_analysis import roi
+
+SCENARIOS = 50_000
+
+
+@pytest.fixture(scope="module")
+def simulation():
+    return roi.simulate(scenarios=SCENARIOS)
+
+
+def test_percentiles_are_ordered(simulation):
+    for metric in roi.METRICS:
+        low, mid, high = (simulation.summary[f"{metric}_p{p}"] for p in roi.PERCENTILES)
+        assert (low <= mid).all() and (mid <= high).all(), metric
+    assert list(simulation.summary.index) == [phase.key for phase in roi.PHASES] + [roi.TOTAL]
+
+
+def test_medians_track_planned_revenue(simulation):
+    # 전환율 / 객단가 분포의 평균이 계획값이므로 중앙값은 계획 매출 근처
+    for phase in roi.PHASES:
+        row = simulation.summary.loc[phase.key]
+        assert row["revenue_p50"] == pytest.approx(phase.planned_revenue(), rel=0.1), phase.key
+    total = simulation.summary.loc[roi.TOTAL]
+    assert total["planned_revenue"] == pytest.approx(sum(phase.planned_revenue() for phase in roi.PHASES))
+    assert total["profit_p50"] == pytest.approx(total["revenue_p50"] - total["cost_p50"], rel=0.05)
+
+
+def test_phase_results_do_not_depend_on_other_phases(simulation):
+    first, second = roi.PHASES[0], roi.PHASES[1]
+    rate = second.rates[0]
+    changed = roi.simulate(roi.with_means({second.key: {rate.name: rate.dist.mean / 2}}), scenarios=SCENARIOS)
+    np.testing.assert_array_equal(changed.summary.loc[first.key, ["revenue_p10", "revenue_p50", "revenue_p90"]],
+                                  simulation.summary.loc[first.key, ["revenue_p10", "revenue_p50", "revenue_p90"]])
+    assert changed.summary.loc[second.key, "revenue_p50"] < simulation.summary.loc[second.key, "revenue_p50"]
+
+
+def test_simulation_is_deterministic(simulation):
+    roi.simulate.cache_clear()
+    roi._phase_summary.cache_clear()
+    roi._phase_scenarios.cache_clear()
+    again = roi.simulate(scenarios=SCENARIOS)
+    np.testing.assert_array_equal(again.summary.to_numpy(), simulation.summary.to_numpy())
+
+
+def test_unknown_assumptions_are_rejected():
+    with pytest.raises(KeyError):
+        roi.with_means({"no_such_phase": {}})
+    with pytest.raises(KeyError):
+        roi.with_means({roi.PHASES[0].key: {"no_such_rate": 0.1}})
+
+
+def test_breakdown_shows_simulated_quantiles(simulation):
+    from dashboard.pages import _roi
+
+    key = roi.PHASES[0].key
+    row = simulation.summary.loc[key]
+    html = _roi.breakdown_html(simulation, key)
+    assert f"${row['revenue_p50']:,.0f}" in html
+    assert f"{row['roi_p50']:,.0f}%" in html
+    table = _roi.summary_table(simulation)
+    assert list(table["Phase"]) == [phase.label for phase in roi.PHASES] + ["Total"]
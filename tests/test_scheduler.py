@@ -0,0 +1,62 @@
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from thelook_analysis.cohort import CohortMatrix, build_cohorts
+from thelook_analysis.duckdb_backend import LocalRunner
+from thelook_analysis.scheduler import COHORT_EXPORT, CUBE_EXPORT, REPURCHASE_EXPORT, Scheduler
+
+
+@pytest.fixture
+def scheduler(source_copy, tmp_path):
+    return Scheduler(source_copy, tmp_path / "thelook.duckdb", tmp_path / "state", export_dir=tmp_path / "marts")
+
+
+def test_affected_follows_source_and_ref_edges(scheduler):
+    assert scheduler.affected(["events"]) == ["stg_events"]
+    assert scheduler.affected(["users"]) == ["stg_users", "mart_rfm_cube"]
+    products = scheduler.affected(["products"])
+    assert products[0] == "stg_products"
+    assert set(products) == {"stg_products", "int_user_first_purchase", "mart_first_purchase_category",
+                             "mart_rfm_cube"}
+    assert products.index("int_user_first_purchase") < products.index("mart_first_purchase_category")
+    assert scheduler.affected(["distribution_centers"]) == []
+
+
+def test_refresh_rebuilds_only_changed_sources(scheduler, source_copy, tmp_path):
+    first = scheduler.refresh()
+    assert set(first.models) == set(scheduler.project.topological_order())
+    assert set(first.exported) == {CUBE_EXPORT, COHORT_EXPORT, REPURCHASE_EXPORT}
+    assert scheduler.version_file.read_text().strip() == first.version
+
+    idle = scheduler.refresh()
+    assert idle.changed == () and idle.models == () and idle.version is None
+    assert scheduler.version_file.read_text().strip() == first.version
+
+    # 가입자 절반만 남기면 users 만 바뀜 → stg_users / mart_rfm_cube 와 코호트 파일만 다시 씀
+    users = source_copy / "users"
+    for path in sorted(users.glob("*.parquet")):
+        table = pq.read_table(path)
+        pq.write_table(table.slice(0, table.num_rows // 2), path)
+    second = scheduler.refresh()
+    assert second.changed == ("users",)
+    assert set(second.models) == {"stg_users", "mart_rfm_cube"}
+    assert set(second.exported) == {CUBE_EXPORT, COHORT_EXPORT}
+    assert second.version != first.version
+
+    marts = tmp_path / "marts"
+    expected = build_cohorts(source_copy)
+    pd.testing.assert_frame_equal(CohortMatrix.load(marts / COHORT_EXPORT).table(), expected.table())
+    full = LocalRunner(source_copy, full_refresh=True)
+    try:
+        full.run(["mart_rfm_cube"])
+        expected_cube = full.query("SELECT * FROM mart_rfm_cube")
+    finally:
+        full.close()
+    key = ["r_score", "f_score", "m_score", "traffic_source", "first_purchase_category", "signup_to_purchase"]
+    pd.testing.assert_frame_equal(_sorted(pd.read_parquet(marts / CUBE_EXPORT), key), _sorted(expected_cube, key),
+                                  check_dtype=False)
+
+
+def _sorted(frame, key):
+    return frame.sort_values(key).reset_index(drop=True)
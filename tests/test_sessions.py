@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from thelook_analysis import sessions
+from thelook_analysis.sessions import SessionCounter, count_stg_event_sessions, first_purchase_dates
+
+POST_PURCHASE_SQL = """
+    WITH first_purchase AS (
+        SELECT user_id, MIN(order_date) AS first_purchase_date FROM stg_order_items GROUP BY user_id
+    )
+    SELECT f.user_id, COUNT(DISTINCT e.session_id) AS sessions, COUNT(e.event_id) AS events
+    FROM first_purchase f
+    LEFT JOIN stg_events e ON e.user_id = f.user_id AND e.event_date > f.first_purchase_date
+    GROUP BY f.user_id
+    ORDER BY f.user_id
+"""
+
+
+@pytest.fixture(scope="module")
+def expected(runner):
+    return runner.query(POST_PURCHASE_SQL)
+
+
+@pytest.fixture(scope="module")
+def first_purchase(runner):
+    rows = runner.query("SELECT user_id, created_at FROM stg_order_items")
+    return first_purchase_dates(rows["user_id"].to_numpy(), rows["created_at"].to_numpy())
+
+
+@pytest.mark.parametrize("clustered", [True, False])
+def test_counts_match_sql(runner, expected, first_purchase, clustered):
+    users, counts, events = count_stg_event_sessions(runner, *first_purchase, clustered=clustered, batch_size=4_096)
+    np.testing.assert_array_equal(users, expected["user_id"].to_numpy())
+    np.testing.assert_array_equal(counts, expected["sessions"].to_numpy())
+    np.testing.assert_array_equal(events, expected["events"].to_numpy())
+
+
+@pytest.mark.parametrize("clustered", [True, False])
+def test_promising_activity_matches_sql(data_dir, runner, clustered):
+    from benchmarks.suites import POST_PURCHASE_SESSIONS_SQL
+
+    expected = runner.query(POST_PURCHASE_SESSIONS_SQL)
+    actual = sessions.promising_activity(data_dir, clustered=clustered, batch_size=4_096)
+    assert len(expected) > 0
+    pd.testing.assert_frame_equal(actual[["segment", "activity_level", "user_count"]],
+                                  expected[["segment", "activity_level", "user_count"]].astype({"user_count": np.int64}),
+                                  check_dtype=False)
+    np.testing.assert_allclose(actual["avg_events"], expected["avg_events"], atol=0.05)
+    np.testing.assert_allclose(actual["avg_monetary"], expected["avg_monetary"], atol=0.005)
+
+
+def test_store_sessions_match_sql(store, expected):
+    np.testing.assert_array_equal(store.user_id, expected["user_id"].to_numpy())
+    np.testing.assert_array_equal(store.post_purchase_sessions, expected["sessions"].to_numpy())
+
+
+def test_unclustered_accepts_any_order_and_clustered_rejects_it(runner, expected, first_purchase):
+    events = runner.query("SELECT user_id, event_at, session_id FROM stg_events")
+    events = events.sample(frac=1.0, random_state=0)
+    counter = SessionCounter(*first_purchase)
+    for start in range(0, len(events), 5_000):
+        chunk = events.iloc[start:start + 5_000]
+        counter.update(chunk["user_id"].to_numpy(), chunk["event_at"].to_numpy(),
+                       session_id=chunk["session_id"].to_numpy())
+    np.testing.assert_array_equal(counter.result()[1], expected["sessions"].to_numpy())
+
+    clustered = SessionCounter(*first_purchase, clustered=True)
+    with pytest.raises(ValueError):
+        clustered.update(events["user_id"].to_numpy(), events["event_at"].to_numpy(),
+                         session_key=np.zeros(len(events), dtype=np.uint64))
+
+
+def test_compaction_keeps_buffer_bounded(monkeypatch):
+    monkeypatch.setattr(sessions, "_COMPACT_THRESHOLD", 8)
+    users = np.arange(1, 5)
+    counter = SessionCounter(users, np.full(4, np.datetime64("2020-01-01")))
+    compactions = []
+    distinct_keys = counter._distinct_keys
+
+    def counted():
+        compactions.append(1)
+        return distinct_keys()
+
+    monkeypatch.setattr(counter, "_distinct_keys", counted)
+    event_at = np.full(4, np.datetime64("2020-02-01"))
+    for batch in range(200):
+        # 배치마다 유저별 새 세션 하나 + 이미 본 세션 반복
+        counter.update(users, event_at, session_id=np.array([f"s{batch}"] * 4, dtype=object))
+        counter.update(users, event_at, session_id=np.array(["s0"] * 4, dtype=object))
+    # 임계값이 남은 키 수의 2배로 늘어나므로 정렬 횟수는 배치 수가 아니라 로그에 비례
+    assert len(compactions) < 20
+    assert counter._buffered <= counter._threshold
+    np.testing.assert_array_equal(counter.result()[1], np.full(4, 200))
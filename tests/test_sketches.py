@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from thelook_analysis.sketches import KLLSketch, Moments, RFMDistribution
+
+
+def _rank_error(sketch, values, qs=np.linspace(0.01, 0.99, 99)):
+    ordered = np.sort(values)
+    estimates = sketch.quantiles(qs)
+    true_ranks = np.searchsorted(ordered, estimates, side="right") / len(ordered)
+    return float(np.max(np.abs(true_ranks - qs)))
+
+
+def test_moments_merge_matches_numpy():
+    values = np.random.default_rng(0).lognormal(3, 1, 10_000)
+    merged = Moments()
+    for part in np.array_split(values, 7):
+        merged.merge(Moments().update(part))
+    assert merged.count == len(values)
+    assert merged.mean == pytest.approx(values.mean())
+    assert merged.std() == pytest.approx(values.std(ddof=1))
+
+
+def test_kll_is_exact_below_capacity():
+    values = np.random.default_rng(1).permutation(100).astype(float)
+    sketch = KLLSketch(k=200, seed=0).update(values)
+    assert sketch.size == 100
+    assert sketch.quantiles([0, 0.5, 1]).tolist() == [0, 49, 99]
+
+
+@pytest.mark.parametrize("k", [100, 200])
+def test_kll_rank_error_bound(k):
+    values = np.random.default_rng(2).lognormal(3, 1, 200_000)
+    single = KLLSketch(k=k, seed=0)
+    for part in np.array_split(values, 50):
+        single.update(part)
+
+    merged = KLLSketch(k=k, seed=0)
+    for i, part in enumerate(np.array_split(values, 16)):
+        merged.merge(KLLSketch(k=k, seed=i).update(part))
+
+    for sketch in (single, merged):
+        assert sketch.count == len(values)
+        assert sketch.size < 4 * k
+        assert _rank_error(sketch, values) < 4.0 / k
+        assert (sketch.min, sketch.max) == (values.min(), values.max())
+
+
+def test_kll_rejects_small_k():
+    with pytest.raises(ValueError):
+        KLLSketch(k=4)
+
+
+def test_rfm_distribution_merge_matches_single_pass(rfm):
+    parts = np.array_split(np.arange(len(rfm.user_id)), 5)
+    merged = RFMDistribution(seed=0)
+    for idx in parts:
+        merged.merge(RFMDistribution(seed=0).update(rfm.recency_days[idx], rfm.frequency[idx], rfm.monetary[idx]))
+    single = RFMDistribution(seed=0).update_rfm(rfm)
+
+    assert merged.count == single.count == len(rfm.user_id)
+    stats, expected = merged.to_dict(), single.to_dict()
+    for metric in RFMDistribution.METRICS:
+        assert stats[metric]["avg"] == pytest.approx(expected[metric]["avg"], abs=0.01)
+        assert stats[metric]["std"] == pytest.approx(expected[metric]["std"], abs=0.01)
+    # frequency 는 값 종류가 적어 분위수가 정확히 일치
+    exact = np.percentile(rfm.frequency, [10, 25, 50, 75, 90, 95], method="inverted_cdf")
+    assert [stats["frequency"][f"p{p}"] for p in (10, 25, 50, 75, 90, 95)] == exact.tolist()
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from thelook_analysis.rfm import SEGMENTS
+from thelook_analysis.snapshots import NONE_LABEL, SnapshotStore, backfill
+
+VIP, AT_RISK, HIBERNATING = (SEGMENTS.index(name) for name in ("VIP", "At Risk", "Hibernating"))
+
+
+def _append(store, date, segments):
+    users = np.array(sorted(segments), dtype=np.int32)
+    codes = np.array([segments[user] for user in users], dtype=np.uint8)
+    scores = np.full(len(users), 3, dtype=np.uint8)
+    return store.append(date, users, codes, scores, scores, scores)
+
+
+def test_append_writes_only_changes(tmp_path):
+    store = SnapshotStore(tmp_path)
+    assert _append(store, "2024-01-01", {1: VIP, 2: AT_RISK, 3: AT_RISK}) == 3
+    # 2: 세그먼트 변경, 3: 빠짐, 4: 신규 → 3행
+    assert _append(store, "2024-01-02", {1: VIP, 2: HIBERNATING, 4: VIP}) == 3
+    assert _append(SnapshotStore(tmp_path), "2024-01-03", {1: VIP, 2: HIBERNATING, 4: VIP}) == 0
+
+    first = store.segmentation("2024-01-01")
+    assert first.user_id.tolist() == [1, 2, 3]
+    last = store.segmentation()
+    assert last.as_of == np.datetime64("2024-01-03")
+    assert dict(zip(last.user_id.tolist(), last.segment.tolist())) == {1: VIP, 2: HIBERNATING, 4: VIP}
+
+    moves = store.transitions("2024-01-01", "2024-01-03")
+    assert moves.loc["VIP", "VIP"] == 1
+    assert moves.loc["At Risk", "Hibernating"] == 1
+    assert moves.loc["At Risk", NONE_LABEL] == 1
+    assert moves.loc[NONE_LABEL, "VIP"] == 1
+    assert moves.to_numpy().sum() == 4
+
+    history = store.history()
+    assert history["VIP"].tolist() == [1, 2, 2]
+    assert history["At Risk"].tolist() == [2, 0, 0]
+    assert store.stats()["rows"] == 6
+
+
+def test_append_rejects_past_dates_and_duplicates(tmp_path):
+    store = SnapshotStore(tmp_path)
+    _append(store, "2024-01-02", {1: VIP})
+    with pytest.raises(ValueError):
+        _append(store, "2024-01-02", {1: VIP})
+    with pytest.raises(ValueError):
+        scores = np.ones(2, dtype=np.uint8)
+        store.append("2024-01-05", np.array([1, 1]), np.array([VIP, VIP]), scores, scores, scores)
+    with pytest.raises(ValueError):
+        store.segmentation("2024-01-01")
+    with pytest.raises(ValueError):
+        store.transitions("2024-01-02", "2024-01-01")
+
+
+def test_empty_snapshot_removes_everyone(tmp_path):
+    store = SnapshotStore(tmp_path)
+    _append(store, "2024-01-01", {1: VIP, 2: AT_RISK})
+    assert _append(store, "2024-01-02", {}) == 2
+    assert len(store.segmentation()) == 0
+    assert store.transitions("2024-01-01", "2024-01-02").loc[:, NONE_LABEL].sum() == 2
+
+
+def test_backfill_matches_int_user_rfm(runner, data_dir, tmp_path):
+    written = backfill(tmp_path, data_dir, "2024-10-01", "2024-12-31", every=13)
+    store = SnapshotStore(tmp_path)
+    assert list(written) == store.dates()
+
+    # 분석 기준일(2025-01-01) 세그먼트 = 마지막(2024-12-31) 스냅샷
+    expected = runner.query("SELECT user_id, customer_segment FROM int_user_rfm ORDER BY user_id")
+    final = store.segmentation().to_frame()
+    np.testing.assert_array_equal(final["user_id"], expected["user_id"])
+    np.testing.assert_array_equal(final["customer_segment"].astype(str), expected["customer_segment"].astype(str))
+
+    start, end = store.dates()[0], store.dates()[-1]
+    moves = store.transitions(start, end)
+    np.testing.assert_array_equal(moves.sum(axis=1).iloc[:-1], store.segmentation(start).counts())
+    np.testing.assert_array_equal(moves.sum(axis=0).iloc[:-1], store.segmentation(end).counts())
+    np.testing.assert_array_equal(store.history().iloc[-1], store.segmentation(end).counts())
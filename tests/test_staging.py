@@ -0,0 +1,43 @@
+import pandas as pd
+import pytest
+
+from thelook_analysis.duckdb_backend import LocalRunner
+
+STAGING = ["stg_orders", "stg_order_items", "stg_events"]
+MONTH = "2024-03-01"
+
+
+def _table(runner, name):
+    frame = runner.query(f'SELECT * EXCLUDE (source_watermark) FROM "{name}"')
+    return frame.sort_values(list(frame.columns[:1])).reset_index(drop=True)
+
+
+@pytest.mark.parametrize("stored", [False, True])
+def test_emptied_month_is_dropped_on_incremental_run(source_copy, return_month, tmp_path, stored):
+    storage = tmp_path / "warehouse" if stored else None
+    runner = LocalRunner(source_copy, database=str(tmp_path / "incremental.duckdb"), storage_dir=storage)
+    runner.run(STAGING)
+    assert runner.query(f"SELECT count(*) AS n FROM stg_orders WHERE order_month = DATE '{MONTH}'")["n"][0] > 0
+
+    return_month(MONTH)
+    runner.run(STAGING)
+    full = LocalRunner(source_copy, full_refresh=True)
+    full.run(STAGING)
+    try:
+        for name in ("stg_orders", "stg_order_items"):
+            actual = _table(runner, name)
+            assert not (actual["order_month"] == pd.Timestamp(MONTH)).any(), name
+            pd.testing.assert_frame_equal(actual, _table(full, name), check_dtype=False)
+    finally:
+        runner.close()
+        full.close()
+
+
+def test_unchanged_source_rewrites_nothing(data_dir):
+    runner = LocalRunner(data_dir)
+    try:
+        runner.run(STAGING)
+        results = {result.model: result.rows for result in runner.run(STAGING)}
+        assert results == {name: 0 for name in STAGING}
+    finally:
+        runner.close()
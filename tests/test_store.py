@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from thelook_analysis.store import COLUMNS, build_columns, open_store, write_store
+
+
+def test_store_matches_score_rfm(store, rfm):
+    assert len(store) == len(rfm.user_id)
+    for name in ("user_id", "recency_days", "frequency", "r_score", "f_score", "m_score", "segment"):
+        np.testing.assert_array_equal(store.column(name), getattr(rfm, name), err_msg=name)
+    np.testing.assert_allclose(store.monetary, rfm.monetary, rtol=1e-6)
+    assert not store.monetary.flags.writeable
+
+
+def test_dictionary_columns_match_models(store, runner):
+    runner.run(["stg_products", "int_user_first_purchase"])
+    expected = runner.query("""
+        SELECT r.user_id, r.customer_segment, u.traffic_source, f.category
+        FROM int_user_rfm r
+        LEFT JOIN stg_users u USING (user_id)
+        LEFT JOIN int_user_first_purchase f USING (user_id)
+        ORDER BY r.user_id
+    """)
+    frame = store.to_frame(columns=["user_id", "segment", "traffic_source", "first_category"])
+    np.testing.assert_array_equal(frame["user_id"], expected["user_id"])
+    np.testing.assert_array_equal(frame["segment"].astype(str), expected["customer_segment"].astype(str))
+    for name, column in (("traffic_source", "traffic_source"), ("first_category", "category")):
+        pd.testing.assert_series_equal(frame[name].astype(object).reset_index(drop=True),
+                                       expected[column].astype(object), check_names=False)
+
+
+def test_lookup(store):
+    rows = np.array([0, len(store) // 2, len(store) - 1])
+    ids = store.user_id[rows]
+    np.testing.assert_array_equal(store.lookup(ids), rows)
+    np.testing.assert_array_equal(store.lookup([-1, int(store.user_id.max()) + 1]), [-1, -1])
+
+
+def test_to_arrow_keeps_dictionary_codes(store):
+    rows = store.lookup(store.user_id[:100])
+    table = store.to_arrow(rows, columns=["user_id", "segment", "first_category"])
+    assert pa.types.is_dictionary(table.schema.field("segment").type)
+    frame = store.to_frame(rows, columns=["user_id", "segment", "first_category"])
+    pd.testing.assert_frame_equal(table.to_pandas(), frame, check_dtype=False, check_categorical=False)
+    assert table.column("first_category").null_count == frame["first_category"].isna().sum()
+
+
+def test_segment_summary_matches_pandas(store):
+    frame = store.to_frame(columns=["segment", "recency_days", "monetary"])
+    grouped = frame.groupby("segment", observed=True).agg(
+        user_count=("monetary", "size"), avg_recency=("recency_days", "mean"), total_revenue=("monetary", "sum"),
+    ).reset_index()
+    summary = store.segment_summary().sort_values("segment").reset_index(drop=True)
+    grouped = grouped.assign(segment=grouped["segment"].astype(str)).sort_values("segment").reset_index(drop=True)
+    np.testing.assert_array_equal(summary["segment"], grouped["segment"])
+    np.testing.assert_array_equal(summary["user_count"], grouped["user_count"])
+    np.testing.assert_allclose(summary["avg_recency"], grouped["avg_recency"])
+    np.testing.assert_allclose(summary["total_revenue"], grouped["total_revenue"], rtol=1e-6)
+    assert summary["pct"].sum() == pytest.approx(100)
+
+
+def test_empty_store_round_trip(tmp_path, rfm):
+    columns, dictionaries = build_columns(rfm)
+    empty = {name: columns[name][:0] for name, _ in COLUMNS}
+    with open_store(write_store(tmp_path / "empty.store", empty, dictionaries)) as store:
+        assert len(store) == 0
+        assert store.segment_summary().empty
+
+
+def test_write_store_validates_columns(tmp_path, rfm):
+    columns, dictionaries = build_columns(rfm)
+    with pytest.raises(ValueError, match="누락"):
+        write_store(tmp_path / "s", {k: v for k, v in columns.items() if k != "monetary"}, dictionaries)
+    with pytest.raises(ValueError, match="오름차순"):
+        write_store(tmp_path / "s", dict(columns, user_id=columns["user_id"][::-1]), dictionaries)
+    with pytest.raises(ValueError, match="int2|<i2|int16"):
+        write_store(tmp_path / "s", dict(columns, frequency=np.full(len(rfm.user_id), 70_000)), dictionaries)
+    (tmp_path / "bogus").write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        open_store(tmp_path / "bogus")
@@ -0,0 +1,59 @@
+import json
+
+import duckdb
+import pyarrow.parquet as pq
+import pytest
+
+from thelook_analysis.synth import SynthConfig, generate
+
+CONFIG = SynthConfig(users=3_000, chunk_users=1_000, products=200)
+TABLES = ("users", "orders", "order_items", "products", "events", "inventory_items", "distribution_centers")
+
+
+def _read(out_dir, table):
+    path = out_dir / table
+    return pq.read_table(path if path.is_dir() else out_dir / f"{table}.parquet")
+
+
+@pytest.fixture(scope="module")
+def generated(tmp_path_factory):
+    out_dir = tmp_path_factory.mktemp("synth")
+    return out_dir, generate(out_dir, CONFIG, workers=1)
+
+
+def test_output_is_deterministic_across_workers(generated, tmp_path):
+    out_dir, rows = generated
+    assert generate(tmp_path, CONFIG, workers=2) == rows
+    for table in TABLES:
+        assert _read(tmp_path, table).equals(_read(out_dir, table)), table
+
+
+def test_seed_changes_output(generated, tmp_path):
+    out_dir, _ = generated
+    generate(tmp_path, SynthConfig(users=3_000, chunk_users=1_000, products=200, seed=7), workers=1)
+    assert not _read(tmp_path, "orders").equals(_read(out_dir, "orders"))
+
+
+def test_manifest_and_keys(generated):
+    out_dir, rows = generated
+    manifest = json.loads((out_dir / "manifest.json").read_text())
+    assert manifest["rows"] == rows
+    assert manifest["config"]["users"] == CONFIG.users
+    for table in TABLES:
+        assert _read(out_dir, table).num_rows == rows[table], table
+
+    con = duckdb.connect()
+    for table in TABLES:
+        con.register(table, _read(out_dir, table))
+    checks = con.execute("""
+        SELECT
+            (SELECT count(DISTINCT id) = count(*) AND min(id) = 1 AND max(id) = count(*) FROM users),
+            (SELECT count(DISTINCT order_id) = count(*) FROM orders),
+            (SELECT count(*) = 0 FROM order_items oi ANTI JOIN orders o USING (order_id)),
+            (SELECT count(*) = 0 FROM order_items oi JOIN orders o USING (order_id) WHERE oi.user_id <> o.user_id),
+            (SELECT count(*) = 0 FROM orders o ANTI JOIN users u ON o.user_id = u.id),
+            (SELECT count(*) = 0 FROM order_items oi ANTI JOIN products p ON oi.product_id = p.id),
+            (SELECT max(created_at) < TIMESTAMP '2025-01-01' FROM orders)
+    """).fetchone()
+    con.close()
+    assert all(checks), checks
@@ -0,0 +1,128 @@
+import contextvars
+import subprocess
+import sys
+import threading
+import time
+
+import duckdb
+import pytest
+
+from dashboard.warehouse import ConnectionPool, DuckDBConnection, QueryExecutor, duckdb_pool, open_pool
+
+
+class _Connection:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def database(tmp_path):
+    path = tmp_path / "thelook.duckdb"
+    con = duckdb.connect(str(path))
+    con.execute("CREATE TABLE segments AS SELECT * FROM (VALUES ('VIP', 3), ('Others', 1)) t(segment, users)")
+    con.close()
+    return path
+
+
+def test_pool_bounds_concurrency_and_reuses():
+    pool = ConnectionPool(_Connection, size=2)
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def work():
+        with pool.connection():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert peak[0] == 2
+    assert pool._created == 2
+
+
+def test_pool_without_reuse_closes_each_connection():
+    pool = ConnectionPool(_Connection, size=2, reuse=False)
+    used = []
+    for _ in range(3):
+        with pool.connection() as conn:
+            used.append(conn)
+    assert len({id(conn) for conn in used}) == 3
+    assert all(conn.closed for conn in used)
+
+
+def test_duckdb_executor_releases_file_lock_between_queries(database):
+    executor = QueryExecutor(duckdb_pool(str(database), size=2))
+    try:
+        results = executor.run({
+            "all": "SELECT segment, users FROM `{dataset}.segments` ORDER BY users DESC",
+            "vip": "SELECT users FROM `{dataset}.segments` WHERE segment = 'VIP'",
+        })
+        assert results["all"]["segment"].astype(str).tolist() == ["VIP", "Others"]
+        assert str(results["all"]["segment"].dtype) == "category"
+        assert results["vip"]["users"].tolist() == [3]
+
+        # 쿼리 사이에는 연결이 닫혀 있으므로 (스케줄러처럼) 읽기-쓰기로 열 수 있음
+        writer = duckdb.connect(str(database))
+        writer.execute("INSERT INTO segments VALUES ('At Risk', 2)")
+        writer.close()
+        assert len(executor.query("SELECT * FROM `{dataset}.segments`")) == 3
+    finally:
+        executor.close()
+
+
+def test_executor_copies_context():
+    current = contextvars.ContextVar("current", default=None)
+    executor = QueryExecutor(ConnectionPool(_Connection, size=2))
+    current.set("page")
+    try:
+        assert executor.map({"a": current.get, "b": current.get}) == {"a": "page", "b": "page"}
+    finally:
+        executor.close()
+
+
+def _hold_write_lock(database, seconds):
+    holder = subprocess.Popen(
+        [sys.executable, "-c",
+         f"import duckdb, time; con = duckdb.connect({str(database)!r}); print('ready', flush=True); "
+         f"time.sleep({seconds})"],
+        stdout=subprocess.PIPE, text=True,
+    )
+    assert holder.stdout.readline().strip() == "ready"
+    return holder
+
+
+def test_open_retries_until_writer_releases_lock(database):
+    holder = _hold_write_lock(database, 0.5)
+    try:
+        conn = DuckDBConnection.open(str(database), lock_timeout=30)
+        assert conn.query_arrow("SELECT count(*) AS n FROM segments").column("n").to_pylist() == [2]
+        conn.close()
+    finally:
+        holder.kill()
+        holder.wait()
+
+
+def test_open_gives_up_after_lock_timeout(database):
+    holder = _hold_write_lock(database, 30)
+    try:
+        with pytest.raises(duckdb.IOException):
+            DuckDBConnection.open(str(database), lock_timeout=0.2)
+    finally:
+        holder.kill()
+        holder.wait()
+
+
+def test_open_pool_rejects_unknown_targets(tmp_path):
+    with pytest.raises(ValueError):
+        open_pool("postgres://localhost/thelook")
+    with pytest.raises(FileNotFoundError):
+        open_pool(f"duckdb://{tmp_path / 'missing.duckdb'}")
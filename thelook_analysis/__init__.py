@@ -0,0 +1,37 @@
+"""
+TheLook E-commerce 분석 엔진
+============================
+BigQuery/dbt 모델(thelook_dbt)과 동일한 로직을 NumPy 기반으로 재현하는 in-process 엔진 모음.
+"""
+
+from thelook_analysis.rfm import (
+    ANALYSIS_AS_OF,
+    F_THRESHOLDS,
+    M_THRESHOLDS,
+    R_THRESHOLDS,
+    SEGMENTS,
+    RFMResult,
+    assign_segments,
+    score_frequency,
+    score_monetary,
+    score_recency,
+    score_rfm,
+)
+from thelook_analysis.sketches import KLLSketch, Moments, RFMDistribution
+
+__all__ = [
+    "ANALYSIS_AS_OF",
+    "F_THRESHOLDS",
+    "KLLSketch",
+    "M_THRESHOLDS",
+    "Moments",
+    "R_THRESHOLDS",
+    "SEGMENTS",
+    "RFMDistribution",
+    "RFMResult",
+    "assign_segments",
+    "score_frequency",
+    "score_monetary",
+    "score_recency",
+    "score_rfm",
+]
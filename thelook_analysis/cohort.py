@@ -0,0 +1,469 @@
+"""
+가입 코호트 리텐션 엔진
+=====================
+`stg_users.signup_date` 와 `stg_order_items.order_date` 를 정수 월 번호(1970-01 = 0)로 바꿔
+가입월 코호트 × 가입 후 경과 개월의 활성 유저 수(리텐션) / 매출 행렬을 만듭니다.
+
+- 코호트 키 = (가입월 - 첫 가입월) × 그룹 수 + 그룹 (그룹 = 유입 채널 등, 선택)
+- 매출 / 주문 상품 수: (코호트 키, 주문월) 결합 키 하나에 대한 np.bincount
+- 활성 유저 수: 배치 행을 주문월별로 모은 뒤(작은 정수 키의 stable argsort = radix 정렬), 월마다 유저 행 번호
+  위치에 행 위치를 scatter 하고 다시 읽어 자기 위치가 남은 행만 유저당 하나로 남깁니다. 유저별 마지막 활성 월과
+  비교해 이전 배치에서 이미 센 유저를 빼고 코호트 키 bincount. 월마다 O(그 달 행 수)
+- 주문 상품은 주문월 순서의 배치로 스트리밍하므로 메모리는 유저 수 + 배치 크기에만 비례합니다
+- 내부 행렬은 (코호트 키 × 달력 월) 이며, 출력할 때 경과 개월(주문월 - 가입월) 축으로 옮깁니다.
+  반영한 월 범위 밖의 칸(관측 전)은 NaN
+
+증분 모드: 행렬은 달력 월 열 단위로 쌓이므로 새 주문월의 주문 상품만 `add` 하면 됩니다.
+`update` 는 저장된 행렬의 마지막 월 열을 비우고(`reopen_last_month`, 만들 때 진행 중이던 달일 수 있음)
+그 달부터의 주문과 마지막 가입일부터의 새 가입자만 원천에서 읽습니다. 그 이전 월은 다시 넣을 수 없습니다.
+
+사용 예:
+    python -m thelook_analysis.cohort build --data-dir data/thelook --out data/cohort.npz
+    python -m thelook_analysis.cohort update --data-dir data/thelook --path data/cohort.npz
+"""
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 주문 상품 스트리밍 배치 크기 (행)
+DEFAULT_BATCH_SIZE = 1 << 22
+
+# user_id 범위가 유저 수의 이 배수 이하이면 정렬 배열 대신 id → 행 번호 직접 조회 표 사용
+_DENSE_SPAN_FACTOR = 4
+
+METRICS = ("active_users", "retention_pct", "revenue", "revenue_per_user", "items")
+
+
+def month_index(dates):
+    """날짜 / 시각 배열 → 1970-01 기준 월 번호 (int32)"""
+    return np.asarray(dates).astype("datetime64[M]").astype(np.int64).astype(np.int32)
+
+
+def month_label(months):
+    """월 번호 → 'YYYY-MM'"""
+    return np.datetime_as_string(np.asarray(months, dtype=np.int64).astype("datetime64[M]"))
+
+
+class CohortMatrix:
+    """가입월(× 그룹) 코호트별 달력 월 활성 유저 수 / 매출 / 주문 상품 수"""
+
+    def __init__(self, user_id, signup_date, group=None, groups=None):
+        """
+        group: 유저별 그룹 라벨 (None 이면 그룹 하나). groups 로 그룹 목록(순서)을 고정할 수 있고,
+        없으면 라벨의 정렬된 고유값
+        """
+        user_id = np.asarray(user_id, dtype=np.int64)
+        cohort = month_index(signup_date)
+        if group is None:
+            self.groups = ("전체",)
+            codes = np.zeros(len(user_id), dtype=np.int32)
+        else:
+            self.groups = tuple(groups) if groups is not None else tuple(sorted(pd.unique(group)))
+            codes = self._group_codes(group)
+        self.first_cohort = int(cohort.min())
+        self.cohorts = 0
+        self.first_month = None
+        self.months = 0
+        self.signed_up_until = None
+        self.unmatched_items = 0
+        # (가장 늦은 미매칭 주문월, 그 달의 미매칭 행 수). reopen_last_month 에서 다시 셀 몫을 빼기 위함
+        self._unmatched_tail = (-1, 0)
+        self.sizes = np.zeros(0, dtype=np.int64)
+        self._user_id = np.zeros(0, dtype=np.int64)
+        self._user_key = np.zeros(0, dtype=np.int32)
+        self._last_active = np.zeros(0, dtype=np.int32)
+        self._slot = None
+        self._active = np.zeros((0, 0), dtype=np.int64)
+        self._revenue = np.zeros((0, 0), dtype=np.float64)
+        self._items = np.zeros((0, 0), dtype=np.int64)
+        self._append_users(user_id, cohort, codes, np.asarray(signup_date, dtype="datetime64[D]"))
+
+    # ============================================
+    # 유저
+    # ============================================
+
+    def _group_codes(self, group):
+        group = np.asarray(group, dtype=object)
+        codes = pd.Categorical(group, categories=self.groups).codes.astype(np.int32)
+        if np.any(codes < 0):
+            raise ValueError(f"알 수 없는 그룹: {group[np.argmax(codes < 0)]} (가능: {self.groups})")
+        return codes
+
+    @property
+    def keys(self):
+        return self.cohorts * len(self.groups)
+
+    def _append_users(self, user_id, cohort, codes, signup_date):
+        if len(user_id) == 0:
+            return
+        if int(cohort.min()) < self.first_cohort:
+            raise ValueError("첫 코호트보다 이른 가입월은 추가할 수 없습니다 (행렬을 다시 만드세요)")
+        cohorts = int(cohort.max()) - self.first_cohort + 1
+        if cohorts > self.cohorts:
+            # 새 코호트는 키 축 끝에 붙음 (키 = 코호트 × 그룹 수 + 그룹)
+            grow = (cohorts - self.cohorts) * len(self.groups)
+            self._active = np.pad(self._active, ((0, grow), (0, 0)))
+            self._revenue = np.pad(self._revenue, ((0, grow), (0, 0)))
+            self._items = np.pad(self._items, ((0, grow), (0, 0)))
+            self.sizes = np.pad(self.sizes, (0, grow))
+            self.cohorts = cohorts
+        key = ((cohort - self.first_cohort) * len(self.groups) + codes).astype(np.int32)
+        self.sizes += np.bincount(key, minlength=self.keys)
+        self._user_id = np.concatenate([self._user_id, user_id])
+        self._user_key = np.concatenate([self._user_key, key])
+        self._last_active = np.concatenate([self._last_active, np.full(len(user_id), -1, dtype=np.int32)])
+        self._slot = None
+        latest = signup_date.max()
+        self.signed_up_until = latest if self.signed_up_until is None else max(self.signed_up_until, latest)
+        self._index_users()
+
+    def _index_users(self):
+        user_id = self._user_id
+        self._id_min = int(user_id.min())
+        span = int(user_id.max()) - self._id_min + 1
+        if span <= _DENSE_SPAN_FACTOR * len(user_id):
+            self._row_by_id = np.full(span, -1, dtype=np.int32)
+            self._row_by_id[user_id - self._id_min] = np.arange(len(user_id), dtype=np.int32)
+            self._sorted = None
+        else:
+            self._row_by_id = None
+            order = np.argsort(user_id, kind="stable")
+            self._sorted = (user_id[order], order.astype(np.int32))
+        if self._row_by_id is not None:
+            duplicated = not np.array_equal(self._row_by_id[user_id - self._id_min], np.arange(len(user_id)))
+        else:
+            ids = self._sorted[0]
+            duplicated = bool(np.any(ids[1:] == ids[:-1]))
+        if duplicated:
+            raise ValueError("user_id 가 중복되었습니다")
+
+    def extend_users(self, user_id, signup_date, group=None):
+        """새 가입자 추가 (증분 모드). 이미 있는 user_id 는 오류"""
+        user_id = np.asarray(user_id, dtype=np.int64)
+        if len(self.groups) > 1 and group is None:
+            raise ValueError("그룹이 있는 행렬에는 group 이 필요합니다")
+        codes = (np.zeros(len(user_id), dtype=np.int32) if len(self.groups) == 1 and group is None
+                 else self._group_codes(np.asarray(group, dtype=object)))
+        self._append_users(user_id, month_index(signup_date), codes, np.asarray(signup_date, dtype="datetime64[D]"))
+        return self
+
+    def known(self, user_id):
+        """이미 있는 유저 여부 (bool 배열)"""
+        return self._rows(user_id) >= 0
+
+    def _rows(self, user_id):
+        """user_id → 유저 행 번호 (없으면 -1)"""
+        user_id = np.asarray(user_id, dtype=np.int64)
+        if self._row_by_id is not None:
+            idx = user_id - self._id_min
+            inside = (idx >= 0) & (idx < len(self._row_by_id))
+            rows = np.full(len(user_id), -1, dtype=np.int32)
+            rows[inside] = self._row_by_id[idx[inside]]
+            return rows
+        ids, order = self._sorted
+        pos = np.minimum(np.searchsorted(ids, user_id), len(ids) - 1)
+        return np.where(ids[pos] == user_id, order[pos], -1).astype(np.int32)
+
+    # ============================================
+    # 주문 반영
+    # ============================================
+
+    @property
+    def last_month(self):
+        """반영된 마지막 주문월 번호 (없으면 None)"""
+        return None if self.first_month is None else self.first_month + self.months - 1
+
+    def add(self, user_id, order_date, sale_price):
+        """
+        주문 상품 배치를 반영합니다. 배치는 주문월이 줄지 않는 순서로 넣어야 하고(배치 안의 순서는 무관),
+        같은 행을 두 번 넣으면 안 됩니다. 유저별 마지막 활성 월을 기억하므로 한 달의 행이 여러 배치에
+        나뉘어도 활성 유저는 한 번만 셉니다
+        """
+        month = month_index(order_date)
+        if len(month) == 0:
+            return self
+        rows = self._rows(user_id)
+        sale_price = np.asarray(sale_price, dtype=np.float64)
+        matched = rows >= 0
+        if not matched.all():
+            self._count_unmatched(month[~matched])
+            rows, month, sale_price = rows[matched], month[matched], sale_price[matched]
+            if len(rows) == 0:
+                return self
+
+        low, high = int(month.min()), int(month.max())
+        if self.first_month is None:
+            self.first_month = low
+        elif low < self.last_month:
+            raise ValueError(f"이미 지난 월입니다: {month_label(low)} (마지막 반영 월 {month_label(self.last_month)})")
+        if high > self.first_month + self.months - 1:
+            # 새 달력 월 열 (사이의 빈 달은 0)
+            grow = high - (self.first_month + self.months - 1)
+            self._active, self._revenue, self._items = (
+                np.pad(matrix, ((0, 0), (0, grow))) for matrix in (self._active, self._revenue, self._items)
+            )
+            self.months += grow
+
+        column = month - self.first_month
+        keys = self._user_key[rows]
+        flat = keys.astype(np.int64) * self.months + column
+        size = self.keys * self.months
+        self._revenue += np.bincount(flat, weights=sale_price, minlength=size).reshape(self.keys, self.months)
+        self._items += np.bincount(flat, minlength=size).reshape(self.keys, self.months)
+        del flat, sale_price
+
+        # 활성 유저: 월별 구간에서 유저당 한 행만 남기고, 이전 배치에서 이미 센 유저는 제외
+        if high > low:
+            order = np.argsort((month - low).astype(np.uint16), kind="stable")
+            rows, keys = rows[order], keys[order]
+            del order
+        bounds = np.r_[0, np.cumsum(np.bincount(month - low, minlength=high - low + 1))]
+        if self._slot is None:
+            self._slot = np.empty(len(self._user_id), dtype=np.int32)
+        for offset in np.flatnonzero(np.diff(bounds)):
+            current = low + int(offset)
+            month_rows = rows[bounds[offset]:bounds[offset + 1]]
+            positions = np.arange(len(month_rows), dtype=np.int32)
+            self._slot[month_rows] = positions
+            first = self._slot[month_rows] == positions
+            first[first] = self._last_active[month_rows[first]] != current
+            self._last_active[month_rows[first]] = current
+            self._active[:, current - self.first_month] += np.bincount(
+                keys[bounds[offset]:bounds[offset + 1]][first], minlength=self.keys,
+            )
+        return self
+
+    def _count_unmatched(self, months):
+        self.unmatched_items += len(months)
+        tail_month, tail = self._unmatched_tail
+        latest = int(months.max())
+        if latest > tail_month:
+            tail_month, tail = latest, 0
+        self._unmatched_tail = (tail_month, tail + int(np.count_nonzero(months == tail_month)))
+
+    def reopen_last_month(self):
+        """
+        마지막 반영 월 열을 비웁니다. 그 달의 주문 상품 전체를 다시 `add` 해야 하며,
+        진행 중이던 달을 반영한 행렬에 이후 들어온 그 달 주문까지 다시 세기 위해 씁니다
+        """
+        if self.first_month is None:
+            return self
+        current = self.last_month
+        for matrix in (self._active, self._revenue, self._items):
+            matrix[:, current - self.first_month] = 0
+        # 다시 넣을 때 그 달 활성 유저를 새로 세도록 (이후 월과의 비교에는 영향 없음)
+        self._last_active[self._last_active == current] = -1
+        tail_month, tail = self._unmatched_tail
+        if tail_month == current:
+            self.unmatched_items -= tail
+            self._unmatched_tail = (tail_month, 0)
+        return self
+
+    # ============================================
+    # 출력 (가입 후 경과 개월 축)
+    # ============================================
+
+    def _select(self, matrix, group):
+        """(키 × 달력 월) → (코호트 × 달력 월). group=None 이면 전체 그룹 합"""
+        matrix = matrix.reshape(self.cohorts, len(self.groups), -1)
+        if group is None:
+            return matrix.sum(axis=1)
+        if group not in self.groups:
+            raise KeyError(f"알 수 없는 그룹: {group} (가능: {self.groups})")
+        return matrix[:, self.groups.index(group)]
+
+    def _by_offset(self, matrix):
+        """(코호트 × 달력 월) → (코호트 × 경과 개월). 관측 전 칸은 NaN"""
+        offsets = self.first_month + np.arange(self.months)[None, :] - (self.first_cohort + np.arange(self.cohorts))[:, None]
+        observed = offsets >= 0
+        result = np.full((self.cohorts, self.last_month - self.first_cohort + 1), np.nan)
+        result[np.nonzero(observed)[0], offsets[observed]] = matrix[observed]
+        return result
+
+    def matrices(self, group=None, since=None):
+        """
+        {지표: (코호트 × 경과 개월) 배열}, 코호트 라벨, 코호트 크기.
+        지표 = active_users, retention_pct, revenue, revenue_per_user, items. since('YYYY-MM') 이전 코호트 제외
+        """
+        if self.first_month is None:
+            raise ValueError("반영된 주문이 없습니다")
+        sizes = self._select(self.sizes[:, None], group)[:, 0].astype(np.float64)
+        active = self._by_offset(self._select(self._active, group))
+        revenue = self._by_offset(self._select(self._revenue, group))
+        items = self._by_offset(self._select(self._items, group))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            per_user = np.where(sizes[:, None] > 0, 1 / sizes[:, None], np.nan)
+        result = {
+            "active_users": active,
+            "retention_pct": active * per_user * 100,
+            "revenue": revenue,
+            "revenue_per_user": revenue * per_user,
+            "items": items,
+        }
+        cohorts = self.first_cohort + np.arange(self.cohorts)
+        start = 0 if since is None else max(int(month_index(np.datetime64(since, "M"))) - self.first_cohort, 0)
+        # since 이후 코호트는 경과 개월도 그만큼 짧으므로 관측 가능한 열까지만 남김
+        width = self.last_month - (self.first_cohort + start) + 1
+        result = {name: values[start:, :max(width, 0)] for name, values in result.items()}
+        return result, month_label(cohorts[start:]), sizes[start:].astype(np.int64)
+
+    def pivot(self, metric="retention_pct", group=None, since=None):
+        """코호트('YYYY-MM') × 경과 개월 DataFrame (히트맵용)"""
+        if metric not in METRICS:
+            raise ValueError(f"알 수 없는 지표: {metric} (가능: {METRICS})")
+        values, labels, _ = self.matrices(group, since)
+        frame = pd.DataFrame(values[metric], index=pd.Index(labels, name="cohort"))
+        frame.columns.name = "months_since_signup"
+        return frame
+
+    def table(self, group=None, since=None):
+        """관측된 칸의 long format (cohort, months_since_signup, cohort_users, 지표...)"""
+        values, labels, sizes = self.matrices(group, since)
+        rows, offsets = np.nonzero(~np.isnan(values["active_users"]))
+        frame = pd.DataFrame({
+            "cohort": labels[rows],
+            "months_since_signup": offsets,
+            "cohort_users": sizes[rows],
+        })
+        for name in METRICS:
+            frame[name] = values[name][rows, offsets]
+        return frame.astype({"active_users": np.int64, "items": np.int64})
+
+    # ============================================
+    # 저장 / 로드 (증분 갱신용)
+    # ============================================
+
+    def save(self, path):
+        path = Path(path)
+        with open(path, "wb") as file:
+            np.savez(
+                file,
+                user_id=self._user_id, user_key=self._user_key, last_active=self._last_active, sizes=self.sizes,
+                active=self._active, revenue=self._revenue, items=self._items,
+                groups=np.asarray(self.groups, dtype=str),
+                state=np.array([self.first_cohort, self.cohorts, -1 if self.first_month is None else self.first_month,
+                                self.months, self.unmatched_items, *self._unmatched_tail], dtype=np.int64),
+                signed_up_until=np.array(self.signed_up_until, dtype="datetime64[D]"),
+            )
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as saved:
+            matrix = cls.__new__(cls)
+            matrix.groups = tuple(str(name) for name in saved["groups"])
+            first_cohort, cohorts, first_month, months, unmatched, *tail = (int(v) for v in saved["state"])
+            matrix.first_cohort, matrix.cohorts = first_cohort, cohorts
+            matrix.first_month = None if first_month < 0 else first_month
+            matrix.months, matrix.unmatched_items = months, unmatched
+            matrix._unmatched_tail = tuple(tail) if tail else (-1, 0)
+            matrix.signed_up_until = saved["signed_up_until"][()]
+            matrix.sizes = saved["sizes"]
+            matrix._user_id, matrix._user_key = saved["user_id"], saved["user_key"]
+            matrix._last_active, matrix._slot = saved["last_active"], None
+            matrix._active, matrix._revenue, matrix._items = saved["active"], saved["revenue"], saved["items"]
+        matrix._index_users()
+        return matrix
+
+
+# ============================================
+# 로컬 Parquet 원천
+# ============================================
+
+def _users(runner, since=None):
+    """since(가입일) 이후 가입자. since 당일 가입자도 포함하므로 이미 있는 유저는 호출하는 쪽에서 제외"""
+    where = "" if since is None else f"WHERE signup_date >= DATE '{since}'"
+    return runner.query(f"SELECT user_id, signup_date, traffic_source FROM stg_users {where}")
+
+
+def _add_order_items(matrix, runner, since_month=None, batch_size=DEFAULT_BATCH_SIZE):
+    """stg_order_items 를 주문월 순서의 배치로 스트리밍하며 반영 (since_month 이상 주문월만)"""
+    where = "" if since_month is None else f"WHERE order_month >= DATE '{month_label(since_month)}-01'"
+    reader = runner.con.execute(
+        f"SELECT user_id, order_date, sale_price FROM stg_order_items {where} ORDER BY order_month"
+    ).to_arrow_reader(batch_size)
+    for batch in reader:
+        user_id, order_date, sale_price = (column.to_numpy(zero_copy_only=False) for column in batch.columns)
+        matrix.add(user_id, order_date, sale_price)
+    return matrix
+
+
+def _group_labels(users):
+    return users["traffic_source"].fillna("(없음)").to_numpy(dtype=object)
+
+
+def cohorts_from_runner(runner, by_channel=True, batch_size=DEFAULT_BATCH_SIZE):
+    """구체화된 stg_users / stg_order_items 가 있는 러너 → CohortMatrix (스케줄러는 자기 데이터베이스로 호출)"""
+    users = _users(runner)
+    matrix = CohortMatrix(users["user_id"].to_numpy(), users["signup_date"].to_numpy(),
+                          _group_labels(users) if by_channel else None)
+    del users
+    return _add_order_items(matrix, runner, batch_size=batch_size)
+
+
+def build_cohorts(data_dir, by_channel=True, batch_size=DEFAULT_BATCH_SIZE):
+    """로컬 Parquet 원천(`duckdb_backend` 배치) → CohortMatrix (by_channel 이면 유입 채널별 그룹)"""
+    from thelook_analysis.duckdb_backend import LocalRunner
+
+    runner = LocalRunner(data_dir)
+    try:
+        runner.run(["stg_users", "stg_order_items"])
+        return cohorts_from_runner(runner, by_channel, batch_size)
+    finally:
+        runner.close()
+
+
+def update_cohorts(matrix, data_dir):
+    """
+    마지막 반영 월부터의 주문 상품과 마지막 가입일부터의 새 가입자만 읽어 반영 (증분 모드).
+    마지막 반영 월은 만들 때 진행 중이었을 수 있으므로 열을 비우고 그 달 전체를 다시 읽음
+    """
+    from thelook_analysis.duckdb_backend import LocalRunner
+
+    runner = LocalRunner(data_dir)
+    try:
+        runner.run(["stg_users", "stg_order_items"])
+        users = _users(runner, since=matrix.signed_up_until)
+        users = users[~matrix.known(users["user_id"].to_numpy())]
+        grouped = len(matrix.groups) > 1
+        matrix.extend_users(users["user_id"].to_numpy(), users["signup_date"].to_numpy(),
+                            _group_labels(users) if grouped else None)
+        matrix.reopen_last_month()
+        return _add_order_items(matrix, runner, since_month=matrix.last_month)
+    finally:
+        runner.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="가입 코호트 리텐션 / 매출 행렬")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="로컬 Parquet 원천에서 행렬 생성")
+    build.add_argument("--data-dir", required=True, help="원천 Parquet 디렉터리")
+    build.add_argument("--out", required=True, help="행렬 파일 (.npz)")
+    build.add_argument("--no-channel", action="store_true", help="유입 채널별로 나누지 않음")
+    update = commands.add_parser("update", help="마지막 반영 월부터의 주문만 다시 반영")
+    update.add_argument("--data-dir", required=True)
+    update.add_argument("--path", required=True, help="build 로 만든 행렬 파일")
+    show = commands.add_parser("show", help="리텐션 행렬 출력")
+    show.add_argument("path")
+    show.add_argument("--since", default=None, help="이 월(YYYY-MM) 이후 코호트만")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        matrix = build_cohorts(args.data_dir, by_channel=not args.no_channel)
+        path = matrix.save(args.out)
+    elif args.command == "update":
+        matrix = update_cohorts(CohortMatrix.load(args.path), args.data_dir)
+        path = matrix.save(args.path)
+    else:
+        print(CohortMatrix.load(args.path).pivot(since=args.since).round(1).to_string())
+        return
+    print(f"written: {path} ({matrix.cohorts} cohorts × {matrix.months} months, "
+          f"last month {month_label(matrix.last_month)})")
+
+
+if __name__ == "__main__":
+    main()
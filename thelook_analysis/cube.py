@@ -0,0 +1,247 @@
+"""
+RFM OLAP 큐브
+=============
+`mart_rfm_cube` (R × F × M × 유입 채널 × 첫 구매 카테고리 × 가입→첫 구매 구간) 를 메모리에 올려 두고,
+대시보드 집계 테이블을 유저 단위 스캔 대신 수천 개 셀의 roll-up 으로 만듭니다.
+
+측정값은 모두 가산이므로 roll-up 은 코드화된 차원 키에 대한 bincount 합이며,
+평균 / 표준편차 / 비율은 합친 뒤 계산합니다.
+
+- users, revenue (SUM monetary), revenue_sq (SUM monetary²), orders (SUM frequency)
+- recency_days_sum, repeat_users (frequency >= 2), first_item_price_sum
+"""
+
+import numpy as np
+import pandas as pd
+
+from thelook_analysis.rfm import SEGMENTS, assign_segments
+
+DIMENSIONS = (
+    "r_score",
+    "f_score",
+    "m_score",
+    "traffic_source",
+    "first_purchase_category",
+    "signup_to_purchase",
+)
+
+MEASURES = (
+    "users",
+    "revenue",
+    "revenue_sq",
+    "orders",
+    "recency_days_sum",
+    "repeat_users",
+    "first_item_price_sum",
+)
+
+# mart_rfm_cube.sql 의 signup_to_purchase 라벨 (정렬 순서 = 라벨 순서)
+SIGNUP_BUCKETS = ("1. 1주일 이내", "2. 1개월 이내", "3. 2개월 이내", "4. 3개월 이내", "5. 3개월+")
+
+VIP = "VIP"
+PROMISING_HIGH = "Promising High Value"
+PROMISING_LOW = "Promising Low Value"
+
+
+class RFMCube:
+    """
+    코드화된 차원 배열 + 가산 측정값 배열. 세그먼트는 (r, f, m) 점수로부터 다시 계산해
+    `segment` 차원으로 함께 제공합니다 (SQL 의 customer_segment 와 같음).
+    """
+
+    def __init__(self, cells):
+        missing = [c for c in DIMENSIONS + MEASURES if c not in cells.columns]
+        if missing:
+            raise ValueError(f"큐브에 없는 컬럼: {missing}")
+        self.codes = {}
+        self.labels = {}
+        for name in DIMENSIONS:
+            labels, codes = np.unique(cells[name].to_numpy(), return_inverse=True)
+            self.labels[name] = labels
+            self.codes[name] = codes.astype(np.int64)
+        segment = assign_segments(cells["r_score"].to_numpy(), cells["f_score"].to_numpy(),
+                                  cells["m_score"].to_numpy())
+        self.labels["segment"] = np.asarray(SEGMENTS, dtype=object)
+        self.codes["segment"] = segment.astype(np.int64)
+        self.measures = {name: cells[name].to_numpy(np.float64) for name in MEASURES}
+
+    def __len__(self):
+        return len(self.measures["users"])
+
+    @classmethod
+    def from_parquet(cls, path):
+        return cls(pd.read_parquet(path))
+
+    @property
+    def dimensions(self):
+        return tuple(self.codes)
+
+    def _mask(self, where):
+        mask = np.ones(len(self), dtype=bool)
+        for name, values in (where or {}).items():
+            values = [values] if np.isscalar(values) else list(values)
+            wanted = np.flatnonzero(np.isin(self.labels[name], values))
+            mask &= np.isin(self.codes[name], wanted)
+        return mask
+
+    def rollup(self, by=(), where=None):
+        """
+        차원 `by` 로 합친 측정값 DataFrame (where={차원: 값 또는 값 목록} 로 셀 필터).
+        비어 있는 조합은 포함하지 않습니다.
+        """
+        by = [by] if isinstance(by, str) else list(by)
+        mask = self._mask(where)
+        if not by:
+            return pd.DataFrame({name: [values[mask].sum()] for name, values in self.measures.items()})
+
+        # 차원 코드를 혼합 기수(mixed radix)로 묶어 하나의 키로 bincount
+        sizes = [len(self.labels[name]) for name in by]
+        key = np.zeros(int(mask.sum()), dtype=np.int64)
+        for name, size in zip(by, sizes):
+            key = key * size + self.codes[name][mask]
+        present, inverse = np.unique(key, return_inverse=True)
+
+        frame = {}
+        rest = present
+        for name, size in reversed(list(zip(by, sizes))):
+            frame[name] = self.labels[name][rest % size]
+            rest = rest // size
+        frame = {name: frame[name] for name in by}
+        for name, values in self.measures.items():
+            frame[name] = np.bincount(inverse, weights=values[mask], minlength=len(present))
+        return pd.DataFrame(frame)
+
+
+def with_stats(frame):
+    """roll-up 결과에 평균 / 표본 표준편차 / 재구매율 컬럼 추가"""
+    frame = frame.copy()
+    users = frame["users"].where(frame["users"] > 0)
+    frame["avg_monetary"] = frame["revenue"] / users
+    frame["avg_frequency"] = frame["orders"] / users
+    frame["avg_recency"] = frame["recency_days_sum"] / users
+    frame["avg_first_price"] = frame["first_item_price_sum"] / users
+    frame["repurchase_rate"] = frame["repeat_users"] / users * 100
+    variance = (frame["revenue_sq"] - frame["revenue"] ** 2 / users) / (users - 1).where(users > 1)
+    frame["std_monetary"] = np.sqrt(variance.clip(lower=0))
+    return frame
+
+
+def _share(part, whole):
+    return (part / whole.where(whole > 0) * 100).fillna(0.0)
+
+
+def _segment_shares(cube, by):
+    """by 차원별 전체 / VIP / Promising High / Promising Low 유저 수 (열: segment 이름)"""
+    counts = cube.rollup([by, "segment"]).pivot_table(
+        index=by, columns="segment", values="users", aggfunc="sum", fill_value=0,
+    )
+    for name in (VIP, PROMISING_HIGH, PROMISING_LOW):
+        if name not in counts.columns:
+            counts[name] = 0.0
+    counts["total"] = counts.sum(axis=1)
+    return counts
+
+
+# ============================================
+# 대시보드 테이블 (dashboard/data.py 의 데이터셋과 같은 컬럼)
+# ============================================
+
+def segment_table(cube):
+    """segment_data: 세그먼트별 규모 / 평균 RFM / 매출 비중"""
+    frame = cube.rollup("segment")
+    total_users, total_revenue = frame["users"].sum(), frame["revenue"].sum()
+    scores = {}
+    for name in ("r_score", "f_score", "m_score"):
+        by_score = cube.rollup(["segment", name])
+        weighted = (by_score[name].astype(np.float64) * by_score["users"]).groupby(by_score["segment"]).sum()
+        scores[name] = frame["segment"].map(weighted).to_numpy() / frame["users"].to_numpy()
+    frame = with_stats(frame)
+    table = pd.DataFrame({
+        "segment": frame["segment"],
+        "user_count": frame["users"].astype(np.int64),
+        "pct": _share(frame["users"], pd.Series(total_users, index=frame.index)),
+        "avg_recency": frame["avg_recency"],
+        "avg_frequency": frame["avg_frequency"],
+        "avg_monetary": frame["avg_monetary"],
+        "revenue_pct": _share(frame["revenue"], pd.Series(total_revenue, index=frame.index)),
+        "r_score": scores["r_score"],
+        "f_score": scores["f_score"],
+        "m_score": scores["m_score"],
+        "total_revenue": frame["revenue"],
+    })
+    order = {name: i for i, name in enumerate(SEGMENTS)}
+    return table.sort_values("segment", key=lambda s: s.map(order)).reset_index(drop=True)
+
+
+def channel_table(cube):
+    """channel_data: 채널별 VIP + Promising 유저 중 VIP / Promising High / Low 비율, VIP 평균 LTV"""
+    counts = _segment_shares(cube, "traffic_source")
+    focus = counts[VIP] + counts[PROMISING_HIGH] + counts[PROMISING_LOW]
+    vip = with_stats(cube.rollup("traffic_source", where={"segment": VIP})).set_index("traffic_source")
+    table = pd.DataFrame({
+        "channel": counts.index,
+        "vip_maturity_rate": _share(counts[VIP], focus).to_numpy(),
+        "promising_high": _share(counts[PROMISING_HIGH], focus).to_numpy(),
+        "promising_low": _share(counts[PROMISING_LOW], focus).to_numpy(),
+        "avg_monetary_vip": vip["avg_monetary"].reindex(counts.index).to_numpy(),
+        "total_users": focus.astype(np.int64).to_numpy(),
+    })
+    table = table[table["total_users"] > 0]
+    return table.sort_values("vip_maturity_rate", ascending=False).reset_index(drop=True)
+
+
+def category_table(cube, top=10):
+    """category_data: 첫 구매 카테고리별 VIP 수 / 평균 LTV 상위 top (평균 LTV 오름차순, 가로 막대용)"""
+    frame = with_stats(cube.rollup("first_purchase_category", where={"segment": VIP}))
+    table = pd.DataFrame({
+        "category": frame["first_purchase_category"],
+        "vip_count": frame["users"].astype(np.int64),
+        "avg_ltv": frame["avg_monetary"],
+    })
+    return table.nlargest(top, "avg_ltv").sort_values("avg_ltv", ascending=True).reset_index(drop=True)
+
+
+def signup_table(cube):
+    """signup_to_purchase: 가입→첫 구매 구간별 규모 / 재구매율 / 평균 LTV / 세그먼트 비율"""
+    counts = _segment_shares(cube, "signup_to_purchase")
+    frame = with_stats(cube.rollup("signup_to_purchase")).set_index("signup_to_purchase").reindex(counts.index)
+    table = pd.DataFrame({
+        "timing": counts.index,
+        "user_count": counts["total"].astype(np.int64).to_numpy(),
+        "repurchase_rate": frame["repurchase_rate"].to_numpy(),
+        "avg_monetary": frame["avg_monetary"].to_numpy(),
+        "vip_rate": _share(counts[VIP], counts["total"]).to_numpy(),
+        "promising_high_rate": _share(counts[PROMISING_HIGH], counts["total"]).to_numpy(),
+        "promising_low_rate": _share(counts[PROMISING_LOW], counts["total"]).to_numpy(),
+    })
+    return table.sort_values("timing").reset_index(drop=True)
+
+
+def channel_category_table(cube, top=5, min_users=5):
+    """channel_category_ltv: 채널 × 첫 구매 카테고리별 VIP(Champions) 평균 LTV 상위 top (VIP min_users 명 이상)"""
+    by = ["traffic_source", "first_purchase_category"]
+    frame = with_stats(cube.rollup(by, where={"segment": VIP}))
+    m5 = cube.rollup(by, where={"segment": VIP, "m_score": 5}).set_index(by)["users"]
+    frame["m_score_5_count"] = m5.reindex(pd.MultiIndex.from_frame(frame[by])).fillna(0).to_numpy()
+    frame = frame[frame["users"] >= min_users]
+    table = pd.DataFrame({
+        "channel": frame["traffic_source"],
+        "category": frame["first_purchase_category"],
+        "champion_count": frame["users"].astype(np.int64),
+        "avg_ltv": frame["avg_monetary"],
+        "avg_first_price": frame["avg_first_price"],
+        "m_score_5_count": frame["m_score_5_count"].astype(np.int64),
+    })
+    return table.nlargest(top, "avg_ltv").reset_index(drop=True)
+
+
+def load_cube(data_dir):
+    """로컬 Parquet 원천에서 mart_rfm_cube 를 DuckDB 로 구체화해 RFMCube 로 로드"""
+    from thelook_analysis.duckdb_backend import LocalRunner
+
+    runner = LocalRunner(data_dir)
+    try:
+        runner.run(["mart_rfm_cube"])
+        return RFMCube(runner.query("SELECT * FROM mart_rfm_cube"))
+    finally:
+        runner.close()
@@ -0,0 +1,117 @@
+"""
+세그먼트 드릴다운 인덱스
+======================
+"Promising High 미활동 유저 목록" 처럼 (세그먼트, 활동 레벨) 그룹의 유저를 페이지 단위로 보여 주기 위한
+RFM 저장소(thelook_analysis.store) 위의 정렬 인덱스입니다.
+
+- 그룹 키 = 세그먼트 코드 × 활동 레벨 수 + 활동 레벨 (활동 레벨 = 구매 후 세션 수 구간, sessions.DEFAULT_EDGES)
+- 정렬 컬럼마다 (그룹, 값, user_id) 순 행 번호 순열(int32)을 한 번 만들어 두면
+  한 그룹의 정렬된 유저는 순열의 연속 구간이므로, 페이지는 offset/limit 슬라이스 하나로 O(limit) 에 조회됩니다.
+  (내림차순은 같은 구간을 뒤에서부터 읽음. 순열은 컬럼별로 처음 요청될 때 생성)
+- 활동 레벨 전체(activity=None)는 세그먼트 단위 그룹 키의 순열을 따로 둡니다
+
+페이지 결과는 요청한 행만 담은 pyarrow.Table 이므로 전체 멤버 목록은 어디에도 만들어지지 않습니다.
+"""
+
+import threading
+
+import numpy as np
+
+from thelook_analysis.sessions import DEFAULT_EDGES, activity_labels
+
+# 정렬 가능한 컬럼 (저장소 컬럼 이름)
+SORT_COLUMNS = ("user_id", "recency_days", "frequency", "monetary", "post_purchase_sessions")
+
+# 페이지에 보여 줄 컬럼
+PAGE_COLUMNS = (
+    "user_id", "recency_days", "frequency", "monetary", "r_score", "f_score", "m_score",
+    "traffic_source", "first_category", "post_purchase_sessions",
+)
+
+
+class SegmentIndex:
+    """RFMStore 위의 (세그먼트, 활동 레벨) 그룹별 정렬 인덱스. 여러 세션이 공유해도 안전"""
+
+    def __init__(self, store, edges=DEFAULT_EDGES):
+        edges = np.asarray(edges)
+        if edges[0] != 0 or np.any(np.diff(edges) <= 0):
+            raise ValueError("edges 는 0 으로 시작하는 증가 수열이어야 합니다")
+        self.store = store
+        self.edges = edges
+        self.segments = store.dictionaries["segment"]
+        self.activity_levels = tuple(activity_labels(tuple(edges)))
+        self._levels = len(edges)
+        activity = np.searchsorted(edges, store.post_purchase_sessions, side="right") - 1
+        segment = store.segment.astype(np.int64)
+        self._keys = {
+            True: segment * self._levels + activity,
+            False: segment,
+        }
+        # 그룹 k 의 행은 순열의 [starts[k], starts[k + 1]) 구간
+        self._starts = {
+            by_activity: np.r_[0, np.cumsum(np.bincount(key, minlength=self._groups(by_activity)))]
+            for by_activity, key in self._keys.items()
+        }
+        self._orderings = {}
+        self._lock = threading.Lock()
+
+    def _groups(self, by_activity):
+        return len(self.segments) * (self._levels if by_activity else 1)
+
+    def _group(self, segment, activity):
+        if segment not in self.segments:
+            raise KeyError(f"알 수 없는 세그먼트: {segment}")
+        code = self.segments.index(segment)
+        if activity is None:
+            return False, code
+        if activity not in self.activity_levels:
+            raise KeyError(f"알 수 없는 활동 레벨: {activity}")
+        return True, code * self._levels + self.activity_levels.index(activity)
+
+    def ordering(self, sort, by_activity=True):
+        """그룹 키, sort 값, user_id 순으로 정렬한 행 번호 순열 (처음 요청 시 생성 후 재사용)"""
+        if sort not in SORT_COLUMNS:
+            raise ValueError(f"정렬할 수 없는 컬럼: {sort} (가능: {SORT_COLUMNS})")
+        cache_key = (sort, by_activity)
+        ordering = self._orderings.get(cache_key)
+        if ordering is None:
+            with self._lock:
+                ordering = self._orderings.get(cache_key)
+                if ordering is None:
+                    keys = (self.store.user_id, self.store.column(sort), self._keys[by_activity])
+                    ordering = np.lexsort(keys).astype(np.int32)
+                    self._orderings[cache_key] = ordering
+        return ordering
+
+    def count(self, segment, activity=None):
+        """그룹 유저 수"""
+        by_activity, group = self._group(segment, activity)
+        starts = self._starts[by_activity]
+        return int(starts[group + 1] - starts[group])
+
+    def counts(self):
+        """(segment, activity_level, users) 전체 그룹 목록 (빈 그룹 제외)"""
+        starts = self._starts[True]
+        sizes = np.diff(starts)
+        rows = []
+        for group in np.flatnonzero(sizes):
+            segment, level = divmod(int(group), self._levels)
+            rows.append((self.segments[segment], self.activity_levels[level], int(sizes[group])))
+        return rows
+
+    def rows(self, segment, activity=None, sort="monetary", descending=True, offset=0, limit=50):
+        """그룹을 sort 로 정렬했을 때 [offset, offset + limit) 번째 유저의 저장소 행 번호"""
+        by_activity, group = self._group(segment, activity)
+        start, stop = self._starts[by_activity][group:group + 2]
+        offset = max(int(offset), 0)
+        ordering = self.ordering(sort, by_activity)
+        if descending:
+            high = max(stop - offset, start)
+            return ordering[max(high - limit, start):high][::-1]
+        low = min(start + offset, stop)
+        return ordering[low:min(low + limit, stop)]
+
+    def page(self, segment, activity=None, sort="monetary", descending=True, offset=0, limit=50,
+             columns=PAGE_COLUMNS):
+        """한 페이지의 유저 → pyarrow.Table (사전 컬럼은 dictionary 타입)"""
+        return self.store.to_arrow(self.rows(segment, activity, sort, descending, offset, limit), list(columns))
@@ -0,0 +1,595 @@
+"""
+thelook_dbt 로컬 실행 백엔드 (DuckDB + Parquet)
+==============================================
+`thelook_dbt` 모델을 BigQuery 대신 로컬 Parquet 소스 위에서 DuckDB 로 구체화합니다.
+모델 SQL 은 그대로 두고 (단일 소스 유지) 실행 직전에 BigQuery 문법만 DuckDB 문법으로 번역합니다.
+
+- `{{ source('look', 'orders') }}` → `<data_dir>/orders.parquet` 또는 `<data_dir>/orders/**/*.parquet`
+- `{{ ref('stg_orders') }}` → 로컬 DuckDB 데이터베이스의 테이블/뷰
+- 구체화 방식은 dbt_project.yml 의 `+materialized` 와 모델 내 `config()` 를 따름
+  (view / table / incremental; incremental 은 unique_key 기준 delete + insert 로 merge,
+  incremental_strategy='insert_overwrite' 는 결과에 포함된 파티션을 통째로 교체)
+- insert_overwrite 모델의 config `partitions_to_replace` (파티션 값을 반환하는 SELECT, post_hook 처럼 렌더링) 는
+  모델 실행 전에 평가해 그 파티션도 함께 비움. 다시 만든 결과에 행이 하나도 없는 파티션(예: 그 달 주문이 모두 반품)이
+  이전 내용 그대로 남지 않도록
+- config 의 post_hook (문자열 또는 목록) 은 구체화 직후 같은 Jinja 컨텍스트로 렌더링해 순서대로 실행
+- partition_by / cluster_by 가 있는 모델은 (파티션, 클러스터 키) 순으로 정렬해 저장.
+  storage_dir 를 주면 `<storage_dir>/<model>/<field>=<value>/*.parquet` hive 파티션 Parquet 로 쓰고
+  뷰로 노출하므로, 날짜 조건은 파티션 단위로 건너뛰고 user_id 기준 집계는 정렬된 구간을 읽음
+
+사용 예:
+    python -m thelook_analysis.duckdb_backend --data-dir data/thelook --database thelook.duckdb
+    python -m thelook_analysis.duckdb_backend --data-dir data/thelook --storage-dir data/warehouse
+"""
+
+import argparse
+import copy
+import re
+import shutil
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import duckdb
+import jinja2
+import yaml
+
+DEFAULT_PROJECT_DIR = Path(__file__).resolve().parent.parent / "thelook_dbt"
+
+_REF_RE = re.compile(r"\bref\(\s*['\"](\w+)['\"]\s*\)")
+_SOURCE_RE = re.compile(r"\bsource\(\s*['\"](\w+)['\"]\s*,\s*['\"](\w+)['\"]\s*\)")
+
+
+# ============================================
+# BigQuery → DuckDB SQL 번역
+# ============================================
+
+def _split_args(body):
+    """최상위 콤마 기준으로 함수 인자 분리 (괄호/문자열 내부 콤마는 무시)"""
+    args, depth, quote, start = [], 0, None, 0
+    for i, ch in enumerate(body):
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in "'\"`":
+            quote = ch
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "," and depth == 0:
+            args.append(body[start:i].strip())
+            start = i + 1
+    args.append(body[start:].strip())
+    return args
+
+
+def _find_call_end(sql, open_idx):
+    """sql[open_idx] == '(' 에 대응하는 ')' 위치"""
+    depth, quote = 0, None
+    for i in range(open_idx, len(sql)):
+        ch = sql[i]
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in "'\"`":
+            quote = ch
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+            if depth == 0:
+                return i
+    raise ValueError(f"괄호가 닫히지 않은 함수 호출: {sql[open_idx - 20:open_idx + 40]!r}")
+
+
+def _rewrite_calls(sql, rewrites):
+    """
+    `name(...)` 호출(name 은 rewrites 의 키)을 찾아 rewrites[name](args) 결과로 치환 (인자도 재귀적으로 번역).
+    한 번의 패스로 모든 이름을 처리하므로, 이미 번역된 결과(date_trunc 등)를 다시 번역하지 않음
+    """
+    names = sorted(rewrites, key=len, reverse=True)
+    pattern = re.compile(rf"(?<![\w.])({'|'.join(names)})\s*\(", re.IGNORECASE)
+    out, pos = [], 0
+    while True:
+        match = pattern.search(sql, pos)
+        if not match:
+            out.append(sql[pos:])
+            return "".join(out)
+        open_idx = match.end() - 1
+        close_idx = _find_call_end(sql, open_idx)
+        args = [translate_sql(arg) for arg in _split_args(sql[open_idx + 1:close_idx])]
+        out.append(sql[pos:match.start()])
+        out.append(rewrites[match.group(1).upper()](args))
+        pos = close_idx + 1
+
+
+def _date_diff(args):
+    # BigQuery: DATE_DIFF(end, start, DAY) / DuckDB: date_diff('day', start, end)
+    end, start, part = args
+    return f"date_diff('{part.lower()}', {start}, {end})"
+
+
+def _date_trunc(args):
+    # BigQuery: DATE_TRUNC(date, MONTH) → DATE / DuckDB: date_trunc('month', date) → TIMESTAMP
+    value, part = args
+    return f"CAST(date_trunc('{part.lower()}', {value}) AS DATE)"
+
+
+def _backticks(sql):
+    # `project.dataset.table` → "project"."dataset"."table"
+    return re.sub(
+        r"`([^`]+)`",
+        lambda m: ".".join(f'"{part}"' for part in m.group(1).split(".")),
+        sql,
+    )
+
+
+_CALL_REWRITES = {
+    "DATE_DIFF": _date_diff,
+    "DATE_TRUNC": _date_trunc,
+    "DATE": lambda args: f"CAST({args[0]} AS DATE)",
+}
+
+
+def translate_sql(sql):
+    """
+    모델에서 사용하는 BigQuery 문법을 DuckDB 문법으로 번역합니다.
+
+    - 백틱 식별자 → 큰따옴표 식별자
+    - DATE_DIFF(end, start, DAY) → date_diff('day', start, end)
+    - DATE_TRUNC(date, MONTH) → CAST(date_trunc('month', date) AS DATE)
+    - DATE(x) → CAST(x AS DATE)
+    - STDDEV → STDDEV_SAMP (BigQuery STDDEV 는 표본 표준편차)
+    - QUALIFY 는 DuckDB 가 그대로 지원하므로 변환하지 않음
+    """
+    sql = _backticks(sql)
+    sql = _rewrite_calls(sql, _CALL_REWRITES)
+    sql = re.sub(r"(?<![\w.])STDDEV\s*\(", "STDDEV_SAMP(", sql, flags=re.IGNORECASE)
+    return sql
+
+
+# ============================================
+# dbt 프로젝트 파싱
+# ============================================
+
+@dataclass
+class Model:
+    name: str
+    path: Path
+    raw_sql: str
+    config: dict
+    refs: set = field(default_factory=set)
+    sources: set = field(default_factory=set)
+
+    @property
+    def materialized(self):
+        return self.config.get("materialized", "view")
+
+    @property
+    def partition_field(self):
+        partition_by = self.config.get("partition_by")
+        return partition_by["field"] if partition_by else None
+
+    @property
+    def sort_keys(self):
+        """저장 순서: 파티션 컬럼 → cluster_by 컬럼"""
+        cluster_by = self.config.get("cluster_by") or []
+        keys = [self.partition_field] if self.partition_field else []
+        return keys + ([cluster_by] if isinstance(cluster_by, str) else list(cluster_by))
+
+    @property
+    def partitions_to_replace(self):
+        return self.config.get("partitions_to_replace")
+
+    @property
+    def post_hooks(self):
+        hooks = self.config.get("post_hook") or self.config.get("post-hook") or []
+        return [hooks] if isinstance(hooks, str) else list(hooks)
+
+
+class Project:
+    """dbt_project.yml / sources.yml / models/**/*.sql 을 읽어 모델 DAG 를 구성"""
+
+    def __init__(self, project_dir=DEFAULT_PROJECT_DIR):
+        self.project_dir = Path(project_dir)
+        with open(self.project_dir / "dbt_project.yml", encoding="utf-8") as f:
+            self.settings = yaml.safe_load(f)
+        self.name = self.settings["name"]
+        self.vars = dict(self.settings.get("vars") or {})
+        self.sources = self._load_sources()
+        self.models = self._load_models()
+
+    def _model_dirs(self):
+        return [self.project_dir / p for p in self.settings.get("model-paths", ["models"])]
+
+    def _load_sources(self):
+        sources = {}
+        for model_dir in self._model_dirs():
+            for path in model_dir.rglob("*.yml"):
+                with open(path, encoding="utf-8") as f:
+                    spec = yaml.safe_load(f) or {}
+                for source in spec.get("sources", []):
+                    for table in source.get("tables", []):
+                        sources[(source["name"], table["name"])] = table
+        return sources
+
+    def _folder_config(self, rel_parts):
+        """dbt_project.yml models: 블록에서 폴더 경로를 따라 `+` 설정을 누적"""
+        node = (self.settings.get("models") or {}).get(self.name) or {}
+        config = {k[1:]: v for k, v in node.items() if k.startswith("+")}
+        for part in rel_parts:
+            node = node.get(part) or {}
+            if not isinstance(node, dict):
+                break
+            config.update({k[1:]: v for k, v in node.items() if k.startswith("+")})
+        return config
+
+    def _load_models(self):
+        models = {}
+        for model_dir in self._model_dirs():
+            for path in sorted(model_dir.rglob("*.sql")):
+                raw_sql = path.read_text(encoding="utf-8")
+                config = self._folder_config(path.relative_to(model_dir).parent.parts)
+                config.update(_inline_config(raw_sql))
+                models[path.stem] = Model(
+                    name=path.stem,
+                    path=path,
+                    raw_sql=raw_sql,
+                    config=config,
+                    refs=set(_REF_RE.findall(raw_sql)),
+                    sources=set(_SOURCE_RE.findall(raw_sql)),
+                )
+        return models
+
+    def topological_order(self, select=None):
+        """ref() 의존성 순서대로 모델 이름 목록 (select 지정 시 해당 모델과 upstream 만)"""
+        wanted = set(self.models) if select is None else self.upstream(select)
+        order, visiting, done = [], set(), set()
+
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"ref() 순환 참조: {name}")
+            visiting.add(name)
+            for ref in sorted(self.models[name].refs):
+                if ref not in self.models:
+                    raise KeyError(f"{name} 이(가) 존재하지 않는 모델을 참조합니다: {ref}")
+                visit(ref)
+            visiting.discard(name)
+            done.add(name)
+            if name in wanted:
+                order.append(name)
+
+        for name in sorted(wanted):
+            visit(name)
+        return order
+
+    def upstream(self, names):
+        """names 와 그 upstream 모델 전체"""
+        result, stack = set(), list(names)
+        while stack:
+            name = stack.pop()
+            if name not in result:
+                result.add(name)
+                stack.extend(self.models[name].refs)
+        return result
+
+    def downstream(self, names):
+        """names 와 그 downstream 모델 전체 (ref() 를 거꾸로 따라감)"""
+        children = {}
+        for model in self.models.values():
+            for ref in model.refs:
+                children.setdefault(ref, set()).add(model.name)
+        result, stack = set(), list(names)
+        while stack:
+            name = stack.pop()
+            if name not in result:
+                result.add(name)
+                stack.extend(children.get(name, ()))
+        return result
+
+    def source_consumers(self, tables):
+        """소스 테이블 이름 중 하나라도 직접 source() 로 읽는 모델"""
+        tables = set(tables)
+        return {model.name for model in self.models.values() if any(table in tables for _, table in model.sources)}
+
+
+def _inline_config(raw_sql):
+    """모델 파일의 {{ config(...) }} 값을 수집 (다른 Jinja 구문은 무시)"""
+    captured = {}
+    env = jinja2.Environment(undefined=jinja2.ChainableUndefined)
+    template = env.from_string(raw_sql)
+    context = {
+        "config": lambda **kwargs: captured.update(kwargs) or "",
+        "ref": lambda name: name,
+        "source": lambda source, table: f"{source}.{table}",
+        "var": lambda name, default=None: default,
+        "is_incremental": lambda: False,
+        "this": "this",
+    }
+    template.render(**context)
+    return captured
+
+
+# ============================================
+# 로컬 실행기
+# ============================================
+
+@dataclass
+class RunResult:
+    model: str
+    materialized: str
+    seconds: float
+    rows: int = None
+
+
+class LocalRunner:
+    """Parquet 소스 위에서 모델을 DuckDB 로 구체화"""
+
+    def __init__(self, data_dir, database=":memory:", project=None, vars=None, full_refresh=False,
+                 storage_dir=None):
+        self.project = project or Project()
+        self.data_dir = Path(data_dir)
+        self.storage_dir = Path(storage_dir) if storage_dir else None
+        self.con = duckdb.connect(str(database))
+        self.vars = {**self.project.vars, **(vars or {})}
+        self.full_refresh = full_refresh
+        self._register_sources()
+        self._register_stored_models()
+
+    def fork(self):
+        """
+        같은 데이터베이스를 새 커서(연결)로 쓰는 러너. 서로 다른 모델을 스레드별로 동시에 구체화할 때 사용하며
+        임시 테이블(__dbt_tmp)은 연결마다 따로 생깁니다. 사용 후 close()
+        """
+        forked = copy.copy(self)
+        forked.con = self.con.cursor()
+        return forked
+
+    def _source_scan(self, table):
+        directory = self.data_dir / table
+        if directory.is_dir():
+            return f"read_parquet('{directory.as_posix()}/**/*.parquet', hive_partitioning = true)"
+        file = self.data_dir / f"{table}.parquet"
+        if file.exists():
+            return f"read_parquet('{file.as_posix()}')"
+        return None
+
+    def _register_sources(self):
+        for source_name, table in sorted(self.project.sources):
+            scan = self._source_scan(table)
+            if scan is None:
+                continue
+            self.con.execute(f'CREATE SCHEMA IF NOT EXISTS "{source_name}"')
+            self.con.execute(f'CREATE OR REPLACE VIEW "{source_name}"."{table}" AS SELECT * FROM {scan}')
+
+    # ============================================
+    # hive 파티션 Parquet 저장 (storage_dir)
+    # ============================================
+
+    def _stored(self, model):
+        return self.storage_dir is not None and model.partition_field is not None and model.materialized != "view"
+
+    def _stored_path(self, model):
+        return self.storage_dir / model.name
+
+    def _register_stored(self, model):
+        # 파티션 컬럼은 파일이 아니라 경로에만 있으므로 타입을 지정해 읽음
+        self._drop_relation(model.name, keep="VIEW")
+        path = self._stored_path(model)
+        data_type = model.config["partition_by"].get("data_type", "date").upper()
+        self.con.execute(
+            f'CREATE OR REPLACE VIEW "{model.name}" AS SELECT * FROM read_parquet('
+            f"'{path.as_posix()}/**/*.parquet', hive_partitioning = true, "
+            f"hive_types = {{'{model.partition_field}': '{data_type}'}})"
+        )
+
+    def _register_stored_models(self):
+        """이전 실행이 남긴 저장 모델을 뷰로 등록 (다음 실행이 incremental 로 이어지도록)"""
+        for model in self.project.models.values():
+            if self._stored(model) and any(self._stored_path(model).glob("*/*.parquet")):
+                self._register_stored(model)
+
+    def _write_partitions(self, model, relation, append):
+        """relation 을 정렬해 hive 파티션 Parquet 로 쓰기 (append=False 면 전체 교체)"""
+        path = self._stored_path(model)
+        if not append and path.exists():
+            shutil.rmtree(path)
+        path.mkdir(parents=True, exist_ok=True)
+        order = ", ".join(f'"{key}"' for key in model.sort_keys)
+        self.con.execute(
+            f"COPY (SELECT * FROM {relation} ORDER BY {order}) TO '{path.as_posix()}' "
+            f"(FORMAT PARQUET, PARTITION_BY (\"{model.partition_field}\"), APPEND, "
+            f"FILENAME_PATTERN 'part-{{uuid}}')"
+        )
+        self._register_stored(model)
+
+    def _drop_partitions(self, model, values):
+        for value in values:
+            shutil.rmtree(self._stored_path(model) / f"{model.partition_field}={value}", ignore_errors=True)
+
+    def _drop_relation(self, name, keep):
+        """materialized 가 바뀐 경우(예: view → table) CREATE OR REPLACE 가 실패하지 않도록 다른 종류의 객체 삭제"""
+        row = self.con.execute(
+            "SELECT table_type FROM information_schema.tables WHERE table_schema = 'main' AND table_name = ?",
+            [name],
+        ).fetchone()
+        if row and row[0] != keep:
+            self.con.execute(f'DROP {"VIEW" if row[0] == "VIEW" else "TABLE"} "{name}"')
+
+    def relation_exists(self, name):
+        return self.con.execute(
+            "SELECT count(*) FROM information_schema.tables WHERE table_schema = 'main' AND table_name = ?",
+            [name],
+        ).fetchone()[0] > 0
+
+    def is_incremental(self, model):
+        """dbt 의 is_incremental() 과 동일: incremental 모델 + 대상 테이블 존재 + full refresh 아님"""
+        return (
+            model.materialized == "incremental"
+            and not self.full_refresh
+            and self.relation_exists(model.name)
+        )
+
+    def render(self, model, sql=None):
+        """Jinja 렌더링 후 DuckDB 문법으로 번역한 SQL (sql 을 주면 모델 본문 대신 그 문자열, 예: post_hook)"""
+
+        def source(source_name, table):
+            if (source_name, table) not in self.project.sources:
+                raise KeyError(f"sources.yml 에 정의되지 않은 소스: {source_name}.{table}")
+            return f'"{source_name}"."{table}"'
+
+        def var(name, default=None):
+            if name not in self.vars and default is None:
+                raise KeyError(f"정의되지 않은 var: {name}")
+            return self.vars.get(name, default)
+
+        incremental = self.is_incremental(model)
+        template = jinja2.Environment(undefined=jinja2.StrictUndefined).from_string(sql or model.raw_sql)
+        rendered = template.render(
+            config=lambda **kwargs: "",
+            ref=lambda name: f'"{name}"',
+            source=source,
+            var=var,
+            is_incremental=lambda: incremental,
+            this=f'"{model.name}"',
+        )
+        return translate_sql(rendered)
+
+    def run_model(self, name):
+        model = self.project.models[name]
+        sql = self.render(model)
+        started = time.perf_counter()
+        if model.materialized == "view":
+            self._drop_relation(name, keep="VIEW")
+            self.con.execute(f'CREATE OR REPLACE VIEW "{name}" AS {sql}')
+            rows = None
+        elif model.materialized == "table" or (
+            model.materialized == "incremental" and not self.is_incremental(model)
+        ):
+            rows = self._create(model, sql)
+        elif model.config.get("incremental_strategy") == "insert_overwrite":
+            rows = self._insert_overwrite(model, sql)
+        elif model.materialized == "incremental":
+            rows = self._merge(model, sql)
+        else:
+            raise ValueError(f"{name}: 지원하지 않는 materialized={model.materialized!r}")
+        for hook in model.post_hooks:
+            self.con.execute(self.render(model, hook))
+        return RunResult(name, model.materialized, time.perf_counter() - started, rows)
+
+    def _ordered(self, model, sql):
+        if not model.sort_keys:
+            return sql
+        order = ", ".join(f'"{key}"' for key in model.sort_keys)
+        return f"SELECT * FROM ({sql}) ORDER BY {order}"
+
+    def _create(self, model, sql):
+        """전체 구체화. 정렬 키가 있으면 그 순서로 저장 (DuckDB row group min/max 로 구간 건너뛰기)"""
+        name = model.name
+        if self._stored(model):
+            self.con.execute(f'CREATE OR REPLACE TEMP TABLE "{name}__dbt_tmp" AS {sql}')
+            self._write_partitions(model, f'"{name}__dbt_tmp"', append=False)
+            rows = self.con.execute(f'SELECT count(*) FROM "{name}__dbt_tmp"').fetchone()[0]
+            self.con.execute(f'DROP TABLE "{name}__dbt_tmp"')
+            return rows
+        self._drop_relation(name, keep="BASE TABLE")
+        self.con.execute(f'CREATE OR REPLACE TABLE "{name}" AS {self._ordered(model, sql)}')
+        return self.con.execute(f'SELECT count(*) FROM "{name}"').fetchone()[0]
+
+    def _insert_overwrite(self, model, sql):
+        """
+        incremental (insert_overwrite): 결과에 나타난 파티션과 partitions_to_replace 파티션을 통째로 교체.
+        partitions_to_replace 는 {{ this }} 의 워터마크를 읽으므로 결과를 쓰기 전에 평가. 반영 행 수 반환
+        """
+        name, field = model.name, model.partition_field
+        if field is None:
+            raise ValueError(f"{name}: insert_overwrite 에는 partition_by 가 필요합니다")
+        replaced = f'"{name}__dbt_partitions"'
+        partitions = model.partitions_to_replace
+        partitions = self.render(model, partitions) if partitions else f'SELECT "{field}" FROM "{name}" WHERE false'
+        self.con.execute(f"CREATE OR REPLACE TEMP TABLE {replaced} AS {partitions}")
+        self.con.execute(f'CREATE OR REPLACE TEMP TABLE "{name}__dbt_tmp" AS {sql}')
+        self.con.execute(f'INSERT INTO {replaced} SELECT DISTINCT "{field}" FROM "{name}__dbt_tmp"')
+        if self._stored(model):
+            values = {row[0] for row in self.con.execute(f"SELECT * FROM {replaced}").fetchall()}
+            self._drop_partitions(model, sorted(values))
+            self._write_partitions(model, f'"{name}__dbt_tmp"', append=True)
+        else:
+            self.con.execute(f'DELETE FROM "{name}" WHERE "{field}" IN (SELECT * FROM {replaced})')
+            inserted = self._ordered(model, f'SELECT * FROM "{name}__dbt_tmp"')
+            self.con.execute(f'INSERT INTO "{name}" BY NAME {inserted}')
+        rows = self.con.execute(f'SELECT count(*) FROM "{name}__dbt_tmp"').fetchone()[0]
+        self.con.execute(f'DROP TABLE "{name}__dbt_tmp"')
+        self.con.execute(f"DROP TABLE {replaced}")
+        return rows
+
+    def _merge(self, model, sql):
+        """incremental 실행: 결과를 임시 테이블로 만든 뒤 unique_key 기준 delete + insert. 반영 행 수 반환"""
+        name = model.name
+        unique_key = model.config.get("unique_key")
+        self.con.execute(f'CREATE OR REPLACE TEMP TABLE "{name}__dbt_tmp" AS {sql}')
+        if unique_key:
+            keys = [unique_key] if isinstance(unique_key, str) else list(unique_key)
+            key_list = ", ".join(f'"{k}"' for k in keys)
+            self.con.execute(
+                f'DELETE FROM "{name}" WHERE ({key_list}) IN (SELECT {key_list} FROM "{name}__dbt_tmp")'
+            )
+        self.con.execute(f'INSERT INTO "{name}" BY NAME SELECT * FROM "{name}__dbt_tmp"')
+        rows = self.con.execute(f'SELECT count(*) FROM "{name}__dbt_tmp"').fetchone()[0]
+        self.con.execute(f'DROP TABLE "{name}__dbt_tmp"')
+        return rows
+
+    def run(self, select=None):
+        """select(모델 이름 목록)와 upstream 을 의존성 순서대로 실행"""
+        return [self.run_model(name) for name in self.project.topological_order(select)]
+
+    def export(self, export_dir, models=None):
+        """구체화된 모델을 <export_dir>/<model>.parquet 로 저장"""
+        export_dir = Path(export_dir)
+        export_dir.mkdir(parents=True, exist_ok=True)
+        for name in models or self.project.topological_order():
+            self.con.execute(f"COPY \"{name}\" TO '{(export_dir / name).as_posix()}.parquet' (FORMAT PARQUET)")
+
+    def query(self, sql, params=None):
+        return self.con.execute(sql, params or []).df()
+
+    def close(self):
+        self.con.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="thelook_dbt 모델을 로컬 Parquet + DuckDB 로 실행")
+    parser.add_argument("--data-dir", required=True, help="소스 Parquet 디렉터리 (<table>.parquet 또는 <table>/)")
+    parser.add_argument("--database", default=":memory:", help="DuckDB 데이터베이스 파일")
+    parser.add_argument("--project-dir", default=str(DEFAULT_PROJECT_DIR))
+    parser.add_argument("--select", nargs="*", help="실행할 모델 (upstream 포함)")
+    parser.add_argument("--vars", default=None, help="YAML 형식 var 오버라이드 (예: \"{rfm_as_of: '2025-01-01'}\")")
+    parser.add_argument("--export-dir", default=None, help="실행 후 모델을 Parquet 로 내보낼 디렉터리")
+    parser.add_argument("--full-refresh", action="store_true", help="incremental 모델을 전체 재구축")
+    parser.add_argument("--storage-dir", default=None, help="partition_by 모델을 hive 파티션 Parquet 로 저장할 디렉터리")
+    args = parser.parse_args(argv)
+
+    runner = LocalRunner(
+        args.data_dir,
+        database=args.database,
+        project=Project(args.project_dir),
+        vars=yaml.safe_load(args.vars) if args.vars else None,
+        full_refresh=args.full_refresh,
+        storage_dir=args.storage_dir,
+    )
+    total = 0.0
+    for result in runner.run(args.select):
+        total += result.seconds
+        rows = "" if result.rows is None else f"{result.rows:,} rows"
+        print(f"{result.model:<36} {result.materialized:<12} {result.seconds:8.3f}s  {rows}")
+    print(f"{'TOTAL':<36} {'':<12} {total:8.3f}s")
+    if args.export_dir:
+        runner.export(args.export_dir, args.select and runner.project.topological_order(args.select))
+    runner.close()
+
+
+if __name__ == "__main__":
+    main()
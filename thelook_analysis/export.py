@@ -0,0 +1,180 @@
+"""
+캠페인 대상 추출 (스트리밍)
+=========================
+Action Plan 의 대상 고객군(미활동 Promising, VIP, 윈백 대상 등)을 CSV / Parquet 로 내보냅니다.
+
+- 유저 속성(세그먼트, 점수, 마지막 주문일, 구매 후 세션 수)은 RFM 저장소(thelook_analysis.store)에서,
+  email 은 원천 users Parquet 에서 가져옵니다
+- users 를 row group 단위로 스트리밍하며 각 배치의 user_id 를 저장소에서 이진 탐색(store.lookup)하므로
+  메모리는 배치 크기에만 비례하고 대상 규모와 무관합니다 (출력 순서 = users 원천 순서)
+- users 원천이 없으면 저장소를 청크 단위로 훑고 email 은 비워 둡니다
+- 배치마다 바로 파일에 쓰므로 (CSVWriter / ParquetWriter) 전체 목록이 메모리에 모이지 않습니다
+
+사용 예:
+    python -m thelook_analysis.export --store data/rfm.store --data-dir data/thelook \\
+        --audience winback --out winback.parquet
+"""
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pcsv
+import pyarrow.parquet as pq
+
+from thelook_analysis.store import open_store
+
+DEFAULT_BATCH_SIZE = 1 << 16
+
+# 대상 고객군: 세그먼트 목록 + 구매 후 세션이 없는 유저만 (inactive)
+AUDIENCES = {
+    "promising_high_inactive": {
+        "label": "Promising High 미활동", "segments": ("Promising High Value",), "inactive": True,
+    },
+    "promising_low_inactive": {
+        "label": "Promising Low 미활동", "segments": ("Promising Low Value",), "inactive": True,
+    },
+    "vip": {"label": "VIP", "segments": ("VIP",), "inactive": False},
+    "winback": {
+        "label": "윈백 (Need Attention + At Risk + Hibernating)",
+        "segments": ("Need Attention", "At Risk", "Hibernating"), "inactive": False,
+    },
+    "hibernating": {"label": "Hibernating", "segments": ("Hibernating",), "inactive": False},
+}
+
+EXPORT_SCHEMA = pa.schema([
+    ("user_id", pa.int64()),
+    ("email", pa.string()),
+    ("segment", pa.string()),
+    ("r_score", pa.int8()),
+    ("f_score", pa.int8()),
+    ("m_score", pa.int8()),
+    ("recency_days", pa.int32()),
+    ("frequency", pa.int16()),
+    ("monetary", pa.float64()),
+    ("last_order_date", pa.date32()),
+    ("post_purchase_sessions", pa.int32()),
+])
+
+FORMATS = ("csv", "parquet")
+
+
+def _audience(name):
+    if name not in AUDIENCES:
+        raise KeyError(f"알 수 없는 대상 고객군: {name} (가능: {', '.join(AUDIENCES)})")
+    return AUDIENCES[name]
+
+
+def _mask(store, audience, rows):
+    """저장소 행 번호 배열 중 대상 고객군에 속하는 행 (bool)"""
+    codes = [store.dictionaries["segment"].index(name) for name in audience["segments"]
+             if name in store.dictionaries["segment"]]
+    mask = np.isin(store.segment[rows], codes)
+    if audience["inactive"]:
+        mask &= store.post_purchase_sessions[rows] == 0
+    return mask
+
+
+def _store_chunks(store, batch_size):
+    for start in range(0, len(store), batch_size):
+        yield np.arange(start, min(start + batch_size, len(store)))
+
+
+def count(store, name, batch_size=DEFAULT_BATCH_SIZE):
+    """대상 고객 수 (저장소를 청크 단위로 훑음)"""
+    audience = _audience(name)
+    return int(sum(_mask(store, audience, rows).sum() for rows in _store_chunks(store, batch_size)))
+
+
+def _batch(store, rows, emails=None):
+    segments = np.asarray(store.dictionaries["segment"], dtype=object)
+    last_order = store.as_of - store.recency_days[rows].astype("timedelta64[D]")
+    columns = {
+        "user_id": store.user_id[rows],
+        "email": emails if emails is not None else pa.nulls(len(rows), pa.string()),
+        "segment": segments[store.segment[rows]],
+        "r_score": store.r_score[rows],
+        "f_score": store.f_score[rows],
+        "m_score": store.m_score[rows],
+        "recency_days": store.recency_days[rows],
+        "frequency": store.frequency[rows],
+        "monetary": np.round(store.monetary[rows].astype(np.float64), 2),
+        "last_order_date": last_order,
+        "post_purchase_sessions": store.post_purchase_sessions[rows],
+    }
+    arrays = []
+    for field in EXPORT_SCHEMA:
+        values = columns[field.name]
+        arrays.append(values if isinstance(values, pa.Array) else pa.array(values, field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=EXPORT_SCHEMA)
+
+
+def _users_files(data_dir):
+    directory = Path(data_dir) / "users"
+    if directory.is_dir():
+        return sorted(directory.glob("**/*.parquet"))
+    single = Path(data_dir) / "users.parquet"
+    return [single] if single.exists() else []
+
+
+def iter_audience(store, name, data_dir=None, batch_size=DEFAULT_BATCH_SIZE):
+    """대상 고객 행을 pyarrow.RecordBatch (EXPORT_SCHEMA) 로 스트리밍. 빈 배치는 건너뜀"""
+    audience = _audience(name)
+    files = _users_files(data_dir) if data_dir else []
+    if not files:
+        for rows in _store_chunks(store, batch_size):
+            rows = rows[_mask(store, audience, rows)]
+            if len(rows):
+                yield _batch(store, rows)
+        return
+
+    for file in files:
+        for users in pq.ParquetFile(file).iter_batches(batch_size=batch_size, columns=["id", "email"]):
+            rows = store.lookup(users.column("id").to_numpy())
+            found = np.flatnonzero(rows >= 0)
+            keep = found[_mask(store, audience, rows[found])]
+            if len(keep):
+                emails = users.column("email").take(pa.array(keep)).cast(pa.string())
+                yield _batch(store, rows[keep], emails)
+
+
+def write(batches, sink, fmt):
+    """RecordBatch 스트림을 sink(경로 또는 바이너리 파일 객체) 에 CSV / Parquet 로 기록. 기록한 행 수 반환"""
+    if fmt not in FORMATS:
+        raise ValueError(f"지원하지 않는 형식: {fmt} (가능: {FORMATS})")
+    rows = 0
+    if fmt == "csv":
+        writer = pcsv.CSVWriter(sink, EXPORT_SCHEMA)
+    else:
+        writer = pq.ParquetWriter(sink, EXPORT_SCHEMA, compression="zstd")
+    with writer:
+        for batch in batches:
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    return rows
+
+
+def export(store_path, name, out, data_dir=None, fmt=None, batch_size=DEFAULT_BATCH_SIZE):
+    """저장소 파일 → 대상 고객 파일 (형식은 fmt 또는 out 확장자)"""
+    fmt = fmt or Path(out).suffix.lstrip(".").lower()
+    with open_store(store_path) as store:
+        return write(iter_audience(store, name, data_dir, batch_size), str(out), fmt)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="캠페인 대상 고객 목록 스트리밍 추출")
+    parser.add_argument("--store", required=True, help="RFM 저장소 파일 (thelook_analysis.store)")
+    parser.add_argument("--audience", required=True, choices=sorted(AUDIENCES))
+    parser.add_argument("--out", required=True, help="출력 파일 (.csv / .parquet)")
+    parser.add_argument("--data-dir", default=None, help="email 을 가져올 원천 Parquet 디렉터리")
+    parser.add_argument("--format", choices=FORMATS, default=None, help="기본값: 출력 파일 확장자")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    rows = export(args.store, args.audience, args.out, args.data_dir, args.format, args.batch_size)
+    print(f"written: {args.out} ({rows:,} rows)")
+
+
+if __name__ == "__main__":
+    main()
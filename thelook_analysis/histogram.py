@@ -0,0 +1,145 @@
+"""
+RFM 기준값 시뮬레이션용 3-D 히스토그램
+=====================================
+(recency 일 × frequency 회 × monetary 구간) 격자에 유저 수 / 매출 합계를 한 번 집계한 뒤
+3차원 누적합(prefix sum)으로 바꿔 둡니다. 기준값이 바뀌면 축마다 점수가 같은 연속 구간을 구하고,
+구간 상자(box) 합을 누적합 꼭짓점 8개의 포함-배제로 계산합니다. 재분류 비용은 유저 수와 무관하게
+(점수 구간 수)³ 번의 조회이며, 히스토그램 생성만 O(유저 수) 입니다.
+
+격자 해상도 안에서는 `score_rfm` 과 같은 결과입니다.
+- recency: 1일 단위. recency_max 이상은 마지막 칸 → R 기준값은 recency_max 미만
+- frequency: 1회 단위. frequency_max 이상은 마지막 칸 → F 기준값은 frequency_max 이하
+- monetary: monetary_step 달러 단위. monetary_max 이상은 마지막 칸 → M 기준값은 step 의 배수, monetary_max 이하
+"""
+
+import numpy as np
+import pandas as pd
+
+from thelook_analysis.rfm import (
+    F_THRESHOLDS,
+    M_THRESHOLDS,
+    R_THRESHOLDS,
+    SEGMENTS,
+    assign_segments,
+    score_frequency,
+    score_monetary,
+    score_recency,
+)
+
+# 기본 격자: 731 × 6 × 601 칸 (분석 기간 2년 / 5회 이상 / $600 이상은 마지막 칸)
+DEFAULT_RECENCY_MAX = 730
+DEFAULT_FREQUENCY_MAX = 5
+DEFAULT_MONETARY_MAX = 600
+DEFAULT_MONETARY_STEP = 1
+
+# 히스토그램 집계 시 한 번에 처리할 유저 수 (평탄화 인덱스 배열 메모리 상한)
+_CHUNK_SIZE = 1 << 23
+
+
+class RFMHistogram:
+    """유저 수 / 매출 합계 3-D 히스토그램과 그 누적합"""
+
+    def __init__(self, counts, revenue, recency_max=DEFAULT_RECENCY_MAX, frequency_max=DEFAULT_FREQUENCY_MAX,
+                 monetary_max=DEFAULT_MONETARY_MAX, monetary_step=DEFAULT_MONETARY_STEP):
+        self.recency_max = recency_max
+        self.frequency_max = frequency_max
+        self.monetary_max = monetary_max
+        self.monetary_step = monetary_step
+        if counts.shape != self.shape or revenue.shape != self.shape:
+            raise ValueError(f"히스토그램 모양 {counts.shape} 가 격자 {self.shape} 와 다릅니다")
+        self.users = int(counts.sum())
+        self.revenue = float(revenue.sum())
+        self._count_prefix = self._prefix(counts.astype(np.int64))
+        # 포함-배제 중간값이 ±유저 수 범위이므로 여유를 두고 int32 로 줄임
+        if self.users <= np.iinfo(np.int32).max // 4:
+            self._count_prefix = self._count_prefix.astype(np.int32)
+        self._revenue_prefix = self._prefix(revenue.astype(np.float64))
+
+    @property
+    def shape(self):
+        return (self.recency_max + 1, self.frequency_max + 1, self.monetary_max // self.monetary_step + 1)
+
+    @property
+    def nbytes(self):
+        return self._count_prefix.nbytes + self._revenue_prefix.nbytes
+
+    @staticmethod
+    def _prefix(values):
+        # 앞쪽에 0 을 한 줄씩 덧대어 P[i, j, k] = values[:i, :j, :k] 합이 되도록
+        prefix = np.zeros(tuple(n + 1 for n in values.shape), dtype=values.dtype)
+        prefix[1:, 1:, 1:] = values.cumsum(0).cumsum(1).cumsum(2)
+        return prefix
+
+    @classmethod
+    def from_arrays(cls, recency_days, frequency, monetary, recency_max=DEFAULT_RECENCY_MAX,
+                    frequency_max=DEFAULT_FREQUENCY_MAX, monetary_max=DEFAULT_MONETARY_MAX,
+                    monetary_step=DEFAULT_MONETARY_STEP):
+        """유저별 배열(RFMResult / RFMStore 컬럼)로부터 생성. 청크 단위 bincount 한 번의 패스"""
+        if monetary_max % monetary_step:
+            raise ValueError("monetary_max 는 monetary_step 의 배수여야 합니다")
+        r_bins, f_bins = recency_max + 1, frequency_max + 1
+        m_bins = monetary_max // monetary_step + 1
+        size = r_bins * f_bins * m_bins
+        counts = np.zeros(size, dtype=np.int64)
+        revenue = np.zeros(size, dtype=np.float64)
+        for start in range(0, len(recency_days), _CHUNK_SIZE):
+            stop = start + _CHUNK_SIZE
+            money = np.asarray(monetary[start:stop], dtype=np.float64)
+            r = np.clip(recency_days[start:stop], 0, recency_max).astype(np.int64)
+            f = np.clip(frequency[start:stop], 0, frequency_max).astype(np.int64)
+            m = np.clip(np.floor(money / monetary_step), 0, m_bins - 1).astype(np.int64)
+            flat = (r * f_bins + f) * m_bins + m
+            counts += np.bincount(flat, minlength=size)
+            revenue += np.bincount(flat, weights=money, minlength=size)
+        shape = (r_bins, f_bins, m_bins)
+        return cls(counts.reshape(shape), revenue.reshape(shape), recency_max, frequency_max,
+                   monetary_max, monetary_step)
+
+    @classmethod
+    def from_store(cls, store, **grid):
+        """RFMStore (memory-mapped) 로부터 생성"""
+        return cls.from_arrays(store.recency_days, store.frequency, store.monetary, **grid)
+
+    def _check(self, r_thresholds, f_thresholds, m_thresholds):
+        if max(r_thresholds) >= self.recency_max:
+            raise ValueError(f"R 기준값은 {self.recency_max}일 미만이어야 합니다")
+        if max(f_thresholds) > self.frequency_max:
+            raise ValueError(f"F 기준값은 {self.frequency_max}회 이하여야 합니다")
+        if max(m_thresholds) > self.monetary_max or any(t % self.monetary_step for t in m_thresholds):
+            raise ValueError(f"M 기준값은 ${self.monetary_step} 단위, ${self.monetary_max} 이하여야 합니다")
+
+    @staticmethod
+    def _boxes(scores):
+        """점수 배열 → (점수가 같은 연속 구간 경계, 구간별 점수)"""
+        edges = np.concatenate(([0], np.flatnonzero(np.diff(scores)) + 1, [len(scores)]))
+        return edges, scores[edges[:-1]]
+
+    def _box_sums(self, prefix, r_edges, f_edges, m_edges):
+        corners = prefix[np.ix_(r_edges, f_edges, m_edges)]
+        return np.diff(np.diff(np.diff(corners, axis=0), axis=1), axis=2)
+
+    def segment(self, r_thresholds=R_THRESHOLDS, f_thresholds=F_THRESHOLDS, m_thresholds=M_THRESHOLDS):
+        """
+        주어진 기준값으로 재분류한 세그먼트별 유저 수 / 매출.
+        기준값 의미는 score_recency / score_frequency / score_monetary 와 같습니다.
+        """
+        self._check(r_thresholds, f_thresholds, m_thresholds)
+        r_bins, f_bins, m_bins = self.shape
+        # 각 칸의 대표값(하한)에 점수 함수를 그대로 적용
+        r_edges, r_score = self._boxes(score_recency(np.arange(r_bins), r_thresholds))
+        f_edges, f_score = self._boxes(score_frequency(np.arange(f_bins), f_thresholds))
+        m_edges, m_score = self._boxes(score_monetary(np.arange(m_bins) * self.monetary_step, m_thresholds))
+
+        counts = self._box_sums(self._count_prefix, r_edges, f_edges, m_edges)
+        revenue = self._box_sums(self._revenue_prefix, r_edges, f_edges, m_edges)
+        codes = assign_segments(r_score[:, None, None], f_score[None, :, None], m_score[None, None, :])
+
+        user_count = np.bincount(codes.ravel(), weights=counts.ravel(), minlength=len(SEGMENTS))
+        segment_revenue = np.bincount(codes.ravel(), weights=revenue.ravel(), minlength=len(SEGMENTS))
+        return pd.DataFrame({
+            "segment": SEGMENTS,
+            "user_count": user_count.astype(np.int64),
+            "pct": user_count / max(self.users, 1) * 100,
+            "revenue": segment_revenue,
+            "revenue_pct": segment_revenue / (self.revenue or 1.0) * 100,
+        })
@@ -0,0 +1,296 @@
+"""
+재구매 간격 히스토그램
+=====================
+VIP 페이지의 `vip_repurchase_timing` (1주 / 2주 / 1개월 / ... / 3개월+) 과 `conversion_speed` (≤30 / 31-60 / 61+일) 는
+같은 값(첫 구매 → 두 번째 구매 간격)을 서로 다르게 나눈 표입니다. 주문을 한 번 훑어 간격을 1일 단위
+히스토그램으로 쌓아 두면 어떤 구간 체계든 인접한 칸을 더하는 것만으로 만들 수 있습니다.
+
+- 주문 상품 행을 (user_id, 주문 시각, order_id) 로 정렬해 주문 단위로 묶고, 유저 경계를 넘지 않는 np.diff 로
+  연속 주문 간격을 구합니다. nth 번째 → nth + 1 번째 주문 간격만 사용 (기본 1 → 2, SQL 의 order_rank 기준과 동일)
+- 칸 = (세그먼트, 간격 일수). 칸마다 유저 수와 합계(첫 / 두 번째 주문 매출, LTV, M 점수, 구매 사이 세션 / 상품 조회)를
+  저장하므로 구간 평균은 합계 / 유저 수
+- 구간 재집계 비용은 (세그먼트 × 최대 간격 일수) 칸의 np.add.reduceat 하나로 주문 수와 무관합니다
+
+사용 예:
+    python -m thelook_analysis.repurchase --data-dir data/thelook --edges 7 14 30 60 90
+    python -m thelook_analysis.repurchase --data-dir data/thelook --out data/repurchase.npz
+"""
+
+import argparse
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from thelook_analysis.rfm import ANALYSIS_AS_OF, SEGMENTS, score_rfm
+from thelook_analysis.sessions import stg_events_relation
+
+# vip_repurchase_timing / conversion_speed 의 구간 (간격 일수 상한, 포함) 과 라벨
+VIP_TIMING_EDGES = (7, 14, 30, 60, 90)
+VIP_TIMING_LABELS = (
+    "1. Within 1 Week", "2. Within 2 Weeks", "3. Within 1 Month",
+    "4. Within 2 Months", "5. Within 3 Months", "6. 3+ Months",
+)
+CONVERSION_SPEED_EDGES = (30, 60)
+CONVERSION_SPEED_LABELS = ("1. Quick (≤30 days)", "2. Medium (31-60 days)", "3. Slow (61+ days)")
+
+# 칸별 합계 이름 (유저 단위 값)
+MEASURES = ("first_revenue", "second_revenue", "ltv", "m_score", "sessions", "product_views")
+
+
+@dataclass
+class PurchaseGaps:
+    """nth 번째 → nth + 1 번째 주문이 있는 유저별 간격 (user_id 오름차순)"""
+
+    user_id: np.ndarray
+    first_date: np.ndarray
+    second_date: np.ndarray
+    first_revenue: np.ndarray
+    second_revenue: np.ndarray
+
+    def __len__(self):
+        return len(self.user_id)
+
+    @property
+    def days(self):
+        return (self.second_date - self.first_date).astype(np.int64)
+
+
+def purchase_gaps(user_id, order_id, created_at, order_date, sale_price, nth=1):
+    """
+    주문 상품 행 → PurchaseGaps. 주문 순서는 (주문 시각, order_id), 주문 매출은 상품 sale_price 합계.
+    """
+    if nth < 1:
+        raise ValueError("nth 는 1 이상이어야 합니다")
+    user_id = np.asarray(user_id)
+    order_id = np.asarray(order_id)
+    order_day = np.asarray(order_date, dtype="datetime64[D]").view(np.int64)
+    sale_price = np.asarray(sale_price, dtype=np.float64)
+
+    order = np.lexsort((order_id, np.asarray(created_at), user_id))
+    u, o = user_id[order], order_id[order]
+    new_order = np.r_[True, (u[1:] != u[:-1]) | (o[1:] != o[:-1])] if len(u) else np.array([], dtype=bool)
+    starts = np.flatnonzero(new_order)
+    users = u[starts]
+    days = order_day[order][starts]
+    revenue = np.add.reduceat(sale_price[order], starts) if len(starts) else sale_price[:0]
+
+    # 유저 안에서의 주문 순번 (0 부터) 과 다음 주문까지의 간격
+    new_user = np.r_[True, users[1:] != users[:-1]] if len(users) else new_order[:0]
+    user_starts = np.flatnonzero(new_user)
+    rank = np.arange(len(users)) - np.repeat(user_starts, np.diff(np.r_[user_starts, len(users)]))
+    pair = np.flatnonzero((rank[:-1] == nth - 1) & ~new_user[1:])
+    return PurchaseGaps(
+        user_id=users[pair],
+        first_date=days[pair].view("datetime64[D]"),
+        second_date=days[pair + 1].view("datetime64[D]"),
+        first_revenue=revenue[pair],
+        second_revenue=revenue[pair + 1],
+    )
+
+
+def bucket_labels(edges):
+    """간격 상한 → 구간 라벨 ('1. 0-7일', '2. 8-14일', ..., 'k. 91일+')"""
+    labels, low = [], 0
+    for i, high in enumerate(edges):
+        labels.append(f"{i + 1}. {low}-{high}일" if high > low else f"{i + 1}. {high}일")
+        low = high + 1
+    labels.append(f"{len(edges) + 1}. {low}일+")
+    return tuple(labels)
+
+
+class RepurchaseHistogram:
+    """(그룹 × 간격 일수) 유저 수 / 합계 히스토그램"""
+
+    def __init__(self, counts, sums, groups=SEGMENTS, nth=1):
+        if counts.shape[0] != len(groups) or any(values.shape != counts.shape for values in sums.values()):
+            raise ValueError(f"히스토그램 모양 {counts.shape} 가 그룹 수 {len(groups)} 와 맞지 않습니다")
+        self.counts = counts
+        self.sums = sums
+        self.groups = tuple(groups)
+        self.nth = nth
+
+    @property
+    def max_days(self):
+        return self.counts.shape[1] - 1
+
+    @property
+    def nbytes(self):
+        return self.counts.nbytes + sum(values.nbytes for values in self.sums.values())
+
+    @classmethod
+    def from_arrays(cls, days, group, measures=None, groups=SEGMENTS, nth=1):
+        """
+        유저 단위 배열로부터 생성. group = 그룹 코드 (groups 의 인덱스),
+        measures = {MEASURES 중 이름: 유저별 값} (없는 합계는 표에서 빠짐)
+        """
+        days = np.asarray(days, dtype=np.int64)
+        if len(days) and days.min() < 0:
+            raise ValueError("간격은 0일 이상이어야 합니다")
+        width = int(days.max()) + 1 if len(days) else 1
+        key = np.asarray(group, dtype=np.int64) * width + days
+        size = len(groups) * width
+        shape = (len(groups), width)
+        counts = np.bincount(key, minlength=size).reshape(shape)
+        sums = {}
+        for name, values in (measures or {}).items():
+            if name not in MEASURES:
+                raise ValueError(f"알 수 없는 합계: {name} (가능: {MEASURES})")
+            sums[name] = np.bincount(key, weights=np.asarray(values, dtype=np.float64), minlength=size).reshape(shape)
+        return cls(counts, sums, groups, nth)
+
+    def save(self, path):
+        path = Path(path)
+        with open(path, "wb") as file:
+            np.savez(file, counts=self.counts, groups=np.asarray(self.groups, dtype=str), nth=np.int64(self.nth),
+                     **{f"sum_{name}": values for name, values in self.sums.items()})
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as saved:
+            sums = {name[len("sum_"):]: saved[name] for name in saved.files if name.startswith("sum_")}
+            return cls(saved["counts"], sums, tuple(str(name) for name in saved["groups"]), int(saved["nth"]))
+
+    def _rows(self, group):
+        if group is None:
+            return slice(None)
+        if group not in self.groups:
+            raise KeyError(f"알 수 없는 그룹: {group} (가능: {self.groups})")
+        index = self.groups.index(group)
+        return slice(index, index + 1)
+
+    def table(self, edges, group="VIP", labels=None):
+        """
+        간격 상한 edges (포함, 증가 수열) 로 나눈 구간표 (bucket, count, pct, avg_days, avg_<합계>...).
+        마지막 구간은 edges[-1] 초과 전부이며 유저가 없는 구간은 생략. group=None 이면 전체 그룹 합
+        """
+        edges = np.asarray(edges, dtype=np.int64)
+        if len(edges) == 0 or edges[0] < 0 or np.any(np.diff(edges) <= 0):
+            raise ValueError("edges 는 0 이상의 증가 수열이어야 합니다")
+        labels = tuple(labels) if labels is not None else bucket_labels(tuple(int(e) for e in edges))
+        if len(labels) != len(edges) + 1:
+            raise ValueError(f"라벨은 구간 수({len(edges) + 1})만큼 필요합니다")
+
+        rows = self._rows(group)
+        counts = self.counts[rows].sum(axis=0)
+        columns = {
+            "count": counts,
+            "days": counts * np.arange(len(counts)),
+            **{name: values[rows].sum(axis=0) for name, values in self.sums.items()},
+        }
+        # 구간 k 의 칸 = [starts[k], starts[k + 1]). 최대 간격을 넘는 상한은 잘라서 빈 구간으로
+        starts = np.r_[0, np.minimum(edges + 1, len(counts))]
+        present = np.r_[starts[:-1] < starts[1:], starts[-1] < len(counts)]
+        sums = {name: np.add.reduceat(values, starts[present]) for name, values in columns.items()}
+
+        count = sums["count"]
+        keep = count > 0
+        total = max(int(count.sum()), 1)
+        frame = pd.DataFrame({
+            "bucket": np.asarray(labels, dtype=object)[present][keep],
+            "count": count[keep].astype(np.int64),
+            "pct": count[keep] * 100.0 / total,
+            "avg_days": sums["days"][keep] / count[keep],
+        })
+        for name in MEASURES:
+            if name in sums:
+                frame[f"avg_{name}"] = sums[name][keep] / count[keep]
+        return frame
+
+
+# ============================================
+# 로컬 Parquet 원천
+# ============================================
+
+# 첫 구매 다음 날부터 두 번째 구매 전날까지의 세션 / 상품 조회 (CONVERSION_SPEED_SQL 과 같은 기준)
+_BETWEEN_PURCHASES_SQL = """
+SELECT
+    p.user_id,
+    COUNT(DISTINCT e.session_id) AS sessions,
+    COUNT(CASE WHEN e.event_type = 'product' THEN 1 END) AS product_views
+FROM gap_pairs p
+JOIN {stg_events} e
+    ON e.user_id = p.user_id AND e.event_date > p.first_date AND e.event_date < p.second_date
+GROUP BY p.user_id
+"""
+
+
+def _between_purchases(runner, gaps):
+    """유저별 구매 사이 (세션 수, 상품 조회 수). 이벤트가 없으면 0"""
+    pairs = pd.DataFrame({"user_id": gaps.user_id, "first_date": gaps.first_date, "second_date": gaps.second_date})
+    runner.con.register("gap_pairs", pairs)
+    try:
+        activity = runner.query(_BETWEEN_PURCHASES_SQL.format(stg_events=stg_events_relation(runner)))
+    finally:
+        runner.con.unregister("gap_pairs")
+    sessions = np.zeros(len(gaps), dtype=np.int64)
+    product_views = np.zeros(len(gaps), dtype=np.int64)
+    rows = np.searchsorted(gaps.user_id, activity["user_id"].to_numpy())
+    sessions[rows] = activity["sessions"].to_numpy()
+    product_views[rows] = activity["product_views"].to_numpy()
+    return sessions, product_views
+
+
+def build_repurchase_histogram(data_dir, nth=1, as_of=ANALYSIS_AS_OF, events=True):
+    """
+    로컬 Parquet 원천(`duckdb_backend` 배치) → 세그먼트별 RepurchaseHistogram.
+    세그먼트 / LTV / M 점수는 score_rfm (int_user_rfm 과 같은 기준), events=False 면 세션 / 상품 조회 합계 생략
+    """
+    from thelook_analysis.duckdb_backend import LocalRunner
+
+    runner = LocalRunner(data_dir)
+    try:
+        runner.run(["stg_orders", "stg_order_items"])
+        return histogram_from_runner(runner, nth, as_of, events)
+    finally:
+        runner.close()
+
+
+def histogram_from_runner(runner, nth=1, as_of=ANALYSIS_AS_OF, events=True):
+    """구체화된 stg_orders / stg_order_items 가 있는 러너 → RepurchaseHistogram (스케줄러는 자기 데이터베이스로 호출)"""
+    rows = runner.query("""
+        SELECT o.user_id, o.order_id, o.created_at, o.order_date, oi.sale_price
+        FROM stg_orders o
+        JOIN stg_order_items oi ON o.order_id = oi.order_id
+    """)
+    columns = [rows[name].to_numpy() for name in ("user_id", "order_id", "created_at", "order_date", "sale_price")]
+    del rows
+    gaps = purchase_gaps(*columns, nth=nth)
+    activity = _between_purchases(runner, gaps) if events and len(gaps) else None
+
+    user_id, order_id, _, order_date, sale_price = columns
+    rfm = score_rfm(user_id, order_id, order_date, sale_price, as_of=as_of)
+    # gaps.user_id 는 rfm.user_id 의 부분집합 (둘 다 오름차순)
+    users = np.searchsorted(rfm.user_id, gaps.user_id)
+    measures = {
+        "first_revenue": gaps.first_revenue,
+        "second_revenue": gaps.second_revenue,
+        "ltv": rfm.monetary[users],
+        "m_score": rfm.m_score[users],
+    }
+    if activity is not None:
+        measures["sessions"], measures["product_views"] = activity
+    return RepurchaseHistogram.from_arrays(gaps.days, rfm.segment[users], measures, nth=nth)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="재구매 간격 구간표 (1일 단위 히스토그램 재집계)")
+    parser.add_argument("--data-dir", required=True, help="원천 Parquet 디렉터리")
+    parser.add_argument("--edges", nargs="*", type=int, default=list(VIP_TIMING_EDGES), help="구간 상한 (일, 포함)")
+    parser.add_argument("--segment", default="VIP", help="세그먼트 (all = 전체)")
+    parser.add_argument("--nth", type=int, default=1, help="nth → nth + 1 번째 주문 간격")
+    parser.add_argument("--no-events", action="store_true", help="구매 사이 세션 / 상품 조회를 집계하지 않음")
+    parser.add_argument("--out", default=None, help="히스토그램을 저장할 파일 (.npz, 대시보드 THELOOK_REPURCHASE)")
+    args = parser.parse_args(argv)
+
+    histogram = build_repurchase_histogram(args.data_dir, nth=args.nth, events=not args.no_events)
+    if args.out:
+        histogram.save(args.out)
+    group = None if args.segment == "all" else args.segment
+    print(histogram.table(args.edges, group).round(2).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+RFM 스코어링 엔진
+=================
+`thelook_dbt/models/intermediate/int_user_rfm.sql` 의 집계/스코어링/세그먼트 로직을
+NumPy group-by 로 재현합니다. id 가 조밀하면 정렬 없이 bincount 로, 그 외에는
+정렬 + reduceat 으로 집계하며 유저 단위 Python 루프가 없으므로 수억 건의 order_items 도
+웨어하우스 왕복 없이 스코어링할 수 있습니다.
+
+입력은 `stg_orders JOIN stg_order_items ON order_id` 결과와 같은 행 단위 배열
+(user_id, order_id, order_date, sale_price) 입니다.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# Recency 기준일 (int_user_rfm.sql 의 DATE('2025-01-01'))
+ANALYSIS_AS_OF = np.datetime64("2025-01-01", "D")
+
+# 점수 경계값 (SQL CASE 순서 그대로)
+R_THRESHOLDS = (90, 180, 365, 545)   # recency_days <= 기준 → 5, 4, 3, 2 / 그 외 1
+F_THRESHOLDS = (3, 2)                # frequency >= 3 → 5, = 2 → 4 / 그 외 1
+M_THRESHOLDS = (300, 135, 67, 34)    # monetary >= 기준 → 5, 4, 3, 2 / 그 외 1
+
+# customer_segment 코드 (uint8) → 이름
+SEGMENTS = (
+    "VIP",
+    "Loyal High Value",
+    "Loyal Low Value",
+    "Promising High Value",
+    "Promising Low Value",
+    "Need Attention",
+    "At Risk",
+    "Hibernating",
+    "Others",
+)
+
+_INT64_MAX = np.iinfo(np.int64).max
+
+# id 범위가 행 수의 이 배수 이하이면 정렬 없이 bincount 경로 사용
+_DENSE_SPAN_FACTOR = 4
+
+
+@dataclass
+class RFMResult:
+    """유저별 RFM 결과 (user_id 오름차순, 모든 필드는 길이가 같은 배열)"""
+
+    user_id: np.ndarray
+    recency_days: np.ndarray
+    frequency: np.ndarray
+    monetary: np.ndarray
+    r_score: np.ndarray
+    f_score: np.ndarray
+    m_score: np.ndarray
+    segment: np.ndarray
+    last_order_date: np.ndarray
+
+    def __len__(self):
+        return len(self.user_id)
+
+    @property
+    def customer_segment(self):
+        """세그먼트 코드를 int_user_rfm 의 customer_segment 문자열로 변환"""
+        return np.asarray(SEGMENTS, dtype=object)[self.segment]
+
+    def to_frame(self):
+        """int_user_rfm 과 같은 컬럼 순서의 DataFrame"""
+        return pd.DataFrame({
+            "user_id": self.user_id,
+            "recency_days": self.recency_days,
+            "frequency": self.frequency,
+            "monetary": self.monetary,
+            "r_score": self.r_score,
+            "f_score": self.f_score,
+            "m_score": self.m_score,
+            "customer_segment": self.customer_segment,
+            "last_order_date": self.last_order_date,
+        })
+
+
+def score_recency(recency_days, thresholds=R_THRESHOLDS):
+    """recency_days <= 90/180/365/545 → 5/4/3/2, 그 외 1"""
+    edges = np.sort(np.asarray(thresholds))
+    idx = np.searchsorted(edges, np.asarray(recency_days), side="left")
+    return (len(edges) + 1 - idx).astype(np.uint8)
+
+
+def score_frequency(frequency, thresholds=F_THRESHOLDS):
+    """frequency >= 3 → 5, = 2 → 4, 그 외 1 (SQL 의 ELSE 1)"""
+    frequency = np.asarray(frequency)
+    mid, high = np.sort(np.asarray(thresholds))
+    return np.where(frequency >= high, 5, np.where(frequency >= mid, 4, 1)).astype(np.uint8)
+
+
+def score_monetary(monetary, thresholds=M_THRESHOLDS):
+    """monetary >= 300/135/67/34 → 5/4/3/2, 그 외 1"""
+    edges = np.sort(np.asarray(thresholds, dtype=np.float64))
+    idx = np.searchsorted(edges, np.asarray(monetary), side="right")
+    return (1 + idx).astype(np.uint8)
+
+
+def assign_segments(r_score, f_score, m_score):
+    """int_user_rfm.sql 의 customer_segment CASE 를 위에서부터 순서대로 적용 (SEGMENTS 코드 반환)"""
+    r, f, m = np.asarray(r_score), np.asarray(f_score), np.asarray(m_score)
+    conditions = [
+        (r >= 4) & (f >= 4) & (m >= 4),   # VIP
+        (r >= 3) & (f >= 4) & (m >= 3),   # Loyal High Value
+        (r >= 3) & (f >= 4) & (m <= 2),   # Loyal Low Value
+        (r >= 4) & (f == 1) & (m >= 3),   # Promising High Value
+        (r >= 4) & (f == 1) & (m <= 2),   # Promising Low Value
+        (r <= 2) & (f >= 4) & (m >= 3),   # Need Attention
+        (r == 3) & (f == 1),              # At Risk
+        (r <= 2) & (f <= 2),              # Hibernating
+    ]
+    codes = np.arange(len(conditions), dtype=np.uint8)
+    return np.select(conditions, codes, default=np.uint8(len(SEGMENTS) - 1)).astype(np.uint8)
+
+
+def _round_half_away(values, decimals=2):
+    # BigQuery ROUND 는 half away from zero (np.round 는 half to even)
+    scale = 10.0 ** decimals
+    return np.sign(values) * np.floor(np.abs(values) * scale + 0.5) / scale
+
+
+def _group_order(user_id, order_id):
+    """(user_id, order_id) 정렬 순서. 가능하면 단일 int64 키 argsort 로 lexsort 비용을 피함"""
+    u_min, u_max = int(user_id.min()), int(user_id.max())
+    o_min, o_max = int(order_id.min()), int(order_id.max())
+    o_span = o_max - o_min + 1
+    if (u_max - u_min + 1) * o_span <= _INT64_MAX:
+        key = (user_id.astype(np.int64) - u_min) * o_span + (order_id.astype(np.int64) - o_min)
+        return np.argsort(key)
+    return np.lexsort((order_id, user_id))
+
+
+def _aggregate_sorted(user_id, order_id, order_days, sale_price):
+    """정렬 + reduceat 경로 (임의의 id 분포)"""
+    order = _group_order(user_id, order_id)
+    u = user_id[order]
+    o = order_id[order]
+
+    new_user = np.empty(len(u), dtype=bool)
+    new_user[0] = True
+    np.not_equal(u[1:], u[:-1], out=new_user[1:])
+    new_order = new_user.copy()
+    new_order[1:] |= o[1:] != o[:-1]
+    starts = np.flatnonzero(new_user)
+
+    last_days = np.maximum.reduceat(order_days[order], starts)
+    frequency = np.add.reduceat(new_order.astype(np.int64), starts)
+    monetary = np.add.reduceat(sale_price[order], starts)
+    return u[starts], last_days, frequency, monetary
+
+
+def _aggregate_dense(user_id, order_id, order_days, sale_price):
+    """
+    bincount 경로 (정렬 없음). id 가 조밀하고 주문 하나가 한 유저에만 속할 때 사용하며,
+    조건이 맞지 않으면 None 을 반환해 정렬 경로로 넘깁니다.
+    """
+    n = len(user_id)
+    u_min, o_min = int(user_id.min()), int(order_id.min())
+    u_span = int(user_id.max()) - u_min + 1
+    o_span = int(order_id.max()) - o_min + 1
+    if max(u_span, o_span) > _DENSE_SPAN_FACTOR * n:
+        return None
+
+    u_idx = user_id.astype(np.int64) - u_min
+    o_idx = order_id.astype(np.int64) - o_min
+    order_user = np.full(o_span, -1, dtype=np.int64)
+    order_user[o_idx] = u_idx
+    if not np.array_equal(order_user[o_idx], u_idx):
+        return None
+
+    counts = np.bincount(u_idx, minlength=u_span)
+    present = np.flatnonzero(counts)
+    frequency = np.bincount(order_user[order_user >= 0], minlength=u_span)[present]
+    monetary = np.bincount(u_idx, weights=sale_price, minlength=u_span)[present]
+    last_days = np.full(u_span, np.iinfo(np.int64).min, dtype=np.int64)
+    np.maximum.at(last_days, u_idx, order_days)
+    users = (present + u_min).astype(user_id.dtype)
+    return users, last_days[present], frequency, monetary
+
+
+def score_rfm(user_id, order_id, order_date, sale_price, as_of=ANALYSIS_AS_OF):
+    """
+    행 단위 주문 배열로부터 int_user_rfm 과 동일한 유저별 RFM 결과를 계산합니다.
+
+    - recency_days: as_of - MAX(order_date) (일)
+    - frequency: COUNT(DISTINCT order_id)
+    - monetary: ROUND(SUM(sale_price), 2)
+    """
+    user_id = np.asarray(user_id)
+    order_id = np.asarray(order_id)
+    order_date = np.asarray(order_date, dtype="datetime64[D]")
+    sale_price = np.asarray(sale_price, dtype=np.float64)
+    as_of = np.datetime64(as_of, "D")
+
+    if len(user_id) == 0:
+        empty = np.array([], dtype=np.uint8)
+        return RFMResult(
+            user_id=user_id[:0], recency_days=np.array([], dtype=np.int64),
+            frequency=np.array([], dtype=np.int64), monetary=np.array([], dtype=np.float64),
+            r_score=empty, f_score=empty, m_score=empty, segment=empty,
+            last_order_date=np.array([], dtype="datetime64[D]"),
+        )
+
+    order_days = order_date.view(np.int64)
+    aggregated = _aggregate_dense(user_id, order_id, order_days, sale_price)
+    if aggregated is None:
+        aggregated = _aggregate_sorted(user_id, order_id, order_days, sale_price)
+    users, last_days, frequency, monetary = aggregated
+
+    last_order_date = last_days.view("datetime64[D]")
+    monetary = _round_half_away(monetary)
+    recency_days = (as_of - last_order_date).astype(np.int64)
+
+    r_score = score_recency(recency_days)
+    f_score = score_frequency(frequency)
+    m_score = score_monetary(monetary)
+
+    return RFMResult(
+        user_id=users,
+        recency_days=recency_days,
+        frequency=frequency,
+        monetary=monetary,
+        r_score=r_score,
+        f_score=f_score,
+        m_score=m_score,
+        segment=assign_segments(r_score, f_score, m_score),
+        last_order_date=last_order_date,
+    )
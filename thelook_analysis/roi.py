@@ -0,0 +1,377 @@
+"""
+Action Plan ROI 몬테카를로 시뮬레이션
+====================================
+Phase 별 전환율 / 객단가 가정을 점 추정값 대신 분포로 두고, Phase 마다 시나리오 100만 개를
+한 번의 배치 NumPy 연산으로 평가해 추가 매출 / 비용 / 순이익 / ROI 의 분위수를 구합니다.
+
+- 비율 가정(재활성화율, VIP 전환율 등)은 Beta(평균, 집중도), 금액 가정(객단가, 일시 효과)은 Gamma(평균, 변동계수)
+- 단계(Step)는 앞 단계 인원(또는 대상 인원)에서 이항분포로 전환 인원을 뽑고, 인원 × 객단가를 매출에 더합니다
+  (이항분포는 정규 근사 후 반올림 / [0, n] 클리핑. 대상이 수백 명 이상이라 분위수가 같고 약 4배 빠름)
+- 캠페인 예산 = 계획 매출(가정 평균값으로 계산한 매출) × 비용 비율. 예산은 캠페인 전에 정해지므로
+  실현 매출과 무관하고, 실현 매출이 계획보다 낮으면 ROI 가 내려갑니다 (비용 비율은 전 Phase 공통 가정)
+- Phase 는 서로 독립. Total 은 시나리오별로 Phase 매출을 더한 뒤 분위수를 구합니다
+
+가정 값 조합(Phase / 비용 비율은 frozen dataclass 라 그대로 캐시 키)별로 결과를 메모이즈합니다.
+Phase 하나의 가정이 바뀌면 그 Phase 의 시나리오만 다시 뽑고 나머지는 캐시된 배열을 재사용합니다.
+"""
+
+import functools
+import zlib
+from dataclasses import dataclass, replace
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_SCENARIOS = 1_000_000
+PERCENTILES = (10, 50, 90)
+METRICS = ("revenue", "cost", "profit", "roi")
+TOTAL = "total"
+
+
+# ============================================
+# 가정 분포
+# ============================================
+
+@dataclass(frozen=True)
+class Beta:
+    """비율 가정. 집중도가 클수록 좁음 (표준편차 ≈ sqrt(mean × (1 - mean) / (concentration + 1)))"""
+
+    mean: float
+    concentration: float = 100.0
+
+    def sample(self, rng, size):
+        values = rng.beta(self.mean * self.concentration, (1 - self.mean) * self.concentration, size)
+        return values.astype(np.float32)
+
+
+@dataclass(frozen=True)
+class Gamma:
+    """금액 가정. cv = 표준편차 / 평균"""
+
+    mean: float
+    cv: float = 0.15
+
+    def sample(self, rng, size):
+        shape = 1 / self.cv ** 2
+        values = rng.standard_gamma(shape, size, dtype=np.float32)
+        values *= self.mean / shape
+        return values
+
+
+@dataclass(frozen=True)
+class Assumption:
+    name: str
+    label: str
+    dist: object
+
+    def with_mean(self, mean):
+        return replace(self, dist=replace(self.dist, mean=float(mean)))
+
+
+@dataclass(frozen=True)
+class Step:
+    """
+    base 인원 합계에서 rate 로 전환된 인원(name)을 구하고 (rate 가 없으면 base 그대로) 인원 × value 를 매출에 더함.
+    base 가 비어 있으면 value 를 금액 그대로 더하는 일시 효과 항목
+    """
+
+    name: str
+    label: str
+    base: tuple = ()
+    rate: str = None
+    value: str = None
+
+
+@dataclass(frozen=True)
+class Phase:
+    key: str
+    label: str
+    target: str
+    priority: str
+    populations: tuple          # ((이름, 인원), ...)
+    assumptions: tuple          # (Assumption, ...)
+    steps: tuple                # (Step, ...) 순서대로 평가
+
+    def assumption(self, name):
+        for assumption in self.assumptions:
+            if assumption.name == name:
+                return assumption
+        raise KeyError(f"{self.key}: 알 수 없는 가정 {name}")
+
+    @property
+    def rates(self):
+        """조정 가능한 비율 가정"""
+        return tuple(a for a in self.assumptions if isinstance(a.dist, Beta))
+
+    def with_means(self, means):
+        """{가정 이름: 평균} 으로 가정 평균을 바꾼 Phase"""
+        unknown = set(means) - {a.name for a in self.assumptions}
+        if unknown:
+            raise KeyError(f"{self.key}: 알 수 없는 가정 {sorted(unknown)}")
+        return replace(self, assumptions=tuple(
+            a.with_mean(means[a.name]) if a.name in means else a
+            for a in self.assumptions
+        ))
+
+    def planned_revenue(self):
+        """가정 평균값으로 계산한 추가 매출 (예산 산정 기준)"""
+        counts = dict(self.populations)
+        revenue = 0.0
+        for step in self.steps:
+            value = self.assumption(step.value).dist.mean if step.value else 0.0
+            if not step.base:
+                revenue += value
+                continue
+            count = sum(counts[name] for name in step.base)
+            if step.rate:
+                count *= self.assumption(step.rate).dist.mean
+            counts[step.name] = count
+            revenue += count * value
+        return revenue
+
+
+# ============================================
+# Phase 정의 (Action Plan / Promising 페이지의 산출 근거와 같은 가정)
+# ============================================
+
+PHASES = (
+    Phase(
+        key="promising_high",
+        label="Phase 1-A: Promising High",
+        target="미활동 1,643명",
+        priority="🔴 P1",
+        populations=(("inactive", 1643),),
+        assumptions=(
+            Assumption("reactivation", "재활성화", Beta(0.25)),
+            Assumption("vip_conversion", "VIP 전환", Beta(0.18)),
+            Assumption("second_purchase", "2차 재구매", Beta(0.35)),
+            Assumption("order_value", "추가 구매 객단가", Gamma(120)),
+            Assumption("vip_value", "VIP 객단가", Gamma(250)),
+            Assumption("second_value", "2차 구매 객단가", Gamma(90)),
+            Assumption("ltv_lift", "LTV 상승 효과", Gamma(50_000, cv=0.3)),
+        ),
+        steps=(
+            Step("reactivated", "재활성화 인원", ("inactive",), "reactivation", "order_value"),
+            Step("vip", "VIP 전환 인원", ("reactivated",), "vip_conversion", "vip_value"),
+            Step("second", "2차 재구매 인원", ("reactivated",), "second_purchase", "second_value"),
+            Step("ltv_lift", "LTV 상승 효과", value="ltv_lift"),
+        ),
+    ),
+    Phase(
+        key="promising_low",
+        label="Phase 1-B: Promising Low",
+        target="미활동 4,275명",
+        priority="🔴 P1",
+        populations=(("inactive", 4275),),
+        assumptions=(
+            Assumption("reactivation", "재활성화", Beta(0.15)),
+            Assumption("vip_conversion", "VIP 전환", Beta(0.08)),
+            Assumption("second_purchase", "2차 재구매", Beta(0.25)),
+            Assumption("order_value", "추가 구매 객단가", Gamma(50)),
+            Assumption("vip_value", "VIP 객단가", Gamma(180)),
+            Assumption("second_value", "2차 구매 객단가", Gamma(40)),
+            Assumption("upsell", "업셀링 효과", Gamma(34_000, cv=0.3)),
+        ),
+        steps=(
+            Step("reactivated", "재활성화 인원", ("inactive",), "reactivation", "order_value"),
+            Step("vip", "VIP 전환 인원", ("reactivated",), "vip_conversion", "vip_value"),
+            Step("second", "2차 재구매 인원", ("reactivated",), "second_purchase", "second_value"),
+            Step("upsell", "업셀링 효과", value="upsell"),
+        ),
+    ),
+    Phase(
+        key="vip",
+        label="Phase 2: VIP 유지",
+        target="VIP 1,531명",
+        priority="🟡 P2",
+        populations=(("vip", 1531),),
+        assumptions=(
+            Assumption("fast_repurchase", "3개월 내 재구매 증가", Beta(0.214)),
+            Assumption("churn_prevented", "이탈 방지", Beta(0.10)),
+            Assumption("ltv_gain", "빠른 재구매 LTV 증가분", Gamma(28)),
+            Assumption("repurchase_value", "재구매 객단가", Gamma(140)),
+            Assumption("retained_value", "이탈 방지 잔존 가치", Gamma(160)),
+        ),
+        steps=(
+            Step("fast_repurchase", "빠른 재구매 추가 인원", ("vip",), "fast_repurchase", "ltv_gain"),
+            Step("repurchase", "추가 재구매 인원", ("fast_repurchase",), value="repurchase_value"),
+            Step("retained", "이탈 방지 인원", ("vip",), "churn_prevented", "retained_value"),
+        ),
+    ),
+    Phase(
+        key="winback",
+        label="Phase 3: Winback",
+        target="이탈위험 16,344명",
+        priority="🟠 P2",
+        populations=(("need_attention", 730), ("at_risk", 6637), ("hibernating", 9707)),
+        assumptions=(
+            Assumption("need_attention_return", "Need Attention 복귀", Beta(0.10)),
+            Assumption("at_risk_return", "At Risk 복귀", Beta(0.05)),
+            Assumption("hibernating_return", "Hibernating 복귀", Beta(0.02)),
+            Assumption("second_purchase", "복귀 후 2차 구매", Beta(0.20)),
+            Assumption("need_attention_value", "Need Attention 객단가", Gamma(180)),
+            Assumption("at_risk_value", "At Risk 객단가", Gamma(85)),
+            Assumption("hibernating_value", "Hibernating 객단가", Gamma(70)),
+            Assumption("second_value", "2차 구매 객단가", Gamma(65)),
+        ),
+        steps=(
+            Step("need_attention_returned", "Need Attention 복귀 인원", ("need_attention",),
+                 "need_attention_return", "need_attention_value"),
+            Step("at_risk_returned", "At Risk 복귀 인원", ("at_risk",), "at_risk_return", "at_risk_value"),
+            Step("hibernating_returned", "Hibernating 복귀 인원", ("hibernating",),
+                 "hibernating_return", "hibernating_value"),
+            Step("second", "2차 구매 인원",
+                 ("need_attention_returned", "at_risk_returned", "hibernating_returned"),
+                 "second_purchase", "second_value"),
+        ),
+    ),
+    Phase(
+        key="channel",
+        label="Phase 4: 채널 최적화",
+        target="전 채널",
+        priority="🟢 P3",
+        populations=(("annual_vip", 1560),),
+        assumptions=(
+            Assumption("efficiency", "채널 효율 개선", Beta(0.10)),
+            Assumption("vip_value", "VIP 객단가", Gamma(275)),
+            Assumption("cac_saving", "CAC 절감", Gamma(15_000, cv=0.2)),
+        ),
+        steps=(
+            Step("extra_vip", "연간 추가 VIP", ("annual_vip",), "efficiency", "vip_value"),
+            Step("cac_saving", "CAC 절감", value="cac_saving"),
+        ),
+    ),
+)
+
+# 캠페인 예산 비율 (판촉비 ~15% + 운영비 ~5%). 전 Phase 공통
+COST_RATIO = Assumption("cost_ratio", "캠페인 비용 비율", Beta(0.20, concentration=400.0))
+
+
+def phase(key):
+    for candidate in PHASES:
+        if candidate.key == key:
+            return candidate
+    raise KeyError(f"알 수 없는 Phase: {key} (가능: {', '.join(p.key for p in PHASES)})")
+
+
+# ============================================
+# 시뮬레이션
+# ============================================
+
+def _rng(seed, stream):
+    return np.random.default_rng(np.random.SeedSequence([seed, stream]))
+
+
+def _percentiles(values):
+    return np.percentile(values, PERCENTILES)
+
+
+def _binomial(rng, n, p):
+    """Binomial(n, p) 의 정규 근사 (n, p 는 시나리오별 배열 가능)"""
+    mean = n * p
+    count = rng.standard_normal(len(p), dtype=np.float32)
+    count *= np.sqrt(mean * (1 - p))
+    count += mean
+    return np.clip(np.rint(count, out=count), 0, n, out=count)
+
+
+@functools.lru_cache(maxsize=16)
+def _phase_scenarios(phase, scenarios, seed):
+    """
+    Phase 의 시나리오별 추가 매출(float32, 읽기 전용)과 단계별 인원 분위수.
+    난수 스트림은 Phase key 로 정해지므로 다른 Phase 의 가정이 바뀌어도 결과가 같음
+    """
+    rng = _rng(seed, zlib.crc32(phase.key.encode()))
+    draws = {}
+
+    def draw(name):
+        if name not in draws:
+            draws[name] = phase.assumption(name).dist.sample(rng, scenarios)
+        return draws[name]
+
+    counts = dict(phase.populations)
+    revenue = np.zeros(scenarios, dtype=np.float32)
+    rows = {}
+    for step in phase.steps:
+        if not step.base:
+            revenue += draw(step.value)
+            continue
+        count = sum(counts[name] for name in step.base)
+        if step.rate:
+            count = _binomial(rng, count, draw(step.rate))
+        counts[step.name] = count
+        if step.value:
+            revenue += count * draw(step.value)
+        rows[step.name] = _percentiles(count)
+
+    revenue.flags.writeable = False
+    columns = [f"p{p}" for p in PERCENTILES]
+    return revenue, pd.DataFrame.from_dict(rows, orient="index", columns=columns)
+
+
+@functools.lru_cache(maxsize=4)
+def _cost_ratios(cost_ratio, scenarios, seed):
+    ratios = cost_ratio.dist.sample(_rng(seed, 0), scenarios)
+    ratios.flags.writeable = False
+    return ratios, _percentiles(ratios)
+
+
+def _summary(revenue, budget, ratios, ratio_percentiles):
+    # 비용 = 예산 × 비용 비율 이므로 비용 분위수는 비용 비율 분위수에서 바로 구함
+    cost = ratios * np.float32(budget)
+    profit = revenue - cost
+    loss_probability = np.count_nonzero(profit < 0) / len(profit)
+    values = {
+        "revenue": _percentiles(revenue),
+        "cost": ratio_percentiles * budget,
+        "profit": _percentiles(profit),
+        "roi": _percentiles(np.divide(profit, cost, out=profit) * 100),
+    }
+    row = {f"{metric}_p{p}": value for metric in METRICS for p, value in zip(PERCENTILES, values[metric])}
+    row["planned_revenue"] = budget
+    row["loss_probability"] = loss_probability
+    return row
+
+
+@functools.lru_cache(maxsize=64)
+def _phase_summary(phase, cost_ratio, scenarios, seed):
+    revenue, counts = _phase_scenarios(phase, scenarios, seed)
+    ratios, ratio_percentiles = _cost_ratios(cost_ratio, scenarios, seed)
+    return _summary(revenue, phase.planned_revenue(), ratios, ratio_percentiles), counts
+
+
+@dataclass(frozen=True)
+class Simulation:
+    """
+    summary: index = Phase key + "total", 컬럼 = {revenue,cost,profit,roi}_p{10,50,90}, planned_revenue, loss_probability
+    counts: Phase key → 단계별 인원 분위수 (index = Step.name, 컬럼 = p10/p50/p90)
+    (메모이즈된 결과를 공유하므로 수정하지 말 것)
+    """
+
+    phases: tuple
+    summary: pd.DataFrame
+    counts: dict
+    scenarios: int
+
+
+@functools.lru_cache(maxsize=64)
+def simulate(phases=PHASES, cost_ratio=COST_RATIO, scenarios=DEFAULT_SCENARIOS, seed=0):
+    """Phase 별 / 전체 ROI 분위수. 인자 조합별로 메모이즈 (Phase 단위 시나리오 / 요약도 따로 캐시)"""
+    ratios, ratio_percentiles = _cost_ratios(cost_ratio, scenarios, seed)
+    rows, counts = {}, {}
+    total_revenue = np.zeros(scenarios, dtype=np.float32)
+    total_budget = 0.0
+    for item in phases:
+        rows[item.key], counts[item.key] = _phase_summary(item, cost_ratio, scenarios, seed)
+        total_revenue += _phase_scenarios(item, scenarios, seed)[0]
+        total_budget += rows[item.key]["planned_revenue"]
+    rows[TOTAL] = _summary(total_revenue, total_budget, ratios, ratio_percentiles)
+    return Simulation(tuple(phases), pd.DataFrame.from_dict(rows, orient="index"), counts, scenarios)
+
+
+def with_means(means, phases=PHASES):
+    """{Phase key: {가정 이름: 평균}} 을 적용한 Phase 튜플 (simulate 의 캐시 키로 그대로 사용)"""
+    unknown = set(means) - {item.key for item in phases}
+    if unknown:
+        raise KeyError(f"알 수 없는 Phase: {sorted(unknown)}")
+    return tuple(item.with_means(means[item.key]) if item.key in means else item for item in phases)
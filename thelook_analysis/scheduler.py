@@ -0,0 +1,303 @@
+"""
+변경 감지 갱신 스케줄러
+=====================
+매번 전체 모델을 다시 만드는 `dbt run` 대신, 소스 테이블 지문(fingerprint)을 주기적으로 비교해
+바뀐 소스의 downstream 모델만 로컬 DuckDB 로 다시 구체화하고, 끝나면 데이터 버전을 올려 대시보드 캐시를 무효화합니다.
+
+- 지문 = Parquet 파일 목록 (상대 경로, 크기, mtime) + 행 수 + MAX(created_at) (컬럼이 있는 소스만).
+  파일 목록이 그대로면 행 수 / 최댓값은 다시 계산하지 않음
+- 영향 모델 = 바뀐 소스를 source() 로 읽는 모델과 그 ref() downstream 전체
+- 실행: 영향 모델 중 의존 모델이 끝난 것부터 스레드 풀에 넣어 서로 독립인 가지를 동시에 구체화
+  (모델마다 LocalRunner.fork() 로 같은 데이터베이스의 새 연결 사용). 영향 밖 upstream 은 저장된 결과를 그대로 씀
+- 모두 성공하면 지문을 상태 파일에 저장하고 버전 파일에 새 버전을 씁니다.
+  대시보드는 THELOOK_DATA_VERSION_FILE 로 이 파일을 가리키면 다음 rerun 부터 새 버전 키로 캐시를 채움
+- --export-dir 가 있으면 버전을 올리기 전에 대시보드가 읽는 파일을 이 데이터베이스의 모델로 다시 씀
+  (영향을 받은 것만, 임시 파일 → rename). 대시보드가 원천 Parquet 에서 다시 계산하지 않도록
+  THELOOK_RFM_CUBE / THELOOK_COHORTS / THELOOK_REPURCHASE 로 이 파일들을 가리키면 됨
+    - mart_rfm_cube.parquet : mart_rfm_cube 가 다시 실행되었을 때
+    - cohort.npz            : users / order_items 가 바뀌었을 때 (stg_users / stg_order_items 로 생성)
+    - repurchase.npz        : orders / order_items / events 가 바뀌었을 때
+- 실패하면 상태 / 버전을 갱신하지 않으므로 다음 주기에 같은 변경을 다시 시도
+
+상태 파일이 없는 첫 실행은 모든 소스가 바뀐 것으로 보고 전체 모델을 실행합니다.
+실행 사이에 모델이 남아 있어야 하므로 --database 는 파일이어야 합니다. 대시보드(THELOOK_WAREHOUSE)는 쿼리마다
+읽기 전용 연결을 잠깐 열므로, 그 사이 파일 잠금이 겹치면 --lock-timeout 초까지 재시도합니다.
+
+사용 예:
+    python -m thelook_analysis.scheduler --data-dir data/thelook --database data/thelook.duckdb \\
+        --state-dir data/scheduler --export-dir data/marts --interval 300
+    THELOOK_DATA_VERSION_FILE=data/scheduler/data_version THELOOK_RFM_CUBE=data/marts/mart_rfm_cube.parquet \\
+        THELOOK_COHORTS=data/marts/cohort.npz THELOOK_REPURCHASE=data/marts/repurchase.npz \\
+        streamlit run streamlit_analysis.py
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+import duckdb
+
+from thelook_analysis.duckdb_backend import LocalRunner, Project
+
+STATE_FILE = "state.json"
+VERSION_FILE = "data_version"
+
+DEFAULT_INTERVAL = 300
+DEFAULT_WORKERS = 4
+DEFAULT_LOCK_TIMEOUT = 60.0
+
+# --export-dir 파일 이름
+CUBE_EXPORT = "mart_rfm_cube.parquet"
+COHORT_EXPORT = "cohort.npz"
+REPURCHASE_EXPORT = "repurchase.npz"
+
+# 최신 적재 시각 지문에 쓰는 컬럼 (없는 소스는 행 수 / 파일만)
+WATERMARK_COLUMN = "created_at"
+
+
+def source_files(data_dir, table):
+    """소스 테이블의 Parquet 파일 (`<table>/**/*.parquet` 또는 `<table>.parquet`)"""
+    directory = Path(data_dir) / table
+    if directory.is_dir():
+        return sorted(directory.glob("**/*.parquet"))
+    single = Path(data_dir) / f"{table}.parquet"
+    return [single] if single.exists() else []
+
+
+@dataclass
+class RefreshResult:
+    """갱신 한 번의 결과. 바뀐 소스가 없으면 models 가 비어 있고 version 은 None"""
+
+    changed: tuple
+    models: tuple = ()
+    results: list = field(default_factory=list)
+    version: str = None
+    seconds: float = 0.0
+    exported: tuple = ()
+
+
+class Scheduler:
+    """소스 지문 비교 → 영향 모델만 병렬 실행 → 데이터 버전 갱신"""
+
+    def __init__(self, data_dir, database, state_dir, project=None, storage_dir=None, workers=DEFAULT_WORKERS,
+                 version_file=None, export_dir=None, lock_timeout=DEFAULT_LOCK_TIMEOUT):
+        self.data_dir = Path(data_dir)
+        self.database = str(database)
+        self.state_dir = Path(state_dir)
+        self.project = project or Project()
+        self.storage_dir = storage_dir
+        self.workers = workers
+        self.version_file = Path(version_file) if version_file else self.state_dir / VERSION_FILE
+        self.export_dir = Path(export_dir) if export_dir else None
+        self.lock_timeout = lock_timeout
+
+    # ============================================
+    # 상태 / 버전 파일
+    # ============================================
+
+    def load_state(self):
+        try:
+            with open(self.state_dir / STATE_FILE, encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {"sources": {}, "version": None}
+
+    @staticmethod
+    def _write(path, text):
+        # 임시 파일에 쓴 뒤 rename 해서 읽는 쪽(대시보드)이 쓰다 만 내용을 보지 않도록 함
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+        tmp.write_text(text, encoding="utf-8")
+        tmp.replace(path)
+
+    def _save(self, fingerprints, version):
+        state = {"sources": fingerprints, "version": version, "updated_at": datetime.now(timezone.utc).isoformat()}
+        self._write(self.state_dir / STATE_FILE, json.dumps(state, ensure_ascii=False, indent=2, sort_keys=True))
+        self._write(self.version_file, version + "\n")
+
+    # ============================================
+    # 변경 감지
+    # ============================================
+
+    def fingerprint(self, runner, source_name, table, previous=None):
+        """소스 하나의 지문 (파일이 없으면 None). 파일 목록이 previous 와 같으면 previous 를 그대로 반환"""
+        files = [[path.relative_to(self.data_dir).as_posix(), path.stat().st_size, path.stat().st_mtime_ns]
+                 for path in source_files(self.data_dir, table)]
+        if not files:
+            return None
+        if previous is not None and previous.get("files") == files:
+            return previous
+        relation = f'"{source_name}"."{table}"'
+        columns = [column[0] for column in runner.con.execute(f"SELECT * FROM {relation} LIMIT 0").description]
+        watermark = f"MAX({WATERMARK_COLUMN})" if WATERMARK_COLUMN in columns else "NULL"
+        rows, latest = runner.con.execute(f"SELECT COUNT(*), {watermark} FROM {relation}").fetchone()
+        return {"files": files, "rows": rows, "max_created_at": None if latest is None else str(latest)}
+
+    def detect(self, runner, state=None):
+        """(바뀐 소스 테이블 이름 목록, 현재 지문 dict)"""
+        previous = (state or self.load_state())["sources"]
+        fingerprints, changed = {}, []
+        for source_name, table in sorted(self.project.sources):
+            current = self.fingerprint(runner, source_name, table, previous.get(table))
+            if current is None:
+                continue
+            fingerprints[table] = current
+            if current != previous.get(table):
+                changed.append(table)
+        return changed, fingerprints
+
+    def affected(self, tables):
+        """바뀐 소스 테이블 → 다시 실행할 모델 (의존성 순서)"""
+        models = self.project.downstream(self.project.source_consumers(tables))
+        return [name for name in self.project.topological_order() if name in models]
+
+    # ============================================
+    # 실행
+    # ============================================
+
+    @staticmethod
+    def _run_one(runner, name):
+        forked = runner.fork()
+        try:
+            return forked.run_model(name)
+        finally:
+            forked.close()
+
+    def run_models(self, runner, models):
+        """models 를 의존성이 허용하는 만큼 동시에 실행. RunResult 를 완료 순서로 반환"""
+        models = set(models)
+        waiting = {name: self.project.models[name].refs & models for name in models}
+        done, results, running = set(), [], {}
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="refresh") as pool:
+            while waiting or running:
+                for name in sorted(name for name, refs in waiting.items() if refs <= done):
+                    del waiting[name]
+                    running[pool.submit(self._run_one, runner, name)] = name
+                if not running:
+                    raise ValueError(f"ref() 순환 참조: {sorted(waiting)}")
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    results.append(future.result())
+                    done.add(name)
+        return results
+
+    def _open_runner(self):
+        """읽기-쓰기로 연결. 대시보드 쿼리가 읽기 전용 연결로 잠금을 잡고 있으면 lock_timeout 초까지 재시도"""
+        deadline = time.monotonic() + self.lock_timeout
+        delay = 0.05
+        while True:
+            try:
+                return LocalRunner(self.data_dir, database=self.database, project=self.project,
+                                   storage_dir=self.storage_dir)
+            except duckdb.IOException as exc:
+                if "lock" not in str(exc).lower() or time.monotonic() + delay > deadline:
+                    raise
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
+
+    def refresh(self):
+        """한 주기: 변경 감지 후 영향 모델 실행 / 대시보드 파일 내보내기, 성공 시 상태 / 버전 갱신"""
+        started = time.perf_counter()
+        state = self.load_state()
+        runner = self._open_runner()
+        try:
+            changed, fingerprints = self.detect(runner, state)
+            if not changed:
+                return RefreshResult(changed=(), seconds=time.perf_counter() - started)
+            models = self.affected(changed)
+            results = self.run_models(runner, models)
+            exported = self.export(runner, changed, models)
+        finally:
+            runner.close()
+
+        digest = hashlib.sha256(json.dumps(fingerprints, sort_keys=True).encode()).hexdigest()
+        version = f"local-{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}-{digest[:8]}"
+        self._save(fingerprints, version)
+        return RefreshResult(tuple(changed), tuple(result.model for result in results), results, version,
+                             time.perf_counter() - started, exported)
+
+    # ============================================
+    # 대시보드 파일 내보내기
+    # ============================================
+
+    @staticmethod
+    def _replace(path, write):
+        # 다 쓴 뒤 rename 해서 대시보드가 쓰다 만 파일을 읽지 않도록 함
+        tmp = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+        try:
+            write(tmp)
+            tmp.replace(path)
+        finally:
+            tmp.unlink(missing_ok=True)
+
+    def export(self, runner, changed, models):
+        """영향을 받은 (또는 아직 없는) 대시보드 파일을 runner 의 모델로 다시 씀. 쓴 파일 이름 튜플"""
+        if self.export_dir is None:
+            return ()
+        from thelook_analysis.cohort import cohorts_from_runner
+        from thelook_analysis.repurchase import histogram_from_runner
+
+        self.export_dir.mkdir(parents=True, exist_ok=True)
+        changed = set(changed)
+        exports = (
+            (CUBE_EXPORT, "mart_rfm_cube" in models,
+             lambda path: runner.con.execute(f"COPY (SELECT * FROM mart_rfm_cube) TO '{path}' (FORMAT PARQUET)")),
+            (COHORT_EXPORT, bool(changed & {"users", "order_items"}),
+             lambda path: cohorts_from_runner(runner).save(path)),
+            (REPURCHASE_EXPORT, bool(changed & {"orders", "order_items", "events"}),
+             lambda path: histogram_from_runner(runner).save(path)),
+        )
+        written = []
+        for name, affected, write in exports:
+            path = self.export_dir / name
+            if affected or not path.exists():
+                self._replace(path, write)
+                written.append(name)
+        return tuple(written)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="소스 변경 감지 → 영향 모델만 재실행 → 데이터 버전 갱신")
+    parser.add_argument("--data-dir", required=True, help="소스 Parquet 디렉터리")
+    parser.add_argument("--database", required=True, help="DuckDB 데이터베이스 파일 (실행 사이에 모델 보존)")
+    parser.add_argument("--state-dir", required=True, help="지문 상태 / 버전 파일 디렉터리")
+    parser.add_argument("--storage-dir", default=None, help="partition_by 모델을 hive 파티션 Parquet 로 저장할 디렉터리")
+    parser.add_argument("--version-file", default=None, help=f"기본값: <state-dir>/{VERSION_FILE}")
+    parser.add_argument("--export-dir", default=None, help="대시보드가 읽는 마트 파일(큐브 / 코호트 / 재구매)을 쓸 디렉터리")
+    parser.add_argument("--lock-timeout", type=float, default=DEFAULT_LOCK_TIMEOUT,
+                        help="데이터베이스 파일 잠금이 풀리기를 기다릴 최대 시간 (초)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="동시에 실행할 모델 수")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="확인 주기 (초)")
+    parser.add_argument("--once", action="store_true", help="한 번만 확인하고 종료")
+    args = parser.parse_args(argv)
+
+    scheduler = Scheduler(args.data_dir, args.database, args.state_dir, storage_dir=args.storage_dir,
+                          workers=args.workers, version_file=args.version_file, export_dir=args.export_dir,
+                          lock_timeout=args.lock_timeout)
+    while True:
+        result = scheduler.refresh()
+        stamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if result.version is None:
+            print(f"[{stamp}] no source changes ({result.seconds:.2f}s)")
+        else:
+            print(f"[{stamp}] changed: {', '.join(result.changed)} → {len(result.models)} models "
+                  f"({result.seconds:.2f}s), version {result.version}")
+            for run in result.results:
+                rows = "" if run.rows is None else f"{run.rows:,} rows"
+                print(f"    {run.model:<36} {run.materialized:<12} {run.seconds:8.3f}s  {rows}")
+            if result.exported:
+                print(f"    exported: {', '.join(result.exported)}")
+        if args.once:
+            break
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
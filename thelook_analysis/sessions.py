@@ -0,0 +1,336 @@
+"""
+구매 후 세션 집계 엔진
+=====================
+대시보드 `promising_activity` (활동 레벨별 유저 수 / avg_events / avg_monetary) 를 `stg_events` 에서
+직접 계산합니다. events 는 가장 큰 테이블이므로 구체화하지 않고 stg_events 의 SELECT 문(컬럼명 / 필터)을
+DuckDB 로 배치 스트리밍하며, 유저별 누적 배열(세션 수, 이벤트 수)만 유지합니다.
+
+- 대상 유저의 첫 구매일(first purchase date) 다음 날부터의 이벤트만 집계
+- 세션 경계는 정렬된 배열 연산으로 판정
+  - clustered=True (stg_events 기본): stg_events 를 (user_id, session_id 해시) 순으로 정렬해 스트리밍
+    (정렬은 DuckDB 가 하며 메모리를 넘으면 디스크로 내림). user 또는 세션 키가 바뀌는 지점이 새 세션이고
+    메모리는 대상 유저 수에만 비례. 원천 파일을 직접 읽을 때는 (user_id, 세션, sequence_number) 순으로
+    저장되어 있음이 보장될 때만 사용 (예: 합성 데이터) 하며 sequence_number 가 증가하지 않는 지점이 새 세션.
+    정렬되어 있지 않으면 ValueError
+  - clustered=False: 원천 순서 그대로. (user, session_id 해시) 키를 모아 주기적으로 정렬·중복 제거하므로
+    정렬 비용은 없지만 메모리는 구매 후 세션 수에 비례
+- activity_table(): 임의의 세션 수 구간(edges)으로 버킷팅
+
+사용 예:
+    python -m thelook_analysis.sessions --data-dir data/thelook --edges 0 1 2 4 6
+    python -m thelook_analysis.sessions --data-dir data/thelook --no-clustered
+"""
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from thelook_analysis.rfm import ANALYSIS_AS_OF, SEGMENTS, score_rfm
+
+# promising_activity 의 활동 레벨 구간: 0 / 1 / 2-3 / 4-5 / 6+
+DEFAULT_EDGES = (0, 1, 2, 4, 6)
+
+PROMISING_SEGMENTS = ("Promising High Value", "Promising Low Value")
+
+DEFAULT_BATCH_SIZE = 1 << 20
+
+# clustered=False 에서 마지막 정렬 이후 쌓인 키가 이 크기를 넘으면 정렬·중복 제거.
+# 중복 제거 후 남은 키 수의 2배로 늘려 정렬 횟수를 로그 수준으로 유지
+_COMPACT_THRESHOLD = 1 << 22
+
+# clustered 스트리밍에서 stg_events 의 세션 키와 정렬 순서
+_SESSION_KEY = "hash(session_id) AS session_key"
+_SESSION_ORDER = "user_id, session_key"
+
+
+def first_purchase_dates(user_id, order_date):
+    """행 단위 (user_id, order_date) → (유저 오름차순 user_id, 첫 구매일)"""
+    user_id = np.asarray(user_id)
+    order_date = np.asarray(order_date, dtype="datetime64[D]")
+    order = np.lexsort((order_date, user_id))
+    u = user_id[order]
+    starts = np.flatnonzero(np.r_[True, u[1:] != u[:-1]])
+    return u[starts], order_date[order][starts]
+
+
+class SessionCounter:
+    """대상 유저별 구매 후 세션 수 / 이벤트 수 스트리밍 집계"""
+
+    def __init__(self, user_id, first_purchase_date, clustered=False):
+        order = np.argsort(user_id, kind="stable")
+        self.user_id = np.asarray(user_id)[order]
+        self.first_day = np.asarray(first_purchase_date, dtype="datetime64[D]")[order].view(np.int64)
+        self.clustered = clustered
+        n = len(self.user_id)
+        self.sessions = np.zeros(n, dtype=np.int64)
+        self.events = np.zeros(n, dtype=np.int64)
+        # clustered 상태 (배치 경계를 넘는 세션 처리)
+        self._last_user = None
+        self._last_mark = None
+        self._ordinal = 0
+        self._last_counted = -1
+        # unclustered 상태
+        self._keys = []
+        self._buffered = 0
+        self._threshold = _COMPACT_THRESHOLD
+
+    def _post_purchase(self, user_id, event_at):
+        """(대상 유저 인덱스, 구매 후 이벤트 여부)"""
+        idx = np.searchsorted(self.user_id, user_id)
+        idx_clipped = np.minimum(idx, len(self.user_id) - 1)
+        tracked = (idx < len(self.user_id)) & (self.user_id[idx_clipped] == user_id)
+        event_day = np.asarray(event_at).astype("datetime64[D]").view(np.int64)
+        return idx_clipped, tracked & (event_day > self.first_day[idx_clipped])
+
+    def update(self, user_id, event_at, sequence_number=None, session_id=None, session_key=None):
+        """
+        이벤트 배치 하나 반영. clustered 면 session_key (세션별 정수 키) 또는 sequence_number,
+        아니면 session_id 필요
+        """
+        user_id = np.asarray(user_id)
+        if len(user_id) == 0 or len(self.user_id) == 0:
+            return self
+        idx, keep = self._post_purchase(user_id, event_at)
+        if self.clustered:
+            if session_key is not None:
+                self._update_clustered(user_id, np.asarray(session_key), True, idx, keep)
+            else:
+                self._update_clustered(user_id, np.asarray(sequence_number), False, idx, keep)
+        else:
+            self._update_keyed(session_id, idx, keep)
+        self.events += np.bincount(idx[keep], minlength=len(self.user_id))
+        return self
+
+    def _update_clustered(self, user_id, mark, by_key, idx, keep):
+        """mark: by_key 면 세션 키 (바뀌면 새 세션), 아니면 sequence_number (증가하지 않으면 새 세션)"""
+        if np.any(user_id[1:] < user_id[:-1]) or (self._last_user is not None and user_id[0] < self._last_user):
+            raise ValueError("events 가 user_id 순으로 정렬되어 있지 않습니다 (clustered=False 사용)")
+        new_session = np.empty(len(user_id), dtype=bool)
+        if by_key:
+            new_session[0] = mark[0] != self._last_mark
+            new_session[1:] = mark[1:] != mark[:-1]
+        else:
+            new_session[0] = self._last_mark is None or mark[0] <= self._last_mark
+            new_session[1:] = mark[1:] <= mark[:-1]
+        new_session[0] |= self._last_user is None or user_id[0] != self._last_user
+        new_session[1:] |= user_id[1:] != user_id[:-1]
+        ordinal = self._ordinal + np.cumsum(new_session)
+        self._last_user, self._last_mark, self._ordinal = user_id[-1], mark[-1], int(ordinal[-1])
+
+        kept = ordinal[keep]
+        if len(kept) == 0:
+            return
+        # 구매 후 이벤트 중 각 세션의 첫 이벤트에서만 세션 수 증가
+        first = np.empty(len(kept), dtype=bool)
+        first[0] = kept[0] != self._last_counted
+        first[1:] = kept[1:] != kept[:-1]
+        self.sessions += np.bincount(idx[keep][first], minlength=len(self.user_id))
+        self._last_counted = int(kept[-1])
+
+    def _update_keyed(self, session_id, idx, keep):
+        if session_id is None:
+            raise ValueError("clustered=False 에는 session_id 가 필요합니다")
+        session_hash = pd.util.hash_array(np.asarray(session_id, dtype=object)[keep])
+        self._keys.append((idx[keep].astype(np.int64), session_hash))
+        self._buffered += int(keep.sum())
+        if self._buffered > self._threshold:
+            self._keys = [self._distinct_keys()]
+            self._buffered = 0
+            self._threshold = max(self._threshold, 2 * len(self._keys[0][0]))
+
+    def _distinct_keys(self):
+        users = np.concatenate([u for u, _ in self._keys])
+        hashes = np.concatenate([h for _, h in self._keys])
+        order = np.lexsort((hashes, users))
+        users, hashes = users[order], hashes[order]
+        distinct = np.r_[True, (users[1:] != users[:-1]) | (hashes[1:] != hashes[:-1])]
+        return users[distinct], hashes[distinct]
+
+    def result(self):
+        """(user_id, sessions, events) — user_id 오름차순"""
+        if not self.clustered and self._keys:
+            users, _ = self._distinct_keys()
+            self.sessions = np.bincount(users, minlength=len(self.user_id))
+        return self.user_id, self.sessions, self.events
+
+
+def _event_files(path):
+    path = Path(path)
+    return sorted(path.glob("**/*.parquet")) if path.is_dir() else [path]
+
+
+def iter_event_batches(path, columns, batch_size=DEFAULT_BATCH_SIZE):
+    """events Parquet (파일 또는 디렉터리) 를 파일명 순, row group 단위로 스트리밍"""
+    for file in _event_files(path):
+        parquet = pq.ParquetFile(file)
+        for batch in parquet.iter_batches(batch_size=batch_size, columns=columns):
+            yield batch
+
+
+def stg_events_relation(runner):
+    """FROM 절에 쓸 stg_events: 구체화되어 있으면 그 테이블, 아니면 모델 SELECT 문 (events 를 구체화하지 않음)"""
+    if runner.relation_exists("stg_events"):
+        return '"stg_events"'
+    return f"({runner.render(runner.project.models['stg_events'])})"
+
+
+def iter_stg_events(runner, columns, batch_size=DEFAULT_BATCH_SIZE, order_by=None):
+    """
+    stg_events 를 배치로 스트리밍 (columns 는 SQL 식). 러너에 구체화되어 있지 않으면 모델 SELECT 문을
+    그대로 실행하므로 events 전체를 메모리에 올리지 않습니다. order_by 가 없으면 저장 순서 그대로,
+    있으면 DuckDB 가 정렬 (메모리를 넘으면 디스크로 내림)
+    """
+    sql = f"SELECT {', '.join(columns)} FROM {stg_events_relation(runner)}"
+    if order_by:
+        sql += f" ORDER BY {order_by}"
+    reader = runner.con.execute(sql).to_arrow_reader(batch_size)
+    yield from reader
+
+
+def count_sessions(batches, user_id, first_purchase_date, clustered=False, time_column="event_at"):
+    """
+    이벤트 배치 iterable (user_id, time_column, clustered 면 session_key 또는 sequence_number /
+    아니면 session_id 컬럼) → 대상 유저별 (user_id, 구매 후 세션 수, 구매 후 이벤트 수)
+    """
+    counter = SessionCounter(user_id, first_purchase_date, clustered=clustered)
+    for batch in batches:
+        users = batch.column("user_id").to_numpy()
+        event_at = batch.column(time_column).to_numpy()
+        if clustered and "session_key" in batch.schema.names:
+            counter.update(users, event_at, session_key=batch.column("session_key").to_numpy())
+        elif clustered:
+            counter.update(users, event_at, sequence_number=batch.column("sequence_number").to_numpy())
+        else:
+            counter.update(users, event_at, session_id=batch.column("session_id").to_numpy(zero_copy_only=False))
+    return counter.result()
+
+
+def _event_columns(time_column, clustered):
+    return ["user_id", time_column, "sequence_number" if clustered else "session_id"]
+
+
+def count_stg_event_sessions(runner, user_id, first_purchase_date, clustered=True, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    runner 의 stg_events 를 스트리밍하며 대상 유저별 구매 후 세션 / 이벤트 수 계산.
+    clustered 면 (user_id, 세션 키) 순으로 정렬해 읽음 (메모리는 대상 유저 수에 비례)
+    """
+    if clustered:
+        batches = iter_stg_events(runner, ["user_id", "event_at", _SESSION_KEY], batch_size, order_by=_SESSION_ORDER)
+    else:
+        batches = iter_stg_events(runner, _event_columns("event_at", clustered), batch_size)
+    return count_sessions(batches, user_id, first_purchase_date, clustered=clustered)
+
+
+def count_post_purchase_sessions(events_path, user_id, first_purchase_date, clustered=False,
+                                 batch_size=DEFAULT_BATCH_SIZE, time_column="created_at"):
+    """
+    events 원천 Parquet 를 직접 스트리밍하며 대상 유저별 구매 후 세션 / 이벤트 수를 계산합니다.
+    time_column 은 원천 기준 (stg_events 의 event_at = events.created_at).
+    """
+    batches = iter_event_batches(events_path, _event_columns(time_column, clustered), batch_size)
+    return count_sessions(batches, user_id, first_purchase_date, clustered=clustered, time_column=time_column)
+
+
+def activity_labels(edges=DEFAULT_EDGES):
+    """edges → 활동 레벨 이름 ('0. 미활동', '1. 1 Session', '2. 2-3 Sessions', ..., 'k. n+ Sessions')"""
+    labels = []
+    for i, low in enumerate(edges):
+        high = edges[i + 1] - 1 if i + 1 < len(edges) else None
+        if low == 0 and high == 0:
+            name = "미활동"
+        elif high is None:
+            name = f"{low}+ Sessions"
+        elif low == high:
+            name = f"{low} Session" if low == 1 else f"{low} Sessions"
+        else:
+            name = f"{low}-{high} Sessions"
+        labels.append(f"{i}. {name}")
+    return labels
+
+
+def activity_table(segment, monetary, sessions, events, edges=DEFAULT_EDGES):
+    """
+    유저 단위 배열 → promising_activity 형태의 DataFrame
+    (segment, activity_level, user_count, pct, avg_events, avg_monetary). 빈 버킷은 생략
+    """
+    edges = np.asarray(edges)
+    if edges[0] != 0 or np.any(np.diff(edges) <= 0):
+        raise ValueError("edges 는 0 으로 시작하는 증가 수열이어야 합니다")
+    labels = activity_labels(tuple(edges))
+    segment = np.asarray(segment)
+    bucket = np.searchsorted(edges, sessions, side="right") - 1
+    segment_names, segment_idx = np.unique(segment, return_inverse=True)
+    key = segment_idx * len(edges) + bucket
+    size = len(segment_names) * len(edges)
+    count = np.bincount(key, minlength=size)
+    event_sum = np.bincount(key, weights=events, minlength=size)
+    monetary_sum = np.bincount(key, weights=monetary, minlength=size)
+    segment_total = np.bincount(segment_idx, minlength=len(segment_names))
+
+    rows = []
+    for k in np.flatnonzero(count):
+        s, b = divmod(int(k), len(edges))
+        rows.append({
+            "segment": segment_names[s],
+            "activity_level": labels[b],
+            "user_count": int(count[k]),
+            "pct": round(100.0 * count[k] / segment_total[s], 2),
+            "avg_events": round(event_sum[k] / count[k], 1),
+            "avg_monetary": round(monetary_sum[k] / count[k], 2),
+        })
+    return pd.DataFrame(rows, columns=["segment", "activity_level", "user_count", "pct", "avg_events", "avg_monetary"])
+
+
+def promising_activity(data_dir, edges=DEFAULT_EDGES, segments=PROMISING_SEGMENTS, as_of=ANALYSIS_AS_OF,
+                       clustered=True, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    로컬 Parquet 원천(`duckdb_backend` 와 같은 배치)에서 promising_activity 를 계산합니다.
+    주문 행과 이벤트 모두 staging 모델(stg_orders / stg_order_items / stg_events) 정의를 그대로 쓰며,
+    이벤트는 스트리밍합니다 (clustered 는 count_stg_event_sessions 참고)
+    """
+    from thelook_analysis.duckdb_backend import LocalRunner
+
+    runner = LocalRunner(data_dir)
+    try:
+        runner.run(["stg_orders", "stg_order_items"])
+        rows = runner.query("""
+            SELECT o.user_id, o.order_id, o.order_date, oi.sale_price, oi.created_at
+            FROM stg_orders o
+            JOIN stg_order_items oi ON o.order_id = oi.order_id
+        """)
+        rfm = score_rfm(rows["user_id"].to_numpy(), rows["order_id"].to_numpy(),
+                        rows["order_date"].to_numpy(), rows["sale_price"].to_numpy(), as_of=as_of)
+        codes = [SEGMENTS.index(name) for name in segments]
+        target = np.isin(rfm.segment, codes)
+        first_users, first_dates = first_purchase_dates(rows["user_id"].to_numpy(), rows["created_at"].to_numpy())
+        # rfm.user_id 와 first_users 는 같은 유저 집합(오름차순)
+        users, sessions, events = count_stg_event_sessions(
+            runner, first_users[target], first_dates[target], clustered=clustered, batch_size=batch_size,
+        )
+    finally:
+        runner.close()
+    return activity_table(rfm.customer_segment[target], rfm.monetary[target], sessions, events, edges)
+
+
+def events_path(data_dir):
+    directory = Path(data_dir) / "events"
+    return directory if directory.is_dir() else Path(data_dir) / "events.parquet"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Promising 구매 후 활동 레벨 집계 (events 스트리밍)")
+    parser.add_argument("--data-dir", required=True, help="원천 Parquet 디렉터리")
+    parser.add_argument("--edges", nargs="*", type=int, default=list(DEFAULT_EDGES), help="세션 수 구간 하한")
+    parser.add_argument("--clustered", action=argparse.BooleanOptionalAction, default=True,
+                        help="(user_id, 세션) 순으로 정렬해 스트리밍 (--no-clustered: 원천 순서 + 세션 키 중복 제거)")
+    args = parser.parse_args(argv)
+
+    table = promising_activity(args.data_dir, edges=tuple(args.edges), clustered=args.clustered)
+    print(table.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
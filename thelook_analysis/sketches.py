@@ -0,0 +1,220 @@
+"""
+스트리밍 분포 스케치
+====================
+`rfm_distribution` (p10/p25/p50/p75/p90/p95/avg/std) 을 한 번의 스트리밍 패스와
+고정 메모리로 계산하기 위한 병합 가능한(mergeable) 스케치 모음.
+
+- KLLSketch: 분위수 스케치. 저장 항목 수는 k 에 비례하고 rank 오차는 대략 O(1/k)
+- Moments: Welford/Chan 방식의 count/mean/M2 상태 (평균, 표준편차)
+- RFMDistribution: recency/frequency/monetary 각각의 (KLL, Moments) 묶음
+
+파티션(또는 프로세스)별로 스케치를 만든 뒤 merge() 로 합치면 전체 분포와 같은 결과를 얻습니다.
+유저 단위 지표이므로 order 데이터는 user_id 기준으로 파티셔닝되어 있어야 합니다
+(한 유저의 주문이 여러 파티션에 나뉘면 RFM 값 자체가 달라짐).
+"""
+
+import math
+
+import numpy as np
+
+from thelook_analysis.rfm import score_rfm
+
+# rfm_distribution 에서 사용하는 분위수
+DEFAULT_PERCENTILES = (10, 25, 50, 75, 90, 95)
+
+
+class Moments:
+    """병합 가능한 1·2차 모멘트 (count, mean, M2)"""
+
+    def __init__(self, count=0, mean=0.0, m2=0.0):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
+    def update(self, values):
+        """배치 단위 갱신: 배치 통계를 구한 뒤 Chan 의 병렬 공식으로 합침"""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if len(values) == 0:
+            return self
+        batch_mean = float(values.mean())
+        batch_m2 = float(((values - batch_mean) ** 2).sum())
+        return self._combine(len(values), batch_mean, batch_m2)
+
+    def merge(self, other):
+        return self._combine(other.count, other.mean, other.m2)
+
+    def _combine(self, count, mean, m2):
+        if count == 0:
+            return self
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        return self
+
+    def variance(self, ddof=1):
+        if self.count - ddof <= 0:
+            return float("nan")
+        return self.m2 / (self.count - ddof)
+
+    def std(self, ddof=1):
+        """표준편차 (기본값은 BigQuery STDDEV 와 같은 표본 표준편차)"""
+        return math.sqrt(self.variance(ddof))
+
+
+class KLLSketch:
+    """
+    KLL 분위수 스케치.
+
+    레벨 h 의 항목은 가중치 2**h 를 가지며, 레벨 용량을 넘으면 정렬 후 짝/홀 위치 중 하나를
+    무작위로 골라 절반만 위 레벨로 올립니다(compaction). 배치 입력은 NumPy 로 한 번에 처리합니다.
+    """
+
+    _DECAY = 2.0 / 3.0
+
+    def __init__(self, k=200, seed=None):
+        if k < 8:
+            raise ValueError("k 는 8 이상이어야 합니다")
+        self.k = k
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self.levels = [np.empty(0, dtype=np.float64)]
+        self._rng = np.random.default_rng(seed)
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def size(self):
+        """현재 저장 중인 항목 수 (메모리 사용량 지표)"""
+        return sum(len(level) for level in self.levels)
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(2, int(math.ceil(self.k * self._DECAY ** depth)))
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        self.count += len(values)
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """다른 스케치를 병합 (other 는 변경하지 않음)"""
+        if other.count == 0:
+            return self
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0, dtype=np.float64))
+        for h, level in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], level])
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+
+    def _compress(self):
+        while True:
+            compacted = False
+            for h in range(len(self.levels)):
+                level = self.levels[h]
+                if len(level) <= self._capacity(h):
+                    continue
+                level = np.sort(level)
+                # 홀수 개면 하나는 현재 레벨에 남김
+                keep = level[:1] if len(level) % 2 else level[:0]
+                pairs = level[len(keep):]
+                promoted = pairs[int(self._rng.integers(2))::2]
+                self.levels[h] = keep
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0, dtype=np.float64))
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1], promoted])
+                compacted = True
+            if not compacted:
+                return
+
+    def _weighted_items(self):
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([
+            np.full(len(level), 2 ** h, dtype=np.int64) for h, level in enumerate(self.levels)
+        ])
+        order = np.argsort(items, kind="stable")
+        return items[order], np.cumsum(weights[order])
+
+    def quantiles(self, qs):
+        """분위수(0~1) 목록에 대한 근사값 (누적 가중치가 q·N 이상이 되는 가장 작은 값)"""
+        qs = np.asarray(qs, dtype=np.float64)
+        if self.count == 0:
+            return np.full(qs.shape, np.nan)
+        items, cumulative = self._weighted_items()
+        targets = qs * cumulative[-1]
+        idx = np.searchsorted(cumulative, targets, side="left")
+        result = items[np.clip(idx, 0, len(items) - 1)]
+        # 양 끝은 정확한 최솟값/최댓값
+        result = np.where(qs <= 0, self.min, result)
+        return np.where(qs >= 1, self.max, result)
+
+    def quantile(self, q):
+        return float(self.quantiles([q])[0])
+
+    def rank(self, value):
+        """value 이하 항목 비율의 근사값"""
+        if self.count == 0:
+            return float("nan")
+        items, cumulative = self._weighted_items()
+        idx = np.searchsorted(items, value, side="right")
+        return 0.0 if idx == 0 else float(cumulative[idx - 1] / cumulative[-1])
+
+
+class RFMDistribution:
+    """recency / frequency / monetary 분포 스케치 묶음"""
+
+    METRICS = ("recency", "frequency", "monetary")
+
+    def __init__(self, k=200, seed=None):
+        self.quantile_sketches = {m: KLLSketch(k=k, seed=seed) for m in self.METRICS}
+        self.moments = {m: Moments() for m in self.METRICS}
+
+    def update(self, recency_days, frequency, monetary):
+        """유저 단위 배열로 갱신"""
+        for metric, values in zip(self.METRICS, (recency_days, frequency, monetary)):
+            self.quantile_sketches[metric].update(values)
+            self.moments[metric].update(values)
+        return self
+
+    def update_rfm(self, result):
+        """RFMResult 로 갱신"""
+        return self.update(result.recency_days, result.frequency, result.monetary)
+
+    def update_orders(self, user_id, order_id, order_date, sale_price, **kwargs):
+        """user_id 기준 파티션 하나의 행 단위 주문 배열로 갱신"""
+        return self.update_rfm(score_rfm(user_id, order_id, order_date, sale_price, **kwargs))
+
+    def merge(self, other):
+        for metric in self.METRICS:
+            self.quantile_sketches[metric].merge(other.quantile_sketches[metric])
+            self.moments[metric].merge(other.moments[metric])
+        return self
+
+    @property
+    def count(self):
+        return self.moments["recency"].count
+
+    def to_dict(self, percentiles=DEFAULT_PERCENTILES, decimals=2):
+        """`rfm_distribution` 과 같은 형태의 dict"""
+        result = {}
+        for metric in self.METRICS:
+            values = self.quantile_sketches[metric].quantiles(np.asarray(percentiles) / 100.0)
+            stats = {f"p{p}": round(float(v), decimals) for p, v in zip(percentiles, values)}
+            stats["avg"] = round(self.moments[metric].mean, decimals)
+            stats["std"] = round(self.moments[metric].std(), decimals)
+            result[metric] = stats
+        return result
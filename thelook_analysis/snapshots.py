@@ -0,0 +1,355 @@
+"""
+일별 세그먼트 스냅샷 (변경분만 저장)
+==================================
+유저별 세그먼트 / RFM 점수를 매일 남기되, 전날과 세그먼트가 달라진 유저의 행만 기록합니다.
+첫 스냅샷은 전체 유저, 이후 스냅샷은 변경분이므로 저장 크기는 (유저 수 + 누적 변경 수) 에 비례하고
+유저 테이블을 날짜 수만큼 복사하지 않습니다.
+
+- 레이아웃: `<root>/snapshot_date=YYYY-MM-DD/segments.parquet` (hive 파티션, user_id 정렬, zstd)
+  컬럼 = user_id int32 | segment uint8 | r_score / f_score / m_score uint8
+- 세그먼트 코드는 rfm.SEGMENTS 와 같고, REMOVED(255)는 이전 스냅샷에 있던 유저가 빠졌다는 표시
+- 점수는 세그먼트가 바뀐 시점의 값입니다 (세그먼트가 같으면 점수가 바뀌어도 행을 쓰지 않음)
+- D 시점 세그먼트 = D 이하 파티션을 날짜 순으로 이어 붙인 뒤 유저별 마지막 행 (stable 정렬 한 번)
+- 두 날짜 사이 이동 행렬 = 시작일 상태의 대각선 + (시작일, 종료일] 변경분만 재배치
+
+스냅샷 D 는 D 까지의 주문으로 계산한 RFM (as_of = D + 1일) 입니다. 분석 기준일 2025-01-01 의 세그먼트가
+2024-12-31 스냅샷과 같습니다. dbt 로는 `thelook_dbt/snapshots/snap_user_segment.sql` 이 같은 기준의
+check 스냅샷(SCD2)을 만듭니다.
+
+사용 예:
+    python -m thelook_analysis.snapshots backfill --data-dir data/thelook --root data/snapshots \\
+        --start 2023-01-01 --end 2024-12-31
+    python -m thelook_analysis.snapshots take --data-dir data/thelook --root data/snapshots --date 2025-01-01
+    python -m thelook_analysis.snapshots transitions --root data/snapshots --start 2024-06-30 --end 2024-12-31
+"""
+
+import argparse
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from thelook_analysis.rfm import SEGMENTS, score_rfm
+
+PARTITION = "snapshot_date"
+FILE_NAME = "segments.parquet"
+
+# 이전 스냅샷에 있던 유저가 빠졌음을 나타내는 세그먼트 코드
+REMOVED = 255
+
+# 이동 행렬에서 스냅샷에 없는 유저 (신규 / 이탈)
+NONE_LABEL = "(없음)"
+
+SNAPSHOT_SCHEMA = pa.schema([
+    ("user_id", pa.int32()),
+    ("segment", pa.uint8()),
+    ("r_score", pa.uint8()),
+    ("f_score", pa.uint8()),
+    ("m_score", pa.uint8()),
+])
+
+SCORE_COLUMNS = ("r_score", "f_score", "m_score")
+
+# user_id 범위가 누적 행 수의 이 배수 이하이면 history 에서 정렬 대신 id → 위치 직접 조회
+_DENSE_SPAN_FACTOR = 4
+
+
+def _day(value):
+    return np.datetime64(value, "D")
+
+
+@dataclass
+class Segmentation:
+    """한 시점의 유저별 세그먼트 / 점수 (user_id 오름차순)"""
+
+    as_of: np.datetime64
+    user_id: np.ndarray
+    segment: np.ndarray
+    r_score: np.ndarray
+    f_score: np.ndarray
+    m_score: np.ndarray
+
+    def __len__(self):
+        return len(self.user_id)
+
+    def counts(self):
+        """세그먼트별 유저 수 (SEGMENTS 순서)"""
+        return pd.Series(np.bincount(self.segment, minlength=len(SEGMENTS))[:len(SEGMENTS)],
+                         index=pd.Index(SEGMENTS, name="segment"), name="user_count")
+
+    def to_frame(self):
+        return pd.DataFrame({
+            "user_id": self.user_id,
+            "customer_segment": pd.Categorical.from_codes(self.segment.astype(np.int8), categories=list(SEGMENTS)),
+            "r_score": self.r_score,
+            "f_score": self.f_score,
+            "m_score": self.m_score,
+        })
+
+
+def _last_rows(user_id):
+    """날짜 순으로 이어 붙인 행 중 유저별 마지막 행의 위치 (user_id 오름차순)"""
+    order = np.argsort(user_id, kind="stable")
+    u = user_id[order]
+    last = np.empty(len(u), dtype=bool)
+    if len(u):
+        np.not_equal(u[1:], u[:-1], out=last[:-1])
+        last[-1] = True
+    return order[last]
+
+
+def _match(sorted_ids, values):
+    """(values 중 sorted_ids 에 있는 것의 mask, 그 위치). sorted_ids 가 비어 있어도 동작"""
+    found = np.searchsorted(sorted_ids, values)
+    known = found < len(sorted_ids)
+    known[known] = sorted_ids[found[known]] == values[known]
+    return known, found
+
+
+class SnapshotStore:
+    """`<root>/snapshot_date=*/segments.parquet` 변경분 스냅샷 디렉터리"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self._latest = None
+        self._lock = threading.Lock()
+
+    def _path(self, date):
+        return self.root / f"{PARTITION}={_day(date)}" / FILE_NAME
+
+    def dates(self):
+        """기록된 스냅샷 날짜 (오름차순)"""
+        if not self.root.is_dir():
+            return []
+        prefix = f"{PARTITION}="
+        return sorted(_day(path.parent.name[len(prefix):])
+                      for path in self.root.glob(f"{prefix}*/{FILE_NAME}"))
+
+    def _rows(self, after=None, until=None):
+        """(after, until] 파티션 행을 날짜 순으로 이어 붙인 컬럼 dict"""
+        # ParquetFile.read 는 파일 하나를 바로 읽으므로 작은 파티션이 많을 때 read_table (dataset 경로) 보다 빠름
+        tables = [pq.ParquetFile(self._path(date)).read() for date in self.dates()
+                  if (after is None or date > _day(after)) and (until is None or date <= _day(until))]
+        table = pa.concat_tables(tables) if tables else SNAPSHOT_SCHEMA.empty_table()
+        return {name: table.column(name).to_numpy() for name in SNAPSHOT_SCHEMA.names}
+
+    def segmentation(self, as_of=None):
+        """as_of(기본: 마지막 스냅샷) 시점의 전체 세그먼트 재구성"""
+        dates = self.dates()
+        if not dates:
+            raise ValueError(f"스냅샷이 없습니다: {self.root}")
+        as_of = dates[-1] if as_of is None else _day(as_of)
+        if as_of < dates[0]:
+            raise ValueError(f"첫 스냅샷({dates[0]}) 이전 시점입니다: {as_of}")
+        rows = self._rows(until=as_of)
+        last = _last_rows(rows["user_id"])
+        last = last[rows["segment"][last] != REMOVED]
+        return Segmentation(as_of, *(rows[name][last] for name in SNAPSHOT_SCHEMA.names))
+
+    def _previous(self, dates):
+        # 연속 append 시 디렉터리를 다시 읽지 않도록 마지막 상태를 보관
+        if not dates:
+            return None
+        if self._latest is None or self._latest.as_of != dates[-1]:
+            self._latest = self.segmentation(dates[-1])
+        return self._latest
+
+    def append(self, date, user_id, segment, r_score, f_score, m_score):
+        """
+        date 시점의 전체 세그먼트를 받아 직전 스냅샷과 달라진 유저만 기록. 기록한 행 수 반환.
+        date 는 마지막 스냅샷보다 뒤여야 합니다
+        """
+        date = _day(date)
+        with self._lock:
+            dates = self.dates()
+            if dates and date <= dates[-1]:
+                raise ValueError(f"이미 지난 날짜입니다: {date} (마지막 스냅샷 {dates[-1]})")
+            order = np.argsort(user_id, kind="stable")
+            current = Segmentation(date, *(np.asarray(values)[order]
+                                           for values in (user_id, segment, r_score, f_score, m_score)))
+            if np.any(current.user_id[1:] == current.user_id[:-1]):
+                raise ValueError("user_id 가 중복되었습니다")
+
+            previous = self._previous(dates)
+            if previous is None:
+                changed = np.ones(len(current), dtype=bool)
+                removed = np.array([], dtype=np.int64)
+            else:
+                known, rows = _match(previous.user_id, current.user_id)
+                changed = ~known
+                changed[known] = previous.segment[rows[known]] != current.segment[known]
+                still = np.zeros(len(previous), dtype=bool)
+                still[rows[known]] = True
+                removed = previous.user_id[~still]
+
+            delta = {
+                "user_id": np.r_[current.user_id[changed], removed],
+                "segment": np.r_[current.segment[changed], np.full(len(removed), REMOVED)],
+                **{name: np.r_[getattr(current, name)[changed], np.zeros(len(removed), dtype=np.uint8)]
+                   for name in SCORE_COLUMNS},
+            }
+            order = np.argsort(delta["user_id"], kind="stable")
+            table = pa.Table.from_arrays(
+                [pa.array(delta[field.name][order], field.type) for field in SNAPSHOT_SCHEMA], schema=SNAPSHOT_SCHEMA,
+            )
+            self._write(date, table)
+            self._latest = current
+            return table.num_rows
+
+    def _write(self, date, table):
+        # 임시 파일에 쓴 뒤 rename 해서 읽는 쪽이 쓰다 만 파티션을 보지 않도록 함
+        path = self._path(date)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        pq.write_table(table, tmp, compression="zstd")
+        tmp.replace(path)
+
+    def transitions(self, start, end):
+        """
+        start → end 세그먼트 이동 행렬 (행 = start 세그먼트, 열 = end 세그먼트, 값 = 유저 수).
+        스냅샷에 없던 / 빠진 유저는 NONE_LABEL 행 / 열
+        """
+        start, end = _day(start), _day(end)
+        if end < start:
+            raise ValueError(f"종료일({end})이 시작일({start})보다 앞섭니다")
+        size = len(SEGMENTS) + 1
+        none = len(SEGMENTS)
+        before = self.segmentation(start)
+        matrix = np.diag(np.r_[np.bincount(before.segment, minlength=len(SEGMENTS))[:len(SEGMENTS)], 0])
+
+        rows = self._rows(after=start, until=end)
+        last = _last_rows(rows["user_id"])
+        users, after = rows["user_id"][last], rows["segment"][last].astype(np.int64)
+        after[after == REMOVED] = none
+        known, found = _match(before.user_id, users)
+        origin = np.full(len(users), none, dtype=np.int64)
+        origin[known] = before.segment[found[known]]
+
+        # 변경된 유저는 대각선에서 빼고 (시작, 끝) 칸으로 옮김
+        matrix -= np.diag(np.bincount(origin[known], minlength=size))
+        matrix += np.bincount(origin * size + after, minlength=size * size).reshape(size, size)
+        labels = SEGMENTS + (NONE_LABEL,)
+        return pd.DataFrame(matrix, index=pd.Index(labels, name="from"), columns=pd.Index(labels, name="to"))
+
+    def history(self):
+        """스냅샷 날짜 × 세그먼트 유저 수. 파티션을 한 번 훑으며 변경분만 반영"""
+        dates = self.dates()
+        tables = [pq.ParquetFile(self._path(date)).read(columns=["user_id", "segment"]) for date in dates]
+        users = [table.column("user_id").to_numpy() for table in tables]
+        total = sum(len(values) for values in users)
+        low = min((int(values.min()) for values in users if len(values)), default=0)
+        high = max((int(values.max()) for values in users if len(values)), default=-1)
+        if high - low + 1 <= _DENSE_SPAN_FACTOR * max(total, 1):
+            # id 가 조밀하면 user_id - low 를 그대로 상태 배열 위치로
+            size, locate = high - low + 1, lambda values: values.astype(np.int64) - low
+        else:
+            universe = np.unique(np.concatenate(users))
+            size, locate = len(universe), lambda values: np.searchsorted(universe, values)
+        state = np.full(size, len(SEGMENTS), dtype=np.int64)
+        counts = np.zeros(len(SEGMENTS) + 1, dtype=np.int64)
+        rows = []
+        for table, values in zip(tables, users):
+            index = locate(values)
+            segment = table.column("segment").to_numpy().astype(np.int64)
+            segment[segment == REMOVED] = len(SEGMENTS)
+            counts -= np.bincount(state[index], minlength=len(counts))
+            counts += np.bincount(segment, minlength=len(counts))
+            state[index] = segment
+            rows.append(counts[:len(SEGMENTS)].copy())
+        return pd.DataFrame(rows, index=pd.Index(dates, name=PARTITION), columns=list(SEGMENTS))
+
+    def stats(self):
+        """스냅샷 수 / 누적 행 수 / 디스크 크기"""
+        paths = [self._path(date) for date in self.dates()]
+        return {
+            "snapshots": len(paths),
+            "rows": sum(pq.ParquetFile(path).metadata.num_rows for path in paths),
+            "bytes": sum(path.stat().st_size for path in paths),
+        }
+
+
+# ============================================
+# 로컬 Parquet 원천에서 스냅샷 생성
+# ============================================
+
+def _order_rows(data_dir):
+    """주문 상품 행 (user_id, order_id, order_date, sale_price) — order_date 오름차순"""
+    from thelook_analysis.duckdb_backend import LocalRunner
+
+    runner = LocalRunner(data_dir)
+    try:
+        runner.run(["stg_orders", "stg_order_items"])
+        rows = runner.query("""
+            SELECT o.user_id, o.order_id, o.order_date, oi.sale_price
+            FROM stg_orders o
+            JOIN stg_order_items oi ON o.order_id = oi.order_id
+            ORDER BY o.order_date
+        """)
+    finally:
+        runner.close()
+    return (rows["user_id"].to_numpy(), rows["order_id"].to_numpy(),
+            rows["order_date"].to_numpy().astype("datetime64[D]"), rows["sale_price"].to_numpy())
+
+
+def _snapshot(store, rows, date):
+    # date 까지의 주문(order_date 오름차순 행의 앞부분)으로 date 다음 날 기준 RFM
+    user_id, order_id, order_date, sale_price = rows
+    stop = np.searchsorted(order_date, date, side="right")
+    rfm = score_rfm(user_id[:stop], order_id[:stop], order_date[:stop], sale_price[:stop], as_of=date + 1)
+    return store.append(date, rfm.user_id, rfm.segment, rfm.r_score, rfm.f_score, rfm.m_score)
+
+
+def take(root, data_dir, date):
+    """date 시점 스냅샷 하나 추가. 기록한 (변경) 행 수 반환"""
+    return _snapshot(SnapshotStore(root), _order_rows(data_dir), _day(date))
+
+
+def backfill(root, data_dir, start, end, every=1):
+    """start ~ end 의 every 일 간격 스냅샷을 차례로 추가 (주문은 한 번만 읽음). {날짜: 기록 행 수}"""
+    store = SnapshotStore(root)
+    rows = _order_rows(data_dir)
+    dates = np.arange(_day(start), _day(end) + 1, every)
+    return {date: _snapshot(store, rows, date) for date in dates}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="일별 세그먼트 스냅샷 (변경분 저장)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    take_parser = commands.add_parser("take", help="한 시점 스냅샷 추가")
+    take_parser.add_argument("--data-dir", required=True, help="원천 Parquet 디렉터리")
+    take_parser.add_argument("--root", required=True, help="스냅샷 디렉터리")
+    take_parser.add_argument("--date", required=True, help="스냅샷 날짜 (이 날까지의 주문)")
+    fill = commands.add_parser("backfill", help="기간의 스냅샷을 차례로 추가")
+    fill.add_argument("--data-dir", required=True)
+    fill.add_argument("--root", required=True)
+    fill.add_argument("--start", required=True)
+    fill.add_argument("--end", required=True)
+    fill.add_argument("--every", type=int, default=1, help="스냅샷 간격 (일)")
+    show = commands.add_parser("show", help="한 시점 세그먼트 분포")
+    show.add_argument("--root", required=True)
+    show.add_argument("--date", default=None, help="기본값: 마지막 스냅샷")
+    moves = commands.add_parser("transitions", help="두 시점 사이 세그먼트 이동 행렬")
+    moves.add_argument("--root", required=True)
+    moves.add_argument("--start", required=True)
+    moves.add_argument("--end", required=True)
+    args = parser.parse_args(argv)
+
+    if args.command == "take":
+        rows = take(args.root, args.data_dir, args.date)
+        print(f"written: {args.date} ({rows:,} changed rows)")
+    elif args.command == "backfill":
+        written = backfill(args.root, args.data_dir, args.start, args.end, args.every)
+        print(f"written: {len(written)} snapshots ({sum(written.values()):,} rows)")
+    elif args.command == "show":
+        print(SnapshotStore(args.root).segmentation(args.date).counts().to_string())
+    else:
+        print(SnapshotStore(args.root).transitions(args.start, args.end).to_string())
+
+
+if __name__ == "__main__":
+    main()
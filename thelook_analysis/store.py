@@ -0,0 +1,375 @@
+"""
+유저별 RFM 상태 저장소 (memory-mapped struct-of-arrays)
+=====================================================
+유저별 RFM 결과를 컬럼별 고정폭 배열로 하나의 파일에 저장하고, 읽을 때는 `mmap` 으로 열어
+복사 없이 NumPy 배열 뷰로 노출합니다. 여러 대시보드 프로세스가 같은 파일을 읽기 전용으로 열면
+OS 페이지 캐시를 공유하므로 프로세스 수와 관계없이 메모리는 한 벌만 사용합니다.
+
+유저당 23 bytes (1억 명 ≈ 2.3 GB):
+
+    user_id int32 | recency_days int32 | frequency int16 | monetary float32
+    r/f/m_score uint8 ×3 | segment uint8 | traffic_source uint8 | first_category int16
+    post_purchase_sessions uint16 (첫 구매 다음 날부터의 세션 수, 65535 에서 포화)
+
+문자열 컬럼(segment / traffic_source / first_category)은 코드로 저장하고 사전은 헤더에 둡니다.
+traffic_source 255, first_category -1 은 값 없음입니다. monetary 는 float32 이므로
+유저당 10만 달러 이하에서 센트 단위까지 정확합니다.
+
+파일 레이아웃:
+
+    b"THLKRFM1" | uint64 헤더 길이 | JSON 헤더 | 컬럼 블록 ... (각 블록 64 bytes 정렬)
+
+사용 예:
+    python -m thelook_analysis.store build --data-dir data/thelook --out data/rfm.store
+    python -m thelook_analysis.store info data/rfm.store
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from thelook_analysis.rfm import ANALYSIS_AS_OF, SEGMENTS, score_rfm
+
+MAGIC = b"THLKRFM1"
+FORMAT_VERSION = 2
+
+# (컬럼, dtype) — 파일 내 블록 순서
+COLUMNS = (
+    ("user_id", "<i4"),
+    ("recency_days", "<i4"),
+    ("frequency", "<i2"),
+    ("monetary", "<f4"),
+    ("r_score", "u1"),
+    ("f_score", "u1"),
+    ("m_score", "u1"),
+    ("segment", "u1"),
+    ("traffic_source", "u1"),
+    ("first_category", "<i2"),
+    ("post_purchase_sessions", "<u2"),
+)
+
+# 코드 → 이름 사전을 갖는 컬럼
+DICTIONARY_COLUMNS = ("segment", "traffic_source", "first_category")
+
+MISSING_CODES = {"traffic_source": 255, "first_category": -1}
+
+_ALIGN = 64
+_PREFIX = struct.Struct("<8sQ")
+
+
+def _checked(name, values, dtype):
+    """정수 컬럼이 dtype 범위를 넘으면 조용히 잘리지 않도록 ValueError"""
+    values = np.asarray(values)
+    dtype = np.dtype(dtype)
+    if dtype.kind in "iu" and len(values):
+        info = np.iinfo(dtype)
+        lo, hi = values.min(), values.max()
+        if lo < info.min or hi > info.max:
+            raise ValueError(f"{name} 값 범위 [{lo}, {hi}] 가 {dtype} 를 벗어납니다")
+    return values.astype(dtype, copy=False)
+
+
+def _align(offset):
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+def write_store(path, columns, dictionaries, as_of=ANALYSIS_AS_OF):
+    """
+    컬럼 배열(dict)을 저장소 파일로 씁니다. user_id 는 오름차순이어야 합니다.
+    임시 파일에 쓴 뒤 rename 하므로 이미 파일을 연 프로세스는 이전 내용을 계속 봅니다.
+    """
+    missing = [name for name, _ in COLUMNS if name not in columns]
+    if missing:
+        raise ValueError(f"누락된 컬럼: {missing}")
+    arrays = {name: _checked(name, columns[name], dtype) for name, dtype in COLUMNS}
+    rows = len(arrays["user_id"])
+    if any(len(values) != rows for values in arrays.values()):
+        raise ValueError("컬럼 길이가 서로 다릅니다")
+    if rows and np.any(np.diff(arrays["user_id"]) <= 0):
+        raise ValueError("user_id 는 중복 없이 오름차순이어야 합니다")
+
+    # 오프셋은 데이터 영역(헤더 뒤 첫 정렬 위치) 기준
+    layout = []
+    offset = 0
+    for name, dtype in COLUMNS:
+        layout.append({"name": name, "dtype": dtype, "offset": offset})
+        offset = _align(offset + rows * np.dtype(dtype).itemsize)
+    header = {
+        "version": FORMAT_VERSION,
+        "rows": rows,
+        "as_of": str(np.datetime64(as_of, "D")),
+        "columns": layout,
+        "dictionaries": {name: list(dictionaries.get(name, ())) for name in DICTIONARY_COLUMNS},
+    }
+    payload = json.dumps(header, ensure_ascii=False).encode()
+    data_start = _align(_PREFIX.size + len(payload))
+
+    path = Path(path)
+    tmp = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as out:
+        out.write(_PREFIX.pack(MAGIC, len(payload)))
+        out.write(payload)
+        for spec in layout:
+            out.seek(data_start + spec["offset"])
+            out.write(memoryview(np.ascontiguousarray(arrays[spec["name"]])).cast("B"))
+        out.truncate(data_start + offset)
+    tmp.replace(path)
+    return path
+
+
+class RFMStore:
+    """
+    읽기 전용 저장소. 컬럼은 mmap 위의 읽기 전용 NumPy 뷰(`store.monetary` 등)이며
+    실제로 접근한 페이지만 메모리에 올라옵니다.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, "rb") as source:
+            magic, length = _PREFIX.unpack(source.read(_PREFIX.size))
+            if magic != MAGIC:
+                raise ValueError(f"RFM 저장소 파일이 아닙니다: {self.path}")
+            self.header = json.loads(source.read(length))
+            if self.header["version"] != FORMAT_VERSION:
+                raise ValueError(f"지원하지 않는 저장소 버전: {self.header['version']} "
+                                 f"(현재 {FORMAT_VERSION}, `store build` 로 다시 생성하세요)")
+            data_start = _align(_PREFIX.size + length)
+            self._mmap = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) if self.header["rows"] else None
+
+        self.rows = self.header["rows"]
+        self.as_of = np.datetime64(self.header["as_of"], "D")
+        self.dictionaries = {name: tuple(values) for name, values in self.header["dictionaries"].items()}
+        self._columns = {}
+        for spec in self.header["columns"]:
+            dtype = np.dtype(spec["dtype"])
+            if self._mmap is None:
+                self._columns[spec["name"]] = np.empty(0, dtype=dtype)
+            else:
+                self._columns[spec["name"]] = np.frombuffer(self._mmap, dtype=dtype, count=self.rows,
+                                                            offset=data_start + spec["offset"])
+
+    def __len__(self):
+        return self.rows
+
+    def __getattr__(self, name):
+        columns = self.__dict__.get("_columns", {})
+        if name in columns:
+            return columns[name]
+        raise AttributeError(name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def nbytes(self):
+        return sum(values.nbytes for values in self._columns.values())
+
+    def column(self, name):
+        return self._columns[name]
+
+    def close(self):
+        """mmap 해제. 이후 컬럼 뷰에 접근하면 안 됨"""
+        self._columns = {}
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # 외부에 남아 있는 뷰가 있으면 GC 가 정리하도록 둠
+                pass
+            self._mmap = None
+
+    def decode(self, name, codes=None):
+        """사전 컬럼 코드를 이름으로 (값 없음은 NaN). 메모리 절약을 위해 Categorical 로 반환"""
+        codes = self._columns[name] if codes is None else codes
+        categories = list(self.dictionaries[name])
+        missing = MISSING_CODES.get(name)
+        as_int = codes.astype(np.int32)
+        if missing is not None:
+            as_int = np.where(codes == missing, -1, as_int)
+        return pd.Categorical.from_codes(as_int, categories=categories)
+
+    def lookup(self, user_ids):
+        """user_id → 행 번호 (없으면 -1). user_id 컬럼이 정렬되어 있으므로 이진 탐색"""
+        user_ids = np.asarray(user_ids, dtype=np.int64)
+        keys = self._columns["user_id"]
+        rows = np.searchsorted(keys, user_ids)
+        found = rows < len(keys)
+        found[found] = keys[rows[found]] == user_ids[found]
+        return np.where(found, rows, -1)
+
+    def to_frame(self, rows=None, columns=None):
+        """선택한 행/컬럼을 DataFrame 으로 (사전 컬럼은 이름으로 디코딩). 선택 범위만 복사됨"""
+        names = columns or [name for name, _ in COLUMNS]
+        frame = {}
+        for name in names:
+            values = self._columns[name] if rows is None else self._columns[name][rows]
+            frame[name] = self.decode(name, values) if name in DICTIONARY_COLUMNS else values
+        return pd.DataFrame(frame)
+
+    def to_arrow(self, rows=None, columns=None):
+        """
+        선택한 행/컬럼을 pyarrow.Table 로. 사전 컬럼은 (코드, 사전) 그대로 DictionaryArray 가 되므로
+        행마다 문자열을 만들지 않습니다 (값 없음은 null)
+        """
+        import pyarrow as pa
+
+        names = columns or [name for name, _ in COLUMNS]
+        arrays = []
+        for name in names:
+            values = self._columns[name] if rows is None else self._columns[name][rows]
+            if name in DICTIONARY_COLUMNS:
+                codes = values.astype(np.int32)
+                missing = MISSING_CODES.get(name)
+                mask = codes == missing if missing is not None else None
+                if mask is not None:
+                    codes[mask] = 0
+                arrays.append(pa.DictionaryArray.from_arrays(
+                    pa.array(codes, mask=mask), pa.array(list(self.dictionaries[name]), pa.string()),
+                ))
+            else:
+                arrays.append(pa.array(values))
+        return pa.Table.from_arrays(arrays, names=names)
+
+    def segment_summary(self):
+        """세그먼트별 유저 수 / 평균 RFM / 매출 합계 (bincount, 유저 단위 복사 없음)"""
+        segment = self._columns["segment"]
+        size = len(self.dictionaries["segment"])
+        counts = np.bincount(segment, minlength=size)
+
+        def total(name):
+            return np.bincount(segment, weights=self._columns[name], minlength=size)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            frame = pd.DataFrame({
+                "segment": self.dictionaries["segment"],
+                "user_count": counts,
+                "avg_recency": total("recency_days") / counts,
+                "avg_frequency": total("frequency") / counts,
+                "avg_monetary": total("monetary") / counts,
+                "r_score": total("r_score") / counts,
+                "f_score": total("f_score") / counts,
+                "m_score": total("m_score") / counts,
+                "total_revenue": total("monetary"),
+            })
+        frame["pct"] = frame["user_count"] / max(self.rows, 1) * 100
+        frame["revenue_pct"] = frame["total_revenue"] / max(frame["total_revenue"].sum(), 1e-9) * 100
+        return frame[frame["user_count"] > 0].reset_index(drop=True)
+
+
+def open_store(path):
+    return RFMStore(path)
+
+
+# ============================================
+# 로컬 원천에서 빌드
+# ============================================
+
+def _encode(user_id, keys, labels, missing):
+    """(keys, labels) 행을 user_id 순서의 코드 배열로. 사전은 이름 오름차순"""
+    dictionary, codes = np.unique(np.asarray(labels, dtype=object).astype(str), return_inverse=True)
+    out = np.full(len(user_id), missing, dtype=np.int64)
+    rows = np.searchsorted(user_id, keys)
+    inside = rows < len(user_id)
+    inside[inside] = user_id[rows[inside]] == keys[inside]
+    out[rows[inside]] = codes[inside]
+    return out, tuple(dictionary)
+
+
+def build_columns(rfm, users=None, first_category=None, sessions=None):
+    """
+    RFMResult (+ 선택적 유저 traffic_source / 첫 구매 카테고리 프레임, 구매 후 세션 수) → write_store 입력.
+    users: (user_id, traffic_source), first_category: (user_id, category),
+    sessions: rfm.user_id 순서의 구매 후 세션 수 배열 (없으면 0)
+    """
+    user_id = np.asarray(rfm.user_id)
+    if sessions is None:
+        sessions = np.zeros(len(user_id), dtype=np.int64)
+    columns = {
+        "user_id": user_id,
+        "recency_days": rfm.recency_days,
+        "frequency": rfm.frequency,
+        "monetary": rfm.monetary,
+        "r_score": rfm.r_score,
+        "f_score": rfm.f_score,
+        "m_score": rfm.m_score,
+        "segment": rfm.segment,
+        "post_purchase_sessions": np.minimum(sessions, np.iinfo(np.uint16).max),
+    }
+    dictionaries = {"segment": SEGMENTS}
+    for name, frame, label in (("traffic_source", users, "traffic_source"),
+                               ("first_category", first_category, "category")):
+        if frame is None or len(frame) == 0:
+            columns[name] = np.full(len(user_id), MISSING_CODES[name])
+            dictionaries[name] = ()
+            continue
+        columns[name], dictionaries[name] = _encode(
+            user_id, frame["user_id"].to_numpy(np.int64), frame[label].to_numpy(), MISSING_CODES[name],
+        )
+    return columns, dictionaries
+
+
+def build_store(data_dir, path, as_of=ANALYSIS_AS_OF):
+    """
+    로컬 Parquet 원천(`duckdb_backend` 배치)에서 RFM 을 계산해 저장소 파일을 만듭니다.
+    구매 후 세션 수는 events 를 스트리밍해 계산합니다 (thelook_analysis.sessions).
+    """
+    from thelook_analysis.duckdb_backend import LocalRunner
+    from thelook_analysis.sessions import count_stg_event_sessions, events_path, first_purchase_dates
+
+    runner = LocalRunner(data_dir)
+    try:
+        runner.run(["stg_orders", "stg_order_items", "stg_users", "int_user_first_purchase"])
+        rows = runner.query("""
+            SELECT o.user_id, o.order_id, o.order_date, oi.sale_price, oi.created_at
+            FROM stg_orders o
+            JOIN stg_order_items oi ON o.order_id = oi.order_id
+        """)
+        users = runner.query("SELECT user_id, traffic_source FROM stg_users WHERE traffic_source IS NOT NULL")
+        first_category = runner.query(
+            "SELECT user_id, category FROM int_user_first_purchase WHERE category IS NOT NULL"
+        )
+        rfm = score_rfm(rows["user_id"].to_numpy(), rows["order_id"].to_numpy(),
+                        rows["order_date"].to_numpy(), rows["sale_price"].to_numpy(), as_of=as_of)
+        sessions = None
+        if events_path(data_dir).exists():
+            # rfm.user_id 와 first_users 는 같은 유저 집합(오름차순)
+            first_users, first_dates = first_purchase_dates(rows["user_id"].to_numpy(), rows["created_at"].to_numpy())
+            _, sessions, _ = count_stg_event_sessions(runner, first_users, first_dates)
+    finally:
+        runner.close()
+    columns, dictionaries = build_columns(rfm, users, first_category, sessions)
+    return write_store(path, columns, dictionaries, as_of=as_of)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="유저별 RFM memory-mapped 저장소")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="로컬 Parquet 원천에서 저장소 생성")
+    build.add_argument("--data-dir", required=True, help="원천 Parquet 디렉터리")
+    build.add_argument("--out", required=True, help="저장소 파일 경로")
+    build.add_argument("--as-of", default=str(ANALYSIS_AS_OF), help="Recency 기준일")
+    info = commands.add_parser("info", help="저장소 요약 출력")
+    info.add_argument("path")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        path = build_store(args.data_dir, args.out, as_of=np.datetime64(args.as_of, "D"))
+        print(f"written: {path} ({path.stat().st_size / 1e6:,.1f} MB)")
+        return
+
+    with open_store(args.path) as store:
+        print(f"{store.path}: {len(store):,} users, {store.nbytes / 1e6:,.1f} MB, as_of={store.as_of}")
+        print(store.segment_summary().round(2).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
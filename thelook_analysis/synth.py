@@ -0,0 +1,545 @@
+"""
+TheLook 합성 데이터 생성기
+==========================
+README ERD 의 7개 원천 테이블(users, orders, order_items, products, events, inventory_items,
+distribution_centers)을 BigQuery 없이 로컬 Parquet 로 생성합니다. 컬럼은 staging 모델이
+읽는 원천 컬럼과 같아서 `duckdb_backend` 로 그대로 dbt 모델을 실행할 수 있습니다.
+
+대시보드에서 관찰되는 분포를 흉내 냅니다.
+- 구매 고객당 주문 ≈ 1.2회 (기하분포), 주문당 상품 1~4개
+- 상품 가격은 로그정규 → 유저 monetary 는 long-tail
+- 유저별 가격 선호 분위(value_q)가 높을수록 첫 구매 이후 재방문 세션 확률이 높음
+  (Promising High ≈ 절반, Promising Low ≈ 80~90% 가 구매 후 미활동)
+- 가입 traffic_source 는 Search ≈ 70%, Organic 15%, Facebook 6%, Email 5%, Display 4%
+
+생성은 user_id 구간(chunk) 단위로 나뉘며 chunk 마다 (seed, chunk, stream) 으로 난수열을 고정하므로
+프로세스 수와 무관하게 같은 seed 는 같은 데이터를 만듭니다. 한 유저의 주문/이벤트는 같은 chunk 파일에
+들어가므로 `<table>/part-NNNNN.parquet` 는 그대로 user_id 기준 파티션입니다.
+
+사용 예:
+    python -m thelook_analysis.synth --out data/thelook --users 1000000 --workers 8
+"""
+
+import argparse
+import functools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+TABLES = (
+    "users", "orders", "order_items", "products", "events", "inventory_items", "distribution_centers",
+)
+
+# 난수 스트림 구분값 (chunk 별 SeedSequence 의 세 번째 원소)
+_COUNTS, _VALUES, _PRODUCTS = 0, 1, 2
+
+_DAY_US = 86_400 * 1_000_000
+_MINUTE_US = 60 * 1_000_000
+
+ROW_GROUP_SIZE = 1 << 20
+
+USER_TRAFFIC = (("Search", 0.70), ("Organic", 0.15), ("Facebook", 0.06), ("Email", 0.05), ("Display", 0.04))
+EVENT_TRAFFIC = (("Email", 0.45), ("Adwords", 0.30), ("Facebook", 0.10), ("YouTube", 0.10), ("Organic", 0.05))
+ORDER_STATUS = (("Complete", 0.25), ("Shipped", 0.30), ("Processing", 0.20), ("Cancelled", 0.15), ("Returned", 0.10))
+
+# (country, state, city, 가중치)
+LOCATIONS = (
+    ("China", "Guangdong", "Shenzhen", 0.12), ("China", "Shanghai", "Shanghai", 0.11),
+    ("China", "Beijing", "Beijing", 0.11), ("United States", "California", "Los Angeles", 0.08),
+    ("United States", "Texas", "Houston", 0.06), ("United States", "New York", "New York", 0.05),
+    ("United States", "Florida", "Miami", 0.03), ("Brasil", "São Paulo", "São Paulo", 0.09),
+    ("Brasil", "Rio de Janeiro", "Rio de Janeiro", 0.05), ("South Korea", "Seoul", "Seoul", 0.05),
+    ("United Kingdom", "England", "London", 0.05), ("France", "Île-de-France", "Paris", 0.05),
+    ("Germany", "Berlin", "Berlin", 0.04), ("Spain", "Madrid", "Madrid", 0.04),
+    ("Japan", "Tokyo", "Tokyo", 0.03), ("Australia", "New South Wales", "Sydney", 0.02),
+    ("Belgium", "Brussels", "Brussels", 0.01), ("Poland", "Mazowieckie", "Warsaw", 0.01),
+)
+
+FIRST_NAMES = {
+    "F": ("Emily", "Olivia", "Sophia", "Ava", "Mia", "Grace", "Chloe", "Emma", "Hannah", "Julia", "Seoyeon", "Jiwoo"),
+    "M": ("James", "Michael", "David", "Daniel", "Joseph", "Ryan", "Kevin", "Brian", "Eric", "Jason", "Minjun", "Jihoon"),
+}
+LAST_NAMES = (
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Kim", "Lee",
+    "Park", "Wang", "Li", "Zhang", "Silva", "Santos", "Martin", "Bernard", "Müller", "Schmidt",
+)
+
+# (category, department, 가중치)
+CATEGORIES = (
+    ("Intimates", "Women", 0.080), ("Jeans", "Women", 0.035), ("Jeans", "Men", 0.035),
+    ("Tops & Tees", "Women", 0.030), ("Tops & Tees", "Men", 0.030), ("Fashion Hoodies & Sweatshirts", "Men", 0.040),
+    ("Fashion Hoodies & Sweatshirts", "Women", 0.030), ("Swim", "Women", 0.035), ("Swim", "Men", 0.030),
+    ("Sleep & Lounge", "Women", 0.030), ("Sleep & Lounge", "Men", 0.030), ("Shorts", "Men", 0.035),
+    ("Shorts", "Women", 0.030), ("Sweaters", "Women", 0.035), ("Sweaters", "Men", 0.030),
+    ("Accessories", "Women", 0.030), ("Accessories", "Men", 0.030), ("Active", "Women", 0.030),
+    ("Active", "Men", 0.030), ("Outerwear & Coats", "Men", 0.030), ("Outerwear & Coats", "Women", 0.025),
+    ("Pants", "Men", 0.035), ("Pants & Capris", "Women", 0.025), ("Dresses", "Women", 0.030),
+    ("Underwear", "Men", 0.030), ("Socks", "Men", 0.025), ("Socks & Hosiery", "Women", 0.015),
+    ("Suits & Sport Coats", "Men", 0.025), ("Plus", "Women", 0.025), ("Maternity", "Women", 0.020),
+    ("Skirts", "Women", 0.020), ("Blazers & Jackets", "Women", 0.020), ("Leggings", "Women", 0.015),
+    ("Suits", "Women", 0.010), ("Jumpsuits & Rompers", "Women", 0.010), ("Clothing Sets", "Women", 0.005),
+)
+
+DISTRIBUTION_CENTERS = (
+    (1, "Memphis TN", 35.1174, -89.9711), (2, "Chicago IL", 41.8369, -87.6847),
+    (3, "Houston TX", 29.7604, -95.3698), (4, "Los Angeles CA", 34.05, -118.25),
+    (5, "New Orleans LA", 29.95, -90.0667), (6, "Port Authority of New York/New Jersey NY/NJ", 40.634, -73.7834),
+    (7, "Philadelphia PA", 39.95, -75.1667), (8, "Mobile AL", 30.6944, -88.0431),
+    (9, "Charleston SC", 32.7833, -79.9333), (10, "Savannah GA", 32.0167, -81.1167),
+)
+
+PURCHASE_URIS = ("/home", "/cart", "/purchase")
+
+
+@dataclass(frozen=True)
+class SynthConfig:
+    """생성 파라미터 (manifest.json 에 그대로 기록)"""
+
+    users: int = 1_000_000
+    seed: int = 42
+    chunk_users: int = 250_000
+    products: int = 29_120
+    start: str = "2019-01-01"
+    end: str = "2025-01-01"              # 미포함 (분석 기준일 ANALYSIS_AS_OF)
+    purchaser_rate: float = 0.6           # 주문이 1건 이상인 유저 비율
+    repeat_rate: float = 0.20             # 주문 후 다음 주문을 할 확률 (주문 수 ~ 기하분포)
+    unsold_rate: float = 0.5              # 판매된 재고 대비 미판매 재고 비율
+
+    @property
+    def chunks(self):
+        return -(-self.users // self.chunk_users)
+
+    def chunk_bounds(self, chunk):
+        """chunk 의 (첫 user_id, 유저 수)"""
+        first = chunk * self.chunk_users
+        return first + 1, min(self.chunk_users, self.users - first)
+
+
+def _rng(config, chunk, stream):
+    return np.random.default_rng(np.random.SeedSequence([config.seed, chunk, stream]))
+
+
+def _choice(rng, weighted, size):
+    weights = np.array([w for *_, w in weighted], dtype=np.float64)
+    return rng.choice(len(weighted), size=size, p=weights / weights.sum()).astype(np.int32)
+
+
+def _dictionary(codes, values):
+    return pa.DictionaryArray.from_arrays(pa.array(codes, pa.int32()), pa.array(values, pa.string()))
+
+
+def _timestamps(micros, valid=None):
+    values = np.asarray(micros, dtype=np.int64).astype("datetime64[us]")
+    mask = None if valid is None else ~valid
+    return pa.array(values, pa.timestamp("us"), mask=mask)
+
+
+def _as_string(values):
+    return pc.cast(pa.array(values), pa.string())
+
+
+def _group_starts(counts):
+    """그룹 크기 배열 → 각 그룹의 시작 위치"""
+    return np.cumsum(counts) - counts
+
+
+def _position_in_group(counts):
+    """np.repeat(arange, counts) 로 펼친 각 행의 그룹 내 위치 (0부터)"""
+    total = int(counts.sum())
+    return np.arange(total, dtype=np.int64) - np.repeat(_group_starts(counts), counts)
+
+
+def _write(table, path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(table, path, row_group_size=ROW_GROUP_SIZE, compression="zstd")
+
+
+# ============================================
+# 상품 / 물류센터 (모든 chunk 가 공유)
+# ============================================
+
+@functools.lru_cache(maxsize=4)
+def _catalog(config):
+    """상품 배열 (프로세스마다 같은 seed 로 재생성; 피클링 없이 워커에서 공유)"""
+    rng = _rng(config, 0, _PRODUCTS)
+    n = config.products
+    category = _choice(rng, CATEGORIES, n)
+    retail_price = np.round(np.clip(rng.lognormal(np.log(40.0), 0.7, n), 1.5, 999.0), 2)
+    return {
+        "id": np.arange(1, n + 1, dtype=np.int64),
+        "category": category,
+        "brand": rng.integers(0, 2_756, n).astype(np.int32),
+        "retail_price": retail_price,
+        "cost": np.round(retail_price * rng.uniform(0.35, 0.6, n), 2),
+        "distribution_center_id": rng.integers(1, len(DISTRIBUTION_CENTERS) + 1, n),
+        # 가격 오름차순 상품 인덱스 (유저 가격 선호 분위 → 상품 선택)
+        "by_price": np.argsort(retail_price, kind="stable"),
+    }
+
+
+def _brands():
+    return [f"Brand {i:04d}" for i in range(2_756)]
+
+
+def _products_table(config):
+    catalog = _catalog(config)
+    category_names = [c for c, _, _ in CATEGORIES]
+    departments = [d for _, d, _ in CATEGORIES]
+    brand = _dictionary(catalog["brand"], _brands())
+    category = _dictionary(catalog["category"], category_names)
+    name = pc.binary_join_element_wise(
+        pc.cast(brand, pa.string()), pc.cast(category, pa.string()), _as_string(catalog["id"]), " ",
+    )
+    return pa.table({
+        "id": catalog["id"],
+        "cost": catalog["cost"],
+        "category": category,
+        "name": name,
+        "brand": brand,
+        "retail_price": catalog["retail_price"],
+        "department": _dictionary(catalog["category"], departments),
+        "sku": pc.binary_join_element_wise("SKU", _as_string(catalog["id"]), "-"),
+        "distribution_center_id": catalog["distribution_center_id"],
+    })
+
+
+def _distribution_centers_table():
+    ids, names, lats, lons = zip(*DISTRIBUTION_CENTERS)
+    return pa.table({"id": list(ids), "name": list(names), "latitude": list(lats), "longitude": list(lons)})
+
+
+# ============================================
+# chunk 단위 생성
+# ============================================
+
+def _chunk_counts(config, chunk):
+    """
+    chunk 의 행 수를 결정하는 난수만 따로 생성 (계획 단계와 쓰기 단계가 같은 값을 재현).
+    전역 id 를 조밀하게 매기기 위해 먼저 모든 chunk 의 행 수를 구한 뒤 누적합으로 offset 을 정합니다.
+    """
+    rng = _rng(config, chunk, _COUNTS)
+    _, n = config.chunk_bounds(chunk)
+    purchaser = rng.random(n) < config.purchaser_rate
+    orders = np.where(purchaser, rng.geometric(1.0 - config.repeat_rate, n), 0)
+    items = 1 + rng.binomial(3, 0.15, int(orders.sum()))
+    value_q = rng.random(n)
+    # 가격 선호가 높을수록 구매 후 재방문 (post-purchase 세션) 확률이 높음
+    active = purchaser & (rng.random(n) < 0.03 + 0.8 * value_q ** 2)
+    post_sessions = np.where(active, 1 + rng.binomial(4, 0.25, n), 0)
+    browse_sessions = np.where(purchaser, 0, rng.random(n) < 0.5).astype(np.int64)
+    purchase_events = 4 + rng.binomial(4, 0.5, len(items))
+    other_events = 1 + rng.binomial(3, 0.4, int(post_sessions.sum() + browse_sessions.sum()))
+    return {
+        "orders": orders,
+        "items": items,
+        "value_q": value_q,
+        "post_sessions": post_sessions,
+        "browse_sessions": browse_sessions,
+        "purchase_events": purchase_events,
+        "other_events": other_events,
+        "unsold": int(rng.binomial(int(items.sum()), config.unsold_rate)),
+    }
+
+
+def _plan_chunk(config, chunk):
+    counts = _chunk_counts(config, chunk)
+    return {
+        "users": config.chunk_bounds(chunk)[1],
+        "orders": len(counts["items"]),
+        "order_items": int(counts["items"].sum()),
+        "events": int(counts["purchase_events"].sum() + counts["other_events"].sum()),
+        "unsold": counts["unsold"],
+    }
+
+
+def _write_chunk(config, out_dir, chunk, offsets):
+    counts = _chunk_counts(config, chunk)
+    catalog = _catalog(config)
+    rng = _rng(config, chunk, _VALUES)
+    first, n = config.chunk_bounds(chunk)
+    start_us = np.datetime64(config.start, "us").astype(np.int64)
+    end_us = np.datetime64(config.end, "us").astype(np.int64)
+    part = f"part-{chunk:05d}.parquet"
+
+    # ---- users ----
+    user_id = np.arange(first, first + n, dtype=np.int64)
+    female = rng.random(n) < 0.5
+    location = _choice(rng, LOCATIONS, n)
+    name_idx = rng.integers(0, len(FIRST_NAMES["F"]), n)
+    first_name_codes = np.where(female, name_idx, name_idx + len(FIRST_NAMES["F"]))
+    last_name_codes = rng.integers(0, len(LAST_NAMES), n)
+    signup = start_us + (rng.random(n) * (end_us - start_us - _DAY_US)).astype(np.int64)
+
+    first_name = _dictionary(first_name_codes, FIRST_NAMES["F"] + FIRST_NAMES["M"])
+    last_name = _dictionary(last_name_codes, LAST_NAMES)
+    email = pc.binary_join_element_wise(
+        pc.utf8_lower(pc.cast(first_name, pa.string())), pc.utf8_lower(pc.cast(last_name, pa.string())),
+        _as_string(user_id), "@example.com", "",
+    )
+    country, state, city, _ = zip(*LOCATIONS)
+    _write(pa.table({
+        "id": user_id,
+        "first_name": first_name,
+        "last_name": last_name,
+        "email": email,
+        "age": rng.integers(12, 71, n),
+        "gender": _dictionary(np.where(female, 0, 1), ["F", "M"]),
+        "state": _dictionary(location, state),
+        "city": _dictionary(location, city),
+        "country": _dictionary(location, country),
+        "traffic_source": _dictionary(_choice(rng, USER_TRAFFIC, n), [s for s, _ in USER_TRAFFIC]),
+        "created_at": _timestamps(signup),
+    }), out_dir / "users" / part)
+
+    # ---- orders ----
+    orders_per_user = counts["orders"]
+    n_orders = int(orders_per_user.sum())
+    order_user = np.repeat(np.arange(n), orders_per_user)
+    order_pos = _position_in_group(orders_per_user)
+    # 첫 주문은 가입 후 지수분포 지연, 이후 주문 간격은 로그정규 (중앙값 150일)
+    gap_days = np.where(
+        order_pos == 0, rng.exponential(60.0, n_orders), rng.lognormal(np.log(150.0), 1.0, n_orders),
+    )
+    gap_us = (gap_days * _DAY_US).astype(np.int64)
+    elapsed = np.cumsum(gap_us)
+    user_starts = _group_starts(orders_per_user)
+    purchasers = orders_per_user > 0
+    first_rows = user_starts[purchasers]
+    elapsed -= np.repeat(elapsed[first_rows] - gap_us[first_rows], orders_per_user[purchasers])
+    # 기준일을 넘는 주문은 가입~기준일 구간 안으로 접어 넣은 뒤 유저 내 시간순 정렬
+    span = end_us - signup[order_user]
+    order_time = signup[order_user] + elapsed % span
+    order_sort = np.lexsort((order_time, order_user))
+    order_time = order_time[order_sort]
+    order_id = offsets["orders"] + 1 + np.arange(n_orders, dtype=np.int64)
+
+    status = _choice(rng, ORDER_STATUS, n_orders)
+    status_names = [s for s, _ in ORDER_STATUS]
+    shipped = np.isin(status, [0, 1, 4])
+    delivered = np.isin(status, [0, 4])
+    returned = status == 4
+    shipped_at = order_time + (rng.random(n_orders) * 3 * _DAY_US).astype(np.int64)
+    delivered_at = shipped_at + ((1 + rng.random(n_orders) * 4) * _DAY_US).astype(np.int64)
+    returned_at = delivered_at + ((1 + rng.random(n_orders) * 13) * _DAY_US).astype(np.int64)
+    items_per_order = counts["items"]
+
+    _write(pa.table({
+        "order_id": order_id,
+        "user_id": user_id[order_user],
+        "status": _dictionary(status, status_names),
+        "gender": _dictionary(np.where(female[order_user], 0, 1), ["F", "M"]),
+        "created_at": _timestamps(order_time),
+        "returned_at": _timestamps(returned_at, returned),
+        "shipped_at": _timestamps(shipped_at, shipped),
+        "delivered_at": _timestamps(delivered_at, delivered),
+        "num_of_item": items_per_order,
+    }), out_dir / "orders" / part)
+
+    # ---- order_items ----
+    n_items = int(items_per_order.sum())
+    item_order = np.repeat(np.arange(n_orders), items_per_order)
+    item_user = order_user[item_order]
+    # 유저 가격 선호 분위 근처의 상품 선택 → monetary long-tail 이 상품 가격 분포를 따름
+    item_q = np.clip(counts["value_q"][item_user] + rng.normal(0.0, 0.12, n_items), 0.0, 1.0 - 1e-9)
+    product_idx = catalog["by_price"][(item_q * config.products).astype(np.int64)]
+    item_id = offsets["order_items"] + 1 + np.arange(n_items, dtype=np.int64)
+    item_time = order_time[item_order] + (rng.random(n_items) * _MINUTE_US).astype(np.int64)
+
+    _write(pa.table({
+        "id": item_id,
+        "order_id": order_id[item_order],
+        "user_id": user_id[item_user],
+        "product_id": catalog["id"][product_idx],
+        "inventory_item_id": item_id,
+        "status": _dictionary(status[item_order], status_names),
+        "created_at": _timestamps(item_time),
+        "shipped_at": _timestamps(shipped_at[item_order], shipped[item_order]),
+        "delivered_at": _timestamps(delivered_at[item_order], delivered[item_order]),
+        "returned_at": _timestamps(returned_at[item_order], returned[item_order]),
+        "sale_price": catalog["retail_price"][product_idx],
+    }), out_dir / "order_items" / part)
+
+    # ---- inventory_items (판매분은 order_items.id 와 같은 id, 미판매분은 그 뒤 id) ----
+    n_unsold = counts["unsold"]
+    unsold_product = rng.integers(0, config.products, n_unsold)
+    inv_product = np.concatenate([product_idx, unsold_product])
+    inv_sold_at = np.concatenate([item_time, np.zeros(n_unsold, dtype=np.int64)])
+    inv_created = np.concatenate([
+        item_time - ((1 + rng.random(n_items) * 90) * _DAY_US).astype(np.int64),
+        start_us + (rng.random(n_unsold) * (end_us - start_us)).astype(np.int64),
+    ])
+    inv_id = np.concatenate([
+        item_id, offsets["inventory_base"] + offsets["unsold"] + 1 + np.arange(n_unsold, dtype=np.int64),
+    ])
+    category_names = [c for c, _, _ in CATEGORIES]
+    _write(pa.table({
+        "id": inv_id,
+        "product_id": catalog["id"][inv_product],
+        "created_at": _timestamps(inv_created),
+        "sold_at": _timestamps(inv_sold_at, np.arange(len(inv_id)) < n_items),
+        "cost": catalog["cost"][inv_product],
+        "product_category": _dictionary(catalog["category"][inv_product], category_names),
+        "product_brand": _dictionary(catalog["brand"][inv_product], _brands()),
+        "product_retail_price": catalog["retail_price"][inv_product],
+        "product_department": _dictionary(catalog["category"][inv_product], [d for _, d, _ in CATEGORIES]),
+        "product_distribution_center_id": catalog["distribution_center_id"][inv_product],
+    }), out_dir / "inventory_items" / part)
+
+    # ---- events ----
+    # 세션 종류: 0 = 구매 세션(주문당 1개, 마지막 이벤트 시각 = 주문 시각), 1 = 구매 후 재방문, 2 = 비구매 탐색
+    first_order_time = np.full(n, end_us, dtype=np.int64)
+    first_order_time[purchasers] = order_time[first_rows]
+    post_user = np.repeat(np.arange(n), counts["post_sessions"])
+    browse_user = np.repeat(np.arange(n), counts["browse_sessions"])
+    post_time = first_order_time[post_user] + (
+        rng.random(len(post_user)) * (end_us - first_order_time[post_user])
+    ).astype(np.int64)
+    browse_time = signup[browse_user] + (
+        rng.random(len(browse_user)) * (end_us - signup[browse_user])
+    ).astype(np.int64)
+
+    session_user = np.concatenate([order_user, post_user, browse_user])
+    session_kind = np.concatenate([
+        np.zeros(n_orders, np.int8), np.ones(len(post_user), np.int8), np.full(len(browse_user), 2, np.int8),
+    ])
+    session_len = np.concatenate([counts["purchase_events"], counts["other_events"]])
+    session_step = ((0.5 + rng.random(len(session_user)) * 4.5) * _MINUTE_US).astype(np.int64)
+    session_start = np.concatenate([order_time, post_time, browse_time])
+    session_start[:n_orders] -= (session_len[:n_orders] - 1) * session_step[:n_orders]
+    session_sort = np.lexsort((session_start, session_user))
+    session_user = session_user[session_sort]
+    session_kind = session_kind[session_sort]
+    session_len = session_len[session_sort]
+    session_step = session_step[session_sort]
+    session_start = session_start[session_sort]
+    session_seq = _position_in_group(np.bincount(session_user, minlength=n))
+    session_source = _choice(rng, EVENT_TRAFFIC, len(session_user))
+
+    n_events = int(session_len.sum())
+    event_session = np.repeat(np.arange(len(session_user)), session_len)
+    pos = _position_in_group(session_len)
+    length = session_len[event_session]
+    purchase_session = session_kind[event_session] == 0
+    # 0 home, 1 department, 2 product, 3 cart, 4 purchase
+    event_type = np.where(pos == 0, 0, np.where(pos == 1, 1, 2))
+    event_type = np.where(purchase_session & (pos == length - 2), 3, event_type)
+    event_type = np.where(purchase_session & (pos == length - 1), 4, event_type)
+    event_user = session_user[event_session]
+    event_q = np.clip(counts["value_q"][event_user] + rng.normal(0.0, 0.2, n_events), 0.0, 1.0 - 1e-9)
+    event_product = catalog["by_price"][(event_q * config.products).astype(np.int64)]
+
+    # uri 는 사전 인코딩: [고정 uri..., 카테고리 uri..., 상품 uri...]
+    category_uris = [f"/department/{d.lower()}/category/{c.lower().replace(' ', '')}" for c, d, _ in CATEGORIES]
+    product_base = len(PURCHASE_URIS) + len(category_uris)
+    uri_code = np.select(
+        [event_type == 0, event_type == 1, event_type == 2, event_type == 3],
+        [0, len(PURCHASE_URIS) + catalog["category"][event_product], product_base + event_product, 1],
+        default=2,
+    )
+    uri_dictionary = pa.concat_arrays([
+        pa.array(PURCHASE_URIS + tuple(category_uris), pa.string()),
+        pc.binary_join_element_wise("/product/", _as_string(catalog["id"]), ""),
+    ])
+    ip_octets = rng.integers(1, 255, (n, 4))
+    ip_address = pc.binary_join_element_wise(*[_as_string(ip_octets[:, k]) for k in range(4)], ".")
+
+    _write(pa.table({
+        "id": offsets["events"] + 1 + np.arange(n_events, dtype=np.int64),
+        "user_id": user_id[event_user],
+        "sequence_number": pos + 1,
+        "session_id": pc.take(
+            pc.binary_join_element_wise(_as_string(user_id[session_user]), _as_string(session_seq + 1), "-"),
+            pa.array(event_session),
+        ),
+        "created_at": _timestamps(session_start[event_session] + pos * session_step[event_session]),
+        "ip_address": pc.take(ip_address, pa.array(event_user)),
+        "city": _dictionary(location[event_user], city),
+        "state": _dictionary(location[event_user], state),
+        "traffic_source": _dictionary(session_source[event_session], [s for s, _ in EVENT_TRAFFIC]),
+        "uri": pa.DictionaryArray.from_arrays(pa.array(uri_code, pa.int32()), uri_dictionary),
+        "event_type": _dictionary(event_type, ["home", "department", "product", "cart", "purchase"]),
+    }), out_dir / "events" / part)
+
+    return _plan_chunk(config, chunk)
+
+
+# ============================================
+# 실행
+# ============================================
+
+def _map(executor, fn, *iterables):
+    return list(executor.map(fn, *iterables)) if executor else list(map(fn, *iterables))
+
+
+def generate(out_dir, config=None, workers=None):
+    """
+    out_dir 아래에 `<table>/part-NNNNN.parquet` (products, distribution_centers 는 단일 파일) 와
+    manifest.json 을 생성하고 테이블별 행 수를 반환합니다.
+    """
+    config = config or SynthConfig()
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    chunks = range(config.chunks)
+    executor = ProcessPoolExecutor(max_workers=min(workers, config.chunks)) if workers > 1 else None
+
+    try:
+        plans = _map(executor, _plan_chunk, [config] * len(chunks), chunks)
+        offsets, running = [], {"orders": 0, "order_items": 0, "events": 0, "unsold": 0}
+        for plan in plans:
+            offsets.append(dict(running))
+            for key in running:
+                running[key] += plan[key]
+        for chunk_offsets in offsets:
+            chunk_offsets["inventory_base"] = running["order_items"]
+
+        _write(_products_table(config), out_dir / "products.parquet")
+        _write(_distribution_centers_table(), out_dir / "distribution_centers.parquet")
+        _map(executor, _write_chunk, [config] * len(chunks), [out_dir] * len(chunks), chunks, offsets)
+    finally:
+        if executor:
+            executor.shutdown()
+
+    rows = {
+        "users": config.users,
+        "orders": running["orders"],
+        "order_items": running["order_items"],
+        "products": config.products,
+        "events": running["events"],
+        "inventory_items": running["order_items"] + running["unsold"],
+        "distribution_centers": len(DISTRIBUTION_CENTERS),
+    }
+    manifest = {"config": asdict(config), "rows": rows}
+    (out_dir / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="TheLook 합성 데이터(Parquet) 생성")
+    parser.add_argument("--out", required=True, help="출력 디렉터리")
+    parser.add_argument("--users", type=int, default=SynthConfig.users)
+    parser.add_argument("--seed", type=int, default=SynthConfig.seed)
+    parser.add_argument("--chunk-users", type=int, default=SynthConfig.chunk_users,
+                        help="파일(파티션) 하나당 유저 수. 바꾸면 같은 seed 라도 다른 데이터가 생성됨")
+    parser.add_argument("--products", type=int, default=SynthConfig.products)
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본값: CPU 수)")
+    args = parser.parse_args(argv)
+
+    config = SynthConfig(users=args.users, seed=args.seed, chunk_users=args.chunk_users, products=args.products)
+    started = time.perf_counter()
+    rows = generate(args.out, config, workers=args.workers)
+    for table in TABLES:
+        print(f"{table:<24} {rows[table]:>14,} rows")
+    print(f"{'TOTAL':<24} {time.perf_counter() - started:13.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+{{
+    config(
+        materialized='incremental',
+        unique_key='user_id',
+        incremental_strategy='merge',
+        post_hook="DELETE FROM {{ this }} WHERE source_watermark < (SELECT MAX(source_watermark) FROM {{ this }})"
+    )
+}}
+
+-- 유저별 첫 구매 정보 (한 유저당 한 행)
+-- 첫 구매 상품을 고르는 ROW_NUMBER() 윈도우를 마트마다 전체 order_items 에 돌리지 않도록,
+-- 집계형 MIN_BY 로 첫 order_item 을 고른 뒤 PK 로 한 번만 조인합니다.
+
+WITH order_items AS (
+    SELECT * FROM {{ ref('stg_order_items') }}
+),
+
+products AS (
+    SELECT * FROM {{ ref('stg_products') }}
+),
+
+-- 0. 이번 실행의 워터마크 (int_user_rfm 과 같은 기준)
+source_watermark AS (
+    SELECT MAX(GREATEST(created_at, COALESCE(returned_at, created_at))) AS watermark
+    FROM {{ source('look', 'order_items') }}
+),
+
+{% if is_incremental() %}
+-- 0-1. 새 order_item 이 생겼거나 기존 order_item 이 반품된 유저만 다시 계산
+--      (첫 구매 상품이 반품되면 다음 상품이 첫 구매가 되므로 반품도 포함)
+changed_users AS (
+    SELECT DISTINCT user_id
+    FROM {{ source('look', 'order_items') }}
+    WHERE GREATEST(created_at, COALESCE(returned_at, created_at)) > (SELECT MAX(source_watermark) FROM {{ this }})
+),
+{% endif %}
+
+-- 1. 유저별 첫 order_item (created_at 이 같으면 임의의 한 행)
+first_item AS (
+    SELECT
+        user_id,
+        MIN_BY(order_item_id, created_at) AS first_order_item_id
+    FROM order_items
+    {% if is_incremental() %}
+    WHERE user_id IN (SELECT user_id FROM changed_users)
+    {% endif %}
+    GROUP BY user_id
+),
+
+first_purchase AS (
+    SELECT
+        f.user_id,
+        oi.order_id AS first_order_id,
+        f.first_order_item_id,
+        oi.created_at AS first_purchase_at,
+        oi.order_date AS first_order_date,
+        oi.product_id,
+        p.category,
+        oi.sale_price,
+        p.brand,
+        p.department
+    FROM first_item f
+    INNER JOIN order_items oi ON f.first_order_item_id = oi.order_item_id
+    LEFT JOIN products p ON oi.product_id = p.product_id
+
+    {% if is_incremental() %}
+    UNION ALL
+
+    -- 변경 없는 유저는 저장된 행을 그대로 다시 씀 (int_user_rfm 과 같이 모든 유저가 이번 워터마크를 갖도록)
+    SELECT
+        user_id,
+        first_order_id,
+        first_order_item_id,
+        first_purchase_at,
+        first_order_date,
+        product_id,
+        category,
+        sale_price,
+        brand,
+        department
+    FROM {{ this }}
+    WHERE user_id NOT IN (SELECT user_id FROM changed_users)
+    {% endif %}
+)
+
+-- 이전 워터마크로 남은 행 = order_item 이 모두 반품/취소되어 결과에서 빠진 유저 → post_hook 이 삭제
+SELECT
+    *,
+    (SELECT watermark FROM source_watermark) AS source_watermark
+FROM first_purchase
@@ -1,3 +1,15 @@
+{{
+    config(
+        materialized='incremental',
+        unique_key='user_id',
+        incremental_strategy='merge',
+        post_hook="DELETE FROM {{ this }} WHERE source_watermark < (SELECT MAX(source_watermark) FROM {{ this }})"
+    )
+}}
+
+-- 결과에는 항상 모든 유저가 이번 실행의 source_watermark 로 들어가므로, 이전 워터마크로 남은 행은
+-- 주문이 모두 반품/취소되어 결과에서 빠진 유저입니다. post_hook 이 merge 직후 이 행들을 삭제
+
 WITH orders AS (
     SELECT * FROM {{ ref('stg_orders') }}
 ),
@@ -6,17 +18,55 @@ order_items AS (
     SELECT * FROM {{ ref('stg_order_items') }}
 ),
 
+-- 0. 이번 실행의 워터마크 (원천 order_items 의 생성/반품 시각 중 최댓값)
+source_watermark AS (
+    SELECT MAX(GREATEST(created_at, COALESCE(returned_at, created_at))) AS watermark
+    FROM {{ source('look', 'order_items') }}
+),
+
+{% if is_incremental() %}
+-- 0-1. 지난 실행 워터마크 이후 새로 생성되었거나 반품된 order_items 를 가진 유저만 재집계
+changed_users AS (
+    SELECT DISTINCT user_id
+    FROM {{ source('look', 'order_items') }}
+    WHERE GREATEST(created_at, COALESCE(returned_at, created_at)) > (SELECT MAX(source_watermark) FROM {{ this }})
+),
+{% endif %}
+
 -- 1. 유저별 RFM 기초 집계
 rfm_base AS (
     SELECT
         o.user_id,
-        -- 기준일은 분석 시점에 따라 달라질 수 있으므로 현재는 고정값 사용 (또는 변수화 가능)
-        DATE_DIFF(DATE('2025-01-01'), MAX(o.order_date), DAY) AS recency_days,
+        MAX(o.order_date) AS last_order_date,
         COUNT(DISTINCT o.order_id) AS frequency,
         ROUND(SUM(oi.sale_price), 2) AS monetary
     FROM orders o
     JOIN order_items oi ON o.order_id = oi.order_id
+    {% if is_incremental() %}
+    WHERE o.user_id IN (SELECT user_id FROM changed_users)
+    {% endif %}
     GROUP BY o.user_id
+
+    {% if is_incremental() %}
+    UNION ALL
+
+    -- 변경 없는 유저는 저장된 집계값을 재사용 (recency 만 아래에서 다시 계산)
+    SELECT
+        user_id,
+        last_order_date,
+        frequency,
+        monetary
+    FROM {{ this }}
+    WHERE user_id NOT IN (SELECT user_id FROM changed_users)
+    {% endif %}
+),
+
+rfm_recency AS (
+    SELECT
+        *,
+        -- 기준일은 분석 시점에 따라 달라질 수 있으므로 var 로 관리 (기본값 2025-01-01)
+        DATE_DIFF(DATE('{{ var("rfm_as_of") }}'), last_order_date, DAY) AS recency_days
+    FROM rfm_base
 ),
 
 -- 2. 점수 부여 (동윤님의 기준 적용)
@@ -42,12 +92,18 @@ rfm_scored AS (
             WHEN monetary >= 34 THEN 2
             ELSE 1
         END AS m_score
-    FROM rfm_base
+    FROM rfm_recency
 )
 
 -- 3. 최종 세그먼트 정의
 SELECT
-    *,
+    user_id,
+    recency_days,
+    frequency,
+    monetary,
+    r_score,
+    f_score,
+    m_score,
     CASE
         -- VIP Champions
         WHEN r_score >= 4 AND f_score >= 4 AND m_score >= 4 THEN 'VIP'
@@ -66,5 +122,7 @@ SELECT
         -- Hibernating
         WHEN r_score <= 2 AND f_score <= 2 THEN 'Hibernating'
         ELSE 'Others'
-    END AS customer_segment
-FROM rfm_scored
\ No newline at end of file
+    END AS customer_segment,
+    last_order_date,
+    (SELECT watermark FROM source_watermark) AS source_watermark
+FROM rfm_scored
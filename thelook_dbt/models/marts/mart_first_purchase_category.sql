@@ -1,11 +1,8 @@
 WITH rfm_segment AS (
     SELECT * FROM {{ ref('int_user_rfm') }}
 ),
-products AS (
-    SELECT * FROM {{ ref('stg_products') }}
-),
-order_items AS (
-    SELECT * FROM {{ ref('stg_order_items') }}
+first_purchase AS (
+    SELECT * FROM {{ ref('int_user_first_purchase') }}
 ),
 first_purchase_info AS (
     SELECT 
@@ -14,13 +11,11 @@ first_purchase_info AS (
         r.frequency,
         r.monetary,
         r.recency_days,
-        o.product_id,
-        o.sale_price,
-        ROW_NUMBER() OVER(PARTITION BY r.user_id ORDER BY o.created_at ASC) AS rn
+        f.category,
+        f.sale_price
     FROM rfm_segment r
-    INNER JOIN order_items o ON r.user_id = o.user_id
+    INNER JOIN first_purchase f ON r.user_id = f.user_id
     WHERE LOWER(r.customer_segment) IN ('promising high value', 'promising low value', 'vip')
-    QUALIFY rn = 1
 ),
 first_pur_cat AS (
     SELECT 
@@ -28,11 +23,11 @@ first_pur_cat AS (
         f.recency_days,
         f.monetary AS ltv,
         f.frequency,
-        p.category,
+        f.category,
         f.sale_price,
         f.customer_segment
     FROM first_purchase_info f
-    INNER JOIN products p ON f.product_id = p.product_id
+    WHERE f.category IS NOT NULL
 )
 SELECT 
     customer_segment,
@@ -0,0 +1,55 @@
+-- RFM OLAP 큐브: 유저 단위 사실을 (R, F, M, 유입 채널, 첫 구매 카테고리, 가입→첫 구매 구간) 으로 미리 집계
+-- 측정값은 모두 가산(additive)이라 어떤 차원 조합으로 다시 합쳐도 정확하며,
+-- 평균/표준편차/비율은 roll-up 후 계산합니다 (thelook_analysis/cube.py)
+WITH rfm_segment AS (
+    SELECT * FROM {{ ref('int_user_rfm') }}
+),
+users AS (
+    SELECT * FROM {{ ref('stg_users') }}
+),
+first_purchase AS (
+    SELECT * FROM {{ ref('int_user_first_purchase') }}
+),
+user_facts AS (
+    SELECT
+        r.user_id,
+        r.r_score,
+        r.f_score,
+        r.m_score,
+        r.customer_segment,
+        r.recency_days,
+        r.frequency,
+        r.monetary,
+        COALESCE(u.traffic_source, 'Unknown') AS traffic_source,
+        COALESCE(f.category, 'Unknown') AS first_purchase_category,
+        f.sale_price AS first_item_price,
+        DATE_DIFF(f.first_order_date, u.signup_date, DAY) AS days_to_first_purchase
+    FROM rfm_segment r
+    LEFT JOIN users u ON r.user_id = u.user_id
+    LEFT JOIN first_purchase f ON r.user_id = f.user_id
+)
+SELECT
+    r_score,
+    f_score,
+    m_score,
+    customer_segment,
+    traffic_source,
+    first_purchase_category,
+    CASE
+        WHEN days_to_first_purchase <= 7 THEN '1. 1주일 이내'
+        WHEN days_to_first_purchase <= 30 THEN '2. 1개월 이내'
+        WHEN days_to_first_purchase <= 60 THEN '3. 2개월 이내'
+        WHEN days_to_first_purchase <= 90 THEN '4. 3개월 이내'
+        ELSE '5. 3개월+'
+    END AS signup_to_purchase,
+
+    -- 가산 측정값
+    COUNT(*) AS users,
+    SUM(monetary) AS revenue,
+    SUM(monetary * monetary) AS revenue_sq,
+    SUM(frequency) AS orders,
+    SUM(recency_days) AS recency_days_sum,
+    SUM(CASE WHEN frequency >= 2 THEN 1 ELSE 0 END) AS repeat_users,
+    SUM(COALESCE(first_item_price, 0)) AS first_item_price_sum
+FROM user_facts
+GROUP BY 1, 2, 3, 4, 5, 6, 7
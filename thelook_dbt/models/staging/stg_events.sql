@@ -1,3 +1,33 @@
+{{
+    config(
+        materialized='incremental',
+        incremental_strategy='insert_overwrite',
+        partition_by={'field': 'event_month', 'data_type': 'date', 'granularity': 'month'},
+        cluster_by=['user_id'],
+        partitions_to_replace="
+            SELECT DISTINCT DATE_TRUNC(DATE(created_at), MONTH) AS event_month
+            FROM {{ source('look', 'events') }}
+            WHERE created_at > (SELECT MAX(source_watermark) FROM {{ this }})
+        "
+    )
+}}
+
+-- 가장 큰 테이블이므로 월 파티션 + user_id 클러스터링. events 는 추가만 되므로
+-- incremental 실행 시 마지막 적재 이후 이벤트가 있는 월만 다시 만듦
+-- 워터마크는 stg_orders / stg_order_items 와 같이 원천 기준 최댓값을 컬럼으로 저장
+-- partitions_to_replace 는 아래 changed_months 와 같은 월 집합. 다시 만든 결과에 행이 남지 않은 달
+-- (예: 그 달 주문이 모두 반품) 도 비워지도록 백엔드가 결과와 별도로 평가해 교체
+WITH source_watermark AS (
+    SELECT MAX(created_at) AS watermark
+    FROM {{ source('look', 'events') }}
+){% if is_incremental() %},
+
+changed_months AS (
+    SELECT DISTINCT DATE_TRUNC(DATE(created_at), MONTH) AS event_month
+    FROM {{ source('look', 'events') }}
+    WHERE created_at > (SELECT MAX(source_watermark) FROM {{ this }})
+)
+{% endif %}
 SELECT 
     id AS event_id,
     user_id,
@@ -10,5 +40,10 @@ SELECT
     city,
     state,
     created_at AS event_at,
-    DATE(created_at) AS event_date
+    DATE(created_at) AS event_date,
+    DATE_TRUNC(DATE(created_at), MONTH) AS event_month,
+    (SELECT watermark FROM source_watermark) AS source_watermark
 FROM {{ source('look', 'events') }}
+{% if is_incremental() %}
+WHERE DATE_TRUNC(DATE(created_at), MONTH) IN (SELECT event_month FROM changed_months)
+{% endif %}
@@ -1,13 +1,49 @@
+{{
+    config(
+        materialized='incremental',
+        incremental_strategy='insert_overwrite',
+        partition_by={'field': 'order_month', 'data_type': 'date', 'granularity': 'month'},
+        cluster_by=['user_id'],
+        partitions_to_replace="
+            SELECT DISTINCT DATE_TRUNC(DATE(created_at), MONTH) AS order_month
+            FROM {{ source('look', 'orders') }}
+            WHERE GREATEST(created_at, COALESCE(returned_at, created_at)) > (SELECT MAX(source_watermark) FROM {{ this }})
+        "
+    )
+}}
+
+-- 월 파티션 + user_id 클러스터링 (stg_order_items 와 같은 방식)
+-- 취소는 시각 컬럼이 없어 워터마크로 잡히지 않으므로 주기적으로 --full-refresh 실행
+-- 적재 워터마크는 분석 기간 필터와 무관하게 원천 전체의 생성/반품 시각 최댓값으로 저장
+-- (기간 밖 행이 매 실행 변경으로 잡혀 마지막 파티션을 계속 다시 쓰지 않도록)
+-- partitions_to_replace 는 아래 changed_months 와 같은 월 집합. 다시 만든 결과에 행이 남지 않은 달
+-- (예: 그 달 주문이 모두 반품) 도 비워지도록 백엔드가 결과와 별도로 평가해 교체
+WITH source_watermark AS (
+    SELECT MAX(GREATEST(created_at, COALESCE(returned_at, created_at))) AS watermark
+    FROM {{ source('look', 'orders') }}
+){% if is_incremental() %},
+
+changed_months AS (
+    SELECT DISTINCT DATE_TRUNC(DATE(created_at), MONTH) AS order_month
+    FROM {{ source('look', 'orders') }}
+    WHERE GREATEST(created_at, COALESCE(returned_at, created_at)) > (SELECT MAX(source_watermark) FROM {{ this }})
+)
+{% endif %}
 SELECT
     order_id,
     user_id,
     status,
     created_at,
     num_of_item,
-    DATE(created_at) as order_date
+    DATE(created_at) as order_date,
+    DATE_TRUNC(DATE(created_at), MONTH) AS order_month,
+    (SELECT watermark FROM source_watermark) AS source_watermark
 FROM {{ source('look', 'orders') }}
 
 WHERE 
     -- 1. 기본 필터링 (취소/반품 제외)
     status NOT IN ('Cancelled', 'Returned')
-    AND DATE(created_at) BETWEEN '2023-01-01' AND '2024-12-31'
\ No newline at end of file
+    AND DATE(created_at) BETWEEN '2023-01-01' AND '2024-12-31'
+    {% if is_incremental() %}
+    AND DATE_TRUNC(DATE(created_at), MONTH) IN (SELECT order_month FROM changed_months)
+    {% endif %}
@@ -0,0 +1,28 @@
+{% snapshot snap_user_segment %}
+
+{{
+    config(
+        target_schema='snapshots',
+        unique_key='user_id',
+        strategy='check',
+        check_cols=['customer_segment'],
+        invalidate_hard_deletes=True
+    )
+}}
+
+-- 유저별 세그먼트 이력 (SCD2). customer_segment 가 바뀐 유저만 새 행이 생기고 이전 행은 dbt_valid_to 로 닫힘
+-- 점수는 세그먼트가 바뀐 시점의 값. 로컬 변경분 스냅샷은 thelook_analysis.snapshots (같은 기준)
+-- int_user_rfm 의 Recency 기준일(var rfm_as_of)은 기본값이 2025-01-01 로 고정이고 주문도 staging 기간
+-- (2023-01-01 ~ 2024-12-31) 안에서만 읽으므로, 기본 vars 로는 소스가 다시 적재되지 않는 한 변화가 기록되지 않음.
+-- 일별 이력은 스냅샷 전에 실행일을 기준일로 int_user_rfm 을 다시 만들어야 함 (README 참고):
+--   dbt run --select int_user_rfm --vars "{rfm_as_of: '<실행일>'}" && dbt snapshot
+-- 이때 기록되는 이동은 Recency 경과에 따른 것과 기간 안 주문의 반품/취소 반영분
+SELECT
+    user_id,
+    customer_segment,
+    r_score,
+    f_score,
+    m_score
+FROM {{ ref('int_user_rfm') }}
+
+{% endsnapshot %}